@@ -13,6 +13,10 @@ from flask_wtf.csrf import CSRFError
 from .admin import add_admin_dashboard, register_bp_admin_blueprints
 from .config import ensure_directories, settings
 from .db import init_db
+from .db.commands import register_db_commands
+from .db.instrumentation import init_sql_instrumentation
+from .db.pool_metrics import init_pool_telemetry
+from .db.read_replica import init_read_replica
 from .db.exceptions import DatabaseInitError
 from .extensions import (
     csrf_init_app,
@@ -24,6 +28,8 @@ from .extensions import (
 from .public import register_blueprints
 from .public.utils import context_data
 from .shared.core import CookieHeaderClient, filters
+from .shared.core.compression import init_compression
+from .shared.core.json_provider import init_json_provider
 
 logger = logging.getLogger(__name__)
 
@@ -123,6 +129,8 @@ def register_error_pages(app: Flask) -> None:
 def init_app_and_db(app, _db) -> bool:
     _db.init_app(app)
     migrate.init_app(app, _db)
+    init_read_replica(app)
+    init_pool_telemetry(app)
 
     try:
         with app.app_context():
@@ -159,6 +167,9 @@ def create_app(config_class: type) -> Flask:
     app.url_map.strict_slashes = False
     app.test_client_class = CookieHeaderClient
     app.config.from_object(config_class())
+    init_json_provider(app)
+    # Registered first so it runs after every other after_request hook
+    init_compression(app)
 
     # Initialize CSRF protection
     csrf_init_app(app)
@@ -185,6 +196,8 @@ def create_app(config_class: type) -> Flask:
         add_admin_dashboard(app, _db)
         register_bp_admin_blueprints(app)
         register_blueprints(app)
+        register_db_commands(app)
+        init_sql_instrumentation(app)
         # register_cli_jobs(app)
     else:
 
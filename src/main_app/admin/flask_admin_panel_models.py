@@ -43,6 +43,7 @@ from ..db.models.views import (
     EnwikiPageviewRecord,
     ViewsNewAllRecord,
     ViewsNewRecord,
+    ViewsNewTotalRecord,
 )
 
 
@@ -118,6 +119,7 @@ categories: list[AdminCategory] = [
             EnwikiPageviewRecord,
             ViewsNewAllRecord,
             ViewsNewRecord,
+            ViewsNewTotalRecord,
         ],
     ),
     AdminCategory(
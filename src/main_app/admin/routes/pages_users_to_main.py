@@ -11,7 +11,6 @@ from flask import Blueprint, flash, redirect, render_template, request, url_for
 from flask.typing import ResponseReturnValue
 
 from ...db.services import LangService, PagesService, PagesUsersToMainPagesService
-from ...extensions import db
 
 logger = logging.getLogger(__name__)
 
@@ -133,11 +132,11 @@ class PagesUsersMainRoutes:
         # later ``delete_user_page`` call rolls the session back, that pending
         # update would silently disappear even though we just flashed success.
         # Force the commit here so the flash matches what is actually persisted.
+        # ``commit()`` also invalidates the cached ``pages`` queries.
         try:
-            db.session.commit()
+            self.pages_service.commit()
         except Exception:
             logger.exception("Failed to commit add_translate_row_to_db for id=%r", page_id)
-            db.session.rollback()
             flash("Failed to persist translations.", "danger")
             return redirect_to
 
@@ -8,6 +8,7 @@ from flask import Blueprint, flash, redirect, render_template, request, url_for
 from flask.typing import ResponseReturnValue
 from werkzeug.wrappers.response import Response
 
+from ....db.exceptions import QueryBudgetExceededError
 from ....db.models import QidOthersRecord, QidRecord
 from ....db.services import QidOthersService, QidService
 
@@ -83,6 +84,9 @@ class QidsSharedModel:
 
         try:
             rows = self.service.list_records(dis=dis)
+        except QueryBudgetExceededError:
+            flash("Listing took too long and was cancelled; try a narrower filter.", "warning")
+            rows = []
         except Exception:
             logger.exception("Failed to list qids rows dis=%r", dis)
             rows = []
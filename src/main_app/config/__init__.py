@@ -8,6 +8,7 @@ from .classes import (
     DbConfig,
     OAuthConfig,
     Paths,
+    PerformanceConfig,
     SecurityConfig,
     SessionConfig,
     Settings,
@@ -37,6 +38,7 @@ __all__ = [
     "OAuthConfig",
     "CorsConfig",
     "UsersConfig",
+    "PerformanceConfig",
     "Settings",
     "settings",
     "ensure_directories",
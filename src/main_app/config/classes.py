@@ -27,6 +27,7 @@ class DbConfig:
     db_host: str
     db_user: str | None
     db_password: str | None
+    db_replica_host: str = ""  # Empty means no read replica; reads use the primary
 
     def to_dict(self) -> dict[str, Any]:
         return {
@@ -34,6 +35,7 @@ class DbConfig:
             "db_host": self.db_host,
             "db_user": self.db_user,
             "db_password": self.db_password,
+            "db_replica_host": self.db_replica_host,
         }
 
 
@@ -100,6 +102,44 @@ class SecurityConfig:
     publish_secret_code: str
 
 
+@dataclass(frozen=True)
+class PerformanceConfig:
+    """Switches for database performance features."""
+
+    views_summary_table: bool  # Read view totals from views_new_totals instead of the views_new_all VIEW
+    coverage_rollup_table: bool  # Read /td/missing counts from category_lang_coverage instead of joining live
+    leaderboard_rollup: bool  # Answer the leaderboard endpoints from leaderboard_rollup instead of aggregating pages
+    query_cache_ttl: int  # Seconds a cached service query result is reused; 0 only invalidates on writes
+    read_your_writes_seconds: int  # After a write, that browser session reads from the primary for this long
+    sql_instrumentation: bool  # Time SQL statements per request (Server-Timing header, N+1 warnings)
+    sql_n_plus_one_threshold: int  # Warn when one statement shape runs more than this many times in a request
+    slow_query_ms: int  # Statements at least this slow are counted and logged as slow
+    slow_query_log: bool  # Also write slow statements to <log_dir>/slow_queries.log
+    sql_debug_endpoint: bool  # Serve recent per-request SQL stats at /debug/sql
+    statement_budget_ms: int  # Execution budget for expensive analytic statements; 0 disables
+    pool_size: int  # Connections kept open per worker (per engine) when auto-sizing is off
+    pool_max_overflow: int  # Extra connections a worker may open under load when auto-sizing is off
+    pool_auto_size: bool  # Derive pool_size/max_overflow from workers, threads and the connection budget
+    db_connection_budget: int  # Max MySQL connections all workers together may open per engine
+    web_workers: int  # Gunicorn worker processes (WEB_CONCURRENCY)
+    web_threads: int  # Threads per gunicorn worker
+    pool_telemetry: bool  # Record pool checkout waits, overflow use, invalidations and connection age
+    results_snapshot_ttl: int  # Seconds a /td/table results snapshot is served as fresh; 0 disables snapshots
+    results_snapshot_max_stale: int  # Seconds a stale snapshot may still be served while it is rebuilt
+    results_page_size: int  # Rows per page of the /td/table results tables; 0 renders every row at once
+    leaderboard_page_size: int  # Rows per page of the leaderboard user and language pages; 0 lists every row at once
+    category_cache_ttl: int  # Seconds fetched mdwiki category members are reused before refetching; 0 never expires
+    autocomplete_index_ttl: int  # Seconds an /api/autocomplete prefix index is reused before rebuilding; 0 only on writes
+    api_conditional_get: bool  # Answer the polled JSON API endpoints with ETag/Last-Modified and 304 Not Modified
+    api_etag_ttl: int  # Seconds an API ETag stays valid without a write in this worker; 0 only changes on writes
+    json_serializer: str  # JSON responses: "auto" (orjson when installed), "orjson" or "json" (standard library)
+    response_compression: bool  # gzip/brotli-compress JSON, CSS, JS and text responses the client accepts
+    compression_min_size: int  # Responses smaller than this many bytes are sent uncompressed
+    parallel_loader_workers: int  # Concurrent queries per page load; below 2 loads inline
+    parallel_loader_timeout_ms: int  # Shared deadline of a parallel page load; 0 means none
+    leaderboard_fragment_ttl: int  # Seconds rendered leaderboard fragments are reused; 0 disables
+
+
 @dataclass(frozen=True)
 class Settings:
     """Main settings container."""
@@ -114,6 +154,7 @@ class Settings:
     other: OtherConfig
     users: UsersConfig
     cors: CorsConfig
+    performance: PerformanceConfig
 
 
 __all__ = [
@@ -127,4 +168,5 @@ __all__ = [
     "SecurityConfig",
     "CorsConfig",
     "UsersConfig",
+    "PerformanceConfig",
 ]
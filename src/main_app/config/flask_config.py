@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from dataclasses import replace
 from typing import Any
 from urllib.parse import quote_plus
 
@@ -28,6 +29,19 @@ def build_sqlalchemy_uri(db_config: DbConfig) -> str:
     return url
 
 
+def pool_sizing(workers: int, threads: int, connection_budget: int) -> tuple[int, int]:
+    """Return ``(pool_size, max_overflow)`` for one worker's engine.
+
+    Each worker gets an equal share of ``connection_budget``. A worker never
+    runs more than ``threads`` requests at once, so that many connections are
+    kept open and the rest of its share is overflow for bursts (background
+    jobs, streaming responses).
+    """
+    share = max(1, connection_budget // max(1, workers))
+    pool_size = max(1, min(threads, share))
+    return pool_size, max(0, share - pool_size)
+
+
 class Config:
     """Base configuration class for Flask applications.
 
@@ -75,6 +89,8 @@ class Config:
     SQLALCHEMY_DATABASE_URI: str | None = None
     SQLALCHEMY_TRACK_MODIFICATIONS: bool = False
     SQLALCHEMY_ENGINE_OPTIONS: dict[str, Any] = {}
+    # Extra engines; "replica" is used by read-only services (see db/read_replica.py)
+    SQLALCHEMY_BINDS: dict[str, Any] = {}
 
     SQLALCHEMY_ECHO: bool = False
 
@@ -93,14 +109,25 @@ class Config:
             db_cfg = settings.database_data
             if db_cfg.db_host:
                 self.SQLALCHEMY_DATABASE_URI = build_sqlalchemy_uri(db_cfg)
+                if db_cfg.db_replica_host and not self.SQLALCHEMY_BINDS:
+                    replica_cfg = replace(db_cfg, db_host=db_cfg.db_replica_host)
+                    self.SQLALCHEMY_BINDS = {"replica": build_sqlalchemy_uri(replica_cfg)}
 
         # Only set MySQL-specific engine options if URI is MySQL (not SQLite)
         uri = self.SQLALCHEMY_DATABASE_URI or ""
         if uri.startswith("mysql") and not self.SQLALCHEMY_ENGINE_OPTIONS:
+            performance = settings.performance
+            if performance.pool_auto_size:
+                pool_size, max_overflow = pool_sizing(
+                    performance.web_workers, performance.web_threads, performance.db_connection_budget
+                )
+            else:
+                pool_size, max_overflow = performance.pool_size, performance.pool_max_overflow
+
             self.SQLALCHEMY_ENGINE_OPTIONS = {
                 "pool_pre_ping": True,
-                "pool_size": 5,
-                "max_overflow": 10,
+                "pool_size": pool_size,
+                "max_overflow": max_overflow,
                 "pool_recycle": 3600,
                 "connect_args": {
                     "connect_timeout": 5,
@@ -109,6 +136,10 @@ class Config:
                     "collation": "utf8mb4_unicode_ci",
                 },
             }
+            if performance.pool_telemetry:
+                from ..db.pool_metrics import InstrumentedQueuePool
+
+                self.SQLALCHEMY_ENGINE_OPTIONS["poolclass"] = InstrumentedQueuePool
 
 
 class DevelopmentConfig(Config):
@@ -160,6 +191,7 @@ class TestingConfig(Config):
 
 
 __all__ = [
+    "pool_sizing",
     "Config",
     "DevelopmentConfig",
     "ProductionConfig",
@@ -14,6 +14,7 @@ from .classes import (
     OAuthConfig,
     OtherConfig,
     Paths,
+    PerformanceConfig,
     SecurityConfig,
     SessionConfig,
     Settings,
@@ -100,12 +101,14 @@ def _load_database_config() -> DbConfig:
             - db_host: from TOOL_TOOLSDB_HOST (default "").
             - db_user: from TOOL_TOOLSDB_USER (or None).
             - db_password: from TOOL_TOOLSDB_PASSWORD (or None).
+            - db_replica_host: from TOOL_TOOLSDB_REPLICA_HOST (default "", no replica).
     """
     return DbConfig(
         db_name=os.getenv("TOOL_TOOLSDB_DBNAME", ""),
         db_host=os.getenv("TOOL_TOOLSDB_HOST", ""),
         db_user=os.getenv("TOOL_TOOLSDB_USER", None),
         db_password=os.getenv("TOOL_TOOLSDB_PASSWORD", None),
+        db_replica_host=os.getenv("TOOL_TOOLSDB_REPLICA_HOST", ""),
     )
 
 
@@ -246,6 +249,46 @@ def load_user_config() -> UsersConfig:
     return users_config
 
 
+def load_performance_config() -> PerformanceConfig:
+    # After enabling VIEWS_SUMMARY_TABLE run `flask rebuild-views-totals` once to backfill the table.
+    return PerformanceConfig(
+        views_summary_table=_env_bool("VIEWS_SUMMARY_TABLE", default=False),
+        # After enabling COVERAGE_ROLLUP_TABLE run `flask rebuild-category-coverage` once (and after bulk imports).
+        coverage_rollup_table=_env_bool("COVERAGE_ROLLUP_TABLE", default=False),
+        # After enabling LEADERBOARD_ROLLUP run `flask rebuild-leaderboard-rollup` once (and after bulk imports).
+        leaderboard_rollup=_env_bool("LEADERBOARD_ROLLUP", default=False),
+        query_cache_ttl=_env_int("QUERY_CACHE_TTL", 60, safe=True),
+        read_your_writes_seconds=_env_int("READ_YOUR_WRITES_SECONDS", 30, safe=True),
+        sql_instrumentation=_env_bool("SQL_INSTRUMENTATION", default=True),
+        sql_n_plus_one_threshold=_env_int("SQL_N_PLUS_ONE_THRESHOLD", 10, safe=True),
+        slow_query_ms=_env_int("SLOW_QUERY_MS", 500, safe=True),
+        slow_query_log=_env_bool("SLOW_QUERY_LOG", default=False),
+        sql_debug_endpoint=_env_bool("SQL_DEBUG_ENDPOINT", default=False),
+        statement_budget_ms=_env_int("STATEMENT_BUDGET_MS", 10000, safe=True),
+        pool_size=_env_int("DB_POOL_SIZE", 5, safe=True),
+        pool_max_overflow=_env_int("DB_MAX_OVERFLOW", 10, safe=True),
+        pool_auto_size=_env_bool("DB_POOL_AUTO_SIZE", default=False),
+        db_connection_budget=_env_int("DB_CONNECTION_BUDGET", 20, safe=True),
+        web_workers=_env_int("WEB_CONCURRENCY", 4, safe=True),
+        web_threads=_env_int("GUNICORN_THREADS", 1, safe=True),
+        pool_telemetry=_env_bool("DB_POOL_TELEMETRY", default=True),
+        results_snapshot_ttl=_env_int("RESULTS_SNAPSHOT_TTL", 300, safe=True),
+        results_snapshot_max_stale=_env_int("RESULTS_SNAPSHOT_MAX_STALE", 3600, safe=True),
+        results_page_size=_env_int("RESULTS_PAGE_SIZE", 100, safe=True),
+        leaderboard_page_size=_env_int("LEADERBOARD_PAGE_SIZE", 100, safe=True),
+        category_cache_ttl=_env_int("CATEGORY_CACHE_TTL", 86400, safe=True),
+        autocomplete_index_ttl=_env_int("AUTOCOMPLETE_INDEX_TTL", 300, safe=True),
+        api_conditional_get=_env_bool("API_CONDITIONAL_GET", default=True),
+        api_etag_ttl=_env_int("API_ETAG_TTL", 60, safe=True),
+        json_serializer=os.getenv("JSON_SERIALIZER", "auto").strip().lower() or "auto",
+        response_compression=_env_bool("RESPONSE_COMPRESSION", default=True),
+        compression_min_size=_env_int("COMPRESSION_MIN_SIZE", 1024, safe=True),
+        parallel_loader_workers=_env_int("PARALLEL_LOADER_WORKERS", 4, safe=True),
+        parallel_loader_timeout_ms=_env_int("PARALLEL_LOADER_TIMEOUT_MS", 10000, safe=True),
+        leaderboard_fragment_ttl=_env_int("LEADERBOARD_FRAGMENT_TTL", 300, safe=True),
+    )
+
+
 @lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """
@@ -281,6 +324,8 @@ def get_settings() -> Settings:
 
     database_data = _load_database_config()
 
+    performance_config = load_performance_config()
+
     return Settings(
         paths=_get_paths(),
         database_data=database_data,
@@ -291,6 +336,7 @@ def get_settings() -> Settings:
         other=other_config,
         users=users_config,
         cors=cors_config,
+        performance=performance_config,
     )
 
 
@@ -7,8 +7,9 @@ from typing import Any
 from flask_sqlalchemy import SQLAlchemy
 from sqlalchemy import event
 
-from .create_helper import create_tables, create_views
+from .create_helper import add_missing_columns, create_missing_indexes, create_tables, create_views
 from .exceptions import DatabaseInitError
+from .schema_version import metadata_fingerprint, record_fingerprint, schema_lock, stored_fingerprint
 
 logger = logging.getLogger(__name__)
 
@@ -38,13 +39,16 @@ def register_events(engine) -> None:
         event.listen(engine, "connect", receive_connect)
 
 
-def init_db(_db: SQLAlchemy) -> None:
+def init_db(_db: SQLAlchemy, force: bool = False) -> None:
     """
     Initialize database tables and views if they don't exist.
 
     Creates all real tables (skipping views) and creates views manually
     using the SQL stored in each view model's ``__table_args__["info"]``.
-    This is idempotent-safe to call on every app startup.
+
+    The DDL only runs when the models' metadata fingerprint differs from the
+    one recorded in ``schema_version`` (or when ``force`` is set), under an
+    advisory lock so concurrent workers don't all run it.
 
     Raises:
         DatabaseInitError: If table creation fails.
@@ -53,10 +57,28 @@ def init_db(_db: SQLAlchemy) -> None:
 
     register_events(_db.engine)
 
-    # Create only real tables; skip view-backed mapped classes
-    create_tables(_db)
+    fingerprint = metadata_fingerprint(_db)
+    if not force and stored_fingerprint(_db) == fingerprint:
+        logger.debug("Schema fingerprint %s unchanged, skipping DDL", fingerprint[:12])
+        return
+
+    with schema_lock(_db.engine):
+        # Another worker may have applied it while we waited for the lock
+        if not force and stored_fingerprint(_db) == fingerprint:
+            return
+
+        logger.info("Schema fingerprint changed, running schema bootstrap")
+
+        # Create only real tables; skip view-backed mapped classes
+        create_tables(_db)
+
+        # Bring tables created by older releases up to date (new nullable columns and indexes)
+        add_missing_columns(_db)
+        create_missing_indexes(_db)
+
+        create_views(_db)
 
-    create_views(_db)
+        record_fingerprint(_db, fingerprint)
 
 
 __all__ = [
@@ -0,0 +1,103 @@
+"""
+Flask CLI commands for database maintenance.
+"""
+
+from __future__ import annotations
+
+import click
+from flask import Flask
+from flask.cli import with_appcontext
+
+
+@click.command("rebuild-views-totals")
+@with_appcontext
+def rebuild_views_totals_command() -> None:
+    """Rebuild the views_new_totals summary table from views_new."""
+    from .services import ViewsNewTotalsService
+
+    rows = ViewsNewTotalsService().rebuild()
+    click.echo(f"views_new_totals rebuilt with {rows} rows.")
+
+
+@click.command("rebuild-category-coverage")
+@click.option("--category", "categories", multiple=True, help="Only refresh these categories (repeatable).")
+@with_appcontext
+def rebuild_category_coverage_command(categories: tuple[str, ...]) -> None:
+    """Rebuild the category_lang_coverage rollup from category_members and all_qids_exists."""
+    from .services import CategoryLangCoverageService
+
+    service = CategoryLangCoverageService()
+    if categories:
+        refreshed = service.refresh_categories(categories)
+        click.echo(f"category_lang_coverage refreshed for {refreshed} categories.")
+        return
+    rows = service.rebuild()
+    click.echo(f"category_lang_coverage rebuilt with {rows} rows.")
+
+
+@click.command("sync-category-members")
+@click.option("--category", "categories", multiple=True, help="Only sync these categories (repeatable).")
+@with_appcontext
+def sync_category_members_command(categories: tuple[str, ...]) -> None:
+    """Add the mdwiki members of the configured categories, crawled at their stored depth, to category_members."""
+    from ..shared.clients import crawl_mdwiki_category
+    from .services import CategoryMemberService, CategoryService
+
+    records = CategoryService().list_categories()
+    if categories:
+        records = [record for record in records if record.category in categories]
+    service = CategoryMemberService()
+    for record in records:
+        crawl = crawl_mdwiki_category(record.category, record.depth, use_cache=True)
+        if not crawl.complete:
+            click.echo(f"{record.category}: crawl incomplete, skipped.")
+            continue
+        added = service.sync_category_members(record.category, crawl.titles)
+        click.echo(f"{record.category}: {added} members added.")
+
+
+@click.command("rebuild-leaderboard-rollup")
+@with_appcontext
+def rebuild_leaderboard_rollup_command() -> None:
+    """Rebuild the leaderboard_rollup table from pages, words and view totals."""
+    from .services import LeaderboardRollupService
+
+    rows = LeaderboardRollupService().rebuild()
+    click.echo(f"leaderboard_rollup rebuilt with {rows} rows.")
+
+
+@click.command("backfill-pub-date")
+@click.option("--batch-size", default=1000, show_default=True, help="Rows updated per transaction.")
+@with_appcontext
+def backfill_pub_date_command(batch_size: int) -> None:
+    """Populate pages.pub_date and pages_users.pub_date from pupdate."""
+    from .services import PagesService, UserPagesService
+
+    for name, service in (("pages", PagesService()), ("pages_users", UserPagesService())):
+        updated = service.backfill_pub_dates(batch_size)
+        click.echo(f"{name}: pub_date set on {updated} rows.")
+
+
+@click.command("sync-schema")
+@with_appcontext
+def sync_schema_command() -> None:
+    """Run the schema bootstrap even if the recorded fingerprint matches."""
+    from ..extensions import db
+    from . import init_db
+
+    init_db(db, force=True)
+    click.echo("Schema synchronised.")
+
+
+def register_db_commands(app: Flask) -> None:
+    app.cli.add_command(rebuild_views_totals_command)
+    app.cli.add_command(rebuild_category_coverage_command)
+    app.cli.add_command(sync_category_members_command)
+    app.cli.add_command(rebuild_leaderboard_rollup_command)
+    app.cli.add_command(backfill_pub_date_command)
+    app.cli.add_command(sync_schema_command)
+
+
+__all__ = [
+    "register_db_commands",
+]
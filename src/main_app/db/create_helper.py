@@ -23,6 +23,59 @@ def create_tables(_db: SQLAlchemy) -> None:
         raise DatabaseInitError(f"Failed to create tables: {exc}") from exc
 
 
+def add_missing_columns(_db: SQLAlchemy) -> list[str]:
+    """
+    ALTER existing tables to add nullable model columns they are missing.
+
+    ``create_all`` never touches existing tables, so columns added to a model
+    later (e.g. ``pages.pub_date``) would otherwise be absent on old databases.
+    Only nullable columns without a server default are added; anything else
+    needs a hand-written migration and is just logged.
+    Returns the list of ``table.column`` names added.
+    """
+    from sqlalchemy import inspect as sa_inspect
+    from sqlalchemy.schema import CreateColumn
+
+    inspector = sa_inspect(_db.engine)
+    existing_tables = set(inspector.get_table_names())
+    added: list[str] = []
+
+    with _db.engine.connect() as conn:
+        for table in _db.metadata.tables.values():
+            if table.info.get("is_view") or table.name not in existing_tables:
+                continue
+
+            existing_columns = {col["name"] for col in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in existing_columns:
+                    continue
+                if not column.nullable or column.primary_key:
+                    logger.error("Column %s.%s is missing and cannot be added automatically", table.name, column.name)
+                    continue
+
+                column_ddl = CreateColumn(column).compile(dialect=_db.engine.dialect)
+                try:
+                    with conn.begin():
+                        conn.execute(text(f"ALTER TABLE {table.name} ADD COLUMN {column_ddl}"))
+                except SQLAlchemyError as exc:
+                    raise DatabaseInitError(f"Failed to add column {table.name}.{column.name}: {exc}") from exc
+                logger.info("Added missing column %s.%s", table.name, column.name)
+                added.append(f"{table.name}.{column.name}")
+
+    return added
+
+
+def create_missing_indexes(_db: SQLAlchemy) -> None:
+    """Create model indexes that do not exist yet on already existing tables."""
+    real_tables = [t for t in _db.metadata.tables.values() if not t.info.get("is_view")]
+    try:
+        for table in real_tables:
+            for index in table.indexes:
+                index.create(_db.engine, checkfirst=True)
+    except SQLAlchemyError as exc:
+        raise DatabaseInitError(f"Failed to create indexes: {exc}") from exc
+
+
 def create_views(_db: SQLAlchemy) -> None:
     from sqlalchemy import inspect as sa_inspect
 
@@ -62,6 +115,8 @@ def create_views(_db: SQLAlchemy) -> None:
 
 
 __all__ = [
+    "add_missing_columns",
+    "create_missing_indexes",
     "create_views",
     "create_tables",
 ]
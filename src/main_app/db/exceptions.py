@@ -16,6 +16,15 @@ class DatabaseInitError(Exception):
     """Raised when database initialization fails."""
 
 
+class QueryBudgetExceededError(TimeoutError):
+    """Raised when a statement runs past its execution budget and is cancelled by the database."""
+
+    def __init__(self, name: str, budget_ms: int) -> None:
+        self.name = name
+        self.budget_ms = budget_ms
+        super().__init__(f"Statement budget {name!r} of {budget_ms}ms exceeded")
+
+
 class MaxUserConnectionsError(Exception):
     pass
 
@@ -49,6 +58,7 @@ __all__ = [
     "DuplicateRecordError",
     "DatabaseInitError",
     "MaxUserConnectionsError",
+    "QueryBudgetExceededError",
     "UserNotFoundError",
     "InsufficientDatabaseConfigError",
 ]
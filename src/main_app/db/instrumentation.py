@@ -0,0 +1,224 @@
+"""
+Per-request SQL instrumentation.
+
+Engine-level ``before/after_cursor_execute`` hooks time every statement. While
+a request is active the timings are collected on ``g``, and when the response
+goes out:
+
+- a ``Server-Timing: db;dur=<ms>;desc="<n> queries"`` header is added,
+- a warning is logged for every normalised statement shape that ran more than
+  ``settings.performance.sql_n_plus_one_threshold`` times (a likely N+1),
+- a summary is kept in a small in-process ring buffer served by the optional
+  admin-only ``/debug/sql`` endpoint (together with the connection pool status).
+
+Statements slower than ``settings.performance.slow_query_ms`` are counted in
+``metrics`` and, when ``settings.performance.slow_query_log`` is on, written
+in normalised form to ``slow_queries.log`` in the log directory.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+import threading
+import time
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from logging.handlers import WatchedFileHandler
+from typing import Any
+
+from flask import Flask, Response, g, has_request_context, jsonify, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from ..config import settings
+from ..shared.core.metrics import metrics
+from .pool_metrics import pool_status
+
+logger = logging.getLogger(__name__)
+slow_query_logger = logging.getLogger("main_app.slow_sql")
+
+SLOWEST_KEPT = 5
+RECENT_REQUESTS_KEPT = 50
+
+_WHITESPACE_RE = re.compile(r"\s+")
+_STRING_LITERAL_RE = re.compile(r"'(?:[^'\\]|\\.)*'")
+_NUMBER_RE = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PLACEHOLDER_RE = re.compile(r"%\(\w+\)s|%s|\?|:\w+")
+_PLACEHOLDER_LIST_RE = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+
+_recent_lock = threading.Lock()
+_recent_requests: deque[dict[str, Any]] = deque(maxlen=RECENT_REQUESTS_KEPT)
+
+
+def normalize_statement(statement: str) -> str:
+    """Reduce a SQL statement to its shape: literals and placeholders become ``?`` and IN-lists collapse."""
+    shape = _STRING_LITERAL_RE.sub("?", statement)
+    shape = _PLACEHOLDER_RE.sub("?", shape)
+    shape = _NUMBER_RE.sub("?", shape)
+    shape = _PLACEHOLDER_LIST_RE.sub("(?)", shape)
+    return _WHITESPACE_RE.sub(" ", shape).strip()
+
+
+@dataclass
+class RequestQueryStats:
+    count: int = 0
+    total_ms: float = 0.0
+    slowest: list[tuple[float, str]] = field(default_factory=list)
+    shapes: Counter[str] = field(default_factory=Counter)
+
+    def record(self, statement: str, duration_ms: float) -> None:
+        shape = normalize_statement(statement)
+        self.count += 1
+        self.total_ms += duration_ms
+        self.shapes[shape] += 1
+        self.slowest.append((duration_ms, shape))
+        self.slowest.sort(key=lambda item: item[0], reverse=True)
+        del self.slowest[SLOWEST_KEPT:]
+
+    def merge(self, other: RequestQueryStats) -> None:
+        """Add the statements ``other`` recorded (e.g. on a worker thread of this request)."""
+        self.count += other.count
+        self.total_ms += other.total_ms
+        self.shapes.update(other.shapes)
+        self.slowest.extend(other.slowest)
+        self.slowest.sort(key=lambda item: item[0], reverse=True)
+        del self.slowest[SLOWEST_KEPT:]
+
+    def repeated_shapes(self, threshold: int) -> list[tuple[str, int]]:
+        return [(shape, count) for shape, count in self.shapes.most_common() if count > threshold]
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "total_ms": round(self.total_ms, 2),
+            "slowest": [{"ms": round(ms, 2), "statement": shape} for ms, shape in self.slowest],
+        }
+
+
+def current_query_stats() -> RequestQueryStats | None:
+    """Return the stats collected so far for the current request, if any."""
+    if not has_request_context():
+        return None
+    return g.get("_sql_stats")
+
+
+def merge_query_stats(stats: RequestQueryStats | None) -> None:
+    """Fold stats collected in another context (a worker thread) into the current request's."""
+    if stats is None or not has_request_context():
+        return
+    current = g.get("_sql_stats")
+    if current is None:
+        current = g._sql_stats = RequestQueryStats()
+    current.merge(stats)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    conn.info.setdefault("_query_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    starts = conn.info.get("_query_start")
+    if not starts:
+        return
+    duration_ms = (time.perf_counter() - starts.pop()) * 1000
+
+    if duration_ms >= settings.performance.slow_query_ms:
+        metrics.incr("sql.slow_queries")
+        if settings.performance.slow_query_log:
+            slow_query_logger.info("%.1fms %s", duration_ms, normalize_statement(statement))
+
+    if has_request_context():
+        stats = g.get("_sql_stats")
+        if stats is None:
+            stats = g._sql_stats = RequestQueryStats()
+        stats.record(statement, duration_ms)
+
+
+def _handle_error(exception_context) -> None:
+    # A failed statement never reaches after_cursor_execute; drop its start time
+    conn = exception_context.connection
+    if conn is None or exception_context.statement is None:
+        return
+    starts = conn.info.get("_query_start")
+    if starts:
+        starts.pop()
+
+
+def _finish_request(response: Response) -> Response:
+    stats = current_query_stats()
+    if stats is None or stats.count == 0:
+        return response
+
+    metrics.incr("sql.queries", stats.count)
+    response.headers.add("Server-Timing", f'db;dur={stats.total_ms:.1f};desc="{stats.count} queries"')
+
+    threshold = settings.performance.sql_n_plus_one_threshold
+    for shape, count in stats.repeated_shapes(threshold):
+        metrics.incr("sql.n_plus_one_warnings")
+        logger.warning("Possible N+1 on %s %s: %d x %s", request.method, request.path, count, shape)
+
+    summary = {"method": request.method, "path": request.path, "status": response.status_code, **stats.to_dict()}
+    with _recent_lock:
+        _recent_requests.append(summary)
+    return response
+
+
+def recent_request_stats() -> list[dict[str, Any]]:
+    """Return the summaries of the most recent instrumented requests, newest first."""
+    with _recent_lock:
+        return list(reversed(_recent_requests))
+
+
+def _setup_slow_query_log() -> None:
+    if slow_query_logger.handlers:
+        return
+    log_file = settings.paths.log_dir / "slow_queries.log"
+    try:
+        log_file.parent.mkdir(parents=True, exist_ok=True)
+        handler = WatchedFileHandler(log_file, mode="a", encoding="utf-8")
+    except OSError as exc:
+        logger.error("Could not open slow query log %s: %s", log_file, exc)
+        return
+    handler.setFormatter(logging.Formatter("%(asctime)s - %(message)s", datefmt="%Y-%m-%d %H:%M:%S"))
+    slow_query_logger.addHandler(handler)
+    slow_query_logger.setLevel(logging.INFO)
+    slow_query_logger.propagate = False
+
+
+def init_sql_instrumentation(app: Flask) -> None:
+    """Install the engine hooks and the per-request reporting; no-op when disabled in settings."""
+    performance = settings.performance
+    if not performance.sql_instrumentation:
+        return
+
+    if not event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+        event.listen(Engine, "handle_error", _handle_error)
+
+    if performance.slow_query_log:
+        _setup_slow_query_log()
+
+    app.after_request(_finish_request)
+
+    if performance.sql_debug_endpoint:
+        # Imported here: the admin package imports the public routes, which import the db layer
+        from ..admin.decorators import admin_required
+
+        @app.get("/debug/sql")
+        @admin_required
+        def sql_debug() -> Response:
+            return jsonify(
+                {"requests": recent_request_stats(), "pools": pool_status(), "metrics": metrics.snapshot()}
+            )
+
+
+__all__ = [
+    "RequestQueryStats",
+    "current_query_stats",
+    "init_sql_instrumentation",
+    "merge_query_stats",
+    "normalize_statement",
+    "recent_request_stats",
+]
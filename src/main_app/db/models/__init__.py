@@ -1,4 +1,4 @@
-from .category_members import CategoryMemberRecord
+from .category_members import CategoryLangCoverageRecord, CategoryMemberRecord
 from .dashboard import (
     CategoryRecord,
     ProjectRecord,
@@ -10,6 +10,7 @@ from .metrics import (
 )
 from .pages import (
     InProcessRecord,
+    LeaderboardRollupRecord,
     PageRecord,
     PagesUsersToMainRecord,
     UserPageRecord,
@@ -25,6 +26,7 @@ from .qid import (
     QidOthersRecord,
     QidRecord,
 )
+from .schema import SchemaVersionRecord
 from .setting import (
     LanguageSettingRecord,
     SettingRecord,
@@ -40,11 +42,13 @@ from .views import (
     EnwikiPageviewRecord,
     ViewsNewAllRecord,
     ViewsNewRecord,
+    ViewsNewTotalRecord,
 )
 
 __all__ = [
     "AllQidsExistRecord",
     "AssessmentRecord",
+    "CategoryLangCoverageRecord",
     "CategoryMemberRecord",
     "CategoryRecord",
     "AdminUserRecord",
@@ -53,6 +57,7 @@ __all__ = [
     "InProcessRecord",
     "LangRecord",
     "LanguageSettingRecord",
+    "LeaderboardRollupRecord",
     "MdwikiRevidRecord",
     "PageRecord",
     "PagesUsersToMainRecord",
@@ -61,6 +66,7 @@ __all__ = [
     "QidOthersRecord",
     "RefsCountRecord",
     "ReportRecord",
+    "SchemaVersionRecord",
     "SettingRecord",
     "TranslateTypeRecord",
     "UserPageRecord",
@@ -69,5 +75,6 @@ __all__ = [
     "UserTokenRecord",
     "ViewsNewAllRecord",
     "ViewsNewRecord",
+    "ViewsNewTotalRecord",
     "WordRecord",
 ]
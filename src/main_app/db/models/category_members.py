@@ -11,7 +11,7 @@ from __future__ import annotations
 
 from typing import Any
 
-from sqlalchemy import Index, String, UniqueConstraint
+from sqlalchemy import Index, String, UniqueConstraint, text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from ...extensions import db
@@ -53,6 +53,46 @@ class CategoryMemberRecord(db.Model):
         }
 
 
+class CategoryLangCoverageRecord(db.Model):
+    """
+    Per-(category, lang) rollup of category_members x qids x all_qids_exists,
+    kept in sync by CategoryLangCoverageService when
+    settings.performance.coverage_rollup_table is enabled.
+
+    ``titles`` counts the category's members that exist in ``lang``; the row
+    with ``lang = ''`` holds the number of members of the category.
+
+    CREATE TABLE IF NOT EXISTS category_lang_coverage (
+        category varchar(120) COLLATE utf8mb4_unicode_ci NOT NULL,
+        lang varchar(30) COLLATE utf8mb4_unicode_ci NOT NULL,
+        titles int NOT NULL DEFAULT '0',
+        PRIMARY KEY (category, lang)
+    )
+    """
+
+    __tablename__ = "category_lang_coverage"
+
+    category: Mapped[str] = mapped_column(String(120), primary_key=True, nullable=False)
+    lang: Mapped[str] = mapped_column(String(30), primary_key=True, nullable=False)
+    titles: Mapped[int] = mapped_column(nullable=False, default=0, server_default=text("0"))
+
+    def __init__(self, **kwargs: Any) -> None:
+        if "titles" not in kwargs:
+            kwargs["titles"] = 0
+
+        for key, value in kwargs.items():
+            if hasattr(self, key):
+                setattr(self, key, value)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "category": self.category,
+            "lang": self.lang,
+            "titles": self.titles,
+        }
+
+
 __all__ = [
+    "CategoryLangCoverageRecord",
     "CategoryMemberRecord",
 ]
@@ -7,12 +7,34 @@ from __future__ import annotations
 from datetime import date, datetime
 from typing import Any
 
-from sqlalchemy import ForeignKey, String, text
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import BigInteger, Date, ForeignKey, Index, String, text
+from sqlalchemy.orm import Mapped, mapped_column, validates
 
 from ...extensions import db
 
 
+def to_pub_date(value: Any) -> Any:
+    """
+    Derive the ``pub_date`` value from a ``pupdate`` value.
+
+    ``pupdate`` is free text (normally ``YYYY-MM-DD``); anything that does not
+    start with an ISO date maps to None. SQL expressions such as
+    ``func.current_date()`` are passed through unchanged.
+    """
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    if isinstance(value, str):
+        try:
+            return date.fromisoformat(value.strip()[:10])
+        except ValueError:
+            return None
+    return value
+
+
 class PageRecord(db.Model):
     """
     CREATE TABLE IF NOT EXISTS pages (
@@ -26,12 +48,16 @@ class PageRecord(db.Model):
         target varchar(120) COLLATE utf8mb4_unicode_ci DEFAULT NULL,
         date date DEFAULT NULL,
         pupdate varchar(120) COLLATE utf8mb4_unicode_ci DEFAULT NULL,
+        pub_date date DEFAULT NULL,
         add_date timestamp NOT NULL DEFAULT CURRENT_TIMESTAMP,
         deleted int DEFAULT '0',
         mdwiki_revid int DEFAULT NULL,
         PRIMARY KEY (id),
         KEY idx_title (title),
-        KEY target (target)
+        KEY target (target),
+        KEY idx_pages_lang_cat (lang, cat),
+        KEY idx_pages_user_pub_date (user, pub_date),
+        KEY idx_pages_cat_pub_date (cat, pub_date)
     )
     """
 
@@ -49,10 +75,18 @@ class PageRecord(db.Model):
     target: Mapped[str | None] = mapped_column(String(120))
     date: Mapped[date | None] = mapped_column()
     pupdate: Mapped[str | None] = mapped_column(String(120))
+    # Normalised copy of pupdate, kept in sync by _sync_pub_date, so date filters can use range predicates
+    pub_date: Mapped[date | None] = mapped_column(Date)
     add_date: Mapped[datetime] = mapped_column(nullable=False, server_default=db.func.current_timestamp())
     deleted: Mapped[int] = mapped_column(nullable=False, default=0, server_default=text("0"))
     mdwiki_revid: Mapped[int | None] = mapped_column()
 
+    __table_args__ = (
+        Index("idx_pages_lang_cat", "lang", "cat"),
+        Index("idx_pages_user_pub_date", "user", "pub_date"),
+        Index("idx_pages_cat_pub_date", "cat", "pub_date"),
+    )
+
     def __init__(self, **kwargs: Any) -> None:
         # Apply Python-level defaults for fields not provided
         if "deleted" not in kwargs:
@@ -62,6 +96,11 @@ class PageRecord(db.Model):
             if hasattr(self, key):
                 setattr(self, key, value)
 
+    @validates("pupdate")
+    def _sync_pub_date(self, key: str, value: Any) -> Any:
+        self.pub_date = to_pub_date(value)
+        return value
+
     def to_dict(self) -> dict[str, Any]:
         return {
             "id": self.id,
@@ -93,12 +132,16 @@ class UserPageRecord(db.Model):
         target varchar(120) COLLATE utf8mb4_unicode_ci DEFAULT NULL,
         date date DEFAULT NULL,
         pupdate varchar(120) COLLATE utf8mb4_unicode_ci DEFAULT NULL,
+        pub_date date DEFAULT NULL,
         add_date timestamp NOT NULL DEFAULT CURRENT_TIMESTAMP,
         deleted int DEFAULT '0',
         mdwiki_revid int DEFAULT NULL,
         PRIMARY KEY (id),
         KEY idx_title (title),
-        KEY target (target)
+        KEY target (target),
+        KEY idx_pages_users_lang_cat (lang, cat),
+        KEY idx_pages_users_user_pub_date (user, pub_date),
+        KEY idx_pages_users_cat_pub_date (cat, pub_date)
     )
     """
 
@@ -116,10 +159,18 @@ class UserPageRecord(db.Model):
     target: Mapped[str | None] = mapped_column(String(120))
     date: Mapped[date | None] = mapped_column()
     pupdate: Mapped[str | None] = mapped_column(String(120))
+    # Normalised copy of pupdate, kept in sync by _sync_pub_date, so date filters can use range predicates
+    pub_date: Mapped[date | None] = mapped_column(Date)
     add_date: Mapped[datetime] = mapped_column(nullable=False, server_default=db.func.current_timestamp())
     deleted: Mapped[int] = mapped_column(nullable=False, default=0, server_default=text("0"))
     mdwiki_revid: Mapped[int | None] = mapped_column()
 
+    __table_args__ = (
+        Index("idx_pages_users_lang_cat", "lang", "cat"),
+        Index("idx_pages_users_user_pub_date", "user", "pub_date"),
+        Index("idx_pages_users_cat_pub_date", "cat", "pub_date"),
+    )
+
     def __init__(self, **kwargs: Any) -> None:
         # Apply Python-level defaults for fields not provided
         if "deleted" not in kwargs:
@@ -129,6 +180,11 @@ class UserPageRecord(db.Model):
             if hasattr(self, key):
                 setattr(self, key, value)
 
+    @validates("pupdate")
+    def _sync_pub_date(self, key: str, value: Any) -> Any:
+        self.pub_date = to_pub_date(value)
+        return value
+
     def to_dict(self) -> dict[str, Any]:
         return {
             "id": self.id,
@@ -197,7 +253,8 @@ class InProcessRecord(db.Model):
         word int DEFAULT '0',
         add_date timestamp NOT NULL DEFAULT CURRENT_TIMESTAMP,
         PRIMARY KEY (id),
-        KEY title (title)
+        KEY title (title),
+        KEY idx_in_process_lang_title (lang, title)
     )
     """
 
@@ -214,6 +271,8 @@ class InProcessRecord(db.Model):
     word: Mapped[int | None] = mapped_column(default=0, server_default=text("0"))
     add_date: Mapped[datetime] = mapped_column(nullable=False, server_default=db.func.current_timestamp())
 
+    __table_args__ = (Index("idx_in_process_lang_title", "lang", "title"),)
+
     def __init__(self, **kwargs: Any) -> None:
         # Apply Python-level defaults for fields not provided
         if "cat" not in kwargs:
@@ -240,9 +299,72 @@ class InProcessRecord(db.Model):
         }
 
 
+class LeaderboardRollupRecord(db.Model):
+    """
+    Published translations of ``pages`` summed per (user, lang, cat, month),
+    kept in sync by PagesService and ViewsNewService when
+    settings.performance.leaderboard_rollup is enabled.
+
+    Only rows with a target are counted. NULL user/lang/cat are stored as ''
+    and pages without a pub_date as year = month = 0.
+
+    CREATE TABLE IF NOT EXISTS leaderboard_rollup (
+        user varchar(120) COLLATE utf8mb4_unicode_ci NOT NULL,
+        lang varchar(30) COLLATE utf8mb4_unicode_ci NOT NULL,
+        cat varchar(120) COLLATE utf8mb4_unicode_ci NOT NULL,
+        year smallint NOT NULL DEFAULT '0',
+        month tinyint NOT NULL DEFAULT '0',
+        targets int NOT NULL DEFAULT '0',
+        words bigint NOT NULL DEFAULT '0',
+        views bigint NOT NULL DEFAULT '0',
+        PRIMARY KEY (user, lang, cat, year, month),
+        KEY idx_leaderboard_rollup_lang (lang, year, month),
+        KEY idx_leaderboard_rollup_cat (cat, year, month)
+    )
+    """
+
+    __tablename__ = "leaderboard_rollup"
+
+    user: Mapped[str] = mapped_column(String(120), primary_key=True, nullable=False)
+    lang: Mapped[str] = mapped_column(String(30), primary_key=True, nullable=False)
+    cat: Mapped[str] = mapped_column(String(120), primary_key=True, nullable=False)
+    year: Mapped[int] = mapped_column(primary_key=True, nullable=False, default=0, server_default=text("0"))
+    month: Mapped[int] = mapped_column(primary_key=True, nullable=False, default=0, server_default=text("0"))
+    targets: Mapped[int] = mapped_column(nullable=False, default=0, server_default=text("0"))
+    words: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0, server_default=text("0"))
+    views: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0, server_default=text("0"))
+
+    __table_args__ = (
+        Index("idx_leaderboard_rollup_lang", "lang", "year", "month"),
+        Index("idx_leaderboard_rollup_cat", "cat", "year", "month"),
+    )
+
+    def __init__(self, **kwargs: Any) -> None:
+        for key in ("year", "month", "targets", "words", "views"):
+            kwargs.setdefault(key, 0)
+
+        for key, value in kwargs.items():
+            if hasattr(self, key):
+                setattr(self, key, value)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "user": self.user,
+            "lang": self.lang,
+            "cat": self.cat,
+            "year": self.year,
+            "month": self.month,
+            "targets": self.targets,
+            "words": self.words,
+            "views": self.views,
+        }
+
+
 __all__ = [
+    "LeaderboardRollupRecord",
     "PageRecord",
     "UserPageRecord",
     "PagesUsersToMainRecord",
     "InProcessRecord",
+    "to_pub_date",
 ]
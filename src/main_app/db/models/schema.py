@@ -0,0 +1,50 @@
+"""
+Schema bookkeeping models.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from ...extensions import db
+
+
+class SchemaVersionRecord(db.Model):
+    """
+    One row per schema bootstrap that actually ran DDL; the newest row's
+    fingerprint is compared with the models' fingerprint on worker startup.
+
+    CREATE TABLE IF NOT EXISTS schema_version (
+        id int unsigned NOT NULL AUTO_INCREMENT,
+        fingerprint char(64) NOT NULL,
+        applied_at timestamp NOT NULL DEFAULT CURRENT_TIMESTAMP,
+        PRIMARY KEY (id)
+    )
+    """
+
+    __tablename__ = "schema_version"
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    fingerprint: Mapped[str] = mapped_column(String(64), nullable=False)
+    applied_at: Mapped[datetime] = mapped_column(nullable=False, server_default=db.func.current_timestamp())
+
+    def __init__(self, **kwargs: Any) -> None:
+        for key, value in kwargs.items():
+            if hasattr(self, key):
+                setattr(self, key, value)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "id": self.id,
+            "fingerprint": self.fingerprint,
+            "applied_at": self.applied_at,
+        }
+
+
+__all__ = [
+    "SchemaVersionRecord",
+]
@@ -133,8 +133,44 @@ class ViewsNewAllRecord(db.Model):
     )
 
 
+class ViewsNewTotalRecord(db.Model):
+    """
+    Materialised form of the views_new_all VIEW, kept in sync by ViewsNewService
+    when settings.performance.views_summary_table is enabled.
+
+    CREATE TABLE IF NOT EXISTS views_new_totals (
+        target varchar(120) COLLATE utf8mb4_unicode_ci NOT NULL,
+        lang varchar(30) COLLATE utf8mb4_unicode_ci NOT NULL,
+        views int DEFAULT '0',
+        PRIMARY KEY (target, lang)
+    )
+    """
+
+    __tablename__ = "views_new_totals"
+
+    target: Mapped[str] = mapped_column(String(120), primary_key=True, nullable=False)
+    lang: Mapped[str] = mapped_column(String(30), primary_key=True, nullable=False)
+    views: Mapped[int | None] = mapped_column(default=0, server_default=text("0"))
+
+    def __init__(self, **kwargs: Any) -> None:
+        if "views" not in kwargs:
+            kwargs["views"] = 0
+
+        for key, value in kwargs.items():
+            if hasattr(self, key):
+                setattr(self, key, value)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "target": self.target,
+            "lang": self.lang,
+            "views": self.views,
+        }
+
+
 __all__ = [
     "EnwikiPageviewRecord",
     "ViewsNewRecord",
     "ViewsNewAllRecord",
+    "ViewsNewTotalRecord",
 ]
@@ -0,0 +1,173 @@
+"""
+Request-scoped parallel loading of independent queries.
+
+``ParallelLoader`` runs the callables added to it on a thread pool. Each task
+runs in a copy of the current request context, which pushes its own app
+context, so Flask-SQLAlchemy gives it its own session and therefore its own
+pooled connection. The connection goes back to the pool when the task's
+context is torn down. SQL timings recorded on the worker threads are merged
+into the request's (``instrumentation.merge_query_stats``).
+
+All tasks share one deadline (``settings.performance.parallel_loader_timeout_ms``).
+A task still running at the deadline is abandoned: its ``default`` is used and
+its name is listed in ``LoadResult.timed_out``. Python cannot stop the thread,
+so each parallel task runs under a ``statement_budget`` ending at the deadline:
+the database cancels its statement and the task's connection goes back to the
+pool instead of staying checked out after the response was sent. An exception
+raised by a task is re-raised from ``run()``, as it would have been when
+called inline.
+
+With ``settings.performance.parallel_loader_workers`` below 2, or on SQLite
+(whose in-memory test database is one shared connection), the tasks run one
+after another in the calling thread, still bounded by the deadline.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass, field
+from typing import Any
+
+from flask import copy_current_request_context, g, has_app_context, has_request_context
+
+from ..config import settings
+from ..extensions import db
+from ..shared.core.metrics import metrics
+from .exceptions import QueryBudgetExceededError
+from .instrumentation import RequestQueryStats, merge_query_stats
+from .read_replica import read_session
+from .statement_budget import statement_budget
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class _Task:
+    name: str
+    func: Callable[..., Any]
+    args: tuple[Any, ...]
+    kwargs: dict[str, Any]
+    default: Any
+
+
+@dataclass
+class LoadResult:
+    values: dict[str, Any] = field(default_factory=dict)
+    timed_out: list[str] = field(default_factory=list)
+
+    def __getitem__(self, name: str) -> Any:
+        return self.values[name]
+
+
+def _uses_sqlite() -> bool:
+    return has_app_context() and db.engine.name == "sqlite"
+
+
+def parallel_workers() -> int:
+    """Return how many tasks may run at once; 1 means inline."""
+    workers = settings.performance.parallel_loader_workers
+    if workers < 2 or not has_request_context() or _uses_sqlite():
+        return 1
+    return workers
+
+
+@contextmanager
+def _task_budget(name: str, deadline: float | None) -> Iterator[None]:
+    """Cancel the statements a worker task runs past the shared deadline."""
+    # SQLite never runs tasks in parallel (see parallel_workers); its test database is one shared connection
+    if deadline is None or _uses_sqlite():
+        yield
+        return
+
+    budget_ms = max(1, int((deadline - time.monotonic()) * 1000))
+    with ExitStack() as stack:
+        sessions = [db.session, read_session()]
+        for session in dict.fromkeys(sessions):
+            stack.enter_context(statement_budget(f"parallel_loader.{name}", session, budget_ms))
+        yield
+
+
+def _run_in_worker(task: _Task, deadline: float | None) -> tuple[Any, Any]:
+    with _task_budget(task.name, deadline):
+        value = task.func(*task.args, **task.kwargs)
+    return value, g.get("_sql_stats")
+
+
+class ParallelLoader:
+    def __init__(self, max_workers: int | None = None, timeout_ms: int | None = None) -> None:
+        self.max_workers = parallel_workers() if max_workers is None else max_workers
+        self.timeout_ms = settings.performance.parallel_loader_timeout_ms if timeout_ms is None else timeout_ms
+        self._tasks: list[_Task] = []
+
+    def add(self, name: str, func: Callable[..., Any], *args: Any, default: Any = None, **kwargs: Any) -> None:
+        """Queue ``func(*args, **kwargs)``; its result is stored under ``name``."""
+        if any(task.name == name for task in self._tasks):
+            raise ValueError(f"Task {name!r} was already added")
+        self._tasks.append(_Task(name, func, args, kwargs, default))
+
+    def run(self) -> LoadResult:
+        """Run every queued task and return their results."""
+        deadline = time.monotonic() + self.timeout_ms / 1000 if self.timeout_ms > 0 else None
+        tasks, self._tasks = self._tasks, []
+        if self.max_workers < 2 or len(tasks) < 2:
+            result = self._run_inline(tasks, deadline)
+        else:
+            result = self._run_parallel(tasks, deadline)
+
+        for name in result.timed_out:
+            metrics.incr("parallel_loader.timeouts", task=name)
+        if result.timed_out:
+            logger.warning("Parallel loader deadline of %dms passed; skipped %s", self.timeout_ms, result.timed_out)
+        return result
+
+    def _run_inline(self, tasks: list[_Task], deadline: float | None) -> LoadResult:
+        result = LoadResult()
+        for task in tasks:
+            if deadline is not None and time.monotonic() >= deadline:
+                result.values[task.name] = task.default
+                result.timed_out.append(task.name)
+                continue
+            result.values[task.name] = task.func(*task.args, **task.kwargs)
+        return result
+
+    def _run_parallel(self, tasks: list[_Task], deadline: float | None) -> LoadResult:
+        result = LoadResult()
+        pool = ThreadPoolExecutor(max_workers=min(self.max_workers, len(tasks)), thread_name_prefix="parallel-loader")
+        try:
+            futures: dict[Future[tuple[Any, Any]], _Task] = {}
+            for task in tasks:
+                worker = copy_current_request_context(_run_in_worker)
+                futures[pool.submit(worker, task, deadline)] = task
+
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            done, _ = wait(futures, timeout=timeout)
+
+            for future, task in futures.items():
+                if future not in done:
+                    result.values[task.name] = task.default
+                    result.timed_out.append(task.name)
+                    continue
+                try:
+                    value, stats = future.result()
+                except QueryBudgetExceededError:
+                    # Cancelled at the deadline just before wait() returned
+                    result.values[task.name] = task.default
+                    result.timed_out.append(task.name)
+                    continue
+                if isinstance(stats, RequestQueryStats):
+                    merge_query_stats(stats)
+                result.values[task.name] = value
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+        return result
+
+
+__all__ = [
+    "LoadResult",
+    "ParallelLoader",
+    "parallel_workers",
+]
@@ -0,0 +1,167 @@
+"""
+Connection pool telemetry.
+
+``InstrumentedQueuePool`` is a ``QueuePool`` that records, per engine:
+
+- how long checkouts waited for a connection (total and worst case),
+- how many checkouts were served by overflow connections,
+- how many connections were opened and invalidated,
+- the oldest connection age seen at checkout.
+
+The counters are mirrored into ``metrics`` under ``db.pool.*`` labelled with
+the bind name, and ``pool_status()`` combines them with the live pool gauges
+(size, checked in/out, overflow) for the ``/debug/sql`` endpoint.
+
+``Config`` selects this pool class for MySQL engines when
+``settings.performance.pool_telemetry`` is on.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+from flask import Flask, current_app, has_app_context
+from sqlalchemy import event
+from sqlalchemy.pool import ConnectionPoolEntry, QueuePool
+
+from ..extensions import db
+from ..shared.core.metrics import metrics
+
+DEFAULT_BIND_LABEL = "default"
+CONNECTED_AT_KEY = "_pool_connected_at"
+
+
+@dataclass
+class PoolStats:
+    bind: str = DEFAULT_BIND_LABEL
+    checkouts: int = 0
+    wait_ms_total: float = 0.0
+    wait_ms_max: float = 0.0
+    overflow_checkouts: int = 0
+    connects: int = 0
+    invalidations: int = 0
+    max_connection_age_s: float = 0.0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def record_checkout(self, wait_ms: float, overflow: bool) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self.wait_ms_total += wait_ms
+            self.wait_ms_max = max(self.wait_ms_max, wait_ms)
+            if overflow:
+                self.overflow_checkouts += 1
+        metrics.incr("db.pool.checkouts", bind=self.bind)
+        metrics.incr("db.pool.wait_ms", wait_ms, bind=self.bind)
+        if overflow:
+            metrics.incr("db.pool.overflow_checkouts", bind=self.bind)
+
+    def record_connect(self) -> None:
+        with self._lock:
+            self.connects += 1
+        metrics.incr("db.pool.connects", bind=self.bind)
+
+    def record_invalidation(self) -> None:
+        with self._lock:
+            self.invalidations += 1
+        metrics.incr("db.pool.invalidations", bind=self.bind)
+
+    def record_age(self, age_s: float) -> None:
+        with self._lock:
+            self.max_connection_age_s = max(self.max_connection_age_s, age_s)
+
+    def to_dict(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "bind": self.bind,
+                "checkouts": self.checkouts,
+                "wait_ms_total": round(self.wait_ms_total, 3),
+                "wait_ms_max": round(self.wait_ms_max, 3),
+                "wait_ms_avg": round(self.wait_ms_total / self.checkouts, 3) if self.checkouts else 0.0,
+                "overflow_checkouts": self.overflow_checkouts,
+                "connects": self.connects,
+                "invalidations": self.invalidations,
+                "max_connection_age_s": round(self.max_connection_age_s, 1),
+            }
+
+
+class InstrumentedQueuePool(QueuePool):
+    """QueuePool that times checkouts and tracks overflow use (see module docstring)."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        # recreate() passes the old pool's dispatch, which already carries our listeners
+        recreated = "_dispatch" in kwargs
+        super().__init__(*args, **kwargs)
+        self.telemetry = PoolStats()
+        if not recreated:
+            self._listen(self.telemetry)
+
+    def _listen(self, telemetry: PoolStats) -> None:
+        def on_connect(dbapi_connection: Any, connection_record: ConnectionPoolEntry) -> None:
+            connection_record.info[CONNECTED_AT_KEY] = time.monotonic()
+            telemetry.record_connect()
+
+        def on_checkout(dbapi_connection: Any, connection_record: ConnectionPoolEntry, connection_proxy: Any) -> None:
+            connected_at = connection_record.info.get(CONNECTED_AT_KEY)
+            if connected_at is not None:
+                telemetry.record_age(time.monotonic() - connected_at)
+
+        def on_invalidate(dbapi_connection: Any, connection_record: ConnectionPoolEntry, exception: Any) -> None:
+            telemetry.record_invalidation()
+
+        event.listen(self, "connect", on_connect)
+        event.listen(self, "checkout", on_checkout)
+        event.listen(self, "invalidate", on_invalidate)
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        start = time.perf_counter()
+        record = super()._do_get()
+        wait_ms = (time.perf_counter() - start) * 1000
+        self.telemetry.record_checkout(wait_ms, overflow=self.overflow() > 0)
+        return record
+
+    def recreate(self) -> InstrumentedQueuePool:
+        # dispose() swaps in a fresh pool; keep the counters and bind label
+        new_pool = super().recreate()
+        new_pool.telemetry = self.telemetry  # type: ignore[attr-defined]
+        return new_pool  # type: ignore[return-value]
+
+
+def pool_status() -> dict[str, dict[str, Any]]:
+    """Return live gauges and telemetry for every engine's pool, keyed by bind name."""
+    status: dict[str, dict[str, Any]] = {}
+    if not has_app_context() or "sqlalchemy" not in current_app.extensions:
+        return status
+    for key, engine in db.engines.items():
+        pool = engine.pool
+        bind = key or DEFAULT_BIND_LABEL
+        entry: dict[str, Any] = {"pool": type(pool).__name__}
+        if isinstance(pool, QueuePool):
+            entry.update(
+                size=pool.size(),
+                checked_in=pool.checkedin(),
+                checked_out=pool.checkedout(),
+                overflow=pool.overflow(),
+            )
+        if isinstance(pool, InstrumentedQueuePool):
+            entry.update(pool.telemetry.to_dict())
+        status[bind] = entry
+    return status
+
+
+def init_pool_telemetry(app: Flask) -> None:
+    """Label each instrumented pool with its bind name."""
+    with app.app_context():
+        for key, engine in db.engines.items():
+            if isinstance(engine.pool, InstrumentedQueuePool):
+                engine.pool.telemetry.bind = key or DEFAULT_BIND_LABEL
+
+
+__all__ = [
+    "InstrumentedQueuePool",
+    "PoolStats",
+    "init_pool_telemetry",
+    "pool_status",
+]
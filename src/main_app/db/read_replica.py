@@ -0,0 +1,146 @@
+"""
+Read-replica routing for read-only services.
+
+When ``SQLALCHEMY_BINDS`` has a ``"replica"`` entry, ``read_session()`` hands
+out a session bound to the replica engine; otherwise (and outside an app
+context) it returns the primary ``db.session``.
+
+Read-your-writes: any write through the primary session is recorded in the
+Flask session, and for ``settings.performance.read_your_writes_seconds``
+afterwards that browser's reads go to the primary, so a user who just
+published sees their own page even if the replica is lagging.
+
+Reads inside ``primary_reads()`` always use the primary. ``cached_query``
+computes its results that way: an entry stored under a table version that a
+write just bumped must not hold rows a lagging replica returned.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+from flask import Flask, g, has_app_context, has_request_context
+from flask import session as flask_session
+from flask.globals import app_ctx
+from flask_sqlalchemy.session import Session as FlaskSession
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session, scoped_session, sessionmaker
+
+from ..config import settings
+from ..extensions import db
+
+logger = logging.getLogger(__name__)
+
+REPLICA_BIND_KEY = "replica"
+LAST_WRITE_SESSION_KEY = "_db_last_write"
+
+_force_primary: ContextVar[bool] = ContextVar("force_primary_reads", default=False)
+
+
+def _app_ctx_key() -> int:
+    """Scope replica sessions to the current app context, like ``db.session``."""
+    return id(app_ctx._get_current_object())  # type: ignore[attr-defined]
+
+
+_replica_session: scoped_session[Session] = scoped_session(
+    sessionmaker(expire_on_commit=False),
+    scopefunc=_app_ctx_key,
+)
+
+
+def replica_engine() -> Engine | None:
+    """Return the replica engine, or None when no replica is configured."""
+    if not has_app_context():
+        return None
+    return db.engines.get(REPLICA_BIND_KEY)
+
+
+def mark_recent_write() -> None:
+    """Pin the current browser session (and request) to the primary for the read-your-writes window."""
+    if not has_request_context() or replica_engine() is None:
+        return
+    g._db_wrote = True
+    flask_session[LAST_WRITE_SESSION_KEY] = time.time()
+
+
+def recently_wrote() -> bool:
+    if not has_request_context():
+        return False
+    if g.get("_db_wrote"):
+        return True
+    last_write = flask_session.get(LAST_WRITE_SESSION_KEY)
+    if last_write is None:
+        return False
+    return time.time() - float(last_write) < settings.performance.read_your_writes_seconds
+
+
+@contextmanager
+def primary_reads() -> Iterator[None]:
+    """Send every ``read_session()`` read in this block to the primary."""
+    token = _force_primary.set(True)
+    try:
+        yield
+    finally:
+        _force_primary.reset(token)
+
+
+def read_session() -> Session | Any:
+    """
+    Return the session read-only queries should use.
+
+    The replica session when a replica is configured, the caller has not
+    written recently and is not inside ``primary_reads()``, otherwise the
+    primary ``db.session``.
+    """
+    engine = replica_engine()
+    if engine is None or _force_primary.get() or recently_wrote():
+        return db.session
+
+    if not _replica_session.registry.has():
+        return _replica_session(bind=engine)
+    return _replica_session()
+
+
+class ReadOnlyService:
+    """Base for raw-SQL services that only read; their queries are routed by `read_session()`."""
+
+    @property
+    def session(self) -> Session | Any:
+        return read_session()
+
+
+def _after_flush(session: Session, flush_context: Any) -> None:
+    mark_recent_write()
+
+
+def init_read_replica(app: Flask) -> None:
+    """Register the teardown and write-tracking hooks; a no-op when no replica bind is configured."""
+    if REPLICA_BIND_KEY not in (app.config.get("SQLALCHEMY_BINDS") or {}):
+        return
+
+    if not event.contains(FlaskSession, "after_flush", _after_flush):
+        event.listen(FlaskSession, "after_flush", _after_flush)
+
+    @app.teardown_appcontext
+    def _remove_replica_session(exc: BaseException | None) -> None:
+        _replica_session.remove()
+
+    logger.info("Read replica routing enabled")
+
+
+__all__ = [
+    "REPLICA_BIND_KEY",
+    "ReadOnlyService",
+    "init_read_replica",
+    "mark_recent_write",
+    "primary_reads",
+    "read_session",
+    "recently_wrote",
+    "replica_engine",
+]
@@ -0,0 +1,100 @@
+"""
+Versioned schema bootstrap.
+
+Running ``create_all``, the column/index sync and the view re-creation on
+every worker boot costs seconds of DDL and metadata locks. Instead, a
+fingerprint of the model metadata (table/index DDL plus view SQL) is stored
+in ``schema_version``; boot only runs DDL when the stored fingerprint differs
+from the current one. On MySQL the DDL runs under ``GET_LOCK`` so that only
+one worker performs it while the others wait and then see the new fingerprint.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import select, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.schema import CreateIndex, CreateTable
+
+from .exceptions import DatabaseInitError
+
+logger = logging.getLogger(__name__)
+
+SCHEMA_LOCK_NAME = "publish_py_schema_bootstrap"
+SCHEMA_LOCK_TIMEOUT = 120  # seconds
+
+
+def metadata_fingerprint(_db: SQLAlchemy) -> str:
+    """Return a sha256 over the DDL of every table and index and the SQL of every view."""
+    dialect = _db.engine.dialect
+    parts: list[str] = []
+    for table in sorted(_db.metadata.tables.values(), key=lambda t: t.name):
+        if table.info.get("is_view"):
+            create_query = " ".join(str(table.info.get("create_query", "")).split())
+            parts.append(f"VIEW {table.name} {create_query}")
+            continue
+        parts.append(str(CreateTable(table).compile(dialect=dialect)))
+        for index in sorted(table.indexes, key=lambda i: i.name or ""):
+            parts.append(str(CreateIndex(index).compile(dialect=dialect)))
+    return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()
+
+
+def stored_fingerprint(_db: SQLAlchemy) -> str | None:
+    """Return the most recently applied fingerprint, or None if the table is missing or empty."""
+    from .models import SchemaVersionRecord
+
+    stmt = select(SchemaVersionRecord.fingerprint).order_by(SchemaVersionRecord.id.desc()).limit(1)
+    try:
+        with _db.engine.connect() as conn:
+            return conn.execute(stmt).scalar()
+    except SQLAlchemyError:
+        return None
+
+
+def record_fingerprint(_db: SQLAlchemy, fingerprint: str) -> None:
+    from .models import SchemaVersionRecord
+
+    try:
+        with _db.engine.begin() as conn:
+            conn.execute(SchemaVersionRecord.__table__.insert().values(fingerprint=fingerprint))
+    except SQLAlchemyError as exc:
+        raise DatabaseInitError(f"Failed to record schema version: {exc}") from exc
+
+
+@contextmanager
+def schema_lock(engine: Engine, timeout: int = SCHEMA_LOCK_TIMEOUT) -> Iterator[None]:
+    """
+    Hold a database-wide advisory lock for the duration of the block.
+
+    Uses MySQL/MariaDB ``GET_LOCK``; other dialects (SQLite in tests and
+    development) have a single process touching the schema, so no lock is taken.
+    """
+    if engine.dialect.name not in ("mysql", "mariadb"):
+        yield
+        return
+
+    with engine.connect() as conn:
+        acquired = conn.execute(
+            text("SELECT GET_LOCK(:name, :timeout)"),
+            {"name": SCHEMA_LOCK_NAME, "timeout": timeout},
+        ).scalar()
+        if acquired != 1:
+            raise DatabaseInitError(f"Timed out after {timeout}s waiting for the schema bootstrap lock")
+        try:
+            yield
+        finally:
+            conn.execute(text("SELECT RELEASE_LOCK(:name)"), {"name": SCHEMA_LOCK_NAME})
+
+
+__all__ = [
+    "metadata_fingerprint",
+    "record_fingerprint",
+    "schema_lock",
+    "stored_fingerprint",
+]
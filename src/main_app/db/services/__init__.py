@@ -8,19 +8,24 @@ from .analytics import (
     MdwikiRevidService,
     RefsCountService,
     ViewsNewService,
+    ViewsNewTotalsService,
     WordService,
+    views_totals_model,
 )
 from .config import (
     LanguageSettingService,
     SettingsService,
 )
 from .content import (
+    CategoryLangCoverageService,
+    CategoryMemberService,
     CategoryService,
     LangService,
     ProjectService,
 )
 from .pages import (
     InProcessService,
+    LeaderboardRollupService,
     LeaderboardService,
     MissingStatsService,
     PagesQueryService,
@@ -54,11 +59,13 @@ __all__ = [
     "AllQidsService",
     "PagesQueryService",
     "LeaderboardService",
+    "LeaderboardRollupService",
     "MdwikiRevidService",
     "EnwikiPageviewService",
     "AssessmentService",
     "RefsCountService",
     "ViewsNewService",
+    "ViewsNewTotalsService",
     "WordService",
     "FullTranslatorService",
     "UsersNoInprocessService",
@@ -74,10 +81,13 @@ __all__ = [
     "QidService",
     "QidOthersService",
     "MissingStatsService",
+    "CategoryLangCoverageService",
+    "CategoryMemberService",
     "CategoryService",
     "AdminService",
     "UsersService",
     "UserTokenService",
     "SettingsService",
     "LanguageSettingService",
+    "views_totals_model",
 ]
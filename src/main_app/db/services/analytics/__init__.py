@@ -15,6 +15,10 @@ from .refs_count_service import (
 from .views_new_service import (
     ViewsNewService,
 )
+from .views_new_totals_service import (
+    ViewsNewTotalsService,
+    views_totals_model,
+)
 from .word_service import (
     WordService,
 )
@@ -25,5 +29,7 @@ __all__ = [
     "AssessmentService",
     "RefsCountService",
     "ViewsNewService",
+    "ViewsNewTotalsService",
     "WordService",
+    "views_totals_model",
 ]
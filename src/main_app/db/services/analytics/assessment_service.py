@@ -5,6 +5,8 @@ SQLAlchemy-based service for managing assessments.
 from __future__ import annotations
 
 import logging
+from collections.abc import Iterable
+from typing import Any
 
 from sqlalchemy.exc import IntegrityError
 
@@ -62,6 +64,22 @@ class AssessmentService(CRUDService[AssessmentRecord]):
         )
         return instance
 
+    def bulk_add_or_update_assessments(self, rows: Iterable[dict[str, Any]]) -> tuple[int, int]:
+        """Add or update many assessment records keyed by title.
+
+        Each row is a mapping with ``title`` and optional ``importance``.
+        Rows without a title are skipped. Returns ``(inserted, updated)``.
+        """
+        data: list[dict[str, Any]] = []
+        for row in rows:
+            title = (row.get("title") or "").strip()
+            if not title:
+                logger.warning("Skipping assessment row without title: %r", row)
+                continue
+            data.append({"title": title, "importance": row.get("importance")})
+
+        return self.bulk_upsert(data, conflict_keys=("title",), update_columns=("importance",))
+
     def update_assessment(self, assessment_id: int, **kwargs) -> AssessmentRecord:
         """Update an assessment record."""
         return self.update_or_404(assessment_id, **kwargs)
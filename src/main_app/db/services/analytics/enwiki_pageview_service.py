@@ -5,6 +5,8 @@ SQLAlchemy-based service for managing enwiki pageviews.
 from __future__ import annotations
 
 import logging
+from collections.abc import Iterable
+from typing import Any
 
 from sqlalchemy.exc import IntegrityError
 
@@ -66,6 +68,22 @@ class EnwikiPageviewService(CRUDService[EnwikiPageviewRecord]):
         )
         return instance
 
+    def bulk_add_or_update_enwiki_pageviews(self, rows: Iterable[dict[str, Any]]) -> tuple[int, int]:
+        """Add or update many enwiki pageview records keyed by title.
+
+        Each row is a mapping with ``title`` and optional ``en_views``.
+        Rows without a title are skipped. Returns ``(inserted, updated)``.
+        """
+        data: list[dict[str, Any]] = []
+        for row in rows:
+            title = (row.get("title") or "").strip()
+            if not title:
+                logger.warning("Skipping enwiki pageview row without title: %r", row)
+                continue
+            data.append({"title": title, "en_views": row.get("en_views") or 0})
+
+        return self.bulk_upsert(data, conflict_keys=("title",), update_columns=("en_views",))
+
     def update_enwiki_pageview(self, pageview_id: int, **kwargs) -> EnwikiPageviewRecord:
         """Update an enwiki pageview record."""
         return self.update_or_404(pageview_id, **kwargs)
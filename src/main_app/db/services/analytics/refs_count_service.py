@@ -5,6 +5,8 @@ SQLAlchemy-based service for managing refs counts.
 from __future__ import annotations
 
 import logging
+from collections.abc import Iterable
+from typing import Any
 
 from sqlalchemy.exc import IntegrityError
 
@@ -73,6 +75,28 @@ class RefsCountService(CRUDService[RefsCountRecord]):
         )
         return instance
 
+    def bulk_add_or_update_refs_counts(self, rows: Iterable[dict[str, Any]]) -> tuple[int, int]:
+        """Add or update many refs_count records keyed by title.
+
+        Each row is a mapping with ``r_title`` and optional ``r_lead_refs`` / ``r_all_refs``.
+        Rows without a title are skipped. Returns ``(inserted, updated)``.
+        """
+        data: list[dict[str, Any]] = []
+        for row in rows:
+            r_title = (row.get("r_title") or "").strip()
+            if not r_title:
+                logger.warning("Skipping refs_count row without title: %r", row)
+                continue
+            data.append(
+                {
+                    "r_title": r_title,
+                    "r_lead_refs": row.get("r_lead_refs"),
+                    "r_all_refs": row.get("r_all_refs"),
+                }
+            )
+
+        return self.bulk_upsert(data, conflict_keys=("r_title",), update_columns=("r_lead_refs", "r_all_refs"))
+
     def update_refs_count(self, refs_id: int, **kwargs) -> RefsCountRecord:
         """Update a refs_count record."""
         return self.update_or_404(refs_id, **kwargs)
@@ -5,12 +5,16 @@ SQLAlchemy-based service for managing views new.
 from __future__ import annotations
 
 import logging
+from collections.abc import Iterable, Iterator
+from typing import Any
 
 from sqlalchemy.exc import IntegrityError
 
 from ....extensions import db
 from ...models import ViewsNewRecord
-from ..crud_service import CRUDService
+from ..crud_service import DEFAULT_STREAM_BATCH_SIZE, CRUDService
+from ..pages.leaderboard_rollup_service import LeaderboardRollupService, leaderboard_rollup_enabled
+from .views_new_totals_service import ViewsNewTotalsService, views_summary_enabled
 
 logger = logging.getLogger(__name__)
 
@@ -27,6 +31,10 @@ class ViewsNewService(CRUDService[ViewsNewRecord]):
             order_by=[ViewsNewRecord.id.asc()],
         )
 
+    def iter_views_new(self, batch_size: int = DEFAULT_STREAM_BATCH_SIZE) -> Iterator[ViewsNewRecord]:
+        """Yield all views_new records in id order without loading the whole table."""
+        return self.stream(batch_size)  # type: ignore[return-value]
+
     def list_views_by_target(self, target: str, lang: str | None = None) -> list[ViewsNewRecord]:
         """Return views_new records for a specific target."""
         filters = {"target": target}
@@ -73,10 +81,13 @@ class ViewsNewService(CRUDService[ViewsNewRecord]):
             raise ValueError("Language is required")
 
         try:
-            return self.create(target=target, lang=lang, year=year, views=views)
+            record = self.create(target=target, lang=lang, year=year, views=views)
         except IntegrityError:
             raise ValueError(f"Views record for '{target}' in '{lang}' for year {year} already exists") from None
 
+        self._sync_totals([(target, lang)])
+        return record
+
     def add_or_update_views_new(
         self,
         target: str,
@@ -97,11 +108,42 @@ class ViewsNewService(CRUDService[ViewsNewRecord]):
             keys={"target": target, "lang": lang, "year": year},
             views=views,
         )
+        self._sync_totals([(target, lang)])
         return instance
 
+    def bulk_add_or_update_views_new(self, rows: Iterable[dict[str, Any]]) -> tuple[int, int]:
+        """Add or update many views_new records keyed by (target, lang, year).
+
+        Each row is a mapping with ``target``, ``lang``, ``year`` and optional ``views``.
+        Rows without a target or language are skipped. Returns ``(inserted, updated)``.
+        """
+        data: list[dict[str, Any]] = []
+        for row in rows:
+            target = (row.get("target") or "").strip()
+            lang = (row.get("lang") or "").strip()
+            if not target or not lang:
+                logger.warning("Skipping views_new row without target or lang: %r", row)
+                continue
+            data.append({"target": target, "lang": lang, "year": int(row["year"]), "views": row.get("views") or 0})
+
+        result = self.bulk_upsert(data, conflict_keys=("target", "lang", "year"), update_columns=("views",))
+        self._sync_totals((row["target"], row["lang"]) for row in data)
+        return result
+
     def update_views_new(self, view_id: int, **kwargs) -> ViewsNewRecord:
         """Update a views_new record."""
-        return self.update_or_404(view_id, **kwargs)
+        existing = self.get(view_id)
+        old_key = (existing.target, existing.lang) if existing else None
+        record = self.update_or_404(view_id, **kwargs)
+        self._sync_totals([key for key in (old_key, (record.target, record.lang)) if key])
+        return record
+
+    def delete_record(self, record: ViewsNewRecord) -> bool:
+        key = (record.target, record.lang)
+        deleted = super().delete_record(record)
+        if deleted:
+            self._sync_totals([key])
+        return deleted
 
     def get_total_views_for_target(
         self,
@@ -112,6 +154,24 @@ class ViewsNewService(CRUDService[ViewsNewRecord]):
         records = self.list_views_by_target(target, lang)
         return sum(r.views or 0 for r in records)
 
+    def _sync_totals(self, keys: Iterable[tuple[str, str]]) -> None:
+        """Refresh views_new_totals, then leaderboard_rollup, for the touched (target, lang) pairs when enabled.
+
+        The views_new write has already been committed, so a failure here is logged rather than raised;
+        `flask rebuild-views-totals` and `flask rebuild-leaderboard-rollup` bring the tables back in line.
+        """
+        keys = list(keys)
+        if views_summary_enabled():
+            try:
+                ViewsNewTotalsService().refresh_totals(keys)
+            except Exception:
+                logger.exception("Failed to refresh views_new_totals")
+        if leaderboard_rollup_enabled():
+            try:
+                LeaderboardRollupService().refresh_for_targets(keys)
+            except Exception:
+                logger.exception("Failed to refresh leaderboard_rollup")
+
 
 __all__ = [
     "ViewsNewService",
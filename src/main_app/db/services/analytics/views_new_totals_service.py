@@ -0,0 +1,104 @@
+"""
+SQLAlchemy-based service for the views_new_totals summary table.
+
+views_new_totals holds the same rows as the views_new_all VIEW
+(SUM(views) GROUP BY target, lang over views_new) but as a real table with a
+(target, lang) primary key, so leaderboard joins no longer re-aggregate
+views_new on every request. It is only read and maintained when
+settings.performance.views_summary_table is enabled.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Iterable
+
+from sqlalchemy import delete, func, insert, select, tuple_
+
+from ....config import settings
+from ....extensions import db
+from ...models import ViewsNewAllRecord, ViewsNewRecord, ViewsNewTotalRecord
+from ..crud_service import DEFAULT_BULK_CHUNK_SIZE, CRUDService
+
+logger = logging.getLogger(__name__)
+
+
+def views_summary_enabled() -> bool:
+    return settings.performance.views_summary_table
+
+
+def views_totals_model() -> type[ViewsNewTotalRecord] | type[ViewsNewAllRecord]:
+    """Return the model that per-(target, lang) view totals should be read from."""
+    if views_summary_enabled():
+        return ViewsNewTotalRecord
+    return ViewsNewAllRecord
+
+
+class ViewsNewTotalsService(CRUDService[ViewsNewTotalRecord]):
+    model = ViewsNewTotalRecord
+
+    def __init__(self):
+        super().__init__(db.session, ViewsNewTotalRecord)
+
+    def refresh_totals(
+        self,
+        keys: Iterable[tuple[str, str]],
+        chunk_size: int = DEFAULT_BULK_CHUNK_SIZE,
+    ) -> int:
+        """Recompute the totals of the given (target, lang) pairs from views_new.
+
+        Pairs that no longer have any views_new rows are removed. Returns the
+        number of pairs refreshed.
+        """
+        unique_keys = list(dict.fromkeys(keys))
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be a positive integer")
+
+        try:
+            for start in range(0, len(unique_keys), chunk_size):
+                chunk = unique_keys[start : start + chunk_size]
+                self.session.execute(
+                    delete(ViewsNewTotalRecord).where(
+                        tuple_(ViewsNewTotalRecord.target, ViewsNewTotalRecord.lang).in_(chunk)
+                    )
+                )
+                self.session.execute(
+                    self._insert_totals(tuple_(ViewsNewRecord.target, ViewsNewRecord.lang).in_(chunk))
+                )
+            self.commit()
+        except Exception:
+            self.session.rollback()
+            raise
+
+        return len(unique_keys)
+
+    def rebuild(self) -> int:
+        """Rebuild views_new_totals from scratch. Returns the number of rows written."""
+        try:
+            self.session.execute(delete(ViewsNewTotalRecord))
+            self.session.execute(self._insert_totals())
+            self.commit()
+        except Exception:
+            self.session.rollback()
+            logger.exception("Failed to rebuild views_new_totals")
+            raise
+
+        return self.count()
+
+    def _insert_totals(self, condition=None):
+        totals = select(
+            ViewsNewRecord.target,
+            ViewsNewRecord.lang,
+            func.coalesce(func.sum(ViewsNewRecord.views), 0),
+        )
+        if condition is not None:
+            totals = totals.where(condition)
+        totals = totals.group_by(ViewsNewRecord.target, ViewsNewRecord.lang)
+        return insert(ViewsNewTotalRecord).from_select(["target", "lang", "views"], totals)
+
+
+__all__ = [
+    "ViewsNewTotalsService",
+    "views_summary_enabled",
+    "views_totals_model",
+]
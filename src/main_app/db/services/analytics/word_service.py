@@ -5,6 +5,8 @@ SQLAlchemy-based service for managing words.
 from __future__ import annotations
 
 import logging
+from collections.abc import Iterable
+from typing import Any
 
 from sqlalchemy.exc import IntegrityError
 
@@ -69,6 +71,28 @@ class WordService(CRUDService[WordRecord]):
         )
         return instance
 
+    def bulk_add_or_update_words(self, rows: Iterable[dict[str, Any]]) -> tuple[int, int]:
+        """Add or update many word records keyed by title.
+
+        Each row is a mapping with ``w_title`` and optional ``w_lead_words`` / ``w_all_words``.
+        Rows without a title are skipped. Returns ``(inserted, updated)``.
+        """
+        data: list[dict[str, Any]] = []
+        for row in rows:
+            w_title = (row.get("w_title") or "").strip()
+            if not w_title:
+                logger.warning("Skipping word row without title: %r", row)
+                continue
+            data.append(
+                {
+                    "w_title": w_title,
+                    "w_lead_words": row.get("w_lead_words"),
+                    "w_all_words": row.get("w_all_words"),
+                }
+            )
+
+        return self.bulk_upsert(data, conflict_keys=("w_title",), update_columns=("w_lead_words", "w_all_words"))
+
     def update_word(self, word_id: int, **kwargs) -> WordRecord:
         """Update a word record."""
         return self.update_or_404(word_id, **kwargs)
@@ -1,5 +1,12 @@
 """Content db services."""
 
+from .category_coverage_service import (
+    CategoryLangCoverageService,
+    coverage_rollup_enabled,
+)
+from .category_member_service import (
+    CategoryMemberService,
+)
 from .category_service import (
     CategoryService,
 )
@@ -11,6 +18,9 @@ from .project_service import (
 )
 
 __all__ = [
+    "CategoryLangCoverageService",
+    "coverage_rollup_enabled",
+    "CategoryMemberService",
     "CategoryService",
     "LangService",
     "ProjectService",
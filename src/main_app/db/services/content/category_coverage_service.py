@@ -0,0 +1,129 @@
+"""
+SQLAlchemy-based service for the category_lang_coverage rollup table.
+
+category_lang_coverage holds, per (category, lang), how many members of the
+category exist in the language (category_members -> qids -> all_qids_exists),
+plus a ``lang = ''`` row with the member count. ``/td/missing`` reads it with
+one primary-key range scan instead of re-running the join and GROUP BY. It is
+only read and maintained when settings.performance.coverage_rollup_table is
+enabled.
+
+Category membership written through CategoryMemberService and qids written
+through the qid services are patched right away. all_qids_exists is loaded by
+the import jobs; they call ``refresh_for_qids`` for the rows they touched, or
+``flask rebuild-category-coverage`` after a bulk load.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Iterable
+
+from sqlalchemy import delete, func, insert, literal, select
+
+from ....config import settings
+from ....extensions import db
+from ...models import AllQidsExistRecord, CategoryLangCoverageRecord, CategoryMemberRecord, QidRecord
+from ..crud_service import DEFAULT_BULK_CHUNK_SIZE, CRUDService
+
+logger = logging.getLogger(__name__)
+
+MEMBERS_LANG = ""
+
+
+def coverage_rollup_enabled() -> bool:
+    return settings.performance.coverage_rollup_table
+
+
+class CategoryLangCoverageService(CRUDService[CategoryLangCoverageRecord]):
+    model = CategoryLangCoverageRecord
+
+    def __init__(self):
+        super().__init__(db.session, CategoryLangCoverageRecord)
+
+    def refresh_categories(
+        self,
+        categories: Iterable[str],
+        chunk_size: int = DEFAULT_BULK_CHUNK_SIZE,
+    ) -> int:
+        """Recompute the rows of the given categories. Returns the number of categories refreshed."""
+        unique_categories = [c for c in dict.fromkeys(categories) if c]
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be a positive integer")
+        if not unique_categories:
+            return 0
+
+        try:
+            for start in range(0, len(unique_categories), chunk_size):
+                chunk = unique_categories[start : start + chunk_size]
+                self.session.execute(
+                    delete(CategoryLangCoverageRecord).where(CategoryLangCoverageRecord.category.in_(chunk))
+                )
+                self._insert_rollup(chunk)
+            self.commit()
+        except Exception:
+            self.session.rollback()
+            raise
+
+        return len(unique_categories)
+
+    def refresh_for_titles(self, titles: Iterable[str], chunk_size: int = DEFAULT_BULK_CHUNK_SIZE) -> int:
+        """Refresh every category that contains one of ``titles``."""
+        unique_titles = list(dict.fromkeys(titles))
+        categories: list[str] = []
+        for start in range(0, len(unique_titles), chunk_size):
+            chunk = unique_titles[start : start + chunk_size]
+            stmt = select(CategoryMemberRecord.category).where(CategoryMemberRecord.article_id.in_(chunk)).distinct()
+            categories.extend(self.session.scalars(stmt))
+        return self.refresh_categories(categories, chunk_size)
+
+    def refresh_for_qids(self, qids: Iterable[str], chunk_size: int = DEFAULT_BULK_CHUNK_SIZE) -> int:
+        """Refresh every category with a member whose qid is in ``qids`` (after all_qids_exists writes)."""
+        unique_qids = list(dict.fromkeys(qids))
+        titles: list[str] = []
+        for start in range(0, len(unique_qids), chunk_size):
+            chunk = unique_qids[start : start + chunk_size]
+            titles.extend(self.session.scalars(select(QidRecord.title).where(QidRecord.qid.in_(chunk))))
+        return self.refresh_for_titles(titles, chunk_size)
+
+    def rebuild(self) -> int:
+        """Rebuild category_lang_coverage from scratch. Returns the number of rows written."""
+        try:
+            self.session.execute(delete(CategoryLangCoverageRecord))
+            self._insert_rollup()
+            self.commit()
+        except Exception:
+            self.session.rollback()
+            logger.exception("Failed to rebuild category_lang_coverage")
+            raise
+
+        return self.count()
+
+    def _insert_rollup(self, categories: list[str] | None = None) -> None:
+        members = select(
+            CategoryMemberRecord.category,
+            literal(MEMBERS_LANG),
+            func.count(CategoryMemberRecord.article_id),
+        ).group_by(CategoryMemberRecord.category)
+
+        covered = (
+            select(CategoryMemberRecord.category, AllQidsExistRecord.code, func.count())
+            .join(QidRecord, QidRecord.title == CategoryMemberRecord.article_id)
+            .join(AllQidsExistRecord, AllQidsExistRecord.qid == QidRecord.qid)
+            .where(AllQidsExistRecord.code.is_not(None), AllQidsExistRecord.code != MEMBERS_LANG)
+            .group_by(CategoryMemberRecord.category, AllQidsExistRecord.code)
+        )
+
+        if categories is not None:
+            members = members.where(CategoryMemberRecord.category.in_(categories))
+            covered = covered.where(CategoryMemberRecord.category.in_(categories))
+
+        columns = ["category", "lang", "titles"]
+        self.session.execute(insert(CategoryLangCoverageRecord).from_select(columns, members))
+        self.session.execute(insert(CategoryLangCoverageRecord).from_select(columns, covered))
+
+
+__all__ = [
+    "CategoryLangCoverageService",
+    "coverage_rollup_enabled",
+]
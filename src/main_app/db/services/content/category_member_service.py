@@ -5,12 +5,14 @@ SQLAlchemy-based service for managing category_members table.
 from __future__ import annotations
 
 import logging
+from collections.abc import Iterable
 
 from sqlalchemy import text
 
 from ....extensions import db
 from ...models import CategoryMemberRecord
 from ..crud_service import CRUDService
+from .category_coverage_service import CategoryLangCoverageService, coverage_rollup_enabled
 
 logger = logging.getLogger(__name__)
 
@@ -60,10 +62,44 @@ class CategoryMemberService(CRUDService[CategoryMemberRecord]):
             if existing:
                 return True
             self.create(category=category, article_id=article_id)
-            return True
         except Exception:
             logger.exception("Failed to add category member %s / %s", category, article_id)
             return False
+        self._sync_coverage([category])
+        return True
+
+    def sync_category_members(self, category: str, titles: list[str]) -> int:
+        """Insert the *titles* of *category* that are not stored yet; returns how many were added.
+
+        Only reads the rows of *category*, unlike ``batch_sync_category_members``.
+        """
+
+        existing = {
+            row.article_id
+            for row in self.session.query(CategoryMemberRecord.article_id).filter(
+                CategoryMemberRecord.category == category
+            )
+        }
+        new_rows = [
+            {"category": category, "article_id": title}
+            for title in dict.fromkeys(titles)
+            if title and title not in existing
+        ]
+        if not new_rows:
+            return 0
+        try:
+            self.session.execute(
+                text("INSERT INTO category_members (category, article_id) VALUES (:category, :article_id)"),
+                new_rows,
+            )
+            self.commit()
+        except Exception:
+            logger.exception("Failed to sync members of category %s", category)
+            self.session.rollback()
+            raise
+        logger.info("Inserted %s new members of category %s", len(new_rows), category)
+        self._sync_coverage([category])
+        return len(new_rows)
 
     def batch_sync_category_members(self, data: list[dict]) -> None:
         """Insert only new category_member rows, skipping existing ones.
@@ -94,7 +130,7 @@ class CategoryMemberService(CRUDService[CategoryMemberRecord]):
                     ),
                     new_rows,
                 )
-                self.session.commit()
+                self.commit()
                 logger.info("Inserted %s new category_member rows", len(new_rows))
             else:
                 logger.info("No new category_member rows to insert")
@@ -102,6 +138,27 @@ class CategoryMemberService(CRUDService[CategoryMemberRecord]):
             logger.exception("Failed to sync category members")
             self.session.rollback()
             raise
+        self._sync_coverage(row["category"] for row in new_rows)
+
+    def delete_record(self, record: CategoryMemberRecord) -> bool:
+        category = record.category
+        deleted = super().delete_record(record)
+        if deleted:
+            self._sync_coverage([category])
+        return deleted
+
+    def _sync_coverage(self, categories: Iterable[str]) -> None:
+        """Refresh category_lang_coverage for the touched categories when the rollup is enabled.
+
+        The category_members write has already been committed, so a failure here is logged rather than raised;
+        `flask rebuild-category-coverage` brings the table back in line.
+        """
+        if not coverage_rollup_enabled():
+            return
+        try:
+            CategoryLangCoverageService().refresh_categories(categories)
+        except Exception:
+            logger.exception("Failed to refresh category_lang_coverage")
 
 
 __all__ = [
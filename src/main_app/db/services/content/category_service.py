@@ -13,6 +13,7 @@ from ....extensions import db
 from ...exceptions import RecordNotFoundError
 from ...models import CategoryRecord
 from ..crud_service import CRUDService
+from ..utils.query_cache import cached_query
 
 logger = logging.getLogger(__name__)
 
@@ -108,6 +109,11 @@ class CategoryService(CRUDService[CategoryRecord]):
             order_by=[CategoryRecord.id.asc()],
         )
 
+    @cached_query("categories")
+    def list_categories_as_dicts(self) -> list[dict[str, Any]]:
+        """Return all categories as dicts, cached until the table is written."""
+        return [record.to_dict() for record in self.list_categories()]
+
     def get_camp_to_cats(self) -> dict[str, str]:
         """Retrieve campaign to category mapping from database."""
         categories = self.list_categories()
@@ -5,12 +5,14 @@ SQLAlchemy-based service for managing languages.
 from __future__ import annotations
 
 import logging
+from typing import Any
 
 from sqlalchemy.exc import IntegrityError
 
 from ....extensions import db
 from ...models import LangRecord
 from ..crud_service import CRUDService
+from ..utils.query_cache import cached_query
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +31,11 @@ class LangService(CRUDService[LangRecord]):
             order_by=[LangRecord.lang_id.asc()],
         )
 
+    @cached_query("langs")
+    def list_langs_as_dicts(self) -> list[dict[str, Any]]:
+        """Return all language records as dicts, cached until the table is written."""
+        return [record.to_dict() for record in self.list_langs()]
+
     def get_lang(self, lang_id: int) -> LangRecord | None:
         """Get a language record by ID."""
         orm_obj = self.get(lang_id)
@@ -5,17 +5,25 @@ Generic CRUD service/repository for Flask-SQLAlchemy models.
 from __future__ import annotations
 
 import logging
-from collections.abc import Iterable, Sequence
+from collections.abc import Iterable, Iterator, Sequence
 from typing import Any, TypeVar
 
-from sqlalchemy import Select, func, select
+from sqlalchemy import Row, Select, func, inspect, select, tuple_
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
-from ..exceptions import RecordNotFoundError
+from ..exceptions import CRUDError, RecordNotFoundError
+from ..read_replica import mark_recent_write
+from .utils.query_cache import bump_table_version
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_BULK_CHUNK_SIZE = 1000
+DEFAULT_STREAM_BATCH_SIZE = 1000
+
 ModelT = TypeVar("ModelT")  # , bound=db.Model
 PKT = TypeVar("PKT")  # primary key type, e.g. int, str, uuid.UUID
 
@@ -103,6 +111,76 @@ class CRUDService[ModelT]:
             logger.error("Error listing %s records: %s", self.model_name, exc)
             return []
 
+    def iter_batches(
+        self,
+        batch_size: int = DEFAULT_STREAM_BATCH_SIZE,
+        *,
+        filters: dict[str, Any] | None = None,
+        columns: Sequence[str] | None = None,
+    ) -> Iterator[list[ModelT] | list[Row[Any]]]:
+        """
+        Walk the table in primary-key order, yielding one list of at most `batch_size` rows at a time.
+
+        Uses keyset pagination (``WHERE pk > :last ORDER BY pk LIMIT :n``) instead of OFFSET, so every batch is a
+        cheap index range scan no matter how deep into the table it is, and only one batch is held in memory.
+
+        `filters` is the same column=value equality mapping accepted by `list`. When `columns` is given, lightweight
+        ``Row`` tuples with just those columns are yielded instead of ORM instances; the primary key column is
+        appended when it is not listed, because it drives the pagination.
+
+        Raises:
+            ValueError: If `batch_size` is not positive.
+            CRUDError: If the model has a composite primary key.
+        """
+        if batch_size <= 0:
+            raise ValueError("iter_batches batch_size must be positive")
+
+        pk_columns = inspect(self.model).primary_key  # type: ignore[union-attr]
+        if len(pk_columns) != 1:
+            raise CRUDError(f"iter_batches requires a single-column primary key on {self.model_name}")
+        pk_column = pk_columns[0]
+
+        if columns:
+            table = self.model.__table__  # type: ignore[attr-defined]
+            selected = [table.c[name] for name in columns]
+            if pk_column.name not in columns:
+                selected.append(pk_column)
+            base = select(*selected)
+            pk_index = [column.name for column in selected].index(pk_column.name)
+        else:
+            base = self._base_select()
+            pk_index = None
+
+        if filters:
+            base = base.filter_by(**filters)
+        base = base.order_by(pk_column.asc()).limit(batch_size).execution_options(yield_per=batch_size)
+
+        last_pk: Any = None
+        while True:
+            stmt = base if last_pk is None else base.where(pk_column > last_pk)
+            result = self.session.execute(stmt)
+            batch = list(result.all()) if pk_index is not None else list(result.scalars().all())
+            if not batch:
+                return
+
+            yield batch
+
+            if len(batch) < batch_size:
+                return
+            last_row = batch[-1]
+            last_pk = last_row[pk_index] if pk_index is not None else getattr(last_row, pk_column.key)
+
+    def stream(
+        self,
+        batch_size: int = DEFAULT_STREAM_BATCH_SIZE,
+        *,
+        filters: dict[str, Any] | None = None,
+        columns: Sequence[str] | None = None,
+    ) -> Iterator[ModelT | Row[Any]]:
+        """Yield rows one at a time from `iter_batches`; see there for the arguments."""
+        for batch in self.iter_batches(batch_size, filters=filters, columns=columns):
+            yield from batch
+
     def list_by_statement(self, stmt: Select[tuple[ModelT]]) -> Sequence[ModelT]:
         """Escape hatch: run a caller-built Select and return scalar results."""
         return self.session.execute(stmt).scalars().all()
@@ -276,6 +354,77 @@ class CRUDService[ModelT]:
             logger.error("Error bulk creating %s: %s", self.model_name, exc)
         return instances
 
+    def bulk_upsert(
+        self,
+        rows: Iterable[dict[str, Any]],
+        conflict_keys: Sequence[str],
+        update_columns: Sequence[str] | None = None,
+        chunk_size: int = DEFAULT_BULK_CHUNK_SIZE,
+    ) -> tuple[int, int]:
+        """
+        Insert `rows`, updating the existing row whenever a row collides on `conflict_keys`.
+
+        Runs one multi-row ``INSERT ... ON DUPLICATE KEY UPDATE`` (MySQL) or ``INSERT ... ON CONFLICT DO UPDATE``
+        (SQLite/PostgreSQL) per chunk, straight against the table: no ORM instances are built, loaded or refreshed.
+
+        Important notes:
+        - `conflict_keys` must be backed by a unique constraint (or the primary key) in the database, otherwise the
+          statement can never detect the conflict and will insert duplicates.
+        - Rows repeating the same `conflict_keys` inside one call are collapsed; the last one wins.
+        - Inserted/updated counts come from one lightweight key lookup per chunk, because the MySQL affected-rows
+          value cannot tell an insert from an unchanged update.
+
+        Args:
+            rows: Column=value mappings. Every row must provide the same columns, including `conflict_keys`.
+            conflict_keys: Columns of the unique constraint that identifies a row.
+            update_columns: Columns to overwrite on conflict. Defaults to every provided column except
+                `conflict_keys`. Pass an empty sequence to keep existing rows untouched.
+            chunk_size: Maximum number of rows sent per statement (and committed per transaction).
+
+        Returns:
+            tuple: (inserted, updated) row counts.
+
+        Raises:
+            ValueError: If `conflict_keys` is empty, `chunk_size` is not positive, or a row is missing a conflict key.
+            CRUDError: If the database dialect has no native upsert support.
+        """
+        if not conflict_keys:
+            raise ValueError("bulk_upsert requires at least one conflict key")
+        if chunk_size <= 0:
+            raise ValueError("bulk_upsert chunk_size must be positive")
+
+        # Collapse duplicates on the conflict identity, keeping the last row (matches sequential upsert_by calls).
+        unique_rows: dict[tuple[Any, ...], dict[str, Any]] = {}
+        for row in rows:
+            missing = [key for key in conflict_keys if key not in row]
+            if missing:
+                raise ValueError(f"bulk_upsert: row is missing conflict keys {missing}")
+            unique_rows[tuple(row[key] for key in conflict_keys)] = row
+
+        if not unique_rows:
+            return 0, 0
+
+        pending = list(unique_rows.values())
+        if update_columns is None:
+            update_columns = [column for column in pending[0] if column not in conflict_keys]
+
+        inserted = 0
+        updated = 0
+        for start in range(0, len(pending), chunk_size):
+            chunk = pending[start : start + chunk_size]
+            existing = self._count_existing_keys(chunk, conflict_keys)
+            try:
+                self.session.execute(self._upsert_statement(chunk, conflict_keys, update_columns))
+                self.commit()
+            except Exception as exc:
+                self.session.rollback()
+                logger.error("Error bulk upserting %s: %s", self.model_name, exc)
+                raise
+            inserted += len(chunk) - existing
+            updated += existing
+
+        return inserted, updated
+
     def delete(self, pk: PKT) -> bool:  # pyright: ignore[reportInvalidTypeVarUse]
         """Delete a record by primary key.
 
@@ -335,6 +484,47 @@ class CRUDService[ModelT]:
         except Exception:
             self.session.rollback()
             raise
+        table_name = getattr(self.model, "__tablename__", None)
+        if table_name:
+            bump_table_version(table_name)
+        mark_recent_write()
+
+    def _count_existing_keys(self, chunk: Sequence[dict[str, Any]], conflict_keys: Sequence[str]) -> int:
+        table = self.model.__table__  # type: ignore[attr-defined]
+        key_columns = [table.c[key] for key in conflict_keys]
+        if len(key_columns) == 1:
+            condition = key_columns[0].in_([row[conflict_keys[0]] for row in chunk])
+        else:
+            condition = tuple_(*key_columns).in_([tuple(row[key] for key in conflict_keys) for row in chunk])
+        stmt = select(func.count()).select_from(table).where(condition)
+        return int(self.session.execute(stmt).scalar_one())
+
+    def _upsert_statement(
+        self,
+        chunk: Sequence[dict[str, Any]],
+        conflict_keys: Sequence[str],
+        update_columns: Sequence[str],
+    ) -> Any:
+        table = self.model.__table__  # type: ignore[attr-defined]
+        dialect = self.session.get_bind().dialect.name
+
+        if dialect in ("mysql", "mariadb"):
+            stmt = mysql_insert(table).values(list(chunk))
+            # ON DUPLICATE KEY UPDATE needs at least one assignment; a self-assignment keeps the row untouched.
+            columns = update_columns or conflict_keys[:1]
+            return stmt.on_duplicate_key_update({column: stmt.inserted[column] for column in columns})
+
+        if dialect in ("sqlite", "postgresql"):
+            insert = sqlite_insert if dialect == "sqlite" else postgresql_insert
+            stmt = insert(table).values(list(chunk))
+            if not update_columns:
+                return stmt.on_conflict_do_nothing(index_elements=list(conflict_keys))
+            return stmt.on_conflict_do_update(
+                index_elements=list(conflict_keys),
+                set_={column: stmt.excluded[column] for column in update_columns},
+            )
+
+        raise CRUDError(f"bulk_upsert is not supported for the {dialect!r} dialect")
 
     def _base_select(self) -> Select[tuple[ModelT]]:
         return select(self.model)
@@ -1,6 +1,7 @@
 """Pages db services."""
 
 from .in_process_service import InProcessService
+from .leaderboard_rollup_service import LeaderboardRollupService, leaderboard_rollup_enabled
 from .leaderboard_service import LeaderboardService
 from .missing_stats_service import MissingStatsService
 from .pages_query_service import PagesQueryService
@@ -13,6 +14,8 @@ __all__ = [
     "Results2026Service",
     "MissingStatsService",
     "LeaderboardService",
+    "LeaderboardRollupService",
+    "leaderboard_rollup_enabled",
     "PagesUsersToMainPagesService",
     "TranslateTypeService",
     "InProcessService",
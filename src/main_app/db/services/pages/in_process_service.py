@@ -5,16 +5,30 @@ SQLAlchemy-based service for managing in-process translations.
 from __future__ import annotations
 
 import logging
+from collections.abc import Iterable
+from typing import Any
 
-from sqlalchemy import func
+from sqlalchemy import func, select
 from sqlalchemy.exc import IntegrityError
 
 from ....extensions import db
-from ...models import InProcessRecord
-from ..crud_service import CRUDService
+from ...models import CategoryMemberRecord, InProcessRecord
+from ..crud_service import DEFAULT_BULK_CHUNK_SIZE, CRUDService
 
 logger = logging.getLogger(__name__)
 
+# Columns the results tables read from in_process rows
+_RESULT_COLUMNS = (
+    InProcessRecord.id,
+    InProcessRecord.title,
+    InProcessRecord.user,
+    InProcessRecord.lang,
+    InProcessRecord.cat,
+    InProcessRecord.translate_type,
+    InProcessRecord.word,
+    InProcessRecord.add_date,
+)
+
 
 class InProcessService(CRUDService[InProcessRecord]):
     model = InProcessRecord
@@ -42,6 +56,62 @@ class InProcessService(CRUDService[InProcessRecord]):
             order_by=[InProcessRecord.id.asc()],
         )
 
+    def list_in_process_by_lang_titles(
+        self,
+        lang: str,
+        titles: Iterable[str],
+        chunk_size: int = DEFAULT_BULK_CHUNK_SIZE,
+    ) -> list[dict[str, Any]]:
+        """
+        Return in_process rows for ``lang`` whose title is in ``titles``, as dicts.
+
+        SELECT id, title, user, lang, cat, translate_type, word, add_date
+        FROM in_process WHERE lang = :lang AND title IN (...)
+
+        The title set is sent in chunks of ``chunk_size``; served by
+        idx_in_process_lang_title.
+        """
+        unique_titles = list(dict.fromkeys(titles))
+        if not lang or not unique_titles:
+            return []
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be a positive integer")
+
+        rows: list[dict[str, Any]] = []
+        for start in range(0, len(unique_titles), chunk_size):
+            chunk = unique_titles[start : start + chunk_size]
+            stmt = (
+                select(*_RESULT_COLUMNS)
+                .where(InProcessRecord.lang == lang, InProcessRecord.title.in_(chunk))
+                .order_by(InProcessRecord.id.asc())
+            )
+            rows.extend(dict(row._mapping) for row in self.session.execute(stmt))
+        rows.sort(key=lambda row: row["id"])
+        return rows
+
+    def list_in_process_by_lang_category(self, lang: str, category: str) -> list[dict[str, Any]]:
+        """
+        Return in_process rows for ``lang`` whose title is a member of ``category``, as dicts.
+
+        SELECT ip.id, ip.title, ip.user, ip.lang, ip.cat, ip.translate_type, ip.word, ip.add_date
+        FROM in_process ip
+        JOIN category_members cm ON cm.article_id = ip.title AND cm.category = :category
+        WHERE ip.lang = :lang
+        """
+        if not lang or not category:
+            return []
+        stmt = (
+            select(*_RESULT_COLUMNS)
+            .join(
+                CategoryMemberRecord,
+                (CategoryMemberRecord.article_id == InProcessRecord.title)
+                & (CategoryMemberRecord.category == category),
+            )
+            .where(InProcessRecord.lang == lang)
+            .order_by(InProcessRecord.id.asc())
+        )
+        return [dict(row._mapping) for row in self.session.execute(stmt)]
+
     def get_in_process(self, process_id: int) -> InProcessRecord | None:
         """Get an in_process record by ID."""
         orm_obj = self.get(process_id)
@@ -0,0 +1,224 @@
+"""
+SQLAlchemy-based service for the leaderboard_rollup table.
+
+leaderboard_rollup holds the published translations of ``pages`` summed per
+(user, lang, cat, year, month): targets, words (same rule as the leaderboard:
+``pages.word``, else the words table by translate_type) and views (from
+``views_totals_model()``). The leaderboard endpoints group and filter those
+rows instead of joining pages with words and views on every hit. It is only
+read and maintained when settings.performance.leaderboard_rollup is enabled.
+
+PagesService refreshes the buckets of the pages it writes and ViewsNewService
+those of the targets whose views changed. Bulk imports of pages, words or
+views are followed by ``flask rebuild-leaderboard-rollup``.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Iterable
+from datetime import date
+from typing import Any, NamedTuple
+
+from sqlalchemy import Integer, and_, case, cast, delete, func, insert, or_, select, tuple_
+from sqlalchemy.orm.query import Query
+
+from ....config import settings
+from ....extensions import db
+from ...models import CategoryRecord, LeaderboardRollupRecord, PageRecord, UserRecord, WordRecord
+from ..analytics.views_new_totals_service import views_totals_model
+from ..crud_service import CRUDService
+from ..utils.date_ranges import date_range_condition
+
+logger = logging.getLogger(__name__)
+
+# Buckets per statement; each bucket adds an OR branch to the pages scan
+ROLLUP_CHUNK_SIZE = 200
+
+
+class RollupKey(NamedTuple):
+    user: str
+    lang: str
+    cat: str
+    year: int
+    month: int
+
+
+def leaderboard_rollup_enabled() -> bool:
+    return settings.performance.leaderboard_rollup
+
+
+def rollup_key(user: str | None, lang: str | None, cat: str | None, pub_date: date | None) -> RollupKey:
+    """Return the leaderboard_rollup bucket a page with these values is counted in."""
+    if isinstance(pub_date, date):
+        return RollupKey(user or "", lang or "", cat or "", pub_date.year, pub_date.month)
+    return RollupKey(user or "", lang or "", cat or "", 0, 0)
+
+
+def apply_rollup_filters(
+    query: Query,
+    cat: str | None = None,
+    camp: str | None = None,
+    user_group: str | None = None,
+    year: int | None = None,
+    month: int | None = None,
+) -> Query:
+    """Apply the leaderboard filters (``top_stats_routes.apply_filters``) to a leaderboard_rollup query."""
+    if cat:
+        query = query.filter(LeaderboardRollupRecord.cat == cat)
+    elif camp:
+        query = query.join(
+            CategoryRecord,
+            (LeaderboardRollupRecord.cat == CategoryRecord.category) & (CategoryRecord.campaign == camp),
+        )
+
+    if user_group:
+        query = query.join(
+            UserRecord,
+            (LeaderboardRollupRecord.user == UserRecord.username) & (UserRecord.user_group == user_group),
+        )
+
+    if year:
+        query = query.filter(LeaderboardRollupRecord.year == year)
+        if month:
+            query = query.filter(LeaderboardRollupRecord.month == month)
+
+    return query
+
+
+def _text_matches(column: Any, value: str) -> Any:
+    """``coalesce(column, '') = value`` written so the column index stays usable."""
+    if value:
+        return column == value
+    return or_(column == "", column.is_(None))
+
+
+def _bucket_condition(key: RollupKey) -> Any:
+    if key.year:
+        period = date_range_condition(PageRecord.pub_date, key.year, key.month or None)
+    else:
+        period = PageRecord.pub_date.is_(None)
+    return and_(
+        _text_matches(PageRecord.user, key.user),
+        _text_matches(PageRecord.lang, key.lang),
+        _text_matches(PageRecord.cat, key.cat),
+        period,
+    )
+
+
+class LeaderboardRollupService(CRUDService[LeaderboardRollupRecord]):
+    model = LeaderboardRollupRecord
+
+    def __init__(self):
+        super().__init__(db.session, LeaderboardRollupRecord)
+
+    def refresh_keys(self, keys: Iterable[RollupKey], chunk_size: int = ROLLUP_CHUNK_SIZE) -> int:
+        """Recompute the given buckets from pages. Returns the number of buckets refreshed."""
+        unique_keys = list(dict.fromkeys(RollupKey(*key) for key in keys))
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be a positive integer")
+        if not unique_keys:
+            return 0
+
+        columns = (
+            LeaderboardRollupRecord.user,
+            LeaderboardRollupRecord.lang,
+            LeaderboardRollupRecord.cat,
+            LeaderboardRollupRecord.year,
+            LeaderboardRollupRecord.month,
+        )
+        try:
+            for start in range(0, len(unique_keys), chunk_size):
+                chunk = unique_keys[start : start + chunk_size]
+                self.session.execute(delete(LeaderboardRollupRecord).where(tuple_(*columns).in_(chunk)))
+                self.session.execute(self._insert_rollup(or_(*(_bucket_condition(key) for key in chunk))))
+            self.commit()
+        except Exception:
+            self.session.rollback()
+            raise
+
+        return len(unique_keys)
+
+    def refresh_for_targets(self, targets: Iterable[tuple[str, str]], chunk_size: int = ROLLUP_CHUNK_SIZE) -> int:
+        """Refresh the buckets of the pages published as any of the (target, lang) pairs."""
+        unique_targets = list(dict.fromkeys(targets))
+        keys: list[RollupKey] = []
+        for start in range(0, len(unique_targets), chunk_size):
+            chunk = unique_targets[start : start + chunk_size]
+            rows = self.session.execute(
+                select(PageRecord.user, PageRecord.lang, PageRecord.cat, PageRecord.pub_date).where(
+                    tuple_(PageRecord.target, PageRecord.lang).in_(chunk)
+                )
+            )
+            keys.extend(rollup_key(*row) for row in rows)
+        return self.refresh_keys(keys, chunk_size)
+
+    def rebuild(self) -> int:
+        """Rebuild leaderboard_rollup from scratch. Returns the number of rows written."""
+        try:
+            self.session.execute(delete(LeaderboardRollupRecord))
+            self.session.execute(self._insert_rollup())
+            self.commit()
+        except Exception:
+            self.session.rollback()
+            logger.exception("Failed to rebuild leaderboard_rollup")
+            raise
+
+        return self.count()
+
+    def _insert_rollup(self, condition=None):
+        if db.engine.name == "sqlite":
+            year_expr = cast(func.strftime("%Y", PageRecord.pub_date), Integer)
+            month_expr = cast(func.strftime("%m", PageRecord.pub_date), Integer)
+        else:
+            year_expr = func.year(PageRecord.pub_date)
+            month_expr = func.month(PageRecord.pub_date)
+
+        word_expr = case(
+            (
+                PageRecord.word.is_not(None) & (PageRecord.word != 0) & (PageRecord.word != ""),
+                PageRecord.word,
+            ),
+            (PageRecord.translate_type == "all", WordRecord.w_all_words),
+            else_=WordRecord.w_lead_words,
+        )
+        views_model = views_totals_model()
+        views_expr = case(
+            (views_model.views.is_(None) | (views_model.views == ""), 0),
+            else_=cast(views_model.views, Integer),
+        )
+
+        group = (
+            func.coalesce(PageRecord.user, ""),
+            func.coalesce(PageRecord.lang, ""),
+            func.coalesce(PageRecord.cat, ""),
+            func.coalesce(year_expr, 0),
+            func.coalesce(month_expr, 0),
+        )
+        rollup = (
+            select(
+                *group,
+                func.count(PageRecord.target),
+                func.coalesce(func.sum(word_expr), 0),
+                func.coalesce(func.sum(views_expr), 0),
+            )
+            .select_from(PageRecord)
+            .outerjoin(WordRecord, WordRecord.w_title == PageRecord.title)
+            .outerjoin(views_model, (PageRecord.target == views_model.target) & (PageRecord.lang == views_model.lang))
+            .where(PageRecord.target != "", PageRecord.target.is_not(None))
+            .group_by(*group)
+        )
+        if condition is not None:
+            rollup = rollup.where(condition)
+        return insert(LeaderboardRollupRecord).from_select(
+            ["user", "lang", "cat", "year", "month", "targets", "words", "views"], rollup
+        )
+
+
+__all__ = [
+    "LeaderboardRollupService",
+    "RollupKey",
+    "apply_rollup_filters",
+    "leaderboard_rollup_enabled",
+    "rollup_key",
+]
@@ -4,28 +4,77 @@ SQLAlchemy-based service helpers for leaderboard page statistics.
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from typing import Any
 
 from sqlalchemy import desc, func, text
 
 from ....extensions import db
-from ...models import CategoryRecord, PageRecord, UserRecord
-
+from ...models import CategoryRecord, LeaderboardRollupRecord, PageRecord, UserRecord
+from ...read_replica import ReadOnlyService
+from ...statement_budget import statement_budget
+from ..analytics.views_new_totals_service import views_totals_model
+from ..utils.date_ranges import date_range_condition, period_bounds
+from ..utils.query_cache import cached_query
+from .leaderboard_rollup_service import apply_rollup_filters, leaderboard_rollup_enabled
+
+# Sort expressions of the per-user and per-language pages list; NULLs sort as the lowest value
+PAGES_SORT_FIELDS: dict[str, str] = {
+    "date": "COALESCE(p.pub_date, '')",
+    "title": "p.title",
+    "words": "COALESCE(p.word, 0)",
+    "views": "COALESCE(v.views, 0)",
+}
+
+
+@dataclass(frozen=True)
+class PagesSlice:
+    rows: list[dict[str, Any]]
+    next_key: tuple[Any, int] | None  # (sort value, page id) of the last row when more rows follow
+
+
+def _pages_where(
+    year: int | None,
+    user: str | None,
+    lang: str | None,
+) -> tuple[str, dict[str, object]] | None:
+    """Return the WHERE clause and params of the leaderboard pages list, or None for an impossible year."""
+    conditions: list[str] = []
+    params: dict[str, object] = {}
+
+    if lang is not None:
+        conditions.append("p.lang = :lang")
+        params["lang"] = lang
+    if user is not None:
+        conditions.append("p.user = :user")
+        params["user"] = user
+    if year is not None:
+        try:
+            start, end = period_bounds(year)
+        except ValueError:
+            return None
+        conditions.append(
+            "((p.date >= :year_start AND p.date < :year_end)"
+            " OR (p.pub_date >= :year_start AND p.pub_date < :year_end)"
+            " OR (p.add_date >= :year_start AND p.add_date < :year_end))"
+        )
+        params["year_start"] = start.isoformat()
+        params["year_end"] = end.isoformat()
 
-class LeaderboardService:
+    return (" AND ".join(conditions) if conditions else "1=1"), params
 
-    def __init__(self):
-        self.session = db.session
 
+class LeaderboardService(ReadOnlyService):
+    @cached_query("pages")
     def get_pages_years(
         self,
         user: str | None = None,
         lang: str | None = None,
     ) -> list[int]:
         """
-        SELECT DISTINCT YEAR(pupdate) AS year FROM pages WHERE pupdate <> ''
+        SELECT DISTINCT YEAR(pub_date) AS year FROM pages WHERE pub_date IS NOT NULL
         """
-        query = self.session.query(func.year(PageRecord.pupdate).label("year")).filter(PageRecord.pupdate != "")
+        query = self.session.query(func.year(PageRecord.pub_date).label("year")).filter(PageRecord.pub_date.isnot(None))
         if user is not None:
             query = query.filter(PageRecord.user == user)
 
@@ -39,16 +88,14 @@ class LeaderboardService:
 
     def get_months_of_pages_years(self, year: int) -> list[int]:
         """
-        SELECT DISTINCT MONTH(pupdate) AS month FROM pages
-        WHERE pupdate <> ''
-        AND YEAR(pupdate) = :year
+        SELECT DISTINCT MONTH(pub_date) AS month FROM pages
+        WHERE pub_date >= :year_start AND pub_date < :next_year_start
         """
         rows = (
             self.session.query(
-                func.month(PageRecord.pupdate).label("month"),
+                func.month(PageRecord.pub_date).label("month"),
             )
-            .filter(PageRecord.pupdate != "")
-            .filter(func.year(PageRecord.pupdate) == year)
+            .filter(date_range_condition(PageRecord.pub_date, year))
             .distinct()
             .all()
         )
@@ -56,6 +103,23 @@ class LeaderboardService:
         months.sort(reverse=True)
         return months
 
+    @cached_query("pages", "categories")
+    def get_distinct_langs(self) -> list[str]:
+        """
+        SELECT DISTINCT lang FROM pages p
+        LEFT JOIN categories ca ON p.cat = ca.category
+        WHERE (p.lang != '' AND p.lang IS NOT NULL)
+        """
+        rows = (
+            self.session.query(PageRecord.lang)
+            .distinct()
+            .outerjoin(CategoryRecord, PageRecord.cat == CategoryRecord.category)
+            .filter(PageRecord.lang != "", PageRecord.lang.isnot(None))
+            .order_by(PageRecord.lang)
+            .all()
+        )
+        return [row.lang for row in rows]
+
     def list_of_users_by_translations_count(self) -> dict[str, int]:
         """
         Get a dictionary of users and their translation counts.
@@ -79,55 +143,137 @@ class LeaderboardService:
                 result[user] = count
         return result
 
-    def get_pages(
+    def get_pages_totals(
         self,
         year: int | None = None,
         user: str | None = None,
         lang: str | None = None,
-    ) -> list[dict]:
+    ) -> dict[str, int]:
         """
-        Return pages with views, optionally filtered by year, user, and language.
+        Return the article, word and pageview totals of the pages ``get_pages_slice`` lists.
 
-        SELECT DISTINCT
-            p.title, p.word, p.translate_type, p.cat, p.lang,
-            p.user, p.target, p.date, p.pupdate, p.add_date, p.deleted,
-            v.views
+        SELECT COUNT(*) AS articles, SUM(p.word) AS words, SUM(v.views) AS pageviews
         FROM pages p
         LEFT JOIN views_new_all v ON p.target = v.target AND p.lang = v.lang
         [WHERE conditions by year/user/lang]
+
+        Raises:
+            QueryBudgetExceededError: If the query runs past the statement budget.
         """
-        conditions: list[str] = []
-        params: dict[str, object] = {}
+        where = _pages_where(year, user, lang)
+        if where is None:
+            return {"articles": 0, "words": 0, "pageviews": 0}
+        where_clause, params = where
+        views_table = views_totals_model().__tablename__
 
-        if lang is not None:
-            conditions.append("p.lang = :lang")
-            params["lang"] = lang
-        if user is not None:
-            conditions.append("p.user = :user")
-            params["user"] = user
-        if year is not None:
-            conditions.append(":year IN (YEAR(p.date), YEAR(p.pupdate), YEAR(p.add_date))")
-            params["year"] = year
+        sql = text(
+            f"""
+            SELECT
+                COUNT(*) AS articles,
+                COALESCE(SUM(p.word), 0) AS words,
+                COALESCE(SUM(v.views), 0) AS pageviews
+            FROM pages p
+            LEFT JOIN {views_table} v
+                ON p.target = v.target AND p.lang = v.lang
+            WHERE {where_clause}
+        """
+        )
+
+        session = self.session
+        with statement_budget("leaderboard.get_pages_totals", session):
+            row = session.execute(sql, params).one()
+        # SUM comes back as DECIMAL on MySQL
+        return {"articles": int(row.articles), "words": int(row.words), "pageviews": int(row.pageviews)}
 
-        where_clause = " AND ".join(conditions) if conditions else "1=1"
+    def get_pages_slice(
+        self,
+        year: int | None = None,
+        user: str | None = None,
+        lang: str | None = None,
+        sort: str = "date",
+        order: str = "desc",
+        limit: int | None = None,
+        after: tuple[Any, int] | None = None,
+    ) -> PagesSlice:
+        """
+        Return one page of the pages with views, optionally filtered by year, user, and language.
+
+        SELECT
+            p.id, p.title, p.word, p.translate_type, p.cat, p.lang,
+            p.user, p.target, p.date, p.pupdate, p.add_date, p.deleted,
+            v.views, ca.campaign
+        FROM pages p
+        LEFT JOIN views_new_all v ON p.target = v.target AND p.lang = v.lang
+        LEFT JOIN categories ca ON ca.category = p.cat
+        [WHERE conditions by year/user/lang]
+        ORDER BY <sort> <order>, p.id <order>
+
+        The year filter matches date, pub_date or add_date falling inside the
+        year, written as range predicates so each column's index can be used.
+
+        ``after`` is the ``next_key`` of the previous slice; the slice starts
+        strictly after that row, so deep pages cost the same as the first one.
+        ``limit`` of None returns every remaining row.
+
+        Raises:
+            ValueError: If ``sort`` or ``order`` is not supported.
+            QueryBudgetExceededError: If the query runs past the statement budget.
+        """
+        if sort not in PAGES_SORT_FIELDS:
+            raise ValueError(f"sort must be one of {', '.join(PAGES_SORT_FIELDS)}")
+        if order not in ("asc", "desc"):
+            raise ValueError("order must be asc or desc")
+
+        where = _pages_where(year, user, lang)
+        if where is None:
+            return PagesSlice(rows=[], next_key=None)
+        where_clause, params = where
+        views_table = views_totals_model().__tablename__
+
+        sort_expr = PAGES_SORT_FIELDS[sort]
+        if after is not None:
+            op = "<" if order == "desc" else ">"
+            where_clause += (
+                f" AND ({sort_expr} {op} :after_value OR ({sort_expr} = :after_value AND p.id {op} :after_id))"
+            )
+            params["after_value"], params["after_id"] = after
+
+        limit_clause = ""
+        if limit is not None:
+            # One extra row tells whether another slice follows
+            limit_clause = "LIMIT :limit"
+            params["limit"] = limit + 1
 
         sql = text(
             f"""
-            SELECT DISTINCT
-                p.title, p.word, p.translate_type, p.cat, p.lang,
+            SELECT
+                p.id, p.title, p.word, p.translate_type, p.cat, p.lang,
                 p.user, p.target, p.date, p.pupdate, p.add_date, p.deleted,
-                v.views, ca.campaign
+                v.views, ca.campaign, {sort_expr} AS sort_value
             FROM pages p
-            LEFT JOIN views_new_all v
+            LEFT JOIN {views_table} v
                 ON p.target = v.target AND p.lang = v.lang
             LEFT JOIN categories ca
                 ON ca.category = p.cat
             WHERE {where_clause}
+            ORDER BY sort_value {order.upper()}, p.id {order.upper()}
+            {limit_clause}
         """
         )
 
-        rows = self.session.execute(sql, params).fetchall()
-        return [dict(row._mapping) for row in rows]
+        session = self.session
+        with statement_budget("leaderboard.get_pages_slice", session):
+            rows = [dict(row._mapping) for row in session.execute(sql, params).fetchall()]
+
+        next_key = None
+        if limit is not None and len(rows) > limit:
+            rows = rows[:limit]
+            last = rows[-1]
+            value = last["sort_value"]
+            next_key = (int(value) if sort in ("words", "views") else str(value), int(last["id"]))
+        for row in rows:
+            del row["sort_value"]
+        return PagesSlice(rows=rows, next_key=next_key)
 
     def top_lang_of_user(self, username: str) -> dict[str, int]:
         """
@@ -161,6 +307,7 @@ class LeaderboardService:
         result = {row.lang: row.cnt for row in data}
         return result
 
+    @cached_query("pages", "leaderboard_rollup")
     def top_lang_of_users(
         self,
     ) -> list[dict[Any, Any]]:
@@ -179,19 +326,34 @@ class LeaderboardService:
             p.lang
         result_example: { "user": "DaSupremo", "lang": "gpe", "count": 451 }
         """
-        ranked = (
-            self.session.query(
-                PageRecord.user,
-                PageRecord.lang,
-                func.count(PageRecord.target).label("count"),
-                func.row_number()
-                .over(partition_by=PageRecord.user, order_by=func.count(PageRecord.target).desc())
-                .label("rn"),
+        if leaderboard_rollup_enabled():
+            rollup = LeaderboardRollupRecord
+            ranked = (
+                self.session.query(
+                    rollup.user,
+                    rollup.lang,
+                    func.sum(rollup.targets).label("count"),
+                    func.row_number()
+                    .over(partition_by=rollup.user, order_by=func.sum(rollup.targets).desc())
+                    .label("rn"),
+                )
+                .group_by(rollup.user, rollup.lang)
+                .subquery()
+            )
+        else:
+            ranked = (
+                self.session.query(
+                    PageRecord.user,
+                    PageRecord.lang,
+                    func.count(PageRecord.target).label("count"),
+                    func.row_number()
+                    .over(partition_by=PageRecord.user, order_by=func.count(PageRecord.target).desc())
+                    .label("rn"),
+                )
+                .filter(PageRecord.target != "", PageRecord.target.isnot(None))
+                .group_by(PageRecord.user, PageRecord.lang)
+                .subquery()
             )
-            .filter(PageRecord.target != "", PageRecord.target.isnot(None))
-            .group_by(PageRecord.user, PageRecord.lang)
-            .subquery()
-        )
 
         data = (
             self.session.query(ranked.c.user, ranked.c.lang, ranked.c.count)
@@ -199,7 +361,8 @@ class LeaderboardService:
             .order_by(desc(ranked.c.count))
             .all()
         )
-        result_list = [dict(x._mapping) for x in data]
+        # SUM over the rollup comes back as DECIMAL on MySQL
+        result_list = [{"user": x.user, "lang": x.lang, "count": int(x.count)} for x in data]
         return result_list
 
     def get_leaderboard_chart_data(
@@ -215,13 +378,16 @@ class LeaderboardService:
         """
         Fetch aggregated counts of translations by month for the leaderboard chart.
         """
+        if leaderboard_rollup_enabled():
+            return self._chart_data_from_rollup(camp, cat, user_group, year, month, lang, user)
+
         if db.engine.name == "sqlite":
-            date_expr = func.strftime("%Y-%m", PageRecord.pupdate)
+            date_expr = func.strftime("%Y-%m", PageRecord.pub_date)
         else:
-            date_expr = func.left(PageRecord.pupdate, 7)
+            date_expr = func.date_format(PageRecord.pub_date, "%Y-%m")
 
         query = self.session.query(date_expr.label("date"), func.count().label("count")).filter(
-            PageRecord.target.isnot(None), PageRecord.target != ""
+            PageRecord.target.isnot(None), PageRecord.target != "", PageRecord.pub_date.isnot(None)
         )
 
         if cat:
@@ -239,10 +405,7 @@ class LeaderboardService:
             )
 
         if year:
-            str_like = f"{year}-%"
-            if month:
-                str_like = f"{year}-{month:02d}%"
-            query = query.filter(PageRecord.pupdate.like(str_like))
+            query = query.filter(date_range_condition(PageRecord.pub_date, year, month))
 
         if lang:
             query = query.filter(PageRecord.lang == lang)
@@ -255,6 +418,29 @@ class LeaderboardService:
         rows = query.all()
         return [{"date": row.date, "count": row.count} for row in rows]
 
+    def _chart_data_from_rollup(
+        self,
+        camp: str | None,
+        cat: str | None,
+        user_group: str | None,
+        year: int | None,
+        month: int | None,
+        lang: str | None,
+        user: str | None,
+    ) -> list[dict[str, Any]]:
+        rollup = LeaderboardRollupRecord
+        query = self.session.query(rollup.year, rollup.month, func.sum(rollup.targets).label("count")).filter(
+            rollup.year != 0
+        )
+        query = apply_rollup_filters(query, cat=cat, camp=camp, user_group=user_group, year=year, month=month)
+        if lang:
+            query = query.filter(rollup.lang == lang)
+        if user:
+            query = query.filter(rollup.user == user)
+
+        rows = query.group_by(rollup.year, rollup.month).order_by(rollup.year, rollup.month).all()
+        return [{"date": f"{row.year:04d}-{row.month:02d}", "count": int(row.count)} for row in rows]
+
     def get_chart_data_formatted(
         self,
         camp: str | None = None,
@@ -285,5 +471,7 @@ class LeaderboardService:
 
 
 __all__ = [
+    "PAGES_SORT_FIELDS",
     "LeaderboardService",
+    "PagesSlice",
 ]
@@ -8,7 +8,9 @@ PHP source:
 
 Queries hit the shared MariaDB ``category_members`` table directly (the
 many-to-many membership table; backed by ``CategoryMemberRecord`` so the
-table is created when the Flask app launches).
+table is created when the Flask app launches). When
+settings.performance.coverage_rollup_table is enabled, ``category_coverage``
+reads both numbers from the ``category_lang_coverage`` rollup instead.
 """
 
 from __future__ import annotations
@@ -17,7 +19,8 @@ import logging
 
 from sqlalchemy import text
 
-from ....extensions import db
+from ....config import settings
+from ...read_replica import ReadOnlyService
 
 logger = logging.getLogger(__name__)
 
@@ -48,11 +51,17 @@ _STATS_BY_CATEGORY_SQL = text(
 )
 
 
-class MissingStatsService:
+# One primary-key range scan; the lang = '' row holds the member count
+_COVERAGE_ROLLUP_SQL = text(
+    """
+    SELECT lang, titles
+    FROM category_lang_coverage
+    WHERE category = :cat
+    """
+)
 
-    def __init__(self):
-        self.session = db.session
 
+class MissingStatsService(ReadOnlyService):
     def count_category_members(self, cat: str) -> int:
         """Return the total number of articles in ``cat`` (PHP count_category_members).
 
@@ -74,6 +83,26 @@ class MissingStatsService:
         rows = self.session.execute(_STATS_BY_CATEGORY_SQL, {"cat": cat}).fetchall()
         return [dict(row._mapping) for row in rows]
 
+    def category_coverage(self, cat: str) -> tuple[int, list[dict]]:
+        """Return ``(count_category_members(cat), statics_by_category(cat))``.
+
+        Served from the category_lang_coverage rollup when it is enabled.
+        """
+        if not cat:
+            return 0, []
+        if not settings.performance.coverage_rollup_table:
+            return self.count_category_members(cat), self.statics_by_category(cat)
+
+        total = 0
+        stats: list[dict] = []
+        for lang, titles in self.session.execute(_COVERAGE_ROLLUP_SQL, {"cat": cat}):
+            if lang == "":
+                total = int(titles or 0)
+            else:
+                stats.append({"language_code": lang, "available_title_count": int(titles or 0)})
+        stats.sort(key=lambda row: row["available_title_count"])
+        return total, stats
+
 
 __all__ = [
     "MissingStatsService",
@@ -7,21 +7,18 @@ from __future__ import annotations
 import logging
 from typing import Any
 
-from ....extensions import db
 from ...models import (
     CategoryRecord,
     PageRecord,
     UserPageRecord,
-    ViewsNewAllRecord,
 )
+from ...read_replica import ReadOnlyService
+from ..analytics.views_new_totals_service import views_totals_model
 
 logger = logging.getLogger(__name__)
 
 
-class PagesQueryService:
-    def __init__(self) -> None:
-        self.session = db.session
-
+class PagesQueryService(ReadOnlyService):
     def list_pages_users(self, limit: int = 100, lang: str = "") -> list[dict[str, Any]]:
         """
         Return pages_users records with joined category campaign data.
@@ -71,10 +68,11 @@ class PagesQueryService:
             FROM pages p
             WHERE p.target != ''
         """
+        views_model = views_totals_model()
         views_subquery = (
-            self.session.query(ViewsNewAllRecord.views)
-            .filter(ViewsNewAllRecord.target == PageRecord.target)
-            .filter(ViewsNewAllRecord.lang == PageRecord.lang)
+            self.session.query(views_model.views)
+            .filter(views_model.target == PageRecord.target)
+            .filter(views_model.lang == PageRecord.lang)
             .correlate(PageRecord)
             .scalar_subquery()
         )
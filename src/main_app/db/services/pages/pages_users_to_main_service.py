@@ -16,6 +16,7 @@ from typing import Any
 from ....extensions import db
 from ...models import PageRecord, PagesUsersToMainRecord, QidRecord, UserPageRecord
 from ..crud_service import CRUDService
+from ..utils.query_cache import bump_table_version
 
 logger = logging.getLogger(__name__)
 
@@ -113,7 +114,8 @@ class PagesUsersToMainPagesService(CRUDService[PagesUsersToMainRecord]):
 
             self.session.delete(to_main)
             self.session.delete(user_page)
-            self.session.commit()
+            self.commit()
+            bump_table_version(UserPageRecord.__tablename__)
         except Exception:
             logger.exception("Failed to delete pages_users(_to_main) id=%r", page_id)
             self.session.rollback()
@@ -21,7 +21,7 @@ from typing import Any
 
 from sqlalchemy import text
 
-from ....extensions import db
+from ...read_replica import ReadOnlyService
 
 logger = logging.getLogger(__name__)
 
@@ -81,15 +81,38 @@ _EXISTS_SQL = text(
 )
 
 
-def _rows_to_dicts(rows: list[Any] | Any) -> list[dict]:
-    return [dict(row._mapping) for row in rows]
+# Both lists in one pass: every member with its aq.target (NULL when missing)
+_MEMBERS_SQL = text(
+    """
+    SELECT
+        c.article_id   AS title,
+        c.category     AS category,
+        ase.importance AS importance,
+        rc.r_lead_refs AS r_lead_refs,
+        rc.r_all_refs  AS r_all_refs,
+        ep.en_views    AS en_views,
+        q.qid          AS qid,
+        w.w_lead_words AS w_lead_words,
+        w.w_all_words  AS w_all_words,
+        aq.target      AS target
+    FROM category_members c
+    JOIN qids q                   ON q.title    = c.article_id
+    LEFT JOIN all_qids_exists aq  ON aq.qid     = q.qid AND aq.code = :lang
+    LEFT JOIN assessments ase     ON ase.title  = c.article_id
+    LEFT JOIN enwiki_pageviews ep ON ep.title   = c.article_id
+    LEFT JOIN refs_counts rc      ON rc.r_title = c.article_id
+    LEFT JOIN words w             ON w.w_title  = c.article_id
+    WHERE c.category = :cat
+      AND EXISTS (SELECT 1 FROM langs la WHERE la.code = :lang)
+    """
+)
 
 
-class Results2026Service:
+def _rows_to_dicts(rows: list[Any] | Any) -> list[dict]:
+    return [dict(row._mapping) for row in rows]
 
-    def __init__(self):
-        self.session = db.session
 
+class Results2026Service(ReadOnlyService):
     def missing_by_lang_and_category(self, lang: str, cat: str) -> list[dict]:
         """Return missing-target articles for ``lang`` in category ``cat``."""
         if not lang or not cat:
@@ -104,6 +127,27 @@ class Results2026Service:
         rows = self.session.execute(_EXISTS_SQL, {"lang": lang, "cat": cat}).fetchall()
         return _rows_to_dicts(rows)
 
+    def missing_and_exists_by_lang_and_category(self, lang: str, cat: str) -> tuple[list[dict], list[dict]]:
+        """Return ``(missing, exists)`` for ``lang`` in ``cat`` from a single query.
+
+        Same rows as ``missing_by_lang_and_category`` and
+        ``exists_by_lang_and_category`` (missing rows carry no ``target`` key),
+        but the category join runs once instead of twice.
+        """
+        if not lang or not cat:
+            return [], []
+        result = self.session.execute(_MEMBERS_SQL, {"lang": lang, "cat": cat})
+        missing: list[dict] = []
+        exists: list[dict] = []
+        for row in result:
+            data = dict(row._mapping)
+            if data["target"] is None:
+                del data["target"]
+                missing.append(data)
+            else:
+                exists.append(data)
+        return missing, exists
+
 
 __all__ = [
     "Results2026Service",
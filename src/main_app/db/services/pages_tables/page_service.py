@@ -5,12 +5,21 @@ SQLAlchemy-based service for managing pages and page targets.
 from __future__ import annotations
 
 import logging
+from collections.abc import Iterable
+from typing import Any
 
 from sqlalchemy import func, or_
 
 from ....extensions import db
 from ...models import PageRecord
+from ...models.pages import to_pub_date
 from ..analytics import WordService
+from ..pages.leaderboard_rollup_service import (
+    LeaderboardRollupService,
+    RollupKey,
+    leaderboard_rollup_enabled,
+    rollup_key,
+)
 from .pages_shared_service import BasePagesService
 
 logger = logging.getLogger(__name__)
@@ -63,10 +72,15 @@ class PagesService(BasePagesService):
                 self.model.lang == lang,
                 or_(self.model.target == "", self.model.target.is_(None)),
             ).update(
-                {self.model.target: target, self.model.pupdate: pupdate, "word": word},
+                {
+                    self.model.target: target,
+                    self.model.pupdate: pupdate,
+                    self.model.pub_date: to_pub_date(pupdate),
+                    "word": word,
+                },
                 synchronize_session=False,
             )
-            self.session.commit()
+            self.commit()
         except Exception:
             logger.exception("Failed to update existing page target")
             self.session.rollback()
@@ -101,8 +115,45 @@ class PagesService(BasePagesService):
             )
             .first()
         )
+        if found is not None:
+            self._sync_rollup([self._rollup_key(found)])
         return found is not None
 
+    def create(self, **fields: Any) -> PageRecord:
+        record = super().create(**fields)
+        self._sync_rollup([self._rollup_key(record)])
+        return record
+
+    def update(self, instance: PageRecord, **fields: Any) -> PageRecord:
+        old_key = self._rollup_key(instance)
+        record = super().update(instance, **fields)
+        self._sync_rollup([old_key, self._rollup_key(record)])
+        return record
+
+    def delete_record(self, record: PageRecord) -> bool:
+        key = self._rollup_key(record)
+        deleted = super().delete_record(record)
+        if deleted:
+            self._sync_rollup([key])
+        return deleted
+
+    @staticmethod
+    def _rollup_key(record: PageRecord) -> RollupKey:
+        return rollup_key(record.user, record.lang, record.cat, record.pub_date)
+
+    def _sync_rollup(self, keys: Iterable[RollupKey]) -> None:
+        """Refresh leaderboard_rollup for the touched buckets when the rollup is enabled.
+
+        The pages write has already been committed, so a failure here is logged rather than raised;
+        `flask rebuild-leaderboard-rollup` brings the table back in line.
+        """
+        if not leaderboard_rollup_enabled():
+            return
+        try:
+            LeaderboardRollupService().refresh_keys(keys)
+        except Exception:
+            logger.exception("Failed to refresh leaderboard_rollup")
+
 
 __all__ = [
     "PagesService",
@@ -5,15 +5,17 @@ SQLAlchemy-based shared logic for managing pages_users/pages tables.
 from __future__ import annotations
 
 import logging
+from collections.abc import Iterator
 from datetime import datetime
 from typing import Any, TypeVar
 
-from sqlalchemy import func
+from sqlalchemy import func, update
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from ...models import PageRecord, UserPageRecord
-from ..crud_service import CRUDService
+from ...models.pages import to_pub_date
+from ..crud_service import DEFAULT_STREAM_BATCH_SIZE, CRUDService
 
 logger = logging.getLogger(__name__)
 
@@ -42,6 +44,26 @@ class BasePagesService(CRUDService[ModelT]):
             order_by=[self.model.id.asc()],
         )
 
+    def iter_pages(self, batch_size: int = DEFAULT_STREAM_BATCH_SIZE) -> Iterator[ModelT]:
+        """Yield all pages in id order without loading the whole table."""
+        return self.stream(batch_size)  # type: ignore[return-value]
+
+    def backfill_pub_dates(self, batch_size: int = DEFAULT_STREAM_BATCH_SIZE) -> int:
+        """Fill pub_date from pupdate for rows written before the column existed.
+
+        Rows whose pupdate is not an ISO date are left NULL. Returns the number of rows updated.
+        """
+        updated = 0
+        for batch in self.iter_batches(batch_size, filters={"pub_date": None}, columns=("id", "pupdate")):
+            values = [{"id": row.id, "pub_date": to_pub_date(row.pupdate)} for row in batch]
+            values = [value for value in values if value["pub_date"] is not None]
+            if not values:
+                continue
+            self.session.execute(update(self.model), values)
+            self.commit()
+            updated += len(values)
+        return updated
+
     def list_pages_by_lang_cat(self, lang: str, cat: str) -> list[ModelT]:
         """Return pages filtered by language and category."""
         return self.list(filters={"lang": lang, "cat": cat})
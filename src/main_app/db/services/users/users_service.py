@@ -5,12 +5,13 @@ SQLAlchemy-based service for managing users.
 from __future__ import annotations
 
 import logging
+from collections.abc import Iterator
 
 from sqlalchemy.exc import IntegrityError
 
 from ....extensions import db
 from ...models import UserRecord
-from ..crud_service import CRUDService
+from ..crud_service import DEFAULT_STREAM_BATCH_SIZE, CRUDService
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +24,10 @@ class UsersService(CRUDService[UserRecord]):
         """Return all user identity records."""
         return self.list_all()
 
+    def iter_users(self, batch_size: int = DEFAULT_STREAM_BATCH_SIZE) -> Iterator[UserRecord]:
+        """Yield all user identity records in user_id order without loading the whole table."""
+        return self.stream(batch_size)  # type: ignore[return-value]
+
     def get_user(self, user_id: int) -> UserRecord | None:
         """Fetch a user by user_id."""
         if not user_id:
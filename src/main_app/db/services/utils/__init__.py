@@ -1,7 +1,22 @@
 from __future__ import annotations
 
+from .date_ranges import date_range_condition, period_bounds
+from .query_cache import (
+    bump_table_version,
+    cached_query,
+    clear_query_caches,
+    get_table_modified,
+    get_table_version,
+)
 from .retry_on_disconnect import retry_on_db_disconnect
 
 __all__ = [
+    "bump_table_version",
+    "cached_query",
+    "clear_query_caches",
+    "date_range_condition",
+    "get_table_modified",
+    "get_table_version",
+    "period_bounds",
     "retry_on_db_disconnect",
 ]
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from datetime import date
+from typing import Any
+
+from sqlalchemy import ColumnElement, and_, false
+
+
+def period_bounds(year: int, month: int | None = None) -> tuple[date, date]:
+    """
+    Return the half-open ``[start, end)`` date range covering ``year`` or ``year``/``month``.
+
+    Raises ValueError for a year or month that is out of range.
+    """
+    if month:
+        start = date(year, month, 1)
+        end = date(year + 1, 1, 1) if month == 12 else date(year, month + 1, 1)
+        return start, end
+    return date(year, 1, 1), date(year + 1, 1, 1)
+
+
+def date_range_condition(column: Any, year: int, month: int | None = None) -> ColumnElement[bool]:
+    """
+    Build ``column >= start AND column < end`` for the given year/month.
+
+    Unlike ``YEAR(column) = ...`` or ``column LIKE 'YYYY-%'`` this can use an
+    index on the column. An impossible year/month matches nothing.
+    """
+    try:
+        start, end = period_bounds(year, month)
+    except ValueError:
+        return false()
+    return and_(column >= start, column < end)
+
+
+__all__ = [
+    "date_range_condition",
+    "period_bounds",
+]
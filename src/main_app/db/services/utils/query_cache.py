@@ -0,0 +1,167 @@
+"""
+Versioned result cache for read-mostly service methods.
+
+Each cached method declares the tables it reads. The cache key combines the
+method, its arguments and the current version of every declared table;
+``CRUDService.commit()`` bumps the version of its model's table, so any write
+through a service makes older entries unreachable and they age out of the LRU.
+
+Versions are per process: a write handled by another worker is not seen here.
+Entries therefore also expire after ``settings.performance.query_cache_ttl``
+seconds, which bounds how long such a write (or one committed without going
+through ``CRUDService.commit()``) goes unnoticed. A TTL of 0 keeps entries
+until a write in this process.
+
+Results are computed inside ``read_replica.primary_reads()``: a result read
+from a lagging replica right after a write would otherwise be stored under
+the new version and served until the next one.
+"""
+
+from __future__ import annotations
+
+import functools
+import logging
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Any, ParamSpec, TypeVar
+
+from ....config import settings
+from ....shared.core.metrics import metrics
+from ...read_replica import primary_reads
+
+logger = logging.getLogger(__name__)
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+DEFAULT_CACHE_MAXSIZE = 128
+
+_versions_lock = threading.Lock()
+_table_versions: dict[str, int] = {}
+_table_modified: dict[str, float] = {}
+_caches: list[_LRUCache] = []
+
+
+class _LRUCache:
+    def __init__(self, name: str, maxsize: int) -> None:
+        self.name = name
+        self.maxsize = maxsize
+        self._data: OrderedDict[Hashable, Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> tuple[bool, Any]:
+        with self._lock:
+            if key not in self._data:
+                return False, None
+            self._data.move_to_end(key)
+            return True, self._data[key]
+
+    def put(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+def get_table_version(table: str) -> int:
+    with _versions_lock:
+        return _table_versions.get(table, 0)
+
+
+def get_table_modified(*tables: str) -> float | None:
+    """Return when any of ``tables`` was last written in this process (epoch seconds), or None."""
+    with _versions_lock:
+        times = [_table_modified[table] for table in tables if table in _table_modified]
+    return max(times, default=None)
+
+
+def bump_table_version(*tables: str) -> None:
+    """Invalidate cached results that depend on any of ``tables``."""
+    now = time.time()
+    with _versions_lock:
+        for table in tables:
+            _table_versions[table] = _table_versions.get(table, 0) + 1
+            _table_modified[table] = now
+
+
+def clear_query_caches() -> None:
+    """Drop every cached entry and reset table versions."""
+    with _versions_lock:
+        _table_versions.clear()
+        _table_modified.clear()
+    for cache in _caches:
+        cache.clear()
+
+
+def cached_query(
+    *tables: str,
+    maxsize: int = DEFAULT_CACHE_MAXSIZE,
+) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    """
+    Cache a service method's result until one of ``tables`` is written or
+    the entry is older than ``settings.performance.query_cache_ttl`` seconds.
+
+    The instance (``self``) is not part of the key, so results are shared by
+    every service instance. Arguments must be hashable, and the return value
+    is shared between callers: return plain data (dicts, lists, ints) rather
+    than ORM instances bound to a session.
+
+    Hits and misses are counted in ``metrics`` as ``query_cache.hits`` and
+    ``query_cache.misses`` labelled with the method name.
+    """
+    if not tables:
+        raise ValueError("cached_query needs at least one table name")
+
+    def decorator(func: Callable[P, R]) -> Callable[P, R]:
+        name = func.__qualname__
+        cache = _LRUCache(name, maxsize)
+        _caches.append(cache)
+
+        @functools.wraps(func)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            versions = tuple(get_table_version(table) for table in tables)
+            key = (args[1:], tuple(sorted(kwargs.items())), versions)
+            try:
+                found, value = cache.get(key)
+            except TypeError:
+                logger.debug("%s: unhashable arguments, bypassing cache", name)
+                return func(*args, **kwargs)
+
+            ttl = settings.performance.query_cache_ttl
+            if found:
+                stored_at, value = value
+                if ttl <= 0 or time.monotonic() - stored_at < ttl:
+                    metrics.incr("query_cache.hits", method=name)
+                    return value
+
+            metrics.incr("query_cache.misses", method=name)
+            with primary_reads():
+                value = func(*args, **kwargs)
+            cache.put(key, (time.monotonic(), value))
+            return value
+
+        wrapper.cache_clear = cache.clear  # type: ignore[attr-defined]
+        wrapper.cache_len = cache.__len__  # type: ignore[attr-defined]
+        return wrapper
+
+    return decorator
+
+
+__all__ = [
+    "DEFAULT_CACHE_MAXSIZE",
+    "bump_table_version",
+    "cached_query",
+    "clear_query_caches",
+    "get_table_modified",
+    "get_table_version",
+]
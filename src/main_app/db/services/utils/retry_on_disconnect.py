@@ -6,6 +6,7 @@ import logging
 from sqlalchemy.exc import OperationalError
 
 from ....extensions import db
+from ....shared.core.metrics import metrics
 
 logger = logging.getLogger(__name__)
 
@@ -49,6 +50,7 @@ def retry_on_db_disconnect(
                         raise
 
                     attempt += 1
+                    metrics.incr("db.disconnect_retries", func=func_name)
                     logger.warning(
                         "%s: MySQL server has gone away. Rolling back and retrying (attempt %s/%s).",
                         func_name,
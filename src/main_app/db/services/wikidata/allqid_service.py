@@ -5,19 +5,17 @@ SQLAlchemy-based service for managing QIDs.
 from __future__ import annotations
 
 import logging
+from collections.abc import Iterable
 
-from sqlalchemy import text
+from sqlalchemy import bindparam, text
 
-from ....extensions import db
+from ...read_replica import ReadOnlyService
+from ..crud_service import DEFAULT_BULK_CHUNK_SIZE
 
 logger = logging.getLogger(__name__)
 
 
-class AllQidsService:
-
-    def __init__(self) -> None:
-        self.session = db.session
-
+class AllQidsService(ReadOnlyService):
     def list_targets_by_lang(self, lang: str) -> list[dict]:
         """ """
         sql = text(
@@ -43,6 +41,55 @@ class AllQidsService:
         rows = self.session.execute(sql, {"lang": lang}).fetchall()
         return [dict(row._mapping) for row in rows]
 
+    def list_targets_by_lang_titles(
+        self,
+        lang: str,
+        titles: Iterable[str],
+        chunk_size: int = DEFAULT_BULK_CHUNK_SIZE,
+    ) -> list[dict]:
+        """
+        Same rows as ``list_targets_by_lang``, limited to the given mdwiki ``titles``.
+
+        The title set is sent in chunks of ``chunk_size`` through ``IN``; each
+        title is resolved through the unique ``qids.title`` key and the
+        ``all_qids_exists (qid, code)`` key instead of scanning every target of
+        the language.
+        """
+        unique_titles = list(dict.fromkeys(titles))
+        if not lang or not unique_titles:
+            return []
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be a positive integer")
+
+        sql = text(
+            """
+            SELECT
+                t.qid AS qid,
+                q.title AS title,
+                MIN(aa.category) AS category,
+                t.code AS code,
+                t.target AS target
+            FROM
+                qids q
+                JOIN all_qids_exists t ON t.qid = q.qid
+                LEFT JOIN category_members aa ON aa.article_id = q.title
+            WHERE
+                q.title IN :titles
+                AND t.code = :lang
+                AND t.target != ''
+                AND t.target IS NOT NULL
+            GROUP BY
+                t.qid, q.title, t.code, t.target
+        """
+        ).bindparams(bindparam("titles", expanding=True))
+
+        rows: list[dict] = []
+        for start in range(0, len(unique_titles), chunk_size):
+            chunk = unique_titles[start : start + chunk_size]
+            result = self.session.execute(sql, {"lang": lang, "titles": chunk})
+            rows.extend(dict(row._mapping) for row in result)
+        return rows
+
 
 __all__ = [
     "AllQidsService",
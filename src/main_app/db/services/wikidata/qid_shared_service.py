@@ -15,13 +15,17 @@ Each table-specific service module should only need to:
 from __future__ import annotations
 
 import logging
+from collections.abc import Iterable, Iterator
 from typing import Any
 
 from sqlalchemy import and_, or_
 from sqlalchemy.orm import Session, aliased
 
+from ...exceptions import QueryBudgetExceededError
 from ...models import QidOthersRecord, QidRecord
-from ..crud_service import CRUDService
+from ...statement_budget import statement_budget
+from ..content.category_coverage_service import CategoryLangCoverageService, coverage_rollup_enabled
+from ..crud_service import DEFAULT_STREAM_BATCH_SIZE, CRUDService
 
 logger = logging.getLogger(__name__)
 
@@ -69,25 +73,34 @@ class BaseQidService(CRUDService[ServiceRecord]):
             return []
 
     def list_duplicate_records(self) -> list[ServiceRecord]:
+        """
+        Return rows that share a title or qid with another row.
+
+        Raises:
+            QueryBudgetExceededError: If the self-join runs past the statement budget.
+        """
         try:
-            base = self.session.query(self.model)
-            other = aliased(self.model)
-            rows = (
-                base.join(
-                    other,
-                    and_(
-                        self.model.id != other.id,
-                        or_(
-                            self.model.qid == other.qid,
-                            self.model.title == other.title,
+            with statement_budget(f"{self.model.__tablename__}.list_duplicate_records", self.session):
+                base = self.session.query(self.model)
+                other = aliased(self.model)
+                rows = (
+                    base.join(
+                        other,
+                        and_(
+                            self.model.id != other.id,
+                            or_(
+                                self.model.qid == other.qid,
+                                self.model.title == other.title,
+                            ),
                         ),
-                    ),
+                    )
+                    .order_by(self.model.id.asc())
+                    .distinct()
+                    .all()
                 )
-                .order_by(self.model.id.asc())
-                .distinct()
-                .all()
-            )
             return rows
+        except QueryBudgetExceededError:
+            raise
         except Exception as e:
             logger.exception("Failed to list records: %s", e)
             return []
@@ -112,10 +125,14 @@ class BaseQidService(CRUDService[ServiceRecord]):
         """Return all QID records."""
         return self.list_all(order_by=[self.model.id.asc()])
 
+    def iter_qid_records(self, batch_size: int = DEFAULT_STREAM_BATCH_SIZE) -> Iterator[ServiceRecord]:
+        """Yield all QID records in id order without loading the whole table."""
+        return self.stream(batch_size)  # type: ignore[return-value]
+
     def get_title_to_qid(self) -> dict[str, str]:
         """Retrieve title to QID mapping from database."""
-        records = self.list_qid_records()
-        return {record.title: record.qid or "" for record in records}
+        rows = self.stream(columns=("title", "qid"))
+        return {row.title: row.qid or "" for row in rows}  # type: ignore[union-attr]
 
     # ───────────────────────────────────────────────────────────────
     # get by
@@ -152,10 +169,29 @@ class BaseQidService(CRUDService[ServiceRecord]):
                 keys={"title": title},
                 qid=qid,
             )
-            return instance
         except Exception as e:
             logger.exception("Failed to add or update qid: %s", e)
             return None
+        self._sync_coverage([title])
+        return instance
+
+    def bulk_add_or_update(self, title_to_qid: dict[str, str]) -> tuple[int, int]:
+        """Add or update many records from a ``{title: qid}`` mapping.
+
+        Invalid pairs are logged and skipped. Returns ``(inserted, updated)``.
+        """
+        rows: list[dict[str, str]] = []
+        for title, qid in title_to_qid.items():
+            try:
+                validate_or_raise(title, qid)
+            except ValueError as e:
+                logger.error("Invalid title or qid: %s", e)
+                continue
+            rows.append({"title": title, "qid": qid})
+
+        counts = self.bulk_upsert(rows, conflict_keys=("title",), update_columns=("qid",))
+        self._sync_coverage(row["title"] for row in rows)
+        return counts
 
     def insert(self, title: str, qid: str) -> bool:
         """
@@ -172,13 +208,15 @@ class BaseQidService(CRUDService[ServiceRecord]):
             if existing:
                 if not existing.qid:
                     self.update(existing, qid=qid)
+                    self._sync_coverage([title])
                 return True
 
             orm_obj = self.create(title=title, qid=qid)
-            return orm_obj is not None
         except Exception:
             logger.exception("Failed to insert record title=%r qid=%r", title, qid)
             return False
+        self._sync_coverage([title])
+        return orm_obj is not None
 
     def update_qid(self, qid_id: int, title: str, qid: str) -> ServiceRecord:
         """Update an existing row by primary key."""
@@ -191,13 +229,37 @@ class BaseQidService(CRUDService[ServiceRecord]):
         if not orm_obj:
             raise ValueError(f"record with ID {qid_id} not found")
 
-        return self.update(orm_obj, title=title, qid=qid)
+        old_title = orm_obj.title
+        record = self.update(orm_obj, title=title, qid=qid)
+        self._sync_coverage([old_title, title])
+        return record
 
     # ───────────────────────────────────────────────────────────────
     # delete
 
     def delete_qid(self, qid_id: int) -> bool:
-        return self.delete(qid_id)
+        record = self.get_by_id(qid_id) if qid_id else None
+        title = record.title if record else None
+        deleted = self.delete(qid_id)
+        if deleted and title:
+            self._sync_coverage([title])
+        return deleted
+
+    # ───────────────────────────────────────────────────────────────
+    # category_lang_coverage
+
+    def _sync_coverage(self, titles: Iterable[str]) -> None:
+        """Refresh category_lang_coverage for the categories containing ``titles`` after a ``qids`` write.
+
+        Only the ``qids`` table feeds the rollup. The write has already been committed, so a failure here is
+        logged rather than raised; `flask rebuild-category-coverage` brings the table back in line.
+        """
+        if self.model is not QidRecord or not coverage_rollup_enabled():
+            return
+        try:
+            CategoryLangCoverageService().refresh_for_titles(title for title in titles if title)
+        except Exception:
+            logger.exception("Failed to refresh category_lang_coverage")
 
 
 __all__ = [
@@ -0,0 +1,155 @@
+"""
+Per-statement execution budgets for expensive queries.
+
+``statement_budget(name)`` caps how long statements run on a session's
+connection inside the block:
+
+- MySQL sets ``max_execution_time`` (milliseconds, SELECT only) for the
+  session and restores the server default afterwards; MariaDB uses
+  ``max_statement_time`` (seconds).
+- SQLite installs a progress handler that interrupts the statement once the
+  deadline has passed, so tests exercise the same path.
+
+A statement cancelled by the budget surfaces as ``QueryBudgetExceededError`` and is
+counted in ``metrics`` as ``sql.budget_exceeded`` labelled with the budget
+name. Routes catch it and return a fast degraded response instead of tying up
+a worker. Services that swallow database errors still see it re-raised when
+the block exits.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import event, text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import SQLAlchemyError
+
+from ..config import settings
+from ..shared.core.metrics import metrics
+from .exceptions import QueryBudgetExceededError
+
+logger = logging.getLogger(__name__)
+
+BUDGET_INFO_KEY = "_statement_budget"
+SQLITE_PROGRESS_STEPS = 1000
+
+# ER_QUERY_TIMEOUT (MySQL) and ER_STATEMENT_TIMEOUT (MariaDB)
+_TIMEOUT_ERROR_CODES = frozenset({3024, 1969})
+
+
+@dataclass
+class _Budget:
+    name: str
+    budget_ms: int
+    deadline: float
+    exceeded: bool = False
+    reported: bool = False
+
+    def trip(self) -> QueryBudgetExceededError:
+        self.exceeded = True
+        if not self.reported:
+            self.reported = True
+            metrics.incr("sql.budget_exceeded", budget=self.name)
+            logger.warning("Statement budget %r of %dms exceeded", self.name, self.budget_ms)
+        return QueryBudgetExceededError(self.name, self.budget_ms)
+
+
+def _is_timeout_error(exc: BaseException | None) -> bool:
+    args = getattr(exc, "args", ())
+    return bool(args) and args[0] in _TIMEOUT_ERROR_CODES
+
+
+def _handle_error(context: Any) -> QueryBudgetExceededError | None:
+    conn = context.connection
+    if conn is None or conn.closed:
+        return None
+    budget: _Budget | None = conn.info.get(BUDGET_INFO_KEY)
+    if budget is None:
+        return None
+    if budget.exceeded or _is_timeout_error(context.original_exception):
+        return budget.trip()
+    return None
+
+
+def _install_error_hook() -> None:
+    if not event.contains(Engine, "handle_error", _handle_error):
+        event.listen(Engine, "handle_error", _handle_error)
+
+
+def _apply(conn: Connection, budget: _Budget) -> None:
+    dialect = conn.dialect
+    if dialect.name == "sqlite":
+
+        def _progress() -> int:
+            if time.monotonic() >= budget.deadline:
+                budget.exceeded = True
+                return 1
+            return 0
+
+        conn.connection.driver_connection.set_progress_handler(_progress, SQLITE_PROGRESS_STEPS)
+    elif getattr(dialect, "is_mariadb", False):
+        conn.execute(text("SET SESSION max_statement_time = :seconds"), {"seconds": budget.budget_ms / 1000})
+    elif dialect.name == "mysql":
+        conn.execute(text("SET SESSION max_execution_time = :ms"), {"ms": budget.budget_ms})
+
+
+def _restore(conn: Connection) -> None:
+    dialect = conn.dialect
+    try:
+        if dialect.name == "sqlite":
+            conn.connection.driver_connection.set_progress_handler(None, 0)
+        elif getattr(dialect, "is_mariadb", False):
+            conn.execute(text("SET SESSION max_statement_time = DEFAULT"))
+        elif dialect.name == "mysql":
+            conn.execute(text("SET SESSION max_execution_time = DEFAULT"))
+    except SQLAlchemyError as exc:
+        logger.debug("Could not reset statement budget: %s", exc)
+
+
+@contextmanager
+def statement_budget(
+    name: str,
+    session: Any,
+    budget_ms: int | None = None,
+) -> Iterator[None]:
+    """
+    Cap the execution time of statements run through ``session`` inside the block.
+
+    ``budget_ms`` defaults to ``settings.performance.statement_budget_ms``; a
+    budget of 0 disables the limit.
+
+    Raises:
+        QueryBudgetExceededError: If a statement was cancelled for running past the budget.
+    """
+    if budget_ms is None:
+        budget_ms = settings.performance.statement_budget_ms
+    if budget_ms <= 0:
+        yield
+        return
+
+    _install_error_hook()
+    conn: Connection = session.connection()
+    budget = _Budget(name=name, budget_ms=budget_ms, deadline=time.monotonic() + budget_ms / 1000)
+    _apply(conn, budget)
+    conn.info[BUDGET_INFO_KEY] = budget
+    try:
+        yield
+    finally:
+        conn.info.pop(BUDGET_INFO_KEY, None)
+        if not conn.closed:
+            _restore(conn)
+
+    if budget.exceeded:
+        # The statement's error was swallowed by the caller; surface it anyway
+        raise budget.trip()
+
+
+__all__ = [
+    "statement_budget",
+]
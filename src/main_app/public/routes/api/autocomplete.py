@@ -0,0 +1,173 @@
+"""
+Prefix-indexed autocomplete for ``/api/autocomplete``.
+
+Each kind (users, langs, titles) is kept in memory as a sorted array of
+casefolded keys; a lookup is a ``bisect`` to the first key with the prefix
+followed by a walk over the matching run, so a keystroke no longer runs a
+``LIKE`` scan or ships the whole langs table.
+
+An index is rebuilt when one of its tables has been written through a
+service in this worker (``query_cache.bump_table_version``) or after
+``settings.performance.autocomplete_index_ttl`` seconds, which bounds how long
+writes handled by other workers go unnoticed.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from bisect import bisect_left
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from typing import Any
+
+from ....config import settings
+from ....db.services import LangService, QidService, UsersService
+from ....db.services.utils import get_table_version
+from ....shared.core.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LIMIT = 10
+MAX_LIMIT = 50
+
+# Seconds browsers and proxies may reuse an autocomplete response
+CACHE_MAX_AGE = 60
+
+
+class PrefixIndex:
+    """Sorted-array prefix index; an item may be reachable through several keys."""
+
+    def __init__(self, entries: Iterable[tuple[str, dict[str, Any]]]) -> None:
+        items: list[dict[str, Any]] = []
+        item_ids: dict[int, int] = {}
+        pairs: list[tuple[str, int]] = []
+        for key, item in entries:
+            if not key:
+                continue
+            item_id = item_ids.get(id(item))
+            if item_id is None:
+                item_id = item_ids[id(item)] = len(items)
+                items.append(item)
+            pairs.append((key.casefold(), item_id))
+        pairs.sort()
+        self._keys = [key for key, _ in pairs]
+        self._item_ids = [item_id for _, item_id in pairs]
+        self._items = items
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def search(self, prefix: str, limit: int = DEFAULT_LIMIT) -> list[dict[str, Any]]:
+        """Return up to ``limit`` items with a key starting with ``prefix`` (case-insensitive), in key order."""
+        prefix = prefix.casefold()
+        keys = self._keys
+        seen: set[int] = set()
+        results: list[dict[str, Any]] = []
+        position = bisect_left(keys, prefix)
+        while position < len(keys) and len(results) < limit and keys[position].startswith(prefix):
+            item_id = self._item_ids[position]
+            if item_id not in seen:
+                seen.add(item_id)
+                results.append(self._items[item_id])
+            position += 1
+        return results
+
+
+def _user_entries() -> Iterable[tuple[str, dict[str, Any]]]:
+    for user in UsersService().iter_users():
+        if user.username:
+            yield user.username, {"value": user.username, "label": user.username}
+
+
+def _lang_entries() -> Iterable[tuple[str, dict[str, Any]]]:
+    for lang in LangService().list_langs_as_dicts():
+        code = lang.get("code")
+        if not code:
+            continue
+        name = lang.get("name") or ""
+        autonym = lang.get("autonym") or ""
+        item = {
+            "value": code,
+            "label": f"{code} - {name} ({autonym})",
+            "code": code,
+            "name": name,
+            "autonym": autonym,
+        }
+        for key in (code, name, autonym):
+            yield key, item
+
+
+def _title_entries() -> Iterable[tuple[str, dict[str, Any]]]:
+    for record in QidService().iter_qid_records():
+        if record.title:
+            yield record.title, {"value": record.title, "label": record.title}
+
+
+@dataclass(frozen=True)
+class IndexSource:
+    tables: tuple[str, ...]
+    entries: Callable[[], Iterable[tuple[str, dict[str, Any]]]]
+
+
+INDEX_SOURCES: dict[str, IndexSource] = {
+    "users": IndexSource(tables=("users",), entries=_user_entries),
+    "langs": IndexSource(tables=("langs",), entries=_lang_entries),
+    "titles": IndexSource(tables=("qids",), entries=_title_entries),
+}
+
+
+@dataclass(frozen=True)
+class _BuiltIndex:
+    index: PrefixIndex
+    versions: tuple[int, ...]
+    built_at: float
+
+
+class AutocompleteIndexes:
+    """Lazily built prefix index per kind."""
+
+    def __init__(self, sources: dict[str, IndexSource] = INDEX_SOURCES) -> None:
+        self.sources = sources
+        self._built: dict[str, _BuiltIndex] = {}
+        self._lock = threading.Lock()
+
+    def get(self, kind: str) -> PrefixIndex:
+        """Return the index for ``kind``, rebuilding it when its tables changed or it expired."""
+        source = self.sources[kind]
+        versions = tuple(get_table_version(table) for table in source.tables)
+        ttl = settings.performance.autocomplete_index_ttl
+
+        with self._lock:
+            built = self._built.get(kind)
+            if built is not None and built.versions == versions and (ttl <= 0 or time.monotonic() - built.built_at < ttl):
+                return built.index
+
+            metrics.incr("autocomplete.rebuilds", kind=kind)
+            started = time.monotonic()
+            index = PrefixIndex(source.entries())
+            self._built[kind] = _BuiltIndex(index=index, versions=versions, built_at=started)
+            logger.debug("Built %s autocomplete index with %s items", kind, len(index))
+            return index
+
+    def search(self, kind: str, prefix: str, limit: int = DEFAULT_LIMIT) -> list[dict[str, Any]]:
+        return self.get(kind).search(prefix, limit)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._built.clear()
+
+
+autocomplete_indexes = AutocompleteIndexes()
+
+
+__all__ = [
+    "AutocompleteIndexes",
+    "CACHE_MAX_AGE",
+    "DEFAULT_LIMIT",
+    "INDEX_SOURCES",
+    "MAX_LIMIT",
+    "PrefixIndex",
+    "autocomplete_indexes",
+]
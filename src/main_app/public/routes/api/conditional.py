@@ -0,0 +1,119 @@
+"""
+Conditional GET (ETag / Last-Modified) for the polled JSON API endpoints.
+
+``conditional_get(*tables)`` derives a data version for a request from the
+version of every table the endpoint reads (``query_cache.bump_table_version``,
+bumped by each service write), the request path and its query arguments. A
+request whose ``If-None-Match`` or ``If-Modified-Since`` already matches gets
+a bodyless 304 before the view, and so before any SQL, runs.
+
+Versions are per process, so the ETag also carries a per-worker token and the
+current ``settings.performance.api_etag_ttl`` window. The window bounds how
+long writes handled by other workers (or written straight to the database)
+keep being answered with 304.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import json
+import os
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any
+
+from flask import Response, make_response, request
+
+from ....config import settings
+from ....db.services.utils import get_table_modified, get_table_version
+from ....shared.core.metrics import metrics
+
+# Distinguishes workers whose table version counters happen to agree
+_PROCESS_TOKEN = f"{os.getpid():x}.{time.time_ns():x}"
+_PROCESS_STARTED = time.time()
+
+
+@dataclass(frozen=True)
+class DataVersion:
+    etag: str
+    last_modified: datetime
+
+
+def data_version(tables: tuple[str, ...], now: float | None = None) -> DataVersion:
+    """Return the version of the current request's response given the tables it reads."""
+    now = time.time() if now is None else now
+    ttl = settings.performance.api_etag_ttl
+    window = int(now // ttl) * ttl if ttl > 0 else 0
+
+    payload = json.dumps(
+        [
+            request.path,
+            sorted(request.args.items(multi=True)),
+            [get_table_version(table) for table in tables],
+            _PROCESS_TOKEN,
+            window,
+        ],
+        separators=(",", ":"),
+    )
+    etag = hashlib.sha256(payload.encode("utf-8")).hexdigest()[:32]
+
+    modified = max(_PROCESS_STARTED, window, get_table_modified(*tables) or 0)
+    # HTTP dates have one-second resolution
+    return DataVersion(etag=etag, last_modified=datetime.fromtimestamp(int(modified), tz=UTC))
+
+
+def _not_modified(version: DataVersion) -> bool:
+    if request.if_none_match:
+        return request.if_none_match.contains_weak(version.etag)
+    since = request.if_modified_since
+    return since is not None and version.last_modified <= since
+
+
+def _cache_control(max_age: int) -> str:
+    return f"public, max-age={max_age}" if max_age > 0 else "no-cache"
+
+
+def conditional_get(*tables: str, max_age: int = 0) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """
+    Answer GETs whose validators match the current data version of ``tables`` with 304.
+
+    Successful responses carry a weak ``ETag``, ``Last-Modified`` and
+    ``Cache-Control`` (``public, max-age=<max_age>``, or ``no-cache`` to make
+    clients revalidate every poll). Error responses are passed through untouched.
+    """
+    if not tables:
+        raise ValueError("conditional_get needs at least one table name")
+
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not settings.performance.api_conditional_get or request.method != "GET":
+                return func(*args, **kwargs)
+
+            version = data_version(tables)
+            if _not_modified(version):
+                metrics.incr("api.not_modified", path=request.path)
+                response = Response(status=304)
+            else:
+                response = make_response(func(*args, **kwargs))
+                if response.status_code != 200:
+                    return response
+
+            response.set_etag(version.etag, weak=True)
+            response.last_modified = version.last_modified
+            response.headers["Cache-Control"] = _cache_control(max_age)
+            return response
+
+        return wrapper
+
+    return decorator
+
+
+__all__ = [
+    "DataVersion",
+    "conditional_get",
+    "data_version",
+]
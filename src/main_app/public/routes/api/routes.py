@@ -12,7 +12,9 @@ from typing import Any
 from flask import Blueprint, Response, jsonify, request
 from marshmallow import ValidationError
 
-from ....db.models import CategoryRecord, InProcessRecord, LangRecord, PageRecord, ReportRecord
+from ....db.exceptions import QueryBudgetExceededError
+from ....db.models import CategoryRecord, InProcessRecord, LangRecord, ReportRecord
+from ....db.read_replica import read_session
 from ....db.services import (
     CategoryService,
     InProcessService,
@@ -22,15 +24,27 @@ from ....db.services import (
     ReportService,
     UsersService,
 )
+from ....db.statement_budget import statement_budget
 from ....extensions import db
 from ....shared.core.cors import check_cors
 from ....shared.schemas import PublishReportsQuerySchema
 from ....shared.utils.web_utils import parse_select_fields
+from .autocomplete import CACHE_MAX_AGE, DEFAULT_LIMIT, INDEX_SOURCES, MAX_LIMIT, autocomplete_indexes
+from .conditional import conditional_get
 from .form_utils import FormData, get_form
-from .top_stats_routes import get_top_langs, get_top_users
+from .top_stats_routes import STATUS_TABLES, TOP_STATS_TABLES, get_top_langs, get_top_users
 
 logger = logging.getLogger(__name__)
 
+PAGES_WITH_VIEWS_TABLES = ("pages", "views_new", "views_new_totals")
+PUBLISH_REPORTS_TABLES = ("publish_reports",)
+
+# Seconds browsers and proxies may reuse a response before revalidating; 0 revalidates every poll
+TOP_STATS_MAX_AGE = 60
+STATUS_MAX_AGE = 60
+PAGES_WITH_VIEWS_MAX_AGE = 300
+PUBLISH_REPORTS_MAX_AGE = 0
+
 
 def get_publish_reports() -> tuple[Response, int] | Response:
     """
@@ -104,17 +118,19 @@ def publish_reports_stats() -> tuple[Response, int] | Response:
     """
     try:
         # Query distinct year, month, lang, user, result using SQLAlchemy
-        results = (
-            db.session.query(
-                db.func.extract("year", ReportRecord.date).label("year"),
-                db.func.extract("month", ReportRecord.date).label("month"),
-                ReportRecord.lang,
-                ReportRecord.user,
-                ReportRecord.result,
+        session = read_session()
+        with statement_budget("api.publish_reports_stats", session):
+            results = (
+                session.query(
+                    db.func.extract("year", ReportRecord.date).label("year"),
+                    db.func.extract("month", ReportRecord.date).label("month"),
+                    ReportRecord.lang,
+                    ReportRecord.user,
+                    ReportRecord.result,
+                )
+                .distinct()
+                .all()
             )
-            .distinct()
-            .all()
-        )
 
         # Convert results to list of dicts
         data: list[dict[str, Any]] = [
@@ -128,6 +144,10 @@ def publish_reports_stats() -> tuple[Response, int] | Response:
             for row in results
         ]
 
+    except QueryBudgetExceededError:
+        # Degraded but well-formed: clients keep working with empty filter options
+        return jsonify({"results": [], "count": 0, "degraded": True}), 503
+
     except Exception:
         logger.exception("Error fetching publish_reports_stats")
         return jsonify({"error": "An internal error occurred while fetching stats"}), 500
@@ -161,7 +181,7 @@ def get_in_process() -> tuple[Response, int] | Response:
     try:
         # Perform the JOIN query using SQLAlchemy
         query = (
-            db.session.query(
+            read_session().query(
                 InProcessRecord.id,
                 InProcessRecord.title,
                 InProcessRecord.user,
@@ -309,12 +329,11 @@ def get_categories() -> tuple[Response, int] | Response:
     """
     try:
         category_service = CategoryService()
-        records = category_service.list_categories()
+        records = category_service.list_categories_as_dicts()
     except Exception:
         logger.exception("Error fetching categories data")
         return jsonify({"error": "An internal error occurred while fetching categories data"}), 500
 
-    records = [x.to_dict() for x in records]
     response_data = {
         "results": records,
         "count": len(records),
@@ -332,15 +351,7 @@ def get_distinct_langs() -> tuple[Response, int] | Response:
     WHERE (p.lang != '' AND p.lang IS NOT NULL)
     """
     try:
-        results = (
-            db.session.query(PageRecord.lang)
-            .distinct()
-            .outerjoin(CategoryRecord, PageRecord.cat == CategoryRecord.category)
-            .filter(PageRecord.lang != "", PageRecord.lang.isnot(None))
-            .order_by(PageRecord.lang)
-            .all()
-        )
-        data = [{"lang": row.lang} for row in results]
+        data = [{"lang": lang} for lang in LeaderboardService().get_distinct_langs()]
     except Exception:
         logger.exception("Error fetching distinct langs data")
         return jsonify({"error": "An internal error occurred while fetching distinct langs data"}), 500
@@ -376,12 +387,11 @@ def get_langs() -> tuple[Response, int] | Response:
     """
     try:
         lang_service = LangService()
-        records = lang_service.list_langs()
+        records = lang_service.list_langs_as_dicts()
     except Exception:
         logger.exception("Error fetching langs data")
         return jsonify({"error": "An internal error occurred while fetching langs data"}), 500
 
-    records = [x.to_dict() for x in records]
     response_data = {
         "results": records,
         "count": len(records),
@@ -415,6 +425,40 @@ def get_users() -> tuple[Response, int] | Response:
     return jsonify(response_data)
 
 
+def get_autocomplete() -> tuple[Response, int] | Response:
+    """
+    Handle autocomplete API requests.
+
+    Query Parameters:
+        kind: users, langs or titles
+        q: Case-insensitive prefix to complete
+        limit: Maximum number of results (default 10, at most 50)
+
+    Returns:
+        JSON response with ``{"value", "label"}`` results (langs also carry code, name and autonym)
+    """
+    kind = request.args.get("kind", type=str)
+    if kind not in INDEX_SOURCES:
+        return jsonify({"error": f"Query parameter 'kind' must be one of: {', '.join(INDEX_SOURCES)}"}), 400
+
+    limit = request.args.get("limit", DEFAULT_LIMIT, type=int)
+    if limit is None or limit < 1:
+        return jsonify({"error": "Query parameter 'limit' must be a positive integer"}), 400
+    limit = min(limit, MAX_LIMIT)
+
+    query = (request.args.get("q", type=str) or "").strip()
+
+    try:
+        records = autocomplete_indexes.search(kind, query, limit)
+    except Exception:
+        logger.exception("Error building %s autocomplete", kind)
+        return jsonify({"error": "An internal error occurred while fetching autocomplete data"}), 500
+
+    response = jsonify({"results": records, "count": len(records)})
+    response.headers["Cache-Control"] = f"public, max-age={CACHE_MAX_AGE}"
+    return response
+
+
 class ApiRoutes:
     def __init__(self, bp: Blueprint) -> None:
         self.bp = bp
@@ -425,21 +469,32 @@ class ApiRoutes:
 
         self.bp.before_request(self.handle_options_preflight)
 
-        self.bp.route("/status", methods=["GET"])(self.leaderboard_status)
-        self.bp.route("/top_langs", methods=["GET"])(check_cors(self.get_top_langs))
-        self.bp.route("/top_users", methods=["GET"])(check_cors(self.get_top_users))
+        self.bp.route("/status", methods=["GET"])(
+            conditional_get(*STATUS_TABLES, max_age=STATUS_MAX_AGE)(self.leaderboard_status)
+        )
+        self.bp.route("/top_langs", methods=["GET"])(
+            check_cors(conditional_get(*TOP_STATS_TABLES, max_age=TOP_STATS_MAX_AGE)(self.get_top_langs))
+        )
+        self.bp.route("/top_users", methods=["GET"])(
+            check_cors(conditional_get(*TOP_STATS_TABLES, max_age=TOP_STATS_MAX_AGE)(self.get_top_users))
+        )
         self.bp.route("/top_lang_of_users", methods=["GET"])(check_cors(self.get_top_lang_of_users))
-        self.bp.route("/publish_reports", methods=["GET"])(check_cors(get_publish_reports))
+        self.bp.route("/publish_reports", methods=["GET"])(
+            check_cors(conditional_get(*PUBLISH_REPORTS_TABLES, max_age=PUBLISH_REPORTS_MAX_AGE)(get_publish_reports))
+        )
         self.bp.route("/publish_reports/stats", methods=["GET"])(check_cors(publish_reports_stats))
         self.bp.route("/in_process", methods=["GET"])(check_cors(get_in_process))
         self.bp.route("/in_process_total", methods=["GET"])(check_cors(get_in_process_total))
         self.bp.route("/pages_users", methods=["GET"])(check_cors(get_pages_users))
-        self.bp.route("/pages_with_views", methods=["GET"])(check_cors(get_pages_with_views))
+        self.bp.route("/pages_with_views", methods=["GET"])(
+            check_cors(conditional_get(*PAGES_WITH_VIEWS_TABLES, max_age=PAGES_WITH_VIEWS_MAX_AGE)(get_pages_with_views))
+        )
         self.bp.route("/categories", methods=["GET"])(check_cors(get_categories))
         self.bp.route("/distinct_langs", methods=["GET"])(check_cors(get_distinct_langs))
         self.bp.route("/users_by_translations_count", methods=["GET"])(check_cors(users_by_translations_count))
         self.bp.route("/langs", methods=["GET"])(check_cors(get_langs))
         self.bp.route("/users", methods=["GET"])(check_cors(get_users))
+        self.bp.route("/autocomplete", methods=["GET"])(check_cors(get_autocomplete))
 
     def handle_options_preflight(self):
         if request.method == "OPTIONS":
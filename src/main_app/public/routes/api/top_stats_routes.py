@@ -3,6 +3,9 @@
 Endpoints:
 - /api/top_langs: Aggregated statistics per language
 - /api/top_users: Aggregated statistics per user
+
+With settings.performance.leaderboard_rollup enabled both are answered from
+the leaderboard_rollup table instead of aggregating pages.
 """
 
 from __future__ import annotations
@@ -17,16 +20,34 @@ from werkzeug.datastructures import MultiDict
 from ....db.models import (
     CategoryRecord,
     LangRecord,
+    LeaderboardRollupRecord,
     PageRecord,
     UserRecord,
-    ViewsNewAllRecord,
     WordRecord,
 )
+from ....db.read_replica import read_session
+from ....db.services import views_totals_model
+from ....db.services.pages.leaderboard_rollup_service import apply_rollup_filters, leaderboard_rollup_enabled
+from ....db.services.utils import date_range_condition
 from ....extensions import db
 from .form_utils import FormData, get_form
 
 logger = logging.getLogger(__name__)
 
+# Tables read by the leaderboard aggregates (pages joined with words, views, langs, categories, users)
+TOP_STATS_TABLES = (
+    "pages",
+    "words",
+    "views_new",
+    "views_new_totals",
+    "langs",
+    "categories",
+    "users",
+    "leaderboard_rollup",
+)
+# Tables read by the leaderboard chart (/api/status)
+STATUS_TABLES = ("pages", "categories", "users", "leaderboard_rollup")
+
 
 def apply_filters(form: FormData, query: Query) -> Query:
     if form.cat:
@@ -44,14 +65,129 @@ def apply_filters(form: FormData, query: Query) -> Query:
         )
 
     if form.year:
-        str_like = f"{form.year}-%"
-        if form.month:
-            str_like = f"{form.year}-{form.month:02d}%"
-        query = query.filter(PageRecord.pupdate.like(str_like))
+        query = query.filter(date_range_condition(PageRecord.pub_date, form.year, form.month))
 
     return query
 
 
+def _top_langs_pages_query(form: FormData) -> Query:
+    # Build the word count expression
+    word_expr = case(
+        (
+            PageRecord.word.is_not(None) & (PageRecord.word != 0) & (PageRecord.word != ""),
+            PageRecord.word,
+        ),
+        (PageRecord.translate_type == "all", WordRecord.w_all_words),
+        else_=WordRecord.w_lead_words,
+    )
+
+    # Build the views expression (CAST to UNSIGNED)
+    views_model = views_totals_model()
+    views_expr = case(
+        (views_model.views.is_(None) | (views_model.views == ""), 0),
+        else_=cast(views_model.views, db.Integer),
+    )
+
+    # Query with joins
+    query = (
+        read_session().query(
+            PageRecord.lang,
+            LangRecord.name.label("lang_name"),
+            db.func.count(PageRecord.target).label("targets"),
+            db.func.sum(word_expr).label("words"),
+            db.func.sum(views_expr).label("views"),
+        )
+        .outerjoin(WordRecord, WordRecord.w_title == PageRecord.title)
+        .outerjoin(
+            views_model,
+            (PageRecord.target == views_model.target) & (PageRecord.lang == views_model.lang),
+        )
+        .outerjoin(LangRecord, PageRecord.lang == LangRecord.code)
+        .filter(PageRecord.target != "")
+        .filter(PageRecord.target.is_not(None))
+        .filter(PageRecord.user != "")
+        .filter(PageRecord.user.is_not(None))
+        .filter(PageRecord.lang != "")
+        .filter(PageRecord.lang.is_not(None))
+    )
+
+    query = apply_filters(form, query)
+    return query.group_by(PageRecord.lang, LangRecord.name).order_by(db.func.count(PageRecord.target).desc())
+
+
+def _top_langs_rollup_query(form: FormData) -> Query:
+    query = (
+        read_session()
+        .query(
+            LeaderboardRollupRecord.lang,
+            LangRecord.name.label("lang_name"),
+            db.func.sum(LeaderboardRollupRecord.targets).label("targets"),
+            db.func.sum(LeaderboardRollupRecord.words).label("words"),
+            db.func.sum(LeaderboardRollupRecord.views).label("views"),
+        )
+        .outerjoin(LangRecord, LeaderboardRollupRecord.lang == LangRecord.code)
+        .filter(LeaderboardRollupRecord.user != "", LeaderboardRollupRecord.lang != "")
+    )
+    query = apply_rollup_filters(query, form.cat, form.camp, form.user_group, form.year, form.month)
+    return query.group_by(LeaderboardRollupRecord.lang, LangRecord.name).order_by(
+        db.func.sum(LeaderboardRollupRecord.targets).desc()
+    )
+
+
+def _top_users_pages_query(form: FormData) -> Query:
+    # Build the word count expression
+    word_expr = case(
+        (
+            PageRecord.word.is_not(None) & (PageRecord.word != 0) & (PageRecord.word != ""),
+            PageRecord.word,
+        ),
+        (PageRecord.translate_type == "all", WordRecord.w_all_words),
+        else_=WordRecord.w_lead_words,
+    )
+
+    # Build the views expression (CAST to UNSIGNED)
+    views_model = views_totals_model()
+    views_expr = case(
+        (views_model.views.is_(None) | (views_model.views == ""), 0),
+        else_=cast(views_model.views, db.Integer),
+    )
+
+    # Query with joins
+    query = (
+        read_session().query(
+            PageRecord.user,
+            db.func.count(PageRecord.target).label("targets"),
+            db.func.sum(word_expr).label("words"),
+            db.func.sum(views_expr).label("views"),
+        )
+        .outerjoin(WordRecord, WordRecord.w_title == PageRecord.title)
+        .outerjoin(
+            views_model,
+            (PageRecord.target == views_model.target) & (PageRecord.lang == views_model.lang),
+        )
+        .filter(PageRecord.target != "")
+        .filter(PageRecord.target.is_not(None))
+        .filter(PageRecord.user != "")
+        .filter(PageRecord.user.is_not(None))
+        .filter(PageRecord.lang != "")
+        .filter(PageRecord.lang.is_not(None))
+    )
+
+    query = apply_filters(form, query)
+    return query.group_by(PageRecord.user).order_by(db.func.count(PageRecord.target).desc())
+
+
+def _top_users_rollup_query(form: FormData) -> Query:
+    query = read_session().query(
+        LeaderboardRollupRecord.user,
+        db.func.sum(LeaderboardRollupRecord.targets).label("targets"),
+        db.func.sum(LeaderboardRollupRecord.words).label("words"),
+        db.func.sum(LeaderboardRollupRecord.views).label("views"),
+    ).filter(LeaderboardRollupRecord.user != "", LeaderboardRollupRecord.lang != "")
+    query = apply_rollup_filters(query, form.cat, form.camp, form.user_group, form.year, form.month)
+    return query.group_by(LeaderboardRollupRecord.user).order_by(db.func.sum(LeaderboardRollupRecord.targets).desc())
+
+
 def get_top_langs(request_args: MultiDict[str, str]) -> dict[str, Any]:
     """
     Handle top_langs API requests.
@@ -92,8 +228,8 @@ def get_top_langs(request_args: MultiDict[str, str]) -> dict[str, Any]:
             AND p.user IS NOT NULL
             AND p.lang != ''
             AND p.lang IS NOT NULL
-            AND YEAR (p.pupdate) = '2025'
-            AND MONTH (p.pupdate) = '02'
+            AND p.pub_date >= '2025-02-01'
+            AND p.pub_date < '2025-03-01'
             AND u.user_group = 'WIKI'
             AND p.cat = 'RTT'
         GROUP BY
@@ -110,47 +246,10 @@ def get_top_langs(request_args: MultiDict[str, str]) -> dict[str, Any]:
     form = get_form(request_args)
 
     try:
-        # Build the word count expression
-        word_expr = case(
-            (
-                PageRecord.word.is_not(None) & (PageRecord.word != 0) & (PageRecord.word != ""),
-                PageRecord.word,
-            ),
-            (PageRecord.translate_type == "all", WordRecord.w_all_words),
-            else_=WordRecord.w_lead_words,
-        )
-
-        # Build the views expression (CAST to UNSIGNED)
-        views_expr = case(
-            (ViewsNewAllRecord.views.is_(None) | (ViewsNewAllRecord.views == ""), 0),
-            else_=cast(ViewsNewAllRecord.views, db.Integer),
-        )
-
-        # Query with joins
-        query = (
-            db.session.query(
-                PageRecord.lang,
-                LangRecord.name.label("lang_name"),
-                db.func.count(PageRecord.target).label("targets"),
-                db.func.sum(word_expr).label("words"),
-                db.func.sum(views_expr).label("views"),
-            )
-            .outerjoin(WordRecord, WordRecord.w_title == PageRecord.title)
-            .outerjoin(
-                ViewsNewAllRecord,
-                (PageRecord.target == ViewsNewAllRecord.target) & (PageRecord.lang == ViewsNewAllRecord.lang),
-            )
-            .outerjoin(LangRecord, PageRecord.lang == LangRecord.code)
-            .filter(PageRecord.target != "")
-            .filter(PageRecord.target.is_not(None))
-            .filter(PageRecord.user != "")
-            .filter(PageRecord.user.is_not(None))
-            .filter(PageRecord.lang != "")
-            .filter(PageRecord.lang.is_not(None))
-        )
-
-        query = apply_filters(form, query)
-        query = query.group_by(PageRecord.lang, LangRecord.name).order_by(db.func.count(PageRecord.target).desc())
+        if leaderboard_rollup_enabled():
+            query = _top_langs_rollup_query(form)
+        else:
+            query = _top_langs_pages_query(form)
         if form.limit:
             query = query.limit(int(form.limit))
 
@@ -166,7 +265,7 @@ def get_top_langs(request_args: MultiDict[str, str]) -> dict[str, Any]:
             {
                 "lang": row.lang,
                 "lang_name": row.lang_name if row.lang_name else row.lang,
-                "targets": row.targets,
+                "targets": int(row.targets or 0),
                 "words": int(row.words) if row.words else 0,
                 "views": int(row.views) if row.views else 0,
             }
@@ -223,8 +322,8 @@ def get_top_users(request_args: MultiDict[str, str]) -> dict[str, Any]:
             AND p.user IS NOT NULL
             AND p.lang != ''
             AND p.lang IS NOT NULL
-            AND YEAR (p.pupdate) = '2025'
-            AND MONTH (p.pupdate) = '02'
+            AND p.pub_date >= '2025-02-01'
+            AND p.pub_date < '2025-03-01'
             AND u.user_group = 'WIKI'
             AND p.cat = 'RTT'
         GROUP BY
@@ -239,46 +338,10 @@ def get_top_users(request_args: MultiDict[str, str]) -> dict[str, Any]:
     form = get_form(request_args)
 
     try:
-        # Build the word count expression
-        word_expr = case(
-            (
-                PageRecord.word.is_not(None) & (PageRecord.word != 0) & (PageRecord.word != ""),
-                PageRecord.word,
-            ),
-            (PageRecord.translate_type == "all", WordRecord.w_all_words),
-            else_=WordRecord.w_lead_words,
-        )
-
-        # Build the views expression (CAST to UNSIGNED)
-        views_expr = case(
-            (ViewsNewAllRecord.views.is_(None) | (ViewsNewAllRecord.views == ""), 0),
-            else_=cast(ViewsNewAllRecord.views, db.Integer),
-        )
-
-        # Query with joins
-        query = (
-            db.session.query(
-                PageRecord.user,
-                db.func.count(PageRecord.target).label("targets"),
-                db.func.sum(word_expr).label("words"),
-                db.func.sum(views_expr).label("views"),
-            )
-            .outerjoin(WordRecord, WordRecord.w_title == PageRecord.title)
-            .outerjoin(
-                ViewsNewAllRecord,
-                (PageRecord.target == ViewsNewAllRecord.target) & (PageRecord.lang == ViewsNewAllRecord.lang),
-            )
-            .filter(PageRecord.target != "")
-            .filter(PageRecord.target.is_not(None))
-            .filter(PageRecord.user != "")
-            .filter(PageRecord.user.is_not(None))
-            .filter(PageRecord.lang != "")
-            .filter(PageRecord.lang.is_not(None))
-        )
-
-        query = apply_filters(form, query)
-
-        query = query.group_by(PageRecord.user).order_by(db.func.count(PageRecord.target).desc())
+        if leaderboard_rollup_enabled():
+            query = _top_users_rollup_query(form)
+        else:
+            query = _top_users_pages_query(form)
         if form.limit:
             query = query.limit(int(form.limit))
         results = query.all()
@@ -292,7 +355,7 @@ def get_top_users(request_args: MultiDict[str, str]) -> dict[str, Any]:
         data: list[dict[str, Any]] = [
             {
                 "user": row.user,
-                "targets": row.targets,
+                "targets": int(row.targets or 0),
                 "words": int(row.words) if row.words else 0,
                 "views": int(row.views) if row.views else 0,
             }
@@ -311,6 +374,8 @@ def get_top_users(request_args: MultiDict[str, str]) -> dict[str, Any]:
 
 
 __all__ = [
+    "STATUS_TABLES",
+    "TOP_STATS_TABLES",
     "get_top_langs",
     "get_top_users",
 ]
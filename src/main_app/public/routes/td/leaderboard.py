@@ -9,12 +9,26 @@ from typing import Any
 
 from flask import (
     Blueprint,
+    flash,
     render_template,
     request,
+    url_for,
 )
 
+from markupsafe import Markup
+
+from ....config import settings
+from ....db.exceptions import QueryBudgetExceededError
+from ....db.parallel_loader import ParallelLoader
 from ....db.services import CategoryService, LeaderboardService, ProjectService
 from ..api.top_stats_routes import get_top_langs, get_top_users
+from .leaderboard_fragments import (
+    CHART_FRAGMENT_TABLES,
+    TABLES_FRAGMENT_TABLES,
+    leaderboard_fragments,
+    table_versions,
+)
+from .leaderboard_table import default_pages_query, encode_cursor, parse_pages_query
 
 logger = logging.getLogger(__name__)
 
@@ -68,16 +82,71 @@ class LeaderBoardRoutes:
         camp = request.args.get("camp", type=str)
         campaign_to_cats = self.category_service.get_camp_to_cats()
 
-        form_data = self.load_form_data(list(campaign_to_cats.keys()), year)
-
         cat = campaign_to_cats.get(camp) if camp and camp != "all" else None
-        chart_data = self.load_chart_data(cat, year, camp)
+        user_group = request.args.get("user_group", type=str)
+
+        # Fragments cached for these filters skip their queries altogether
+        tables_key = tuple(sorted(request.args.items(multi=True)))
+        chart_key = (cat, year, camp, user_group)
+        tables_versions = table_versions(TABLES_FRAGMENT_TABLES)
+        chart_versions = table_versions(CHART_FRAGMENT_TABLES)
+        tables_fragments = leaderboard_fragments.get("tables", tables_key, TABLES_FRAGMENT_TABLES)
+        chart_fragments = leaderboard_fragments.get("chart", chart_key, CHART_FRAGMENT_TABLES)
+
+        campaigns = list(campaign_to_cats.keys())
+        loader = ParallelLoader()
+        loader.add(
+            "form_data",
+            self.load_form_data,
+            campaigns,
+            year,
+            default={"campaigns": campaigns, "years": [], "months": [], "user_groups": []},
+        )
+        if chart_fragments is None:
+            loader.add("chart_data", self.load_chart_data, cat, year, camp, default={"labels": [], "counts": []})
+        if tables_fragments is None:
+            loader.add("langs_data", get_top_langs, request.args, default={})
+            loader.add("users_data", get_top_users, request.args, default={})
+            loader.add("users_top_langs", self.lederboard_service.top_lang_of_users, default=[])
+        loaded = loader.run()
+        if loaded.timed_out:
+            flash("Parts of the leaderboard took too long to load and were skipped; try again shortly.", "warning")
+
+        if chart_fragments is None:
+            chart_data = loaded["chart_data"]
+            chart_fragments = {
+                "chart_data": Markup(render_template("td/leaderboard/_chart_data.html", chart_data=chart_data))
+            }
+            if "chart_data" not in loaded.timed_out:
+                leaderboard_fragments.put("chart", chart_key, CHART_FRAGMENT_TABLES, chart_fragments, chart_versions)
+
+        if tables_fragments is None:
+            langs_data = loaded["langs_data"]
+            users_data = loaded["users_data"]
+            tables_fragments = self.render_table_fragments(langs_data, users_data, loaded["users_top_langs"])
+            complete = not loaded.timed_out and not langs_data.get("error") and not users_data.get("error")
+            if complete:
+                leaderboard_fragments.put(
+                    "tables", tables_key, TABLES_FRAGMENT_TABLES, tables_fragments, tables_versions
+                )
 
         form_selected_data = request.args
 
-        langs_data = get_top_langs(request.args)
-        users_data = get_top_users(request.args)
+        return render_template(
+            "td/leaderboard/index.html",
+            # data to use in form
+            form_data=loaded["form_data"],
+            selected_data=form_selected_data,
+            fragments={**chart_fragments, **tables_fragments},  # main data
+        )
 
+    def render_table_fragments(
+        self,
+        langs_data: dict[str, Any],
+        users_data: dict[str, Any],
+        users_top_langs: list[dict[Any, Any]],
+    ) -> dict[str, Markup]:
+        """Render the numbers card, the top users / languages tables and the targets list."""
         result = {
             "langs": langs_data.get("results") or [],
             "users": users_data.get("results") or [],
@@ -86,7 +155,6 @@ class LeaderBoardRoutes:
 
         if users_data.get("results"):
             # {row["user"]: {"lang": row["lang"], "count": row["count"]} for row in result_list}
-            users_top_langs: list[dict[Any, Any]] = self.lederboard_service.top_lang_of_users()
             result["users_top_langs"] = {row["user"]: row for row in users_top_langs}
 
         users_total = users_data.get("count") or 0
@@ -94,27 +162,18 @@ class LeaderBoardRoutes:
 
         numbers_summary = self.load_summary_data(result["users"], users_total, langs_total)
 
-        return render_template(
-            "td/leaderboard/index.html",
-            # data to use in form
-            form_data=form_data,
-            selected_data=form_selected_data,
-            chart_data=chart_data,
-            numbers_summary=numbers_summary,
-            result=result,  # main data
-        )
+        return {
+            "numbers": Markup(render_template("td/leaderboard/_numbers.html", numbers_summary=numbers_summary)),
+            "top_users": Markup(render_template("td/leaderboard/_top_users.html", result=result)),
+            "top_langs": Markup(render_template("td/leaderboard/_top_langs.html", result=result)),
+            "users_targets": Markup(render_template("td/leaderboard/_users_targets.html", result=result)),
+        }
 
     def langs(self, lang_code: str) -> str:
         selected_year = request.args.get("year", type=int)
         lang_years: list[int] = self.lederboard_service.get_pages_years(lang=lang_code)
 
-        lang_pages = self.lederboard_service.get_pages(
-            year=selected_year,
-            lang=lang_code,
-        )
-
-        words_total = sum(int(page["word"]) for page in lang_pages if page.get("word"))
-        pageviews_total = sum(int(page["views"]) for page in lang_pages if page.get("views"))
+        pages_data = self.load_pages(year=selected_year, lang=lang_code)
 
         chart_data = self.lederboard_service.get_chart_data_formatted(
             lang=lang_code,
@@ -129,11 +188,11 @@ class LeaderBoardRoutes:
             },
             selected_data={
                 "year": selected_year,
+                "sort": pages_data["sort"],
+                "order": pages_data["order"],
             },
-            words_total=words_total,
-            pageviews_total=pageviews_total,
             chart_data=chart_data,
-            pages=lang_pages,  # main data
+            **pages_data,  # main data
         )
 
     def users(self, username: str) -> str:
@@ -143,13 +202,7 @@ class LeaderBoardRoutes:
         user_years: list[int] = self.lederboard_service.get_pages_years(user=username)
         user_langs = self.lederboard_service.top_lang_of_user(username)
 
-        user_pages = self.lederboard_service.get_pages(
-            user=username,
-            year=selected_year,
-            lang=selected_lang,
-        )
-        words_total = sum(page["word"] for page in user_pages if page.get("word"))
-        pageviews_total = sum(page["views"] for page in user_pages if page.get("views"))
+        pages_data = self.load_pages(user=username, year=selected_year, lang=selected_lang)
 
         chart_data = self.lederboard_service.get_chart_data_formatted(
             user=username,
@@ -170,13 +223,62 @@ class LeaderBoardRoutes:
             selected_data={
                 "year": selected_year,
                 "lang": selected_lang,
+                "sort": pages_data["sort"],
+                "order": pages_data["order"],
             },
-            words_total=words_total,
-            pageviews_total=pageviews_total,
             chart_data=chart_data,
-            pages=user_pages,  # main data
+            **pages_data,  # main data
         )
 
+    def load_pages(self, **filters: Any) -> dict[str, Any]:
+        """
+        Return the pages table context: one sorted page of rows plus the totals over all of them.
+
+        Either part is left empty (with a notice) if its query ran past the budget.
+        """
+        page_size = settings.performance.leaderboard_page_size
+        try:
+            query = parse_pages_query(request.args, page_size)
+        except ValueError as exc:
+            flash(f"Invalid pages list arguments: {exc}", "warning")
+            query = default_pages_query(page_size)
+
+        try:
+            totals = self.lederboard_service.get_pages_totals(**filters)
+        except QueryBudgetExceededError:
+            flash("The pages totals took too long to load and were skipped; try filtering by year.", "warning")
+            totals = {"articles": 0, "words": 0, "pageviews": 0}
+
+        pages: list[dict[str, Any]] = []
+        next_url = None
+        try:
+            pages_slice = self.lederboard_service.get_pages_slice(
+                sort=query.sort,
+                order=query.order,
+                limit=query.limit,
+                after=query.after,
+                **filters,
+            )
+        except QueryBudgetExceededError:
+            flash("The pages list took too long to load and was skipped; try filtering by year.", "warning")
+        else:
+            pages = pages_slice.rows
+            if pages_slice.next_key is not None:
+                args = request.args.to_dict()
+                args["after"] = encode_cursor(query, pages_slice.next_key, query.offset + len(pages))
+                next_url = url_for(request.endpoint, **(request.view_args or {}), **args)
+
+        return {
+            "pages": pages,
+            "offset": query.offset,
+            "next_url": next_url,
+            "sort": query.sort,
+            "order": query.order,
+            "articles_total": totals["articles"],
+            "words_total": totals["words"],
+            "pageviews_total": totals["pageviews"],
+        }
+
     def load_chart_data(self, cat, year, camp):
         user_group = request.args.get("user_group", type=str)
         chart_data = self.lederboard_service.get_chart_data_formatted(
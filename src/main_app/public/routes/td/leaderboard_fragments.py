@@ -0,0 +1,114 @@
+"""
+Rendered-fragment cache for the leaderboard index page.
+
+The chart data and the top users / top languages tables (with the numbers
+card and the targets list derived from them) only change when one of the
+tables they read is written. Their rendered HTML is kept per fragment group
+and filter arguments, so a repeated view skips both the queries and the
+template rendering for them.
+
+An entry is served while none of its tables has been written in this worker
+(``query_cache.bump_table_version``) and it is younger than
+``settings.performance.leaderboard_fragment_ttl`` seconds, which bounds how
+long writes handled by other workers go unnoticed. A TTL of 0 disables the
+cache.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from dataclasses import dataclass
+
+from markupsafe import Markup
+
+from ....config import settings
+from ....db.services.utils import get_table_version
+from ....shared.core.metrics import metrics
+from ..api.top_stats_routes import STATUS_TABLES, TOP_STATS_TABLES
+
+FRAGMENT_MAXSIZE = 256
+
+# The fragments read what /api/top_langs, /api/top_users and /api/status read
+TABLES_FRAGMENT_TABLES = TOP_STATS_TABLES
+CHART_FRAGMENT_TABLES = STATUS_TABLES
+
+
+@dataclass(frozen=True)
+class _Entry:
+    fragments: dict[str, Markup]
+    versions: tuple[int, ...]
+    built_at: float
+
+
+class FragmentCache:
+    def __init__(self, maxsize: int = FRAGMENT_MAXSIZE) -> None:
+        self.maxsize = maxsize
+        self._entries: OrderedDict[tuple[str, Hashable], _Entry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, group: str, key: Hashable, tables: tuple[str, ...]) -> dict[str, Markup] | None:
+        """Return the fragments stored for ``group``/``key`` if they are still fresh."""
+        ttl = settings.performance.leaderboard_fragment_ttl
+        if ttl <= 0:
+            return None
+
+        versions = table_versions(tables)
+        with self._lock:
+            entry = self._entries.get((group, key))
+            if entry is not None and entry.versions == versions and time.monotonic() - entry.built_at < ttl:
+                self._entries.move_to_end((group, key))
+                metrics.incr("leaderboard_fragments.hits", group=group)
+                return entry.fragments
+
+        metrics.incr("leaderboard_fragments.misses", group=group)
+        return None
+
+    def put(
+        self,
+        group: str,
+        key: Hashable,
+        tables: tuple[str, ...],
+        fragments: dict[str, Markup],
+        versions: tuple[int, ...] | None = None,
+    ) -> None:
+        """
+        Store rendered fragments for ``group``/``key``.
+
+        Pass the ``versions`` read before the data was loaded, so a write that
+        lands while rendering leaves the entry already stale.
+        """
+        if settings.performance.leaderboard_fragment_ttl <= 0:
+            return
+        if versions is None:
+            versions = table_versions(tables)
+        with self._lock:
+            self._entries[(group, key)] = _Entry(fragments=fragments, versions=versions, built_at=time.monotonic())
+            self._entries.move_to_end((group, key))
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def table_versions(tables: tuple[str, ...]) -> tuple[int, ...]:
+    return tuple(get_table_version(table) for table in tables)
+
+
+leaderboard_fragments = FragmentCache()
+
+
+__all__ = [
+    "CHART_FRAGMENT_TABLES",
+    "FragmentCache",
+    "TABLES_FRAGMENT_TABLES",
+    "leaderboard_fragments",
+    "table_versions",
+]
@@ -0,0 +1,124 @@
+"""
+Sort and keyset pagination arguments for the per-user and per-language leaderboard pages.
+
+``LeaderboardService.get_pages_slice`` does the ordering and slicing in SQL;
+this module only turns request arguments into a ``PagesQuery`` and back. A
+page is addressed by an opaque cursor holding the sort key of the last row
+returned (sort value and page id) plus how many rows came before it, which
+keeps the row numbers running across pages.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any
+
+from ....db.services.pages.leaderboard_service import PAGES_SORT_FIELDS
+
+NUMERIC_SORT_FIELDS = ("words", "views")
+
+DEFAULT_SORT = ("date", "desc")
+
+MAX_PAGE_SIZE = 500
+
+
+@dataclass(frozen=True)
+class PagesQuery:
+    sort: str
+    order: str
+    limit: int | None
+    after: tuple[Any, int] | None = None
+    offset: int = 0
+
+
+def encode_cursor(query: PagesQuery, key: tuple[Any, int], offset: int) -> str:
+    payload = json.dumps({"s": query.sort, "o": query.order, "k": list(key), "n": offset}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort: str, order: str) -> tuple[tuple[Any, int], int]:
+    """
+    Decode a cursor returned by ``encode_cursor`` for the same sort and order.
+
+    Returns the (sort value, page id) key and the number of rows before it.
+
+    Raises:
+        ValueError: If the cursor is malformed or was issued for another sort.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as exc:
+        raise ValueError("Invalid cursor") from exc
+
+    if not isinstance(payload, dict) or payload.get("s") != sort or payload.get("o") != order:
+        raise ValueError("Cursor does not match the requested sort")
+
+    key = payload.get("k")
+    offset = payload.get("n")
+    value_kind = int if sort in NUMERIC_SORT_FIELDS else str
+    if (
+        not isinstance(key, list)
+        or len(key) != 2
+        or type(key[0]) is not value_kind
+        or type(key[1]) is not int
+        or type(offset) is not int
+        or offset < 0
+    ):
+        raise ValueError("Invalid cursor")
+    return (key[0], key[1]), offset
+
+
+def parse_pages_query(args: Mapping[str, str], default_limit: int) -> PagesQuery:
+    """
+    Build a ``PagesQuery`` from request arguments (``sort``, ``order``, ``limit``, ``after``).
+
+    A ``default_limit`` of 0 lists every row on one page unless ``limit`` is given.
+
+    Raises:
+        ValueError: If an argument is not valid.
+    """
+    default_sort, default_order = DEFAULT_SORT
+    sort = (args.get("sort") or default_sort).strip()
+    if sort not in PAGES_SORT_FIELDS:
+        raise ValueError(f"sort must be one of {', '.join(PAGES_SORT_FIELDS)}")
+
+    order = (args.get("order") or (default_order if sort == default_sort else "asc")).strip().lower()
+    if order not in ("asc", "desc"):
+        raise ValueError("order must be asc or desc")
+
+    raw_limit = (args.get("limit") or "").strip()
+    try:
+        limit = int(raw_limit) if raw_limit else default_limit
+    except ValueError as exc:
+        raise ValueError("limit must be an integer") from exc
+
+    after_raw = (args.get("after") or "").strip()
+    after, offset = decode_cursor(after_raw, sort, order) if after_raw else (None, 0)
+
+    return PagesQuery(
+        sort=sort,
+        order=order,
+        limit=max(1, min(limit, MAX_PAGE_SIZE)) if limit else None,
+        after=after,
+        offset=offset,
+    )
+
+
+def default_pages_query(default_limit: int) -> PagesQuery:
+    sort, order = DEFAULT_SORT
+    return PagesQuery(sort=sort, order=order, limit=min(default_limit, MAX_PAGE_SIZE) or None)
+
+
+__all__ = [
+    "MAX_PAGE_SIZE",
+    "PagesQuery",
+    "decode_cursor",
+    "default_pages_query",
+    "encode_cursor",
+    "parse_pages_query",
+]
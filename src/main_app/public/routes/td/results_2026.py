@@ -15,7 +15,10 @@ The orchestrator returns a plain dict (the "results bundle") that
 
 from __future__ import annotations
 
+import dataclasses
+import functools
 import logging
+from collections.abc import Callable, Set
 from typing import Any
 
 from ....db.services import (
@@ -31,27 +34,33 @@ from ....shared.utils.wiki_links import (
     wikidata_link,
     wikipedia_link,
 )
+from .results_snapshot import results_snapshots
+from .results_table import TablePage, TableQuery, default_table_query, paginate_rows
 
 logger = logging.getLogger(__name__)
 
 
-def _get_inprocess_for_missing(missing_titles: set[str], code: str) -> dict[str, dict]:
-    """Mirror of PHP ``getinprocess_n($missing, $code)``."""
+def _get_inprocess_for_missing(missing_titles: set[str], code: str, cat: str) -> dict[str, dict]:
+    """Mirror of PHP ``getinprocess_n($missing, $code)``.
+
+    Only the in_process rows of the category's members are loaded; the
+    missing-set filter runs on that small result.
+    """
     service = InProcessService()
-    records = service.list_in_process_by_lang(code)
+    records = service.list_in_process_by_lang_category(code, cat)
     result: dict[str, dict] = {}
     for r in records:
-        if r.title not in missing_titles:
+        if r["title"] not in missing_titles:
             continue
-        result[r.title] = {
-            "id": r.id,
-            "title": r.title,
-            "user": r.user or "",
-            "lang": r.lang,
-            "cat": r.cat or "",
-            "translate_type": r.translate_type or "",
-            "word": r.word or 0,
-            "add_date": r.add_date,  # datetime or None
+        result[r["title"]] = {
+            "id": r["id"],
+            "title": r["title"],
+            "user": r["user"] or "",
+            "lang": r["lang"],
+            "cat": r["cat"] or "",
+            "translate_type": r["translate_type"] or "",
+            "word": r["word"] or 0,
+            "add_date": r["add_date"],  # datetime or None
         }
     return result
 
@@ -141,55 +150,65 @@ def _make_missing_row_dict(
     count: int,
     is_full_row: bool,
     tra_type: str,
-    langcode: str,
-    cat: str,
-    camp: str,
-    full_tr_user: bool,
 ) -> dict[str, Any]:
-    """Build one row dict for the Results table (PHP _make_one_row_results)."""
+    """Build one row dict for the Results table (PHP _make_one_row_results), without its HTML columns."""
     is_video_title = _is_video(title)
     effective_tra_type = "all" if is_video_title else (tra_type or "lead")
     words, refs, importance, en_views, qid = _row_metrics(title_data, effective_tra_type)
 
-    translate_html = _missing_translate_html(
-        title=title,
-        langcode=langcode,
-        cat=cat,
-        camp=camp,
-        tra_type=effective_tra_type,
-        words=words,
-        full_tr_user=full_tr_user,
-        is_video_title=is_video_title,
-    )
-
     # PHP "$count = $full && (substr != 'video:') ? '$count.Full' : $count"
     display_n: str = f"{count}.Full" if is_full_row and not is_video_title else str(count)
 
     return {
         "n": display_n,
         "title": title,
-        "translate_html": translate_html,
         "en_views": en_views,
         "importance": importance,
         "words": words,
         "refs": refs,
-        "qid_html": wikidata_link(qid),
         "is_full_row": is_full_row,
+        "_tra_type": effective_tra_type,
+        "_qid": qid,
     }
 
 
-def _build_missing_rows(
+def _public_fields(row: dict[str, Any]) -> dict[str, Any]:
+    return {key: value for key, value in row.items() if not key.startswith("_")}
+
+
+def _render_missing_row(
+    row: dict[str, Any],
     *,
-    missing: list[dict],
     langcode: str,
     cat: str,
     camp: str,
+    full_tr_user: bool,
+) -> dict[str, Any]:
+    """Add the Translate and Wikidata columns to a row from ``_build_missing_rows``."""
+    rendered = _public_fields(row)
+    rendered["translate_html"] = _missing_translate_html(
+        title=row["title"],
+        langcode=langcode,
+        cat=cat,
+        camp=camp,
+        tra_type=row["_tra_type"],
+        words=row["words"],
+        full_tr_user=full_tr_user,
+        is_video_title=_is_video(row["title"]),
+    )
+    rendered["qid_html"] = wikidata_link(row["_qid"])
+    return rendered
+
+
+def _build_missing_rows(
+    *,
+    missing: list[dict],
     tra_type: str,
     full_tr_user: bool,
-    nolead_titles: set[str],
-    full_titles: set[str],
+    nolead_titles: Set[str],
+    full_titles: Set[str],
 ) -> list[dict[str, Any]]:
-    """Mirror of PHP ``make_results_table_2026``."""
+    """Mirror of PHP ``make_results_table_2026``; ``_render_missing_row`` adds the HTML columns."""
     do_full = (tra_type or "lead") != "all"
 
     # PHP usort by en_views desc.
@@ -217,10 +236,6 @@ def _build_missing_rows(
             count=numb,
             is_full_row=False,
             tra_type=tra_type,
-            langcode=langcode,
-            cat=cat,
-            camp=camp,
-            full_tr_user=full_tr_user,
         )
 
         # PHP: "if (!$do_full || $full_tr_user) { emit and continue; }"
@@ -247,10 +262,6 @@ def _build_missing_rows(
                     count=numb,
                     is_full_row=True,
                     tra_type="all",
-                    langcode=langcode,
-                    cat=cat,
-                    camp=camp,
-                    full_tr_user=full_tr_user,
                 )
             )
 
@@ -318,15 +329,9 @@ def _format_inprocess_date(value: Any) -> str:
 def _build_inprocess_rows(
     *,
     inprocess: dict[str, dict],
-    langcode: str,
-    cat: str,
-    camp: str,
-    tra_btn: str,
-    full_tr_user: bool,
     titles_infos: dict[str, dict],
-    endpoint: str,
 ) -> list[dict[str, Any]]:
-    """Mirror of PHP ``make_results_table_inprocess``."""
+    """Mirror of PHP ``make_results_table_inprocess``; ``_render_inprocess_row`` adds the HTML columns."""
     rows: list[dict[str, Any]] = []
     numb = 1
 
@@ -338,40 +343,24 @@ def _build_inprocess_rows(
         title_data = titles_infos.get(title) or titles_infos.get(display_title) or {}
 
         tra_type = title_tab.get("translate_type") or ""
-        is_video_title = _is_video(display_title)
-        if is_video_title:
+        if _is_video(display_title):
             tra_type = "all"
 
         words, refs, importance, en_views, qid = _row_metrics(title_data, tra_type or "lead")
 
-        user = title_tab.get("user") or ""
-
-        translate_html = _inprocess_translate_html(
-            title=display_title,
-            tra_type=tra_type,
-            langcode=langcode,
-            cat=cat,
-            camp=camp,
-            words=words,
-            tra_btn=tra_btn,
-            full_tr_user=full_tr_user,
-            is_video_title=is_video_title,
-            endpoint=endpoint,
-        )
-
         rows.append(
             {
                 "n": str(numb),
                 "title": display_title,
-                "translate_html": translate_html,
                 "en_views": en_views,
                 "importance": importance,
                 "words": words,
                 "refs": refs,
-                "qid_html": wikidata_link(qid),
-                "user": user,
+                "user": title_tab.get("user") or "",
                 "date": _format_inprocess_date(title_tab.get("add_date") or title_tab.get("date")),
                 "is_full_row": False,
+                "_tra_type": tra_type,
+                "_qid": qid,
             }
         )
 
@@ -380,21 +369,41 @@ def _build_inprocess_rows(
     return rows
 
 
-# ---------------------------------------------------------------------------
-# Exists rows
-# ---------------------------------------------------------------------------
-
-
-def _build_exists_rows(
+def _render_inprocess_row(
+    row: dict[str, Any],
     *,
-    exists: dict[str, dict],
     langcode: str,
     cat: str,
     camp: str,
-    user_coord: bool,
+    tra_btn: str,
+    full_tr_user: bool,
     endpoint: str,
-) -> tuple[list[dict[str, Any]], int, int]:
-    """Mirror of PHP ``make_results_table_exists_2026``.
+) -> dict[str, Any]:
+    """Add the Translate and Wikidata columns to a row from ``_build_inprocess_rows``."""
+    rendered = _public_fields(row)
+    rendered["translate_html"] = _inprocess_translate_html(
+        title=row["title"],
+        tra_type=row["_tra_type"],
+        langcode=langcode,
+        cat=cat,
+        camp=camp,
+        words=row["words"],
+        tra_btn=tra_btn,
+        full_tr_user=full_tr_user,
+        is_video_title=_is_video(row["title"]),
+        endpoint=endpoint,
+    )
+    rendered["qid_html"] = wikidata_link(row["_qid"])
+    return rendered
+
+
+# ---------------------------------------------------------------------------
+# Exists rows
+# ---------------------------------------------------------------------------
+
+
+def _build_exists_rows(*, exists: dict[str, dict]) -> tuple[list[dict[str, Any]], int, int]:
+    """Mirror of PHP ``make_results_table_exists_2026``; ``_render_exists_row`` adds the HTML columns.
 
     Returns ``(rows, count_translated, count_translated_before)``.
     """
@@ -407,37 +416,19 @@ def _build_exists_rows(
         if not title:
             continue
 
-        display_title = title.replace("_", " ")
         via = target_tab.get("via", "")
-        target = target_tab.get("target") or ""
-
         if via == "td":
             count_translated += 1
         else:
             count_translated_before += 1
 
-        translated_html = wikipedia_link(target, langcode) if (target and via == "td") else ""
-        translated_before_html = wikipedia_link(target, langcode) if (target and via != "td") else ""
-
-        # PHP: $tab is shown only when user_coord
-        if user_coord:
-            translate_url = content_translation_url(display_title, langcode, camp, "lead", endpoint)
-            translate_html = (
-                "<div class='inline'>"
-                f"<a href='{translate_url}' class='btn btn-outline-primary btn-sm' target='_blank'>Translate</a>"
-                "</div>"
-            )
-        else:
-            translate_html = ""
-
         rows.append(
             {
                 "n": str(numb),
-                "display_title": display_title,
-                "translate_html": translate_html,
-                "translated_html": translated_html,
-                "translated_before_html": translated_before_html,
-                "qid_html": wikidata_link(target_tab.get("qid") or ""),
+                "display_title": title.replace("_", " "),
+                "_via": via,
+                "_target": target_tab.get("target") or "",
+                "_qid": target_tab.get("qid") or "",
             }
         )
 
@@ -446,34 +437,48 @@ def _build_exists_rows(
     return rows, count_translated, count_translated_before
 
 
-# ---------------------------------------------------------------------------
-# Public entry point
-# ---------------------------------------------------------------------------
-
-
-def results_loader_2026(
+def _render_exists_row(
+    row: dict[str, Any],
     *,
-    code: str,
+    langcode: str,
     camp: str,
-    cat: str,
-    tra_type: str,
-    code_lang_name: str,
     user_coord: bool,
-    settings: dict[str, bool],
-    full_tr_user: bool,
+    endpoint: str,
 ) -> dict[str, Any]:
-    """Build the results bundle for the index page.
+    """Add the link columns to a row from ``_build_exists_rows``."""
+    rendered = _public_fields(row)
+    target, via = row["_target"], row["_via"]
+
+    # PHP: $tab is shown only when user_coord
+    if user_coord:
+        translate_url = content_translation_url(row["display_title"], langcode, camp, "lead", endpoint)
+        rendered["translate_html"] = (
+            "<div class='inline'>"
+            f"<a href='{translate_url}' class='btn btn-outline-primary btn-sm' target='_blank'>Translate</a>"
+            "</div>"
+        )
+    else:
+        rendered["translate_html"] = ""
 
-    Mirrors PHP ``results_loader_2026($data)`` + ``Results_tables_2026(...)``.
-    Returns a dict with the data the Jinja templates need; produces no HTML
-    side effects of its own.
-    """
-    # logic from results_2026/get_results_2026.php
-    bucket = get_results_2026(cat, code)
+    rendered["translated_html"] = wikipedia_link(target, langcode) if (target and via == "td") else ""
+    rendered["translated_before_html"] = wikipedia_link(target, langcode) if (target and via != "td") else ""
+    rendered["qid_html"] = wikidata_link(row["_qid"])
+    return rendered
+
+
+# ---------------------------------------------------------------------------
+# Public entry points
+# ---------------------------------------------------------------------------
+
+
+def _inprocess_button(settings: dict[str, bool], user_coord: bool) -> str:
+    show_btn = settings["show_translation_button"]
+    if isinstance(show_btn, str):
+        show_btn = show_btn.lower() in ("1", "true", "yes", "on")
+    return "1" if (show_btn and user_coord) else "0"
 
-    # logic from results_2026/index.php — load_translate_type('no'|'full')
-    nolead_titles, full_titles = _load_translate_type_sets()
 
+def _titles_infos(bucket: dict[str, Any]) -> dict[str, dict]:
     # logic from results_2026/index.php — Results_tables_2026
     # Build a lookup of per-title metrics so the inprocess rows can reuse the
     # missing/exists data we already loaded (PHP gets this via
@@ -483,53 +488,156 @@ def results_loader_2026(
         titles_infos[row["title"]] = row
     for title, row in bucket["exists"].items():
         titles_infos.setdefault(title, row)
+    return titles_infos
 
-    endpoint = get_endpoint()
 
-    show_btn = settings["show_translation_button"]
-    if isinstance(show_btn, str):
-        show_btn = show_btn.lower() in ("1", "true", "yes", "on")
-    inprocess_button = "1" if (show_btn and user_coord) else "0"
+def _table_rows(
+    table: str,
+    snapshot: dict[str, Any],
+    *,
+    tra_type: str,
+    full_tr_user: bool,
+) -> list[dict[str, Any]]:
+    """Build the unrendered rows of one results table; cheap enough to sort and filter all of them."""
+    bucket = snapshot["bucket"]
+    if table == "missing":
+        return _build_missing_rows(
+            missing=bucket["missing"],
+            tra_type=tra_type,
+            full_tr_user=full_tr_user,
+            nolead_titles=snapshot["nolead_titles"],
+            full_titles=snapshot["full_titles"],
+        )
+    if table == "inprocess":
+        return _build_inprocess_rows(inprocess=bucket["inprocess"], titles_infos=_titles_infos(bucket))
+    return _build_exists_rows(exists=bucket["exists"])[0]
 
-    missing_rows = _build_missing_rows(
-        missing=bucket["missing"],
-        langcode=code,
-        cat=cat,
-        camp=camp,
-        tra_type=tra_type,
-        full_tr_user=full_tr_user,
-        nolead_titles=nolead_titles,
-        full_titles=full_titles,
+
+def _row_renderer(
+    table: str,
+    *,
+    code: str,
+    camp: str,
+    cat: str,
+    user_coord: bool,
+    settings: dict[str, bool],
+    full_tr_user: bool,
+) -> Callable[[dict[str, Any]], dict[str, Any]]:
+    """Return the function that adds the HTML columns to one row of ``table``."""
+    if table == "missing":
+        return functools.partial(_render_missing_row, langcode=code, cat=cat, camp=camp, full_tr_user=full_tr_user)
+    if table == "inprocess":
+        return functools.partial(
+            _render_inprocess_row,
+            langcode=code,
+            cat=cat,
+            camp=camp,
+            tra_btn=_inprocess_button(settings, user_coord),
+            full_tr_user=full_tr_user,
+            endpoint=get_endpoint(),
+        )
+    return functools.partial(
+        _render_exists_row, langcode=code, camp=camp, user_coord=user_coord, endpoint=get_endpoint()
     )
 
-    inprocess_rows = _build_inprocess_rows(
-        inprocess=bucket["inprocess"],
-        langcode=code,
-        cat=cat,
+
+def results_table_page(
+    *,
+    query: TableQuery,
+    code: str,
+    camp: str,
+    cat: str,
+    tra_type: str,
+    user_coord: bool,
+    settings: dict[str, bool],
+    full_tr_user: bool,
+) -> TablePage:
+    """One page of a ``/td/table`` results table.
+
+    Only the requested table is built, and only the rows of the returned page
+    get their HTML columns.
+    """
+    snapshot = results_snapshots.get(code, cat, lambda: load_results_snapshot(cat, code))
+    rows = _table_rows(query.table, snapshot, tra_type=tra_type, full_tr_user=full_tr_user)
+    page = paginate_rows(rows, query)
+    render = _row_renderer(
+        query.table,
+        code=code,
         camp=camp,
-        tra_btn=inprocess_button,
+        cat=cat,
+        user_coord=user_coord,
+        settings=settings,
         full_tr_user=full_tr_user,
-        titles_infos=titles_infos,
-        endpoint=endpoint,
     )
+    return dataclasses.replace(page, rows=[render(row) for row in page.rows])
+
+
+def results_loader_2026(
+    *,
+    code: str,
+    camp: str,
+    cat: str,
+    tra_type: str,
+    code_lang_name: str,
+    user_coord: bool,
+    settings: dict[str, bool],
+    full_tr_user: bool,
+    page_size: int = 0,
+) -> dict[str, Any]:
+    """Build the results bundle for the index page.
+
+    Mirrors PHP ``results_loader_2026($data)`` + ``Results_tables_2026(...)``.
+    Returns a dict with the data the Jinja templates need; produces no HTML
+    side effects of its own.
+
+    With ``page_size`` > 0 the missing and exists tables only hold their first
+    page (in the default sort of ``/td/table/rows``) and carry the cursor of
+    the next one; ``*_total`` always counts every row. Only the rows that are
+    returned get their HTML columns.
+    """
+    # Served from the per-(lang, cat) snapshot; treat it as read-only
+    snapshot = results_snapshots.get(code, cat, lambda: load_results_snapshot(cat, code))
+    bucket = snapshot["bucket"]
+    inprocess_button = _inprocess_button(settings, user_coord)
+
+    def renderer(table: str) -> Callable[[dict[str, Any]], dict[str, Any]]:
+        return _row_renderer(
+            table,
+            code=code,
+            camp=camp,
+            cat=cat,
+            user_coord=user_coord,
+            settings=settings,
+            full_tr_user=full_tr_user,
+        )
 
+    missing_rows = _table_rows("missing", snapshot, tra_type=tra_type, full_tr_user=full_tr_user)
+    inprocess_rows = _table_rows("inprocess", snapshot, tra_type=tra_type, full_tr_user=full_tr_user)
     exists_rows, exists_translated_count, exists_translated_before_count = _build_exists_rows(
-        exists=bucket["exists"],
-        langcode=code,
-        cat=cat,
-        camp=camp,
-        user_coord=user_coord,
-        endpoint=endpoint,
+        exists=bucket["exists"]
     )
 
+    missing_total, exists_total = len(missing_rows), len(exists_rows)
+    missing_next_cursor = exists_next_cursor = None
+    if page_size > 0:
+        missing_page = paginate_rows(missing_rows, default_table_query("missing", page_size))
+        exists_page = paginate_rows(exists_rows, default_table_query("exists", page_size))
+        missing_rows, missing_next_cursor = missing_page.rows, missing_page.next_cursor
+        exists_rows, exists_next_cursor = exists_page.rows, exists_page.next_cursor
+
     return {
-        "summary_data": bucket["summary_data"],
+        "summary_data": dict(bucket["summary_data"]),
         "summary_count": len(bucket["missing"]),
-        "missing_rows": missing_rows,
-        "inprocess_rows": inprocess_rows,
+        "missing_rows": list(map(renderer("missing"), missing_rows)),
+        "missing_total": missing_total,
+        "missing_next_cursor": missing_next_cursor,
+        "inprocess_rows": list(map(renderer("inprocess"), inprocess_rows)),
         "inprocess_count": len(bucket["inprocess"]),
-        "exists_rows": exists_rows,
+        "exists_rows": list(map(renderer("exists"), exists_rows)),
+        "exists_total": exists_total,
+        "exists_next_cursor": exists_next_cursor,
         "exists_count": len(bucket["exists"]),
+        "page_size": page_size,
         "exists_translated_count": exists_translated_count,
         "exists_translated_before_count": exists_translated_before_count,
         "show_translation_button": inprocess_button,
@@ -547,6 +655,21 @@ def results_loader_2026(
 # ---------------------------------------------------------------------------
 
 
+def load_results_snapshot(cat: str, code: str) -> dict[str, Any]:
+    """Compute everything ``results_loader_2026`` reads from the database for ``(code, cat)``."""
+    # logic from results_2026/get_results_2026.php
+    bucket = get_results_2026(cat, code)
+
+    # logic from results_2026/index.php — load_translate_type('no'|'full')
+    nolead_titles, full_titles = _load_translate_type_sets()
+
+    return {
+        "bucket": bucket,
+        "nolead_titles": frozenset(nolead_titles),
+        "full_titles": frozenset(full_titles),
+    }
+
+
 def get_results_2026(cat: str, code: str) -> dict[str, Any]:
     """Mirror of PHP ``get_results_2026($cat, $code)``.
 
@@ -561,9 +684,8 @@ def get_results_2026(cat: str, code: str) -> dict[str, Any]:
     exists_via_td = {p.title: p for p in exists_via_td_rows}
 
     result_2026_service = Results2026Service()
-    items_missing = result_2026_service.missing_by_lang_and_category(code, cat)
+    items_missing, items_exists_list = result_2026_service.missing_and_exists_by_lang_and_category(code, cat)
     missing_by_title = {row["title"]: row for row in items_missing if row.get("title")}
-    items_exists_list = result_2026_service.exists_by_lang_and_category(code, cat)
     items_exists: dict[str, dict] = {row["title"]: row for row in items_exists_list}
 
     # Tag each exists row with via="td" or via="before" — PHP foreach loop.
@@ -572,7 +694,7 @@ def get_results_2026(cat: str, code: str) -> dict[str, Any]:
 
     # logic from results_2026/get_results_2026.php — getinprocess_n
     missing_titles = {row["title"] for row in items_missing}
-    inprocess = _get_inprocess_for_missing(missing_titles, code)
+    inprocess = _get_inprocess_for_missing(missing_titles, code, cat)
 
     # Remove inprocess titles from missing.
     if inprocess:
@@ -601,5 +723,7 @@ def get_results_2026(cat: str, code: str) -> dict[str, Any]:
 
 __all__ = [
     "results_loader_2026",
+    "results_table_page",
     "get_results_2026",
+    "load_results_snapshot",
 ]
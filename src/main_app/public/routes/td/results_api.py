@@ -7,8 +7,13 @@ from __future__ import annotations
 import logging
 from typing import Any
 
-from ....db.services import AllQidsService, CategoryService, InProcessService, PagesService
-from ....shared.clients import get_mdwiki_cat_members
+from ....db.services import (
+    AllQidsService,
+    CategoryService,
+    InProcessService,
+    PagesService,
+)
+from ....shared.clients import crawl_mdwiki_category
 
 logger = logging.getLogger(__name__)
 
@@ -24,13 +29,13 @@ def _get_cat_exists_and_missing(
     cat: str,
     depth: int,
     code: str,
-) -> tuple[dict, list]:
+) -> tuple[dict, list, bool]:
     if not pages_by_title:
         pages_service = PagesService()
         pages_by_title = {p.title: p for p in pages_service.list_pages_by_lang_cat(code, cat)}
 
-    members = get_mdwiki_cat_members(cat, depth, use_cache=True)
-    member_set = set(members)
+    crawl = crawl_mdwiki_category(cat, depth, use_cache=True)
+    member_set = set(crawl.titles)
 
     exists = {}
     for title, page in pages_by_title.items():
@@ -46,12 +51,12 @@ def _get_cat_exists_and_missing(
 
     missing = list(member_set - set(exists.keys()))
 
-    return exists, missing
+    return exists, missing, crawl.complete
 
 
-def _get_exists_targets_by_lang(lang: str) -> dict[str, dict]:
+def _get_exists_targets_by_lang(lang: str, titles: list[str]) -> dict[str, dict]:
     service = AllQidsService()
-    rows = service.list_targets_by_lang(lang)
+    rows = service.list_targets_by_lang_titles(lang, titles)
     result = {row["title"]: row for row in rows}
     return result
 
@@ -75,22 +80,20 @@ def _exists_expends(
 
 def _get_inprocess_for_titles(missing: list[str], code: str) -> dict[str, dict]:
     service = InProcessService()
-    records = service.list_in_process_by_lang(code)
+    records = service.list_in_process_by_lang_titles(code, missing)
 
-    missing_set = set(missing)
     return {
-        r.title: {
-            "id": r.id,
-            "title": r.title,
-            "user": r.user,
-            "lang": r.lang,
-            "cat": r.cat,
-            "translate_type": r.translate_type,
-            "word": r.word,
-            "add_date": r.add_date.isoformat() if r.add_date else None,
+        r["title"]: {
+            "id": r["id"],
+            "title": r["title"],
+            "user": r["user"],
+            "lang": r["lang"],
+            "cat": r["cat"],
+            "translate_type": r["translate_type"],
+            "word": r["word"],
+            "add_date": r["add_date"].isoformat() if r["add_date"] else None,
         }
         for r in records
-        if r.title in missing_set
     }
 
 
@@ -134,9 +137,9 @@ def results_api_result(
     pages = pages_service.list_pages_by_lang_cat(code, cat)
     pages_by_title = {p.title: p for p in pages}
 
-    items_exists, items_missing = _get_cat_exists_and_missing(pages_by_title, cat, depth_int, code)
+    items_exists, items_missing, complete = _get_cat_exists_and_missing(pages_by_title, cat, depth_int, code)
 
-    targets = _get_exists_targets_by_lang(code)
+    targets = _get_exists_targets_by_lang(code, items_missing)
     extra_exists = _exists_expends(items_missing, targets)
 
     if extra_exists:
@@ -162,6 +165,8 @@ def results_api_result(
         "inprocess": inprocess,
         "exists": dict(sorted(items_exists.items())),
         "missing": missing,
+        # The category crawl ran out of time; the lists only cover the categories fetched
+        "partial": not complete,
     }
 
 
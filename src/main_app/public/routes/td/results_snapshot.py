@@ -0,0 +1,168 @@
+"""
+In-memory snapshots of the ``/td/table`` results per (language, category).
+
+Building a results bucket runs the pages lookup, the missing/exists joins, the
+in_process scan for the language and the translate_type scan. The data only
+changes when something is published, an in_process row changes, or one of
+the imported tables (categories, qids, words, ...) is written, so the computed
+bucket is kept per (lang, cat) and reused.
+
+A snapshot is fresh while none of ``RESULTS_SNAPSHOT_TABLES`` has been written
+(see ``query_cache.bump_table_version``) and it is younger than
+``settings.performance.results_snapshot_ttl``. The TTL bounds how long a write
+handled by another worker goes unnoticed. Once stale, the old snapshot is
+still served, for up to ``results_snapshot_max_stale`` seconds, while a
+background thread rebuilds it (stale-while-revalidate).
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from flask import Flask, current_app, has_app_context
+
+from ....config import settings
+from ....db.services.utils import get_table_version
+from ....shared.core.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_MAXSIZE = 256
+
+# Tables read while building a bucket; a write to any of them makes snapshots stale
+RESULTS_SNAPSHOT_TABLES = (
+    "pages",
+    "in_process",
+    "categories",
+    "category_members",
+    "qids",
+    "all_qids_exists",
+    "translate_type",
+    "langs",
+    "assessments",
+    "enwiki_pageviews",
+    "refs_counts",
+    "words",
+)
+
+SnapshotKey = tuple[str, str]
+
+
+@dataclass(frozen=True)
+class _Snapshot:
+    value: Any
+    versions: tuple[int, ...]
+    built_at: float
+
+
+def _table_versions() -> tuple[int, ...]:
+    return tuple(get_table_version(table) for table in RESULTS_SNAPSHOT_TABLES)
+
+
+def _start_refresh(target: Callable[[], None]) -> None:
+    threading.Thread(target=target, name="results-snapshot-refresh", daemon=True).start()
+
+
+class ResultsSnapshotCache:
+    """LRU of results snapshots keyed by ``(lang, cat)``."""
+
+    def __init__(self, maxsize: int = SNAPSHOT_MAXSIZE) -> None:
+        self.maxsize = maxsize
+        self._entries: OrderedDict[SnapshotKey, _Snapshot] = OrderedDict()
+        self._refreshing: set[SnapshotKey] = set()
+        self._lock = threading.Lock()
+
+    def get(self, lang: str, cat: str, loader: Callable[[], Any]) -> Any:
+        """Return the snapshot for ``(lang, cat)``, building it with ``loader`` when needed."""
+        performance = settings.performance
+        if performance.results_snapshot_ttl <= 0:
+            return loader()
+
+        key = (lang, cat)
+        versions = _table_versions()
+        now = time.monotonic()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+
+        if entry is not None:
+            age = now - entry.built_at
+            if entry.versions == versions and age < performance.results_snapshot_ttl:
+                metrics.incr("results_snapshot.hits")
+                return entry.value
+            if age < performance.results_snapshot_max_stale:
+                metrics.incr("results_snapshot.stale_hits")
+                self._schedule_refresh(key, loader)
+                return entry.value
+
+        metrics.incr("results_snapshot.misses")
+        value = loader()
+        self._store(key, value, versions, now)
+        return value
+
+    def invalidate(self, lang: str | None = None, cat: str | None = None) -> None:
+        """Drop snapshots matching ``lang`` and/or ``cat`` (all of them when both are None)."""
+        with self._lock:
+            for key in list(self._entries):
+                if (lang is None or key[0] == lang) and (cat is None or key[1] == cat):
+                    del self._entries[key]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _store(self, key: SnapshotKey, value: Any, versions: tuple[int, ...], built_at: float) -> None:
+        with self._lock:
+            self._entries[key] = _Snapshot(value=value, versions=versions, built_at=built_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def _schedule_refresh(self, key: SnapshotKey, loader: Callable[[], Any]) -> None:
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        app: Flask | None = current_app._get_current_object() if has_app_context() else None  # type: ignore[attr-defined]
+
+        def refresh() -> None:
+            try:
+                versions = _table_versions()
+                built_at = time.monotonic()
+                if app is None:
+                    value = loader()
+                else:
+                    with app.app_context():
+                        value = loader()
+                self._store(key, value, versions, built_at)
+                metrics.incr("results_snapshot.refreshes")
+            except Exception:
+                logger.exception("Failed to refresh results snapshot for %r", key)
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        _start_refresh(refresh)
+
+
+results_snapshots = ResultsSnapshotCache()
+
+
+def invalidate_results_snapshots(lang: str | None = None, cat: str | None = None) -> None:
+    results_snapshots.invalidate(lang, cat)
+
+
+__all__ = [
+    "RESULTS_SNAPSHOT_TABLES",
+    "ResultsSnapshotCache",
+    "invalidate_results_snapshots",
+    "results_snapshots",
+]
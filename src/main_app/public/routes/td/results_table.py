@@ -0,0 +1,201 @@
+"""
+Server-side sort, filter and keyset pagination for the ``/td/table`` results.
+
+The rows are the ones ``results_2026`` builds from the per-(lang, cat)
+snapshot; this module only orders, filters and slices them. A page is
+addressed by an opaque cursor holding the sort key of the last row returned,
+so the next page starts strictly after that row. Every sort key ends with the
+title (and the "Full" flag), which makes it unique within a table.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+RESULT_TABLES = ("missing", "inprocess", "exists")
+
+NUMERIC_SORT_FIELDS = ("en_views", "importance", "words", "refs")
+
+# The exists rows carry no page metrics, only titles and links
+SORT_FIELDS: dict[str, tuple[str, ...]] = {
+    "missing": (*NUMERIC_SORT_FIELDS, "title"),
+    "inprocess": (*NUMERIC_SORT_FIELDS, "title"),
+    "exists": ("title",),
+}
+
+DEFAULT_SORT: dict[str, tuple[str, str]] = {
+    "missing": ("en_views", "desc"),
+    "inprocess": ("en_views", "desc"),
+    "exists": ("title", "asc"),
+}
+
+IMPORTANCE_RANK = {"top": 4, "high": 3, "mid": 2, "low": 1}
+
+MAX_PAGE_SIZE = 500
+
+
+@dataclass(frozen=True)
+class TableQuery:
+    table: str
+    sort: str
+    order: str
+    limit: int
+    q: str = ""
+    importance: str = ""
+    after: tuple[Any, ...] | None = None
+
+
+@dataclass(frozen=True)
+class TablePage:
+    rows: list[dict[str, Any]]
+    next_cursor: str | None
+    total: int
+
+
+def default_table_query(table: str, limit: int) -> TableQuery:
+    sort, order = DEFAULT_SORT[table]
+    return TableQuery(table=table, sort=sort, order=order, limit=limit)
+
+
+def _row_title(row: Mapping[str, Any]) -> str:
+    return str(row.get("title") or row.get("display_title") or "")
+
+
+def _as_int(value: Any) -> int:
+    try:
+        return int(value or 0)
+    except (TypeError, ValueError):
+        return 0
+
+
+def _sort_key(row: Mapping[str, Any], query: TableQuery) -> tuple[Any, ...]:
+    title = _row_title(row).casefold()
+    is_full_row = bool(row.get("is_full_row"))
+    if query.sort == "title":
+        return (title, is_full_row)
+
+    if query.sort == "importance":
+        value = IMPORTANCE_RANK.get(str(row.get("importance") or "").lower(), 0)
+    else:
+        value = _as_int(row.get(query.sort))
+    # Only the sorted field follows the requested order; ties stay alphabetical
+    return (-value if query.order == "desc" else value, title, is_full_row)
+
+
+def _reversed(query: TableQuery) -> bool:
+    return query.sort == "title" and query.order == "desc"
+
+
+def encode_cursor(query: TableQuery, key: Sequence[Any]) -> str:
+    payload = json.dumps({"s": query.sort, "o": query.order, "k": list(key)}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort: str, order: str) -> tuple[Any, ...]:
+    """
+    Decode a cursor returned by ``encode_cursor`` for the same sort and order.
+
+    Raises:
+        ValueError: If the cursor is malformed or was issued for another sort.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as exc:
+        raise ValueError("Invalid cursor") from exc
+
+    if not isinstance(payload, dict) or payload.get("s") != sort or payload.get("o") != order:
+        raise ValueError("Cursor does not match the requested sort")
+
+    key = payload.get("k")
+    expected = (str, bool) if sort == "title" else (int, str, bool)
+    if (
+        not isinstance(key, list)
+        or len(key) != len(expected)
+        or not all(type(value) is kind for value, kind in zip(key, expected, strict=True))
+    ):
+        raise ValueError("Invalid cursor")
+    return tuple(key)
+
+
+def parse_table_query(args: Mapping[str, str], default_limit: int) -> TableQuery:
+    """
+    Build a ``TableQuery`` from request arguments.
+
+    Raises:
+        ValueError: If an argument is not valid for the requested table.
+    """
+    table = (args.get("table") or "missing").strip()
+    if table not in RESULT_TABLES:
+        raise ValueError(f"table must be one of {', '.join(RESULT_TABLES)}")
+
+    default_sort, default_order = DEFAULT_SORT[table]
+    sort = (args.get("sort") or default_sort).strip()
+    if sort not in SORT_FIELDS[table]:
+        raise ValueError(f"sort must be one of {', '.join(SORT_FIELDS[table])}")
+
+    order = (args.get("order") or (default_order if sort == default_sort else "asc")).strip().lower()
+    if order not in ("asc", "desc"):
+        raise ValueError("order must be asc or desc")
+
+    raw_limit = (args.get("limit") or "").strip()
+    try:
+        limit = int(raw_limit) if raw_limit else default_limit
+    except ValueError as exc:
+        raise ValueError("limit must be an integer") from exc
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+
+    after_raw = (args.get("after") or "").strip()
+    after = decode_cursor(after_raw, sort, order) if after_raw else None
+
+    return TableQuery(
+        table=table,
+        sort=sort,
+        order=order,
+        limit=limit,
+        q=(args.get("q") or "").strip(),
+        importance=(args.get("importance") or "").strip(),
+        after=after,
+    )
+
+
+def paginate_rows(rows: Sequence[dict[str, Any]], query: TableQuery) -> TablePage:
+    """Filter, sort and slice ``rows``; ``total`` counts the rows matching the filters."""
+    needle = query.q.casefold()
+    importance = query.importance.lower()
+    matching = [
+        row
+        for row in rows
+        if (not needle or needle in _row_title(row).casefold())
+        and (not importance or str(row.get("importance") or "").lower() == importance)
+    ]
+
+    reverse = _reversed(query)
+    keyed = sorted(((_sort_key(row, query), row) for row in matching), key=lambda item: item[0], reverse=reverse)
+
+    if query.after is not None:
+        after = query.after
+        keyed = [item for item in keyed if (item[0] < after if reverse else item[0] > after)]
+
+    page = keyed[: query.limit]
+    next_cursor = encode_cursor(query, page[-1][0]) if len(keyed) > query.limit else None
+    return TablePage(rows=[row for _, row in page], next_cursor=next_cursor, total=len(matching))
+
+
+__all__ = [
+    "MAX_PAGE_SIZE",
+    "RESULT_TABLES",
+    "SORT_FIELDS",
+    "TablePage",
+    "TableQuery",
+    "decode_cursor",
+    "default_table_query",
+    "encode_cursor",
+    "paginate_rows",
+    "parse_table_query",
+]
@@ -16,6 +16,7 @@ from flask import (
     request,
 )
 
+from ....config import settings
 from ....db.services import (
     CategoryService,
     FullTranslatorService,
@@ -24,8 +25,9 @@ from ....db.services import (
     SettingsService,
 )
 from ....public.auth.utils import load_user
-from .results_2026 import results_loader_2026
+from .results_2026 import results_loader_2026, results_table_page
 from .results_api import results_api_result
+from .results_table import parse_table_query
 
 logger = logging.getLogger(__name__)
 
@@ -60,6 +62,7 @@ class TDRoutes:
     def _setup_routes(self) -> None:
         self.bp.get("/results_api")(self.results_api)
         self.bp.get("/table")(self.table)
+        self.bp.get("/table/rows")(self.table_rows)
         self.bp.get("/")(self.index)
         self.bp.get("/missing")(self.missing)
 
@@ -125,6 +128,7 @@ class TDRoutes:
                     user_coord=user_coord,
                     settings=parsed_settings,
                     full_tr_user=full_tr_user,
+                    page_size=settings.performance.results_page_size,
                 )
             except Exception:
                 logger.exception(
@@ -151,6 +155,64 @@ class TDRoutes:
             results=results_bundle,
         )
 
+    def table_rows(self):
+        """JSON page of one ``/td/table`` results table, sorted and filtered server-side.
+
+        Takes the ``/td/table`` arguments plus ``table`` (missing, inprocess,
+        exists), ``sort``, ``order``, ``q`` (title substring), ``importance``,
+        ``limit`` and ``after`` (the ``next_cursor`` of the previous page).
+        """
+        try:
+            query = parse_table_query(request.args, settings.performance.results_page_size or 100)
+        except ValueError as exc:
+            return jsonify({"error": str(exc)}), 400
+
+        try:
+            campaigns = [x.to_dict() for x in self.category_service.list_categories()]
+            parsed = self._parse_request_args(campaigns, report_errors=False)
+        except Exception:
+            logger.exception("Failed to load campaigns for table rows")
+            return jsonify({"error": "Failed to load results"}), 500
+
+        if not (parsed["code"] and parsed["camp"] and parsed["code_lang_name"]):
+            return jsonify({"error": "Invalid code or camp"}), 400
+
+        user = load_user()
+        user_coord = bool(user and user.is_active_admin)
+        full_tr_user = bool(user and self.full_service.is_full_translator(user.username))
+
+        try:
+            page = results_table_page(
+                query=query,
+                code=parsed["code"],
+                camp=parsed["camp"],
+                cat=parsed["cat"],
+                tra_type=parsed["tra_type"],
+                user_coord=user_coord,
+                settings=parsed["settings"],
+                full_tr_user=full_tr_user,
+            )
+        except Exception:
+            logger.exception(
+                "results_table_page failed for code=%r camp=%r cat=%r",
+                parsed["code"],
+                parsed["camp"],
+                parsed["cat"],
+            )
+            return jsonify({"error": "Failed to load results"}), 500
+
+        return jsonify(
+            {
+                "table": query.table,
+                "sort": query.sort,
+                "order": query.order,
+                "limit": query.limit,
+                "total": page.total,
+                "next_cursor": page.next_cursor,
+                "rows": page.rows,
+            }
+        )
+
     def index(self):
         # Form data — unchanged from the previous index() implementation.
         try:
@@ -182,17 +244,11 @@ class TDRoutes:
         category = request.args.get("cat") or "RTT"
 
         try:
-            stats = self.missing_service.statics_by_category(category)
+            total, stats = self.missing_service.category_coverage(category)
         except Exception:
-            logger.exception("statics_by_category failed for cat=%r", category)
+            logger.exception("category_coverage failed for cat=%r", category)
             flash("Failed to load missing statistics — please try again.", "danger")
-            stats = []
-
-        try:
-            total = self.missing_service.count_category_members(category)
-        except Exception:
-            logger.exception("count_category_members failed for cat=%r", category)
-            total = 0
+            total, stats = 0, []
 
         # PHP merges per-language stats with the langs lookup (autonym + name).
         langs_lookup: dict[str, dict] = {}
@@ -233,12 +289,13 @@ class TDRoutes:
             rows=rows,
         )
 
-    def _parse_request_args(self, campaigns: list[dict]) -> dict[str, Any]:
+    def _parse_request_args(self, campaigns: list[dict], report_errors: bool = True) -> dict[str, Any]:
         """Mirror of src/backend/loaders/load_request.php — load_request().
 
         Returns a dict with the resolved request parameters. ``code_lang_name``
         is empty when the code is unknown; the route uses this to decide
-        whether to render the results card.
+        whether to render the results card. Invalid values are flashed unless
+        ``report_errors`` is False (JSON endpoints).
         """
 
         # Lookup tables used by request parsing (PHP $camps_data and $cats_data).
@@ -257,7 +314,8 @@ class TDRoutes:
         if code:
             lang_record = self.lang_service.get_lang_by_code(code)
             if lang_record is None:
-                flash(f"code ({code}) not valid wiki.", "danger")
+                if report_errors:
+                    flash(f"code ({code}) not valid wiki.", "danger")
                 code = ""
             else:
                 code_lang_name = lang_record.name or lang_record.autonym or ""
@@ -270,7 +328,8 @@ class TDRoutes:
 
         # logic from load_request.php — validate camp against the input list.
         if camp and camp not in camps_data:
-            flash(f"camp ({camp}) not valid.", "danger")
+            if report_errors:
+                flash(f"camp ({camp}) not valid.", "danger")
             camp = ""
 
         # logic from load_request.php — force "lead" when whole-article translate is disabled.
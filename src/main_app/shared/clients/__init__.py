@@ -4,7 +4,7 @@ Services for external API integration.
 Used in both admin and public blueprints.
 """
 
-from .mdwiki_api import get_mdwiki_cat_members
+from .mdwiki_api import CategoryCrawl, crawl_mdwiki_category, get_mdwiki_cat_members
 from .mediawiki_api import get_title_info, publish_do_edit
 from .oauth_client import get_csrf_token, get_cxtoken, get_oauth_client, post_params
 from .revids_client import get_revid, get_revid_db
@@ -16,6 +16,8 @@ __all__ = [
     "post_params",
     "get_cxtoken",
     "get_mdwiki_cat_members",
+    "crawl_mdwiki_category",
+    "CategoryCrawl",
     "publish_do_edit",
     "get_revid",
     "get_revid_db",
@@ -0,0 +1,133 @@
+"""
+Write-through cache of mdwiki category members.
+
+Two layers sit in front of the mdwiki.org API:
+
+- an in-process LRU shared by every ``CategoryFetcher`` of the worker,
+- JSON files under ``<tablesDir>/cats_cash/`` shared by all workers and the
+  external job that used to be their only writer.
+
+Files hold ``{"list": [...], "fetched_at": <unix time>}`` and are replaced
+atomically (temp file + ``os.replace``), so readers never see a half-written
+file. Files without ``fetched_at`` use their modification time.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+CACHE_SUBDIR = "cats_cash"
+MEMORY_MAXSIZE = 512
+
+
+@dataclass(frozen=True)
+class CachedMembers:
+    titles: list[str]
+    fetched_at: float
+
+    def is_fresh(self, ttl: float) -> bool:
+        """Entries never expire when ``ttl`` is 0 or less."""
+        return ttl <= 0 or time.time() - self.fetched_at < ttl
+
+
+def _safe_name(cat: str) -> str:
+    return cat.replace("/", "").replace("\\", "").replace("..", "")
+
+
+class CategoryMembershipCache:
+    """LRU over the ``cats_cash`` files; ``put`` writes both layers."""
+
+    def __init__(self, maxsize: int = MEMORY_MAXSIZE) -> None:
+        self.maxsize = maxsize
+        self._entries: OrderedDict[tuple[str, str], CachedMembers] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, tables_dir: str, cat: str) -> CachedMembers | None:
+        key = (tables_dir, cat)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry
+
+        entry = self._read_file(tables_dir, cat)
+        if entry is not None:
+            self._remember(key, entry)
+        return entry
+
+    def put(self, tables_dir: str, cat: str, titles: list[str]) -> CachedMembers:
+        entry = CachedMembers(titles=list(titles), fetched_at=time.time())
+        self._remember((tables_dir, cat), entry)
+        self._write_file(tables_dir, cat, entry)
+        return entry
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def _remember(self, key: tuple[str, str], entry: CachedMembers) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def _path(self, tables_dir: str, cat: str) -> Path | None:
+        if not tables_dir:
+            return None
+        return Path(tables_dir) / CACHE_SUBDIR / f"{_safe_name(cat)}.json"
+
+    def _read_file(self, tables_dir: str, cat: str) -> CachedMembers | None:
+        file_path = self._path(tables_dir, cat)
+        if file_path is None or not file_path.is_file():
+            return None
+        try:
+            with open(file_path, encoding="utf-8") as f:
+                data = json.load(f)
+            fetched_at = data.get("fetched_at") if isinstance(data, dict) else None
+            if not isinstance(fetched_at, (int, float)):
+                fetched_at = file_path.stat().st_mtime
+        except (json.JSONDecodeError, OSError) as e:
+            logger.warning("Failed to read cache file %s: %s", file_path, e)
+            return None
+
+        titles = data.get("list")
+        if not isinstance(titles, list):
+            return None
+        return CachedMembers(titles=titles, fetched_at=float(fetched_at))
+
+    def _write_file(self, tables_dir: str, cat: str, entry: CachedMembers) -> None:
+        file_path = self._path(tables_dir, cat)
+        if file_path is None:
+            return
+        tmp_name = ""
+        try:
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=file_path.parent, prefix=".tmp-", suffix=".json")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"list": entry.titles, "fetched_at": entry.fetched_at}, f, ensure_ascii=False)
+            os.replace(tmp_name, file_path)
+        except OSError as e:
+            logger.warning("Failed to write cache file %s: %s", file_path, e)
+            if tmp_name:
+                Path(tmp_name).unlink(missing_ok=True)
+
+
+category_cache = CategoryMembershipCache()
+
+
+__all__ = [
+    "CachedMembers",
+    "CategoryMembershipCache",
+    "category_cache",
+]
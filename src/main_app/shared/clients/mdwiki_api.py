@@ -4,16 +4,18 @@ MediaWiki API client for edit operations and category fetching.
 Mirrors: results/getcats.php
 """
 
-import json
 import logging
 import os
 import re
-from pathlib import Path
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from dataclasses import dataclass
 from typing import Any
 
 import requests
 
 from ...config import settings
+from .category_cache import CachedMembers, category_cache
 
 logger = logging.getLogger(__name__)
 
@@ -21,9 +23,38 @@ NS_MAIN = 0
 NS_CATEGORY = 14
 NS_CUSTOM = 3000
 
+DEFAULT_MAX_WORKERS = 4
+DEFAULT_TIME_BUDGET = 30.0
+DEFAULT_GRACE = 1.0
+
+
+@dataclass
+class CategoryCrawl:
+    """Titles found under a category; ``complete`` is False when the time budget ran out or a fetch failed."""
+
+    titles: list[str]
+    complete: bool = True
+    categories: int = 0
+
+
+def _category_key(cat: str) -> str:
+    name = cat.removeprefix("Category:").replace("_", " ").strip()
+    return name[:1].upper() + name[1:]
+
 
 class CategoryFetcher:
-    """Fetch category members from mdwiki.org API with depth recursion and file cache.
+    """Fetch category members from mdwiki.org API with depth recursion and a write-through cache.
+
+    Subcategories are crawled breadth-first, each level's categories fetched
+    concurrently on a pool of ``max_workers`` threads. A category is fetched
+    once however many parents list it (which also breaks cycles), and
+    the whole crawl stops after ``time_budget`` seconds (0 disables the limit)
+    with whatever was fetched so far, plus what in-flight requests return
+    within ``grace`` seconds.
+
+    Every category fetched from the API is written to ``category_cache``
+    (memory and ``tablesDir/cats_cash``); cached entries are used for
+    ``cache_ttl`` seconds and after that only when the API fails.
 
     Mirrors: results/getcats.php (CategoryFetcher class)
     """
@@ -39,6 +70,10 @@ class CategoryFetcher:
         self.connect_timeout = self.options.get("connect_timeout", 10)
         self.timeout = self.options.get("timeout", 15)
         self.tables_dir = self.options.get("tablesDir", "")
+        self.max_workers = max(1, int(self.options.get("max_workers", DEFAULT_MAX_WORKERS)))
+        self.time_budget = float(self.options.get("time_budget", DEFAULT_TIME_BUDGET))
+        self.grace = float(self.options.get("grace", DEFAULT_GRACE))
+        self.cache_ttl = float(self.options.get("cache_ttl", settings.performance.category_cache_ttl))
 
     def get_mdwiki_cat_members(self, root_cat: str, depth: int = 0, use_cache: bool = True) -> list[str]:
         """Fetch all page titles under a category up to given depth.
@@ -51,42 +86,74 @@ class CategoryFetcher:
         Returns:
             Unique, filtered list of page titles
         """
+        return self.crawl(root_cat, depth, use_cache).titles
+
+    def crawl(self, root_cat: str, depth: int = 0, use_cache: bool = True) -> CategoryCrawl:
+        """Like ``get_mdwiki_cat_members`` but also reports whether the crawl finished in time."""
         depth = max(0, depth)
+        deadline = time.monotonic() + self.time_budget if self.time_budget > 0 else None
         titles: list[str] = []
         cats: list[str] = [root_cat]
-        depth_done = -1
-
-        while cats and depth > depth_done:
-            next_cats: list[str] = []
-            for cat in cats:
-                all_titles = self._get_cats_members(cat, use_cache)
-                for title in all_titles:
-                    if title.startswith("Category:"):
-                        next_cats.append(title)
-                    else:
-                        titles.append(title)
-            depth_done += 1
-            cats = next_cats
+        visited = {_category_key(root_cat)}
+        fetched = 0
+        complete = True
+        out_of_time = False
 
-        titles = list(dict.fromkeys(titles))
-        return self._titles_filter(titles)
-
-    def _get_cats_members(self, cat: str, use_cache: bool) -> list[str]:
-        all_items: list[str] = []
-        if use_cache:
-            all_items = self._get_cats_from_cache(cat)
-        if not all_items:
-            all_items = self._fetch_cats_members_api(cat)
-        return all_items
+        pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="category-crawl")
+        try:
+            for _ in range(depth + 1):
+                if not cats or out_of_time:
+                    break
+                futures = [pool.submit(self._get_cats_members, cat, use_cache, deadline) for cat in cats]
+                timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+                done, not_done = wait(futures, timeout=timeout)
+                if not_done:
+                    complete = False
+                    out_of_time = True
+                    # Fetches in flight stop paging at the deadline; keep what they return shortly after
+                    done |= wait(not_done, timeout=self.grace).done
+
+                next_cats: list[str] = []
+                for future in futures:
+                    if future not in done:
+                        continue
+                    items, finished = future.result()
+                    fetched += 1
+                    complete = complete and finished
+                    for title in items:
+                        if not title.startswith("Category:"):
+                            titles.append(title)
+                        elif _category_key(title) not in visited:
+                            visited.add(_category_key(title))
+                            next_cats.append(title)
+                cats = next_cats
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+        if not complete:
+            logger.warning("crawl: incomplete for '%s' (failed fetch or %ss budget exceeded)", root_cat, self.time_budget)
 
-    def _fetch_cats_members_api(self, cat: str) -> list[str]:
-        if not cat.startswith("Category:"):
-            cat = f"Category:{cat}"
+        titles = list(dict.fromkeys(titles))
+        return CategoryCrawl(titles=self._titles_filter(titles), complete=complete, categories=fetched)
+
+    def _get_cats_members(self, cat: str, use_cache: bool, deadline: float | None = None) -> tuple[list[str], bool]:
+        cached = self._get_cats_from_cache(cat) if use_cache else None
+        if cached is not None and cached.is_fresh(self.cache_ttl):
+            return cached.titles, True
+        items, finished = self._fetch_cats_members_api(cat, deadline)
+        if not finished and cached is not None:
+            # mdwiki.org failed or the budget ran out: an expired entry beats a partial list
+            return cached.titles, finished
+        return items, finished
+
+    def _fetch_cats_members_api(self, cat: str, deadline: float | None = None) -> tuple[list[str], bool]:
+        # Cached under the name the caller used, which is what _get_cats_from_cache looks up
+        cmtitle = cat if cat.startswith("Category:") else f"Category:{cat}"
 
         params: dict[str, str] = {
             "action": "query",
             "list": "categorymembers",
-            "cmtitle": cat,
+            "cmtitle": cmtitle,
             "cmlimit": "max",
             "cmtype": "page|subcat",
             "format": "json",
@@ -96,19 +163,25 @@ class CategoryFetcher:
         cmcontinue: str | None = "x"
         iteration = 0
         max_iterations = 100
+        failed = False
 
         while cmcontinue and iteration < max_iterations:
+            if deadline is not None and time.monotonic() >= deadline:
+                logger.warning("fetch_cats_members_api: Time budget exceeded for '%s'", cat)
+                return items, False
             iteration += 1
             if cmcontinue != "x":
                 params["cmcontinue"] = cmcontinue
 
             try:
-                data = self._post_urls_mdwiki(params)
+                data = self._post_urls_mdwiki(params, deadline)
             except requests.RequestException as e:
                 logger.warning("fetch_cats_members_api: Failed to fetch '%s': %s", cat, e)
+                failed = True
                 break
             except Exception as e:
                 logger.warning("fetch_cats_members_api: Failed to fetch '%s': %s", cat, e)
+                failed = True
                 break
 
             members = data.get("query", {}).get("categorymembers", [])
@@ -125,32 +198,14 @@ class CategoryFetcher:
         if iteration >= max_iterations:
             logger.warning("fetch_cats_members_api: Hit maximum iterations for '%s'", cat)
 
-        return items
+        if not failed:
+            category_cache.put(self.tables_dir, cat, items)
+        return items, not failed
 
-    def _get_cats_from_cache(self, cat: str) -> list[str]:
+    def _get_cats_from_cache(self, cat: str) -> CachedMembers | None:
         if self.options.get("nocache"):
-            return []
-        data = self._open_tables_file(cat)
-        if not data:
-            return []
-        lst = data.get("list")
-        if not isinstance(lst, list):
-            return []
-        return lst
-
-    def _open_tables_file(self, cat: str) -> dict | None:
-        if not self.tables_dir:
-            return None
-        safe_cat = cat.replace("/", "").replace("\\", "").replace("..", "")
-        file_path = Path(self.tables_dir) / "cats_cash" / f"{safe_cat}.json"
-        if not file_path.is_file():
-            return None
-        try:
-            with open(file_path, encoding="utf-8") as f:
-                return json.load(f)
-        except (json.JSONDecodeError, OSError) as e:
-            logger.warning("Failed to read cache file %s: %s", file_path, e)
             return None
+        return category_cache.get(self.tables_dir, cat)
 
     def _titles_filter(self, titles: list[str]) -> list[str]:
         pattern = re.compile(r"^(File|Template|User):")
@@ -166,21 +221,33 @@ class CategoryFetcher:
             result.append(t)
         return result
 
-    def _post_urls_mdwiki(self, params: dict) -> dict:
+    def _post_urls_mdwiki(self, params: dict, deadline: float | None = None) -> dict:
+        timeout = self.timeout
+        if deadline is not None:
+            # Don't let one slow response outlive the crawl's budget by much
+            timeout = min(timeout, max(1.0, deadline - time.monotonic()))
         resp = requests.post(
             self.endpoint,
             data=params,
             headers={"User-Agent": settings.other.user_agent},
-            timeout=(self.connect_timeout, self.timeout),
+            timeout=(self.connect_timeout, timeout),
         )
         resp.raise_for_status()
         return resp.json()
 
 
-def get_mdwiki_cat_members(cat: str, depth: int = 0, use_cache: bool = True) -> list[str]:
-    """Convenience function: create fetcher with default options and fetch."""
+def _default_fetcher() -> CategoryFetcher:
     options = {
         "tablesDir": os.getenv("TABLES_PATH", ""),
     }
-    fetcher = CategoryFetcher(options)
-    return fetcher.get_mdwiki_cat_members(cat, depth, use_cache)
+    return CategoryFetcher(options)
+
+
+def get_mdwiki_cat_members(cat: str, depth: int = 0, use_cache: bool = True) -> list[str]:
+    """Convenience function: create fetcher with default options and fetch."""
+    return _default_fetcher().get_mdwiki_cat_members(cat, depth, use_cache)
+
+
+def crawl_mdwiki_category(cat: str, depth: int = 0, use_cache: bool = True) -> CategoryCrawl:
+    """Convenience function: like ``get_mdwiki_cat_members`` with the completeness flag."""
+    return _default_fetcher().crawl(cat, depth, use_cache)
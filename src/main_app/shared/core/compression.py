@@ -0,0 +1,178 @@
+"""
+Content-negotiated gzip / brotli compression of responses.
+
+An ``after_request`` hook compresses a response when:
+
+- the client's ``Accept-Encoding`` allows ``br`` (only if the ``brotli``
+  package is installed) or ``gzip``; brotli is preferred,
+- it is a buffered 200 response of a text-like mimetype (JSON, CSS,
+  JavaScript, plain text) without a ``Content-Encoding`` of its own; HTML is
+  left alone because pages carry CSRF tokens next to reflected input (BREACH),
+- the body is at least ``settings.performance.compression_min_size`` bytes.
+
+Compressed bodies of cacheable responses (``Cache-Control: public`` with an
+``ETag``) are kept in a small LRU keyed by (ETag, encoding), so a popular
+payload polled by many clients is compressed once per data version.
+"""
+
+from __future__ import annotations
+
+import gzip
+import logging
+import threading
+from collections import OrderedDict
+from types import ModuleType
+
+from flask import Flask, Response, request
+
+from ...config import settings
+from .metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - depends on the environment
+    brotli = None
+
+COMPRESSIBLE_MIMETYPES = frozenset(
+    {
+        "application/json",
+        "application/javascript",
+        "text/css",
+        "text/javascript",
+        "text/plain",
+    }
+)
+
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+
+PRECOMPRESSED_MAXSIZE = 64
+PRECOMPRESSED_MAX_BODY = 4 * 1024 * 1024
+
+
+class _PrecompressedCache:
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self._data: OrderedDict[tuple[str, str], bytes] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple[str, str]) -> bytes | None:
+        with self._lock:
+            body = self._data.get(key)
+            if body is not None:
+                self._data.move_to_end(key)
+            return body
+
+    def put(self, key: tuple[str, str], body: bytes) -> None:
+        with self._lock:
+            self._data[key] = body
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+precompressed = _PrecompressedCache(PRECOMPRESSED_MAXSIZE)
+
+
+def choose_encoding(accept_encoding: str, brotli_module: ModuleType | None = brotli) -> str | None:
+    """Return the encoding to use for an ``Accept-Encoding`` header value, or None to send identity."""
+    accepted: dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        quality = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if name:
+            accepted[name.strip().lower()] = quality
+
+    def allowed(encoding: str) -> bool:
+        return accepted.get(encoding, accepted.get("*", 0.0)) > 0
+
+    if brotli_module is not None and allowed("br"):
+        return "br"
+    if allowed("gzip"):
+        return "gzip"
+    return None
+
+
+def compress_body(body: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        assert brotli is not None
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)
+
+
+def _cache_key(response: Response, encoding: str) -> tuple[str, str] | None:
+    etag, _ = response.get_etag()
+    if not etag or not response.cache_control.public:
+        return None
+    return (etag, encoding)
+
+
+def compress_response(response: Response) -> Response:
+    """Compress ``response`` in place when the request and response allow it."""
+    if not settings.performance.response_compression:
+        return response
+    if (
+        response.status_code != 200
+        or response.direct_passthrough
+        or response.is_streamed
+        or "Content-Encoding" in response.headers
+        or response.mimetype not in COMPRESSIBLE_MIMETYPES
+    ):
+        return response
+
+    response.vary.add("Accept-Encoding")
+    encoding = choose_encoding(request.headers.get("Accept-Encoding", ""))
+    if encoding is None:
+        return response
+
+    body = response.get_data()
+    if len(body) < settings.performance.compression_min_size:
+        return response
+
+    key = _cache_key(response, encoding)
+    compressed = precompressed.get(key) if key else None
+    if compressed is None:
+        compressed = compress_body(body, encoding)
+        if key and len(body) <= PRECOMPRESSED_MAX_BODY:
+            precompressed.put(key, compressed)
+        metrics.incr("compression.compressed", encoding=encoding)
+    else:
+        metrics.incr("compression.precompressed_hits", encoding=encoding)
+
+    response.set_data(compressed)
+    response.headers["Content-Encoding"] = encoding
+    etag, weak = response.get_etag()
+    if etag and not weak:
+        # The compressed body is a different byte sequence than the one the strong validator named
+        response.set_etag(etag, weak=True)
+    return response
+
+
+def init_compression(app: Flask) -> None:
+    app.after_request(compress_response)
+
+
+__all__ = [
+    "COMPRESSIBLE_MIMETYPES",
+    "choose_encoding",
+    "compress_body",
+    "compress_response",
+    "init_compression",
+    "precompressed",
+]
@@ -0,0 +1,123 @@
+"""
+Flask JSON provider backed by a fast serializer when one is installed.
+
+``FastJSONProvider`` keeps the output of Flask's ``DefaultJSONProvider``:
+sorted keys, compact separators, dates and datetimes as RFC 822 strings (the
+``default`` hook), Decimal and UUID as strings, dataclasses as dicts. Model
+``to_dict`` methods already turn their dates into ISO strings, which pass
+through unchanged. Non-ASCII text is written as UTF-8 instead of ``\\u``
+escapes.
+
+The serializer is picked by ``settings.performance.json_serializer``:
+``auto`` (orjson if importable, else the standard library), ``orjson`` or
+``json``. Pretty-printed output (debug mode) and calls with ``json.dumps``
+options orjson does not support go through the standard library.
+"""
+
+from __future__ import annotations
+
+import logging
+from types import ModuleType
+from typing import Any
+
+from flask import Flask, Response
+from flask.json.provider import DefaultJSONProvider
+
+from ...config import settings
+
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+JSON_SERIALIZERS = ("auto", "orjson", "json")
+
+_COMPACT_SEPARATORS = (",", ":")
+
+
+def load_serializer(name: str) -> ModuleType | None:
+    """
+    Return the fast serializer module for ``name``, or None for the standard library.
+
+    Raises:
+        ValueError: If ``name`` is unknown, or is ``orjson`` while orjson is not installed.
+    """
+    if name not in JSON_SERIALIZERS:
+        raise ValueError(f"JSON serializer must be one of {', '.join(JSON_SERIALIZERS)}")
+    if name == "json":
+        return None
+    if name == "orjson" and orjson is None:
+        raise ValueError("JSON serializer orjson is not installed")
+    return orjson
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    def __init__(self, app: Flask, serializer: ModuleType | None = None) -> None:
+        super().__init__(app)
+        self.serializer = serializer
+
+    @property
+    def _options(self) -> int:
+        assert self.serializer is not None
+        # Dates go through ``default`` so they keep Flask's RFC 822 format
+        options = self.serializer.OPT_PASSTHROUGH_DATETIME | self.serializer.OPT_NON_STR_KEYS
+        if self.sort_keys:
+            options |= self.serializer.OPT_SORT_KEYS
+        return options
+
+    def _dumps_fast(self, obj: Any) -> bytes | None:
+        assert self.serializer is not None
+        try:
+            return self.serializer.dumps(obj, default=self.default, option=self._options)
+        except TypeError:
+            # Out-of-range integers and the like; let the standard library decide
+            return None
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        if (
+            self.serializer is not None
+            and set(kwargs) <= {"separators"}
+            and kwargs.get("separators", _COMPACT_SEPARATORS) == _COMPACT_SEPARATORS
+        ):
+            data = self._dumps_fast(obj)
+            if data is not None:
+                return data.decode("utf-8")
+            # Keep the compact layout when the standard library takes over
+            kwargs["separators"] = _COMPACT_SEPARATORS
+        return super().dumps(obj, **kwargs)
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        if self.serializer is not None and not kwargs:
+            return self.serializer.loads(s)
+        return super().loads(s, **kwargs)
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        pretty = (self.compact is None and self._app.debug) or self.compact is False
+        if self.serializer is None or pretty:
+            return super().response(*args, **kwargs)
+
+        data = self._dumps_fast(self._prepare_response_obj(args, kwargs))
+        if data is None:
+            return super().response(*args, **kwargs)
+        return self._app.response_class(data + b"\n", mimetype=self.mimetype)
+
+
+def init_json_provider(app: Flask) -> None:
+    """Install ``FastJSONProvider`` with the configured serializer on ``app``."""
+    name = settings.performance.json_serializer
+    try:
+        serializer = load_serializer(name)
+    except ValueError:
+        logger.warning("JSON serializer %r is not available; using the standard library", name)
+        serializer = None
+    app.json = FastJSONProvider(app, serializer)
+
+
+__all__ = [
+    "JSON_SERIALIZERS",
+    "FastJSONProvider",
+    "init_json_provider",
+    "load_serializer",
+]
@@ -0,0 +1,61 @@
+"""
+Minimal in-process metrics registry.
+
+Counters are keyed by name plus optional labels and live for the lifetime of
+the worker process; ``snapshot()`` returns a plain dict suitable for JSON.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Any
+
+LabelKey = tuple[tuple[str, str], ...]
+
+
+def _label_key(labels: dict[str, Any]) -> LabelKey:
+    return tuple(sorted((str(k), str(v)) for k, v in labels.items()))
+
+
+def _format_name(name: str, labels: LabelKey) -> str:
+    if not labels:
+        return name
+    rendered = ",".join(f"{k}={v}" for k, v in labels)
+    return f"{name}{{{rendered}}}"
+
+
+class MetricsRegistry:
+    """Thread-safe store of named counters."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._counters: dict[tuple[str, LabelKey], float] = {}
+
+    def incr(self, name: str, value: float = 1, **labels: Any) -> None:
+        """Add ``value`` to the counter ``name`` with the given labels."""
+        key = (name, _label_key(labels))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def get(self, name: str, **labels: Any) -> float:
+        """Return the current value of a counter, or 0 if never incremented."""
+        with self._lock:
+            return self._counters.get((name, _label_key(labels)), 0)
+
+    def snapshot(self) -> dict[str, float]:
+        """Return every counter as ``{"name{label=value}": value}``."""
+        with self._lock:
+            items = list(self._counters.items())
+        return {_format_name(name, labels): value for (name, labels), value in sorted(items)}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counters.clear()
+
+
+metrics = MetricsRegistry()
+
+__all__ = [
+    "MetricsRegistry",
+    "metrics",
+]
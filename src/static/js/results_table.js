@@ -0,0 +1,140 @@
+// @ts-nocheck
+
+// Incremental loading, server-side sorting and filtering for the /td/table results tables.
+// The first page is rendered by the server; further pages come from /td/table/rows
+// using the keyset cursor of the previous page.
+
+function mdwikiLink(title) {
+    const link = document.createElement('a');
+    link.target = '_blank';
+    link.href = 'https://mdwiki.org/wiki/' + encodeURIComponent(title.replace(/ /g, '_'));
+    link.textContent = title;
+    return link;
+}
+
+function appendCell(tr, tag, options = {}) {
+    const cell = document.createElement(tag);
+    if (options.className) cell.className = options.className;
+    if (options.scope) cell.scope = options.scope;
+    if (options.style) cell.style.cssText = options.style;
+    if (options.node) cell.appendChild(options.node);
+    // *_html fields are built server-side, like the `|safe` fields of the Jinja templates
+    if (options.html !== undefined) cell.innerHTML = options.html;
+    if (options.text !== undefined) cell.textContent = String(options.text);
+    tr.appendChild(cell);
+    return cell;
+}
+
+const rowRenderers = {
+    missing: function (row) {
+        const tr = document.createElement('tr');
+        appendCell(tr, 'th', { className: 'num', scope: 'row', text: row.n });
+        appendCell(tr, 'td', { className: 'link_container', node: mdwikiLink(row.title) });
+        appendCell(tr, 'th', { html: row.translate_html });
+        appendCell(tr, 'td', { className: 'num', style: 'text-align: left', text: row.en_views });
+        appendCell(tr, 'td', { className: 'num', style: 'text-align: left', text: row.importance });
+        appendCell(tr, 'td', { className: 'num', style: 'text-align: left', text: row.words });
+        appendCell(tr, 'td', { className: 'num', style: 'text-align: left', text: row.refs });
+        appendCell(tr, 'td', { html: row.qid_html });
+        return tr;
+    },
+    exists: function (row) {
+        const tr = document.createElement('tr');
+        appendCell(tr, 'th', { scope: 'row', style: 'text-align: center', text: row.n });
+        appendCell(tr, 'td', { className: 'link_container spannowrap', node: mdwikiLink(row.display_title) });
+        appendCell(tr, 'td', { html: row.translate_html });
+        appendCell(tr, 'td', { html: row.translated_html });
+        appendCell(tr, 'td', { html: row.translated_before_html });
+        appendCell(tr, 'td', { html: row.qid_html });
+        return tr;
+    }
+};
+
+function setupResultsTable(table) {
+    const data = table.dataset;
+    const render = rowRenderers[data.table];
+    if (!render) return;
+
+    const tbody = table.tBodies[0];
+    const pager = document.querySelector(`[data-pager-for="${table.id}"]`);
+    const filter = document.querySelector(`[data-filter-for="${table.id}"]`);
+    const loadMore = pager ? pager.querySelector('.load-more') : null;
+
+    const state = {
+        sort: data.sort,
+        order: data.order,
+        q: '',
+        importance: '',
+        cursor: data.nextCursor || '',
+        loading: false
+    };
+
+    function updatePager(total, hasMore) {
+        if (!pager) return;
+        pager.querySelector('.shown-count').textContent = String(tbody.rows.length);
+        pager.querySelector('.total-count').textContent = String(total);
+        loadMore.hidden = !hasMore;
+    }
+
+    function load(reset) {
+        if (state.loading) return;
+        state.loading = true;
+
+        const params = new URLSearchParams({
+            table: data.table,
+            code: data.code,
+            camp: data.camp,
+            type: data.type,
+            sort: state.sort,
+            order: state.order,
+            limit: data.limit
+        });
+        if (state.q) params.set('q', state.q);
+        if (state.importance) params.set('importance', state.importance);
+        if (!reset && state.cursor) params.set('after', state.cursor);
+
+        fetch(`${data.rowsUrl}?${params.toString()}`, { headers: { Accept: 'application/json' } })
+            .then(response => response.ok ? response.json() : Promise.reject(new Error(response.statusText)))
+            .then(json => {
+                if (reset) tbody.replaceChildren();
+                json.rows.forEach(row => tbody.appendChild(render(row)));
+                state.cursor = json.next_cursor || '';
+                updatePager(json.total, Boolean(json.next_cursor));
+            })
+            .catch(error => console.error('Failed to load results rows:', error))
+            .finally(() => { state.loading = false; });
+    }
+
+    if (loadMore) {
+        loadMore.addEventListener('click', () => load(false));
+    }
+
+    table.querySelectorAll('thead th[data-sort]').forEach(th => {
+        th.style.cursor = 'pointer';
+        th.addEventListener('click', () => {
+            const field = th.dataset.sort;
+            if (state.sort === field) {
+                state.order = state.order === 'asc' ? 'desc' : 'asc';
+            } else {
+                state.sort = field;
+                state.order = field === 'title' ? 'asc' : 'desc';
+            }
+            load(true);
+        });
+    });
+
+    if (filter) {
+        let timer = null;
+        filter.querySelectorAll('input, select').forEach(input => {
+            input.addEventListener(input.tagName === 'SELECT' ? 'change' : 'input', () => {
+                clearTimeout(timer);
+                timer = setTimeout(() => {
+                    state[input.name] = input.value.trim();
+                    load(true);
+                }, 300);
+            });
+        });
+    }
+}
+
+document.querySelectorAll('table[data-rows-url]').forEach(setupResultsTable);
@@ -0,0 +1,53 @@
+import time
+
+import pytest
+from sqlalchemy import event
+
+from src.main_app.extensions import db
+
+REPEATS = 20
+VM_STEP = 100  # progress handler granularity, in SQLite VM instructions
+
+
+def _measure(func):
+    """
+    Run ``func`` against the test database and return
+    ``(result, statements, vm_steps, best_ms)``.
+
+    ``vm_steps`` counts SQLite VM instructions of the first run, so it does
+    not depend on the machine; ``statements`` and ``best_ms`` come from the
+    fastest of ``REPEATS`` further runs.
+    """
+    statements = []
+    vm_steps = [0]
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    def step():
+        vm_steps[0] += VM_STEP
+        return 0
+
+    event.listen(db.engine, "before_cursor_execute", count)
+    sqlite_conn = db.session.connection().connection.driver_connection
+    try:
+        sqlite_conn.set_progress_handler(step, VM_STEP)
+        result = func()
+        work = vm_steps[0]
+        sqlite_conn.set_progress_handler(None, 0)
+
+        best = float("inf")
+        for _ in range(REPEATS):
+            statements.clear()
+            start = time.perf_counter()
+            func()
+            best = min(best, time.perf_counter() - start)
+    finally:
+        sqlite_conn.set_progress_handler(None, 0)
+        event.remove(db.engine, "before_cursor_execute", count)
+    return result, len(statements), work, best * 1000
+
+
+@pytest.fixture
+def measure_db():
+    return _measure
@@ -0,0 +1,62 @@
+"""
+Benchmark: targeted exists lookup vs loading every target of the language.
+
+Seeds a big-wiki language (40000 mdwiki titles with a target, each in a
+category) and resolves the targets of 400 candidate titles, half of which
+are translated, the way ``results_api`` does.
+
+Deselected by default; run with:
+
+    pytest tests/benchmarks -m benchmark -s
+"""
+
+import pytest
+from sqlalchemy import insert
+
+from src.main_app.db.models import AllQidsExistRecord, CategoryMemberRecord, CategoryRecord, QidRecord
+from src.main_app.db.services.wikidata.allqid_service import AllQidsService
+from src.main_app.extensions import db
+
+pytestmark = pytest.mark.benchmark
+
+TRANSLATED = 40000
+CANDIDATES = 400
+
+
+@pytest.fixture
+def big_wiki():
+    titles = [f"Article {i}" for i in range(TRANSLATED + CANDIDATES)]
+    db.session.add(CategoryRecord(category="RTT", campaign="Main"))
+    db.session.execute(insert(CategoryMemberRecord), [{"category": "RTT", "article_id": t} for t in titles])
+    db.session.execute(insert(QidRecord), [{"title": t, "qid": f"Q{i}"} for i, t in enumerate(titles)])
+    db.session.execute(
+        insert(AllQidsExistRecord),
+        [{"qid": f"Q{i}", "code": "ar", "target": f"T{i}"} for i in range(TRANSLATED)],
+    )
+    db.session.commit()
+    # The last CANDIDATES titles have no target; half the candidates are among the translated
+    return titles[TRANSLATED - CANDIDATES // 2 : TRANSLATED + CANDIDATES // 2]
+
+
+def test_targeted_lookup_reads_only_candidates(big_wiki, measure_db):
+    service = AllQidsService()
+    candidates = big_wiki
+
+    def load_all():
+        targets = {row["title"]: row for row in service.list_targets_by_lang("ar")}
+        return {title: targets[title] for title in candidates if title in targets}
+
+    def targeted():
+        return {row["title"]: row for row in service.list_targets_by_lang_titles("ar", candidates, chunk_size=250)}
+
+    old, old_statements, old_work, old_ms = measure_db(load_all)
+    new, new_statements, new_work, new_ms = measure_db(targeted)
+
+    print(f"\n{TRANSLATED} targets, {CANDIDATES} candidates")
+    print(f"load all: {old_statements} stmts ~{old_work} VM steps {old_ms:.1f}ms")
+    print(f"targeted: {new_statements} stmts ~{new_work} VM steps {new_ms:.1f}ms")
+
+    assert new == old
+    assert len(new) == CANDIDATES // 2
+    assert new_statements == 2  # 400 titles in chunks of 250
+    assert new_work * 20 < old_work
@@ -212,6 +212,9 @@ def setup_db(mock_app: Flask):
     The Flask-SQLAlchemy session (db.session) is used throughout tests.
     """
     from src.main_app.db import register_events
+    from src.main_app.db.services.utils import clear_query_caches
+    from src.main_app.public.routes.td.leaderboard_fragments import leaderboard_fragments
+    from src.main_app.public.routes.td.results_snapshot import invalidate_results_snapshots
 
     with mock_app.app_context():
         register_events(_db.engine)
@@ -223,6 +226,9 @@ def setup_db(mock_app: Flask):
         yield
 
         _db.session.remove()
+        clear_query_caches()
+        invalidate_results_snapshots()
+        leaderboard_fragments.clear()
 
         # Drop views first (SQLite requires DROP VIEW, not DROP TABLE)
         with _db.engine.connect() as conn:
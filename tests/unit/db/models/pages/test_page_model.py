@@ -4,9 +4,11 @@ Unit tests for domain.models.page module.
 Tests for PageRecord.
 """
 
+from datetime import date
+
 import pytest
 
-from src.main_app.db.models import PageRecord
+from src.main_app.db.models import PageRecord, UserPageRecord
 
 
 @pytest.fixture
@@ -48,3 +50,28 @@ class TestPageRecord:
         assert record.word == 100
         assert record.translate_type == "Lead"
         assert record.mdwiki_revid == 12345
+
+
+class TestPubDate:
+    """Tests for the pub_date column derived from pupdate."""
+
+    def test_set_from_iso_pupdate(self):
+        record = PageRecord(title="T", pupdate="2024-03-05")
+        assert record.pub_date == date(2024, 3, 5)
+
+    def test_ignores_time_suffix(self):
+        record = PageRecord(title="T", pupdate="2024-03-05 10:11:12")
+        assert record.pub_date == date(2024, 3, 5)
+
+    def test_invalid_pupdate_gives_none(self):
+        record = PageRecord(title="T", pupdate="not a date")
+        assert record.pub_date is None
+
+    def test_follows_later_assignment(self):
+        record = PageRecord(title="T", pupdate="2024-03-05")
+        record.pupdate = ""
+        assert record.pub_date is None
+
+    def test_user_page_record(self):
+        record = UserPageRecord(title="T", pupdate="2025-12-31")
+        assert record.pub_date == date(2025, 12, 31)
@@ -148,3 +148,21 @@ class TestDeleteAssessment(TestSetup):
 
     def test_raises_error_if_not_found(self, monkeypatch):
         assert self.service.delete_assessment(9999) is False
+
+
+class TestBulkAddOrUpdateAssessments(TestSetup):
+    """Tests for bulk_add_or_update_assessments method."""
+
+    def test_inserts_and_updates(self):
+        self.service.add_assessment("Malaria", "Low")
+        inserted, updated = self.service.bulk_add_or_update_assessments(
+            [
+                {"title": "Malaria", "importance": "Top"},
+                {"title": "Cholera", "importance": "High"},
+            ]
+        )
+        assert (inserted, updated) == (1, 1)
+
+        self.service.expire_all()
+        assert self.service.get_assessment_by_title("Malaria").importance == "Top"
+        assert self.service.get_assessment_by_title("Cholera").importance == "High"
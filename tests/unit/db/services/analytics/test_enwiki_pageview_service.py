@@ -168,3 +168,21 @@ class TestDeleteEnwikiPageview(TestSetup):
 
     def test_raises_error_if_not_found(self, monkeypatch):
         assert self.service.delete(9999) is False
+
+
+class TestBulkAddOrUpdateEnwikiPageviews(TestSetup):
+    """Tests for bulk_add_or_update_enwiki_pageviews method."""
+
+    def test_inserts_and_updates(self):
+        self.service.add_enwiki_pageview("Malaria", 10)
+        inserted, updated = self.service.bulk_add_or_update_enwiki_pageviews(
+            [
+                {"title": "Malaria", "en_views": 500},
+                {"title": "Cholera"},
+            ]
+        )
+        assert (inserted, updated) == (1, 1)
+
+        self.service.expire_all()
+        assert self.service.get_enwiki_pageview_by_title("Malaria").en_views == 500
+        assert self.service.get_enwiki_pageview_by_title("Cholera").en_views == 0
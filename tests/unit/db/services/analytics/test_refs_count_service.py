@@ -172,3 +172,21 @@ class TestGetRefsCountsForTitle(TestSetup):
         lead, all_refs = self.service.get_ref_counts_for_title("Ghost_Article")
         assert lead is None
         assert all_refs is None
+
+
+class TestBulkAddOrUpdateRefsCounts(TestSetup):
+    """Tests for bulk_add_or_update_refs_counts method."""
+
+    def test_inserts_and_updates(self):
+        self.service.add_refs_count("Malaria", 1, 1)
+        inserted, updated = self.service.bulk_add_or_update_refs_counts(
+            [
+                {"r_title": "Malaria", "r_lead_refs": 5, "r_all_refs": 50},
+                {"r_title": "Cholera", "r_lead_refs": 3, "r_all_refs": 30},
+            ]
+        )
+        assert (inserted, updated) == (1, 1)
+
+        self.service.expire_all()
+        assert self.service.get_ref_counts_for_title("Malaria") == (5, 50)
+        assert self.service.get_ref_counts_for_title("Cholera") == (3, 30)
@@ -207,3 +207,21 @@ class TestGetTotalViewsForTarget(TestSetup):
         """Test that method handles None views."""
         self.service.add_views_new("Empty_Views", "en", 2022, None)
         assert self.service.get_total_views_for_target("Empty_Views") == 0
+
+
+class TestBulkAddOrUpdateViewsNew(TestSetup):
+    """Tests for bulk_add_or_update_views_new method."""
+
+    def test_inserts_and_updates(self):
+        self.service.add_views_new("Malaria", "en", 2023, 10)
+        inserted, updated = self.service.bulk_add_or_update_views_new(
+            [
+                {"target": "Malaria", "lang": "en", "year": 2023, "views": 99},
+                {"target": "Malaria", "lang": "en", "year": "2024", "views": 5},
+                {"target": "", "lang": "en", "year": 2024},
+            ]
+        )
+        assert (inserted, updated) == (1, 1)
+
+        self.service.expire_all()
+        assert self.service.get_total_views_for_target("Malaria", "en") == 104
@@ -0,0 +1,106 @@
+import dataclasses
+
+import pytest
+
+from src.main_app.db.models import ViewsNewAllRecord, ViewsNewTotalRecord
+from src.main_app.db.services.analytics import views_new_totals_service
+from src.main_app.db.services.analytics.views_new_service import ViewsNewService
+from src.main_app.db.services.analytics.views_new_totals_service import ViewsNewTotalsService, views_totals_model
+from src.main_app.db.services.pages.leaderboard_service import LeaderboardService
+from src.main_app.db.services.pages_tables.page_service import PagesService
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def summary_enabled(monkeypatch):
+    settings = views_new_totals_service.settings
+    patched = dataclasses.replace(settings, performance=dataclasses.replace(settings.performance, views_summary_table=True))
+    monkeypatch.setattr(views_new_totals_service, "settings", patched)
+
+
+class TestSetup:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.views_service = ViewsNewService()
+        self.service = ViewsNewTotalsService()
+
+    def totals(self) -> dict[tuple[str, str], int]:
+        return {(r.target, r.lang): r.views for r in self.service.list_all()}
+
+
+class TestViewsTotalsModel:
+    def test_defaults_to_view(self):
+        assert views_totals_model() is ViewsNewAllRecord
+
+    def test_summary_table_when_enabled(self, summary_enabled):
+        assert views_totals_model() is ViewsNewTotalRecord
+
+
+class TestRebuild(TestSetup):
+    def test_rebuild_aggregates_views_new(self):
+        self.views_service.add_views_new("A", "ar", 2024, 10)
+        self.views_service.add_views_new("A", "ar", 2025, 5)
+        self.views_service.add_views_new("B", "fr", 2025, 7)
+
+        assert self.service.rebuild() == 2
+        assert self.totals() == {("A", "ar"): 15, ("B", "fr"): 7}
+
+    def test_rebuild_drops_stale_rows(self):
+        self.service.create(target="Gone", lang="ar", views=3)
+        assert self.service.rebuild() == 0
+        assert self.totals() == {}
+
+
+class TestIncrementalMaintenance(TestSetup):
+    def test_not_maintained_when_disabled(self):
+        self.views_service.add_views_new("A", "ar", 2024, 10)
+        assert self.totals() == {}
+
+    def test_add_and_upsert(self, summary_enabled):
+        self.views_service.add_views_new("A", "ar", 2024, 10)
+        self.views_service.add_or_update_views_new("A", "ar", 2025, 5)
+        assert self.totals() == {("A", "ar"): 15}
+
+        self.views_service.add_or_update_views_new("A", "ar", 2025, 8)
+        assert self.totals() == {("A", "ar"): 18}
+
+    def test_bulk_upsert(self, summary_enabled):
+        self.views_service.bulk_add_or_update_views_new(
+            [
+                {"target": "A", "lang": "ar", "year": 2024, "views": 1},
+                {"target": "A", "lang": "ar", "year": 2025, "views": 2},
+                {"target": "B", "lang": "fr", "year": 2025, "views": 4},
+            ]
+        )
+        assert self.totals() == {("A", "ar"): 3, ("B", "fr"): 4}
+
+    def test_update_moving_to_another_key(self, summary_enabled):
+        record = self.views_service.add_views_new("A", "ar", 2024, 10)
+        self.views_service.update_views_new(record.id, lang="fr")
+        assert self.totals() == {("A", "fr"): 10}
+
+    def test_delete_removes_empty_total(self, summary_enabled):
+        record = self.views_service.add_views_new("A", "ar", 2024, 10)
+        assert self.views_service.delete(record.id) is True
+        assert self.totals() == {}
+
+
+class TestLeaderboardReadsSummaryTable(TestSetup):
+    def test_get_pages_slice_uses_totals(self, summary_enabled):
+        PagesService().add_page("T", "lead", "RTT", "ar", "U", "A")
+        self.service.create(target="A", lang="ar", views=42)
+
+        rows = LeaderboardService().get_pages_slice(limit=None).rows
+        assert [row["views"] for row in rows] == [42]
+
+
+class TestRebuildCommand(TestSetup):
+    def test_command_rebuilds_table(self, runner):
+        self.views_service.add_views_new("A", "ar", 2024, 10)
+
+        result = runner.invoke(args=["rebuild-views-totals"])
+
+        assert result.exit_code == 0, result.output
+        assert "1 rows" in result.output
+        assert self.totals() == {("A", "ar"): 10}
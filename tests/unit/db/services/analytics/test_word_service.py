@@ -176,3 +176,22 @@ class TestGetWordCountsForTitle(TestSetup):
         lead, all_w = self.service.get_word_counts_for_title("Ghost_Article")
         assert lead is None
         assert all_w is None
+
+
+class TestBulkAddOrUpdateWords(TestSetup):
+    """Tests for bulk_add_or_update_words method."""
+
+    def test_inserts_and_updates(self):
+        self.service.add_word("B-cell", 1, 1)
+        inserted, updated = self.service.bulk_add_or_update_words(
+            [
+                {"w_title": " B-cell ", "w_lead_words": 80, "w_all_words": 800},
+                {"w_title": "T-cell", "w_lead_words": 90, "w_all_words": 900},
+                {"w_title": "  "},
+            ]
+        )
+        assert (inserted, updated) == (1, 1)
+
+        self.service.expire_all()
+        assert self.service.get_word_counts_for_title("B-cell") == (80, 800)
+        assert self.service.get_word_counts_for_title("T-cell") == (90, 900)
@@ -0,0 +1,174 @@
+import dataclasses
+
+import pytest
+
+from src.main_app.db.models import AllQidsExistRecord, CategoryMemberRecord, QidRecord
+from src.main_app.db.services.content import category_coverage_service
+from src.main_app.db.services.content.category_coverage_service import CategoryLangCoverageService
+from src.main_app.db.services.content.category_member_service import CategoryMemberService
+from src.main_app.db.services.pages import missing_stats_service
+from src.main_app.db.services.wikidata.qid_others_service import QidOthersService
+from src.main_app.db.services.wikidata.qid_service import QidService
+from src.main_app.db.services.pages.missing_stats_service import MissingStatsService
+from src.main_app.extensions import db
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def rollup_enabled(monkeypatch):
+    settings = category_coverage_service.settings
+    patched = dataclasses.replace(
+        settings, performance=dataclasses.replace(settings.performance, coverage_rollup_table=True)
+    )
+    monkeypatch.setattr(category_coverage_service, "settings", patched)
+    monkeypatch.setattr(missing_stats_service, "settings", patched)
+
+
+@pytest.fixture
+def seeded():
+    db.session.add_all(
+        [
+            CategoryMemberRecord(category="RTT", article_id="Asthma"),
+            CategoryMemberRecord(category="RTT", article_id="Malaria"),
+            CategoryMemberRecord(category="RTT", article_id="Fever"),
+            CategoryMemberRecord(category="Covid", article_id="Fever"),
+            QidRecord(title="Asthma", qid="Q1"),
+            QidRecord(title="Malaria", qid="Q2"),
+            QidRecord(title="Fever", qid="Q3"),
+            QidRecord(title="Cancer", qid="Q4"),
+            AllQidsExistRecord(qid="Q1", code="ar", target="ربو"),
+            AllQidsExistRecord(qid="Q2", code="ar", target="ملاريا"),
+            AllQidsExistRecord(qid="Q3", code="fr", target="Fièvre"),
+            AllQidsExistRecord(qid="Q4", code="fr", target="Cancer"),
+        ]
+    )
+    db.session.commit()
+
+
+def rollup() -> dict[tuple[str, str], int]:
+    return {(r.category, r.lang): r.titles for r in CategoryLangCoverageService().list_all()}
+
+
+class TestRebuild:
+    def test_rebuild_counts_members_and_languages(self, seeded):
+        rows = CategoryLangCoverageService().rebuild()
+
+        assert rows == 5
+        assert rollup() == {
+            ("RTT", ""): 3,
+            ("RTT", "ar"): 2,
+            ("RTT", "fr"): 1,
+            ("Covid", ""): 1,
+            ("Covid", "fr"): 1,
+        }
+
+    def test_matches_live_queries(self, seeded, rollup_enabled):
+        CategoryLangCoverageService().rebuild()
+        service = MissingStatsService()
+
+        for cat in ("RTT", "Covid", "Unknown"):
+            live = (service.count_category_members(cat), service.statics_by_category(cat))
+            assert service.category_coverage(cat) == live
+
+    def test_refresh_categories_only_touches_given_categories(self, seeded):
+        service = CategoryLangCoverageService()
+        service.rebuild()
+        db.session.add(AllQidsExistRecord(qid="Q3", code="ar", target="حمى"))
+        db.session.commit()
+
+        assert service.refresh_categories(["Covid"]) == 1
+        assert rollup()[("Covid", "ar")] == 1
+        assert rollup()[("RTT", "ar")] == 2
+
+    def test_refresh_for_qids_finds_categories(self, seeded):
+        service = CategoryLangCoverageService()
+        service.rebuild()
+        db.session.add(AllQidsExistRecord(qid="Q3", code="ar", target="حمى"))
+        db.session.commit()
+
+        assert service.refresh_for_qids(["Q3", "Q404"]) == 2
+        assert rollup()[("RTT", "ar")] == 3
+        assert rollup()[("Covid", "ar")] == 1
+
+    def test_rejects_bad_chunk_size(self, seeded):
+        with pytest.raises(ValueError):
+            CategoryLangCoverageService().refresh_categories(["RTT"], chunk_size=0)
+
+
+class TestMemberHooks:
+    def test_member_writes_patch_rollup(self, seeded, rollup_enabled):
+        members = CategoryMemberService()
+        CategoryLangCoverageService().rebuild()
+
+        members.sync_category_members("Covid", ["Asthma"])
+        assert rollup()[("Covid", "")] == 2
+        assert rollup()[("Covid", "ar")] == 1
+
+        members.add_category_member("New", "Malaria")
+        assert rollup()[("New", "ar")] == 1
+
+        members.delete_record(members.get_by(category="New", article_id="Malaria"))
+        assert ("New", "") not in rollup()
+
+    def test_qid_writes_patch_rollup(self, seeded, rollup_enabled):
+        qids = QidService()
+        CategoryLangCoverageService().rebuild()
+
+        # Asthma now points at the French-only Q4
+        qids.add_or_update("Asthma", "Q4")
+        assert rollup()[("RTT", "ar")] == 1
+        assert rollup()[("RTT", "fr")] == 2
+
+        qids.bulk_add_or_update({"Asthma": "Q1"})
+        assert rollup()[("RTT", "ar")] == 2
+
+        record = qids.get_by_title("Malaria")
+        qids.update_qid(record.id, "Measles", "Q2")
+        assert rollup()[("RTT", "ar")] == 1
+
+        qids.delete_qid(qids.get_by_title("Fever").id)
+        assert ("Covid", "fr") not in rollup()
+        assert ("RTT", "fr") not in rollup()
+
+    def test_qid_others_writes_leave_rollup_alone(self, seeded, rollup_enabled):
+        CategoryLangCoverageService().rebuild()
+        before = rollup()
+        QidOthersService().add_or_update("Asthma", "Q4")
+        assert rollup() == before
+
+    def test_hooks_are_noop_when_disabled(self, seeded):
+        CategoryMemberService().batch_sync_category_members([{"category": "RTT", "article_id": "Cancer"}])
+        assert rollup() == {}
+
+
+class TestMissingStatsCoverage:
+    def test_falls_back_to_live_queries_when_disabled(self, seeded):
+        total, stats = MissingStatsService().category_coverage("RTT")
+
+        assert total == 3
+        assert {row["language_code"]: row["available_title_count"] for row in stats} == {"ar": 2, "fr": 1}
+
+    def test_reads_rollup_when_enabled(self, seeded, rollup_enabled):
+        # The rollup is served as-is, even before it has been built
+        assert MissingStatsService().category_coverage("RTT") == (0, [])
+
+        CategoryLangCoverageService().rebuild()
+        total, stats = MissingStatsService().category_coverage("RTT")
+        assert total == 3
+        assert stats == [
+            {"language_code": "fr", "available_title_count": 1},
+            {"language_code": "ar", "available_title_count": 2},
+        ]
+
+
+class TestRebuildCommand:
+    def test_command_rebuilds_table(self, seeded, runner):
+        result = runner.invoke(args=["rebuild-category-coverage"])
+
+        assert result.exit_code == 0, result.output
+        assert "5 rows" in result.output
+
+        result = runner.invoke(args=["rebuild-category-coverage", "--category", "RTT"])
+        assert result.exit_code == 0, result.output
+        assert "1 categories" in result.output
@@ -0,0 +1,66 @@
+import pytest
+
+from src.main_app.db.models import CategoryMemberRecord, CategoryRecord
+from src.main_app.db.services.content.category_member_service import CategoryMemberService
+from src.main_app.db.services.utils import get_table_version
+from src.main_app.extensions import db
+from src.main_app.shared import clients
+from src.main_app.shared.clients import CategoryCrawl
+
+
+@pytest.fixture
+def service():
+    db.session.add_all(
+        [
+            CategoryRecord(category="RTT", campaign="Main", depth=2),
+            CategoryRecord(category="Other", campaign="Other"),
+            CategoryMemberRecord(category="RTT", article_id="Asthma"),
+            CategoryMemberRecord(category="Other", article_id="Fever"),
+        ]
+    )
+    db.session.commit()
+    return CategoryMemberService()
+
+
+class TestSyncCategoryMembers:
+    def test_inserts_only_new_titles(self, service):
+        version = get_table_version("category_members")
+        assert service.sync_category_members("RTT", ["Asthma", "Malaria", "Malaria", "Fever"]) == 2
+
+        assert sorted(r.article_id for r in service.get_members_by_category("RTT")) == ["Asthma", "Fever", "Malaria"]
+        assert [r.article_id for r in service.get_members_by_category("Other")] == ["Fever"]
+        assert get_table_version("category_members") > version
+
+    def test_nothing_new(self, service):
+        version = get_table_version("category_members")
+        assert service.sync_category_members("RTT", ["Asthma"]) == 0
+        assert get_table_version("category_members") == version
+
+
+class TestSyncCategoryMembersCommand:
+    @pytest.fixture
+    def crawls(self, monkeypatch):
+        calls = []
+
+        def crawl(cat, depth=0, use_cache=True):
+            calls.append((cat, depth))
+            return CategoryCrawl(titles=["Asthma", "Malaria"], complete=cat == "RTT")
+
+        monkeypatch.setattr(clients, "crawl_mdwiki_category", crawl)
+        return calls
+
+    def test_crawls_configured_categories_at_their_depth(self, service, runner, crawls):
+        result = runner.invoke(args=["sync-category-members"])
+
+        assert result.exit_code == 0
+        assert sorted(crawls) == [("Other", 0), ("RTT", 2)]
+        assert "RTT: 1 members added." in result.output
+        assert "Other: crawl incomplete, skipped." in result.output
+        assert sorted(r.article_id for r in service.get_members_by_category("RTT")) == ["Asthma", "Malaria"]
+        assert [r.article_id for r in service.get_members_by_category("Other")] == ["Fever"]
+
+    def test_only_named_categories(self, service, runner, crawls):
+        result = runner.invoke(args=["sync-category-members", "--category", "RTT", "--category", "Unknown"])
+
+        assert result.exit_code == 0
+        assert crawls == [("RTT", 2)]
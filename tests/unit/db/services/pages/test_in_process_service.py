@@ -99,6 +99,54 @@ class TestListInProcessByLang(TestSetup):
         assert result[0].lang == "fr"
 
 
+class TestListInProcessByLangTitles(TestSetup):
+    """Tests for self.service.list_in_process_by_lang_titles function."""
+
+    def test_filters_by_lang_and_titles(self):
+        self.service.add_in_process("Back pain", "User_A", "fr")
+        self.service.add_in_process("Headache", "User_B", "fr")
+        self.service.add_in_process("Back pain", "User_C", "en")
+
+        result = self.service.list_in_process_by_lang_titles("fr", ["Back pain", "Fever"])
+
+        assert [(row["title"], row["user"]) for row in result] == [("Back pain", "User_A")]
+        assert set(result[0]) == {"id", "title", "user", "lang", "cat", "translate_type", "word", "add_date"}
+
+    def test_chunks_keep_id_order(self):
+        titles = [f"Title {i}" for i in range(5)]
+        for title in titles:
+            self.service.add_in_process(title, "User_A", "fr")
+
+        result = self.service.list_in_process_by_lang_titles("fr", reversed(titles), chunk_size=2)
+
+        assert [row["title"] for row in result] == titles
+
+    def test_empty_titles(self):
+        assert self.service.list_in_process_by_lang_titles("fr", []) == []
+
+
+class TestListInProcessByLangCategory(TestSetup):
+    """Tests for self.service.list_in_process_by_lang_category function."""
+
+    def test_joins_category_members(self, sqlite_db):
+        from src.main_app.db.models import CategoryMemberRecord
+
+        sqlite_db.session.add_all(
+            [
+                CategoryMemberRecord(category="RTT", article_id="Back pain"),
+                CategoryMemberRecord(category="Other", article_id="Headache"),
+            ]
+        )
+        sqlite_db.session.commit()
+        self.service.add_in_process("Back pain", "User_A", "fr")
+        self.service.add_in_process("Headache", "User_B", "fr")
+        self.service.add_in_process("Back pain", "User_C", "en")
+
+        result = self.service.list_in_process_by_lang_category("fr", "RTT")
+
+        assert [(row["title"], row["user"]) for row in result] == [("Back pain", "User_A")]
+
+
 class TestGetInProcess(TestSetup):
     """Tests for self.service.get_in_process function."""
 
@@ -0,0 +1,88 @@
+import pytest
+
+from src.main_app.db.models import CategoryRecord, PageRecord, ViewsNewRecord
+from src.main_app.db.services.pages.leaderboard_service import PAGES_SORT_FIELDS, LeaderboardService
+from src.main_app.extensions import db
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def seeded():
+    db.session.add_all(
+        [
+            CategoryRecord(category="RTT", campaign="Main"),
+            PageRecord(title="Malaria", user="Alice", lang="ar", cat="RTT", target="ملاريا", pupdate="2024-03-02", word=10),
+            PageRecord(title="Asthma", user="Alice", lang="ar", cat="RTT", target="ربو", pupdate="2024-03-20", word=30),
+            PageRecord(title="Fever", user="Bob", lang="ar", cat="RTT", target="حمى", pupdate="2025-01-05", word=20),
+            PageRecord(title="Cough", user="Bob", lang="ar", cat="RTT", target="سعال", pupdate="2025-01-05"),
+            PageRecord(title="Cold", user="Bob", lang="ar", cat="RTT", target=""),
+            PageRecord(title="Malaria", user="Bob", lang="fr", cat="RTT", target="Paludisme", pupdate="2024-05-01", word=5),
+            ViewsNewRecord(target="ملاريا", lang="ar", year=2024, views=40),
+            ViewsNewRecord(target="ملاريا", lang="ar", year=2025, views=2),
+            ViewsNewRecord(target="حمى", lang="ar", year=2025, views=7),
+        ]
+    )
+    db.session.commit()
+
+
+def walk(service, limit, **kwargs):
+    """Follow next keys until the last slice; return every title seen."""
+    titles, after = [], None
+    while True:
+        pages_slice = service.get_pages_slice(limit=limit, after=after, **kwargs)
+        assert len(pages_slice.rows) <= limit
+        titles.extend(row["title"] for row in pages_slice.rows)
+        if pages_slice.next_key is None:
+            return titles
+        after = pages_slice.next_key
+
+
+class TestPagesTotals:
+    def test_matches_python_sums(self, seeded):
+        service = LeaderboardService()
+        for filters in ({"lang": "ar"}, {"user": "Bob"}, {"user": "Bob", "lang": "ar", "year": 2025}, {"year": 2024}):
+            pages = service.get_pages_slice(limit=None, **filters).rows
+            assert service.get_pages_totals(**filters) == {
+                "articles": len(pages),
+                "words": sum(page["word"] for page in pages if page["word"]),
+                "pageviews": sum(page["views"] for page in pages if page["views"]),
+            }
+
+    def test_impossible_year(self, seeded):
+        assert LeaderboardService().get_pages_totals(year=0) == {"articles": 0, "words": 0, "pageviews": 0}
+
+
+class TestPagesSlice:
+    @pytest.mark.parametrize("sort", list(PAGES_SORT_FIELDS))
+    @pytest.mark.parametrize("order", ["asc", "desc"])
+    def test_keyset_walk_matches_full_listing(self, seeded, sort, order):
+        service = LeaderboardService()
+        full = [row["title"] for row in service.get_pages_slice(lang="ar", sort=sort, order=order).rows]
+
+        assert sorted(full) == sorted(title for (title,) in db.session.query(PageRecord.title).filter_by(lang="ar"))
+        for limit in (1, 2, 3):
+            assert walk(service, limit, lang="ar", sort=sort, order=order) == full
+
+    def test_sort_orders(self, seeded):
+        service = LeaderboardService()
+
+        def titles(**kwargs):
+            return [row["title"] for row in service.get_pages_slice(lang="ar", **kwargs).rows]
+
+        assert titles(sort="views", order="desc")[:2] == ["Malaria", "Fever"]
+        assert titles(sort="words", order="asc")[-1] == "Asthma"
+        assert titles(sort="title", order="asc") == ["Asthma", "Cold", "Cough", "Fever", "Malaria"]
+        assert titles(sort="date", order="desc")[-1] == "Cold"
+
+    def test_rows_carry_views_and_campaign(self, seeded):
+        rows = LeaderboardService().get_pages_slice(user="Alice", sort="title", order="asc").rows
+        assert [(row["title"], row["views"], row["campaign"]) for row in rows] == [
+            ("Asthma", None, "Main"),
+            ("Malaria", 42, "Main"),
+        ]
+        assert "sort_value" not in rows[0]
+
+    def test_rejects_unknown_sort(self):
+        with pytest.raises(ValueError):
+            LeaderboardService().get_pages_slice(sort="user")
@@ -0,0 +1,157 @@
+import dataclasses
+
+import pytest
+from werkzeug.datastructures import MultiDict
+
+from src.main_app.db.models import CategoryRecord, PageRecord, UserRecord, ViewsNewRecord, WordRecord
+from src.main_app.db.services.analytics.views_new_service import ViewsNewService
+from src.main_app.db.services.pages import leaderboard_rollup_service
+from src.main_app.db.services.pages.leaderboard_rollup_service import LeaderboardRollupService, rollup_key
+from src.main_app.db.services.pages.leaderboard_service import LeaderboardService
+from src.main_app.db.services.pages_tables.page_service import PagesService
+from src.main_app.extensions import db
+from src.main_app.public.routes.api.top_stats_routes import get_top_langs, get_top_users
+
+pytestmark = pytest.mark.unit
+
+FILTERS = [
+    {},
+    {"cat": "RTT"},
+    {"camp": "Main"},
+    {"user_group": "Wiki"},
+    {"year": "2024"},
+    {"year": "2024", "month": "3"},
+    {"year": "2024", "month": "13"},
+    {"camp": "Main", "user_group": "Wiki", "year": "2025"},
+    {"limit": "1"},
+]
+
+
+@pytest.fixture
+def rollup_enabled(monkeypatch):
+    settings = leaderboard_rollup_service.settings
+    patched = dataclasses.replace(settings, performance=dataclasses.replace(settings.performance, leaderboard_rollup=True))
+    monkeypatch.setattr(leaderboard_rollup_service, "settings", patched)
+
+
+@pytest.fixture
+def seeded():
+    db.session.add_all(
+        [
+            UserRecord(username="Alice", user_group="Wiki"),
+            UserRecord(username="Bob", user_group="Other"),
+            CategoryRecord(category="RTT", campaign="Main"),
+            CategoryRecord(category="Covid", campaign="Covid"),
+            WordRecord(w_title="Malaria", w_lead_words=100, w_all_words=900),
+            WordRecord(w_title="Asthma", w_lead_words=50, w_all_words=500),
+            PageRecord(title="Malaria", user="Alice", lang="ar", cat="RTT", target="ملاريا", pupdate="2024-03-02"),
+            PageRecord(
+                title="Asthma", user="Alice", lang="ar", cat="RTT", target="ربو", pupdate="2024-03-20", translate_type="all"
+            ),
+            PageRecord(title="Malaria", user="Alice", lang="fr", cat="Covid", target="Paludisme", pupdate="2025-01-05"),
+            PageRecord(title="Asthma", user="Bob", lang="fr", cat="RTT", target="Asthme", pupdate="2024-07-01", word=7),
+            PageRecord(title="Fever", user="Bob", lang="de", cat="RTT", target="Fieber", pupdate="not a date"),
+            PageRecord(title="Cough", user="Bob", lang="de", cat="RTT", target=""),
+            PageRecord(title="Cold", user="", lang="de", cat="RTT", target="Erkältung", pupdate="2024-03-01"),
+            ViewsNewRecord(target="ملاريا", lang="ar", year=2024, views=40),
+            ViewsNewRecord(target="ملاريا", lang="ar", year=2025, views=2),
+            ViewsNewRecord(target="Asthme", lang="fr", year=2024, views=9),
+        ]
+    )
+    db.session.commit()
+
+
+def rollup() -> dict[tuple, tuple[int, int, int]]:
+    return {
+        (r.user, r.lang, r.cat, r.year, r.month): (r.targets, r.words, r.views)
+        for r in LeaderboardRollupService().list_all()
+    }
+
+
+def live_and_rollup(monkeypatch, func):
+    live = func()
+    settings = leaderboard_rollup_service.settings
+    patched = dataclasses.replace(settings, performance=dataclasses.replace(settings.performance, leaderboard_rollup=True))
+    monkeypatch.setattr(leaderboard_rollup_service, "settings", patched)
+    try:
+        return live, func()
+    finally:
+        monkeypatch.undo()
+
+
+class TestRebuild:
+    def test_buckets(self, seeded):
+        assert LeaderboardRollupService().rebuild() == 5
+        assert rollup() == {
+            ("Alice", "ar", "RTT", 2024, 3): (2, 100 + 500, 42),
+            ("Alice", "fr", "Covid", 2025, 1): (1, 100, 0),
+            ("Bob", "fr", "RTT", 2024, 7): (1, 7, 9),
+            ("Bob", "de", "RTT", 0, 0): (1, 0, 0),
+            ("", "de", "RTT", 2024, 3): (1, 0, 0),
+        }
+
+    @pytest.mark.parametrize("args", FILTERS)
+    def test_top_stats_match_live_queries(self, seeded, monkeypatch, args):
+        LeaderboardRollupService().rebuild()
+        for func in (get_top_langs, get_top_users):
+            live, rolled = live_and_rollup(monkeypatch, lambda func=func: func(MultiDict(args)))
+            assert rolled == live
+
+    @pytest.mark.parametrize(
+        "kwargs", [{}, {"camp": "Main"}, {"user_group": "Wiki"}, {"year": 2024, "month": 3}, {"lang": "fr"}, {"user": "Bob"}]
+    )
+    def test_chart_matches_live_query(self, seeded, monkeypatch, kwargs):
+        LeaderboardRollupService().rebuild()
+        live, rolled = live_and_rollup(monkeypatch, lambda: LeaderboardService().get_leaderboard_chart_data(**kwargs))
+        assert rolled == live
+
+    def test_top_lang_of_users_matches_live_query(self, seeded, monkeypatch):
+        LeaderboardRollupService().rebuild()
+        live = LeaderboardService().top_lang_of_users()
+        LeaderboardService.top_lang_of_users.cache_clear()
+        _, rolled = live_and_rollup(monkeypatch, lambda: LeaderboardService().top_lang_of_users())
+        assert sorted(rolled, key=lambda row: row["user"]) == sorted(live, key=lambda row: row["user"])
+
+
+class TestIncrementalRefresh:
+    def test_page_writes_patch_buckets(self, seeded, rollup_enabled):
+        LeaderboardRollupService().rebuild()
+        pages = PagesService()
+
+        record = pages.create(title="Malaria", user="Bob", lang="ar", cat="RTT", target="", pupdate="2024-03-09")
+        assert ("Bob", "ar", "RTT", 2024, 3) not in rollup()
+
+        pages.update(record, target="ملاريا ب")
+        assert rollup()[("Bob", "ar", "RTT", 2024, 3)] == (1, 100, 0)
+
+        pages.update(record, pupdate="2024-04-01")
+        assert ("Bob", "ar", "RTT", 2024, 3) not in rollup()
+        assert rollup()[("Bob", "ar", "RTT", 2024, 4)] == (1, 100, 0)
+
+        pages.delete_record(record)
+        assert ("Bob", "ar", "RTT", 2024, 4) not in rollup()
+
+    def test_translate_row_refreshes_bucket(self, seeded, rollup_enabled):
+        PagesService().add_translate_row_to_db("Fever", "lead", "Covid", "fr", "Alice", "Fièvre", "2025-01-09", word=3)
+        assert rollup()[("Alice", "fr", "Covid", 2025, 1)] == (2, 103, 0)
+
+    def test_view_imports_patch_buckets(self, seeded, rollup_enabled):
+        LeaderboardRollupService().rebuild()
+        ViewsNewService().add_views_new("Paludisme", "fr", 2025, 11)
+        assert rollup()[("Alice", "fr", "Covid", 2025, 1)] == (1, 100, 11)
+
+    def test_noop_when_disabled(self, seeded):
+        PagesService().create(title="X", user="Bob", lang="ar", cat="RTT", target="X", pupdate="2024-01-01")
+        assert rollup() == {}
+
+
+def test_rollup_key():
+    assert rollup_key(None, "ar", None, None) == ("", "ar", "", 0, 0)
+
+
+class TestRebuildCommand:
+    def test_command_rebuilds_table(self, seeded, runner):
+        result = runner.invoke(args=["rebuild-leaderboard-rollup"])
+
+        assert result.exit_code == 0, result.output
+        assert "5 rows" in result.output
@@ -19,6 +19,7 @@ from src.main_app.db.services import (
     PagesUsersToMainPagesService,
     UserPagesService,
 )
+from src.main_app.db.services.utils import get_table_version
 from src.main_app.extensions import db
 
 pytestmark = pytest.mark.unit
@@ -235,6 +236,19 @@ class TestDeleteUserPage(TestSetup):
         # TODO: need to check that the page record is deleted
         assert self.user_pages_service.get_record_by_id(page_id) is None
 
+    def test_bumps_both_table_versions(self):
+        page = self.user_pages_service.add_record(
+            UserPageRecord(title="title", translate_type="lead", cat="RTT", lang="ar", user="test", target="target")
+        )
+        self.service.add_record(PagesUsersToMainRecord(id=page.id, new_target="t", new_user="test", new_qid="Q1"))
+        before = (get_table_version("pages_users"), get_table_version("pages_users_to_main"))
+
+        assert self.service.delete_user_page_to_main(page.id) is True
+
+        after = (get_table_version("pages_users"), get_table_version("pages_users_to_main"))
+        assert after[0] > before[0]
+        assert after[1] > before[1]
+
     def test_returns_true_when_user_page_only(self, sqlite_db):
         # PHP path: even if only the pages_users row is present, the deletion
         # should succeed (both queries are issued, idempotent).
@@ -0,0 +1,55 @@
+import pytest
+
+from src.main_app.db.models import (
+    AllQidsExistRecord,
+    AssessmentRecord,
+    CategoryMemberRecord,
+    LangRecord,
+    QidRecord,
+)
+from src.main_app.db.services.pages.results_2026_service import Results2026Service
+from src.main_app.extensions import db
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def seeded():
+    db.session.add_all(
+        [
+            LangRecord(code="ar", autonym="العربية", name="Arabic"),
+            CategoryMemberRecord(category="RTT", article_id="Asthma"),
+            CategoryMemberRecord(category="RTT", article_id="Malaria"),
+            CategoryMemberRecord(category="RTT", article_id="Cancer"),
+            CategoryMemberRecord(category="Other", article_id="Fever"),
+            QidRecord(title="Asthma", qid="Q35869"),
+            QidRecord(title="Malaria", qid="Q12156"),
+            QidRecord(title="Cancer", qid="Q12078"),
+            QidRecord(title="Fever", qid="Q38933"),
+            AllQidsExistRecord(qid="Q12156", code="ar", target="ملاريا"),
+            AssessmentRecord(title="Asthma", importance="Top"),
+        ]
+    )
+    db.session.commit()
+
+
+class TestMissingAndExists:
+    def test_matches_separate_queries(self, seeded):
+        service = Results2026Service()
+        missing, exists = service.missing_and_exists_by_lang_and_category("ar", "RTT")
+
+        key = lambda row: row["title"]  # noqa: E731
+        assert sorted(missing, key=key) == sorted(service.missing_by_lang_and_category("ar", "RTT"), key=key)
+        assert sorted(exists, key=key) == sorted(service.exists_by_lang_and_category("ar", "RTT"), key=key)
+
+    def test_partition(self, seeded):
+        missing, exists = Results2026Service().missing_and_exists_by_lang_and_category("ar", "RTT")
+        assert {row["title"] for row in missing} == {"Asthma", "Cancer"}
+        assert [(row["title"], row["target"]) for row in exists] == [("Malaria", "ملاريا")]
+        assert all("target" not in row for row in missing)
+
+    def test_unknown_lang(self, seeded):
+        assert Results2026Service().missing_and_exists_by_lang_and_category("xx", "RTT") == ([], [])
+
+    def test_empty_arguments(self):
+        assert Results2026Service().missing_and_exists_by_lang_and_category("", "RTT") == ([], [])
@@ -0,0 +1,139 @@
+"""
+Unit tests for the generic ``CRUDService`` bulk helpers.
+"""
+
+import pytest
+
+from src.main_app.db.models import ViewsNewRecord, WordRecord
+from src.main_app.db.services.crud_service import CRUDService
+
+pytestmark = pytest.mark.unit
+
+
+class TestBulkUpsert:
+    @pytest.fixture(autouse=True)
+    def setup(self, sqlite_db):
+        self.session = sqlite_db.session
+        self.service = CRUDService(sqlite_db.session, WordRecord)
+
+    def test_inserts_new_rows(self):
+        rows = [
+            {"w_title": "Asthma", "w_lead_words": 10, "w_all_words": 100},
+            {"w_title": "Anemia", "w_lead_words": 20, "w_all_words": 200},
+        ]
+        inserted, updated = self.service.bulk_upsert(rows, conflict_keys=["w_title"])
+        assert (inserted, updated) == (2, 0)
+        assert self.service.count() == 2
+
+    def test_updates_existing_rows(self):
+        self.service.create(w_title="Asthma", w_lead_words=1, w_all_words=1)
+        rows = [
+            {"w_title": "Asthma", "w_lead_words": 10, "w_all_words": 100},
+            {"w_title": "Anemia", "w_lead_words": 20, "w_all_words": 200},
+        ]
+        inserted, updated = self.service.bulk_upsert(rows, conflict_keys=["w_title"])
+        assert (inserted, updated) == (1, 1)
+
+        self.session.expire_all()
+        record = self.service.get_by(w_title="Asthma")
+        assert record.w_lead_words == 10
+        assert record.w_all_words == 100
+
+    def test_only_listed_update_columns_change(self):
+        self.service.create(w_title="Asthma", w_lead_words=1, w_all_words=1)
+        rows = [{"w_title": "Asthma", "w_lead_words": 10, "w_all_words": 100}]
+        self.service.bulk_upsert(rows, conflict_keys=["w_title"], update_columns=["w_lead_words"])
+
+        self.session.expire_all()
+        record = self.service.get_by(w_title="Asthma")
+        assert record.w_lead_words == 10
+        assert record.w_all_words == 1
+
+    def test_empty_update_columns_keeps_existing_rows(self):
+        self.service.create(w_title="Asthma", w_lead_words=1, w_all_words=1)
+        rows = [{"w_title": "Asthma", "w_lead_words": 10, "w_all_words": 100}]
+        inserted, updated = self.service.bulk_upsert(rows, conflict_keys=["w_title"], update_columns=[])
+        assert (inserted, updated) == (0, 1)
+
+        self.session.expire_all()
+        assert self.service.get_by(w_title="Asthma").w_lead_words == 1
+
+    def test_duplicate_keys_collapse_to_last_row(self):
+        rows = [
+            {"w_title": "Asthma", "w_lead_words": 1, "w_all_words": 1},
+            {"w_title": "Asthma", "w_lead_words": 2, "w_all_words": 2},
+        ]
+        inserted, updated = self.service.bulk_upsert(rows, conflict_keys=["w_title"])
+        assert (inserted, updated) == (1, 0)
+        assert self.service.get_by(w_title="Asthma").w_lead_words == 2
+
+    def test_small_chunks_cover_all_rows(self):
+        rows = [{"w_title": f"Title {i}", "w_lead_words": i, "w_all_words": i} for i in range(25)]
+        inserted, updated = self.service.bulk_upsert(rows, conflict_keys=["w_title"], chunk_size=4)
+        assert (inserted, updated) == (25, 0)
+        assert self.service.count() == 25
+
+    def test_composite_conflict_keys(self, sqlite_db):
+        service = CRUDService(sqlite_db.session, ViewsNewRecord)
+        service.create(target="Asma", lang="es", year=2024, views=5)
+        rows = [
+            {"target": "Asma", "lang": "es", "year": 2024, "views": 50},
+            {"target": "Asma", "lang": "es", "year": 2025, "views": 60},
+        ]
+        inserted, updated = service.bulk_upsert(rows, conflict_keys=["target", "lang", "year"])
+        assert (inserted, updated) == (1, 1)
+
+        self.session.expire_all()
+        assert service.get_by(target="Asma", lang="es", year=2024).views == 50
+
+    def test_empty_rows_is_noop(self):
+        assert self.service.bulk_upsert([], conflict_keys=["w_title"]) == (0, 0)
+
+    def test_rejects_empty_conflict_keys(self):
+        with pytest.raises(ValueError):
+            self.service.bulk_upsert([{"w_title": "Asthma"}], conflict_keys=[])
+
+    def test_rejects_row_missing_conflict_key(self):
+        with pytest.raises(ValueError):
+            self.service.bulk_upsert([{"w_lead_words": 1}], conflict_keys=["w_title"])
+
+
+class TestIterBatches:
+    @pytest.fixture(autouse=True)
+    def setup(self, sqlite_db):
+        self.service = CRUDService(sqlite_db.session, WordRecord)
+        self.service.bulk_upsert(
+            [{"w_title": f"Title {i:02d}", "w_lead_words": i, "w_all_words": i * 10} for i in range(10)],
+            conflict_keys=["w_title"],
+        )
+
+    def test_batches_cover_table_in_pk_order(self):
+        batches = list(self.service.iter_batches(batch_size=4))
+        assert [len(batch) for batch in batches] == [4, 4, 2]
+
+        ids = [record.w_id for batch in batches for record in batch]
+        assert ids == sorted(ids)
+        assert len(set(ids)) == 10
+
+    def test_exact_multiple_of_batch_size(self):
+        batches = list(self.service.iter_batches(batch_size=5))
+        assert [len(batch) for batch in batches] == [5, 5]
+
+    def test_filters(self):
+        rows = list(self.service.stream(batch_size=3, filters={"w_lead_words": 3}))
+        assert [row.w_title for row in rows] == ["Title 03"]
+
+    def test_columns_yield_rows_with_primary_key(self):
+        rows = list(self.service.stream(batch_size=3, columns=["w_title"]))
+        assert len(rows) == 10
+        assert not isinstance(rows[0], WordRecord)
+        assert rows[0].w_title == "Title 00"
+        assert rows[0].w_id is not None
+
+    def test_empty_table(self, sqlite_db):
+        service = CRUDService(sqlite_db.session, ViewsNewRecord)
+        assert list(service.stream()) == []
+
+    def test_rejects_non_positive_batch_size(self):
+        with pytest.raises(ValueError):
+            next(self.service.iter_batches(batch_size=0))
@@ -158,3 +158,13 @@ class TestUserExists(TestSetup):
     def test_returns_false_when_user_not_found(self, monkeypatch):
         """Test that method returns False when user not found."""
         assert self.service.user_exists("Nonexistent_Member") is False
+
+
+class TestIterUsers(TestSetup):
+    """Tests for iter_users method."""
+
+    def test_yields_every_user_across_batches(self):
+        for i in range(5):
+            self.service.create_user(f"Streamed_{i}")
+        names = [user.username for user in self.service.iter_users(batch_size=2)]
+        assert names == [f"Streamed_{i}" for i in range(5)]
@@ -0,0 +1,60 @@
+from datetime import date
+
+import pytest
+
+from src.main_app.db.models import PageRecord
+from src.main_app.db.services.pages_tables.page_service import PagesService
+from src.main_app.db.services.utils.date_ranges import date_range_condition, period_bounds
+from src.main_app.extensions import db
+
+pytestmark = pytest.mark.unit
+
+
+class TestPeriodBounds:
+    def test_year(self):
+        assert period_bounds(2024) == (date(2024, 1, 1), date(2025, 1, 1))
+
+    def test_month(self):
+        assert period_bounds(2024, 2) == (date(2024, 2, 1), date(2024, 3, 1))
+
+    def test_december_rolls_over(self):
+        assert period_bounds(2024, 12) == (date(2024, 12, 1), date(2025, 1, 1))
+
+    def test_invalid_month(self):
+        with pytest.raises(ValueError):
+            period_bounds(2024, 13)
+
+
+class TestDateRangeCondition:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        for title, pupdate in (("A", "2024-01-31"), ("B", "2024-02-01"), ("C", "2024-02-29"), ("D", "2025-01-01")):
+            db.session.add(PageRecord(title=title, pupdate=pupdate))
+        db.session.commit()
+
+    def titles(self, condition) -> list[str]:
+        rows = db.session.query(PageRecord.title).filter(condition).order_by(PageRecord.title).all()
+        return [row.title for row in rows]
+
+    def test_year_range(self):
+        assert self.titles(date_range_condition(PageRecord.pub_date, 2024)) == ["A", "B", "C"]
+
+    def test_month_range(self):
+        assert self.titles(date_range_condition(PageRecord.pub_date, 2024, 2)) == ["B", "C"]
+
+    def test_invalid_period_matches_nothing(self):
+        assert self.titles(date_range_condition(PageRecord.pub_date, 2024, 13)) == []
+
+
+class TestBackfillPubDates:
+    def test_fills_missing_values(self):
+        service = PagesService()
+        for title, pupdate in (("A", "2024-01-31"), ("B", "bad"), ("C", "2023-05-06")):
+            service.create(title=title, pupdate=pupdate)
+        db.session.query(PageRecord).update({PageRecord.pub_date: None}, synchronize_session=False)
+        db.session.commit()
+
+        assert service.backfill_pub_dates(batch_size=2) == 2
+
+        rows = {row.title: row.pub_date for row in db.session.query(PageRecord.title, PageRecord.pub_date)}
+        assert rows == {"A": date(2024, 1, 31), "B": None, "C": date(2023, 5, 6)}
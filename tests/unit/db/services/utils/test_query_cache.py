@@ -0,0 +1,132 @@
+import dataclasses
+
+import pytest
+
+from src.main_app.db.services.content.lang_service import LangService
+from src.main_app.db.services.utils import query_cache
+from src.main_app.db.services.utils.query_cache import (
+    bump_table_version,
+    cached_query,
+    clear_query_caches,
+    get_table_version,
+)
+from src.main_app.shared.core.metrics import metrics
+
+pytestmark = pytest.mark.unit
+
+
+class Counter:
+    def __init__(self):
+        self.calls = 0
+
+    @cached_query("example_table", maxsize=2)
+    def compute(self, value, scale=1):
+        self.calls += 1
+        return value * scale
+
+
+class TestCachedQuery:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        clear_query_caches()
+        self.counter = Counter()
+
+    def test_repeated_call_is_served_from_cache(self):
+        assert self.counter.compute(2) == 2
+        assert self.counter.compute(2) == 2
+        assert self.counter.calls == 1
+
+    def test_arguments_are_part_of_the_key(self):
+        self.counter.compute(2)
+        self.counter.compute(2, scale=3)
+        self.counter.compute(3)
+        assert self.counter.calls == 3
+
+    def test_cache_is_shared_between_instances(self):
+        self.counter.compute(5)
+        other = Counter()
+        assert other.compute(5) == 5
+        assert other.calls == 0
+
+    def test_bumping_table_version_invalidates(self):
+        self.counter.compute(2)
+        bump_table_version("example_table")
+        self.counter.compute(2)
+        assert self.counter.calls == 2
+
+    def test_unrelated_table_does_not_invalidate(self):
+        self.counter.compute(2)
+        bump_table_version("other_table")
+        self.counter.compute(2)
+        assert self.counter.calls == 1
+
+    def test_lru_evicts_oldest_entry(self):
+        self.counter.compute(1)
+        self.counter.compute(2)
+        self.counter.compute(1)
+        self.counter.compute(3)
+        assert Counter.compute.cache_len() == 2
+        self.counter.compute(1)
+        assert self.counter.calls == 3
+        self.counter.compute(2)
+        assert self.counter.calls == 4
+
+    def test_unhashable_arguments_bypass_cache(self):
+        assert self.counter.compute([1], scale=2) == [1, 1]
+        assert self.counter.compute([1], scale=2) == [1, 1]
+        assert self.counter.calls == 2
+
+    def test_hits_and_misses_are_counted(self):
+        name = Counter.compute.__qualname__
+        hits = metrics.get("query_cache.hits", method=name)
+        misses = metrics.get("query_cache.misses", method=name)
+        self.counter.compute(7)
+        self.counter.compute(7)
+        assert metrics.get("query_cache.misses", method=name) == misses + 1
+        assert metrics.get("query_cache.hits", method=name) == hits + 1
+
+    def test_entries_expire_after_ttl(self, monkeypatch):
+        settings = query_cache.settings
+        performance = dataclasses.replace(settings.performance, query_cache_ttl=60)
+        monkeypatch.setattr(query_cache, "settings", dataclasses.replace(settings, performance=performance))
+        now = [1000.0]
+        monkeypatch.setattr(query_cache.time, "monotonic", lambda: now[0])
+
+        self.counter.compute(2)
+        now[0] += 59
+        self.counter.compute(2)
+        assert self.counter.calls == 1
+
+        now[0] += 1
+        self.counter.compute(2)
+        assert self.counter.calls == 2
+
+    def test_zero_ttl_keeps_entries_until_a_write(self, monkeypatch):
+        settings = query_cache.settings
+        performance = dataclasses.replace(settings.performance, query_cache_ttl=0)
+        monkeypatch.setattr(query_cache, "settings", dataclasses.replace(settings, performance=performance))
+        now = [1000.0]
+        monkeypatch.setattr(query_cache.time, "monotonic", lambda: now[0])
+
+        self.counter.compute(2)
+        now[0] += 86400
+        self.counter.compute(2)
+        assert self.counter.calls == 1
+
+    def test_requires_a_table(self):
+        with pytest.raises(ValueError):
+            cached_query()
+
+
+class TestCrudWritesBumpVersion:
+    def test_create_bumps_table_version(self):
+        service = LangService()
+        before = get_table_version("langs")
+        service.add_lang("ar", "العربية", "Arabic")
+        assert get_table_version("langs") > before
+
+    def test_cached_list_sees_new_rows(self):
+        service = LangService()
+        assert service.list_langs_as_dicts() == []
+        service.add_lang("ar", "العربية", "Arabic")
+        assert [row["code"] for row in service.list_langs_as_dicts()] == ["ar"]
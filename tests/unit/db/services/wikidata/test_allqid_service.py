@@ -1,4 +1,50 @@
 """
 Unit tests for src/main_app/shared/services/allqid_service.py module.
-TODO: write tests
 """
+
+import pytest
+
+from src.main_app.db.models import AllQidsExistRecord, CategoryMemberRecord, CategoryRecord, QidRecord
+from src.main_app.db.services.wikidata.allqid_service import AllQidsService
+from src.main_app.extensions import db
+
+
+@pytest.fixture
+def seeded():
+    db.session.add_all(
+        [
+            CategoryRecord(category="RTT", campaign="Main"),
+            CategoryMemberRecord(category="RTT", article_id="Malaria"),
+            QidRecord(title="Asthma", qid="Q1"),
+            QidRecord(title="Malaria", qid="Q2"),
+            QidRecord(title="Fever", qid="Q3"),
+            QidRecord(title="Cancer", qid="Q4"),
+            AllQidsExistRecord(qid="Q1", code="ar", target="ربو"),
+            AllQidsExistRecord(qid="Q2", code="ar", target="ملاريا"),
+            AllQidsExistRecord(qid="Q3", code="ar", target=""),
+            AllQidsExistRecord(qid="Q4", code="fr", target="Cancer"),
+        ]
+    )
+    db.session.commit()
+
+
+class TestListTargetsByLangTitles:
+    def test_matches_full_list_for_titles(self, seeded):
+        service = AllQidsService()
+        titles = ["Malaria", "Fever", "Cancer", "Unknown"]
+
+        expected = [row for row in service.list_targets_by_lang("ar") if row["title"] in titles]
+        assert service.list_targets_by_lang_titles("ar", titles) == expected
+        assert expected == [{"qid": "Q2", "title": "Malaria", "category": "RTT", "code": "ar", "target": "ملاريا"}]
+
+    def test_chunks(self, seeded):
+        rows = AllQidsService().list_targets_by_lang_titles("ar", ["Asthma", "Malaria", "Asthma"], chunk_size=1)
+        assert sorted(row["title"] for row in rows) == ["Asthma", "Malaria"]
+
+    def test_empty_input(self, seeded):
+        assert AllQidsService().list_targets_by_lang_titles("ar", []) == []
+        assert AllQidsService().list_targets_by_lang_titles("", ["Asthma"]) == []
+
+    def test_rejects_bad_chunk_size(self, seeded):
+        with pytest.raises(ValueError):
+            AllQidsService().list_targets_by_lang_titles("ar", ["Asthma"], chunk_size=0)
@@ -274,3 +274,21 @@ class TestInsert(TestSetup):
     def test_insert_returns_false(self):
         ok = self.service.insert("Will_fail", "")
         assert ok is False
+
+
+class TestBulkAddOrUpdate(TestSetup):
+    def test_inserts_updates_and_skips_invalid(self):
+        self.service.add_or_update("Malaria", "Q12156")
+        inserted, updated = self.service.bulk_add_or_update(
+            {
+                "Malaria": "Q999",
+                "Cholera": "Q12090",
+                "Broken": "not-a-qid",
+            }
+        )
+        assert (inserted, updated) == (1, 1)
+
+        self.service.expire_all()
+        assert self.service.get_by_title("Malaria").qid == "Q999"
+        assert self.service.get_by_title("Cholera").qid == "Q12090"
+        assert self.service.get_by_title("Broken") is None
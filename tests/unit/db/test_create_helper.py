@@ -0,0 +1,46 @@
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import Column, Index, Integer, MetaData, String, Table, create_engine, inspect, text
+
+from src.main_app.db.create_helper import add_missing_columns, create_missing_indexes
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def legacy_db():
+    engine = create_engine("sqlite://")
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY, name VARCHAR(20))"))
+
+    metadata = MetaData()
+    Table(
+        "items",
+        metadata,
+        Column("id", Integer, primary_key=True),
+        Column("name", String(20)),
+        Column("extra", String(10)),
+        Index("idx_items_name_extra", "name", "extra"),
+    )
+    yield SimpleNamespace(engine=engine, metadata=metadata)
+    engine.dispose()
+
+
+class TestAddMissingColumns:
+    def test_adds_nullable_column(self, legacy_db):
+        assert add_missing_columns(legacy_db) == ["items.extra"]
+        assert "extra" in {col["name"] for col in inspect(legacy_db.engine).get_columns("items")}
+
+    def test_is_idempotent(self, legacy_db):
+        add_missing_columns(legacy_db)
+        assert add_missing_columns(legacy_db) == []
+
+
+class TestCreateMissingIndexes:
+    def test_creates_index_on_existing_table(self, legacy_db):
+        add_missing_columns(legacy_db)
+        create_missing_indexes(legacy_db)
+        create_missing_indexes(legacy_db)
+        names = {index["name"] for index in inspect(legacy_db.engine).get_indexes("items")}
+        assert "idx_items_name_extra" in names
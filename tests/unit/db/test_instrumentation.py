@@ -0,0 +1,123 @@
+import dataclasses
+import logging
+
+import pytest
+from flask import Flask, Response, g
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+from src.main_app.db import instrumentation
+from src.main_app.db.instrumentation import (
+    RequestQueryStats,
+    init_sql_instrumentation,
+    normalize_statement,
+    recent_request_stats,
+)
+from src.main_app.extensions import db
+from src.main_app.shared.auth.current_user import CurrentUser
+
+pytestmark = pytest.mark.unit
+
+
+class TestNormalizeStatement:
+    def test_replaces_literals_and_placeholders(self):
+        statement = "SELECT * FROM pages WHERE lang = 'ar' AND id = 12 AND user = %(user)s"
+        assert normalize_statement(statement) == "SELECT * FROM pages WHERE lang = ? AND id = ? AND user = ?"
+
+    def test_collapses_in_lists_and_whitespace(self):
+        statement = "SELECT id\n  FROM  words WHERE w_title IN (?, ?, ?)"
+        assert normalize_statement(statement) == "SELECT id FROM words WHERE w_title IN (?)"
+
+    def test_keeps_identifiers_with_digits(self):
+        assert normalize_statement("SELECT t1.id FROM results_2026 t1") == "SELECT t1.id FROM results_2026 t1"
+
+
+class TestRequestQueryStats:
+    def test_counts_and_keeps_slowest(self):
+        stats = RequestQueryStats()
+        for ms in range(1, 9):
+            stats.record(f"SELECT {ms}", float(ms))
+
+        assert stats.count == 8
+        assert stats.total_ms == 36
+        assert [ms for ms, _ in stats.slowest] == [8, 7, 6, 5, 4]
+        assert stats.repeated_shapes(7) == [("SELECT ?", 8)]
+        assert stats.repeated_shapes(8) == []
+
+
+class TestRequestReporting:
+    def test_server_timing_header(self, mock_client):
+        response = mock_client.get("/api/langs")
+        assert response.status_code == 200
+        assert response.headers["Server-Timing"].startswith("db;dur=")
+        assert recent_request_stats()[0]["path"] == "/api/langs"
+
+    def test_n_plus_one_warning(self, mock_app, caplog):
+        with mock_app.test_request_context("/example"):
+            g._sql_stats = stats = RequestQueryStats()
+            for title in ("A", "B", "C"):
+                stats.record(f"SELECT * FROM words WHERE w_title = '{title}'", 1.0)
+            limit = dataclasses.replace(instrumentation.settings.performance, sql_n_plus_one_threshold=2)
+            patched = dataclasses.replace(instrumentation.settings, performance=limit)
+            with caplog.at_level(logging.WARNING), pytest.MonkeyPatch.context() as mp:
+                mp.setattr(instrumentation, "settings", patched)
+                instrumentation._finish_request(Response())
+
+        assert "Possible N+1 on GET /example: 3 x SELECT * FROM words WHERE w_title = ?" in caplog.text
+
+
+class TestDebugEndpoint:
+    @pytest.fixture
+    def debug_app(self, monkeypatch):
+        settings = instrumentation.settings
+        enabled = dataclasses.replace(settings.performance, sql_debug_endpoint=True)
+        monkeypatch.setattr(instrumentation, "settings", dataclasses.replace(settings, performance=enabled))
+
+        app = Flask(__name__)
+        init_sql_instrumentation(app)
+        return app
+
+    def test_registered_only_when_enabled(self, debug_app, mock_admin_required):
+        response = debug_app.test_client().get("/debug/sql")
+
+        assert response.status_code == 200
+        assert set(response.get_json()) == {"requests", "pools", "metrics"}
+
+    def test_requires_an_admin(self, debug_app, mocker):
+        user = CurrentUser(user_id=1, username="U", access_token="", access_secret="", is_active_admin=False)
+        mocker.patch("src.main_app.admin.decorators.load_user", return_value=user)
+
+        assert debug_app.test_client().get("/debug/sql").status_code == 403
+
+    def test_absent_by_default(self):
+        app = Flask(__name__)
+        init_sql_instrumentation(app)
+        assert app.test_client().get("/debug/sql").status_code == 404
+
+
+class TestStatementHooks:
+    def test_slow_statements_logged_only_with_slow_log(self, mock_app, monkeypatch):
+        settings = instrumentation.settings
+        slow = dataclasses.replace(settings.performance, slow_query_ms=0, slow_query_log=False)
+        monkeypatch.setattr(instrumentation, "settings", dataclasses.replace(settings, performance=slow))
+        logged = []
+        monkeypatch.setattr(instrumentation.slow_query_logger, "info", lambda *args: logged.append(args))
+
+        with mock_app.app_context():
+            db.session.execute(text("SELECT 1"))
+            assert logged == []
+
+            slow = dataclasses.replace(slow, slow_query_log=True)
+            monkeypatch.setattr(instrumentation, "settings", dataclasses.replace(settings, performance=slow))
+            db.session.execute(text("SELECT 2"))
+
+        assert [args[2] for args in logged] == ["SELECT ?"]
+
+    def test_failed_statement_pops_start_time(self, mock_app):
+        with mock_app.app_context():
+            connection = db.session.connection()
+            with pytest.raises(OperationalError):
+                connection.execute(text("SELECT * FROM no_such_table"))
+
+            assert connection.info.get("_query_start", []) == []
+            db.session.rollback()
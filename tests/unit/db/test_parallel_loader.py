@@ -0,0 +1,150 @@
+import threading
+import time
+from contextlib import contextmanager
+
+import pytest
+from flask import g
+
+from src.main_app.db import parallel_loader
+from src.main_app.db.exceptions import QueryBudgetExceededError
+from src.main_app.db.instrumentation import RequestQueryStats
+from src.main_app.db.parallel_loader import ParallelLoader, parallel_workers
+
+pytestmark = pytest.mark.unit
+
+
+def _sleep(seconds, value):
+    time.sleep(seconds)
+    return value
+
+
+@pytest.fixture
+def budgets(monkeypatch):
+    """Record the statement budgets the worker tasks run under."""
+    recorded = []
+
+    @contextmanager
+    def recording(name, session, budget_ms):
+        recorded.append((name, budget_ms))
+        yield
+
+    monkeypatch.setattr(parallel_loader, "_uses_sqlite", lambda: False)
+    monkeypatch.setattr(parallel_loader, "statement_budget", recording)
+    return recorded
+
+
+class TestParallelLoader:
+    def test_runs_tasks_concurrently(self, mock_app):
+        with mock_app.test_request_context("/"):
+            loader = ParallelLoader(max_workers=4, timeout_ms=0)
+            for name in ("a", "b", "c"):
+                loader.add(name, _sleep, 0.2, name.upper())
+
+            started = time.monotonic()
+            result = loader.run()
+            elapsed = time.monotonic() - started
+
+        assert result.values == {"a": "A", "b": "B", "c": "C"}
+        assert result.timed_out == []
+        assert elapsed < 0.5
+
+    def test_deadline_uses_defaults(self, mock_app):
+        with mock_app.test_request_context("/"):
+            loader = ParallelLoader(max_workers=2, timeout_ms=50)
+            loader.add("fast", _sleep, 0, "done")
+            loader.add("slow", _sleep, 0.5, "late", default="fallback")
+            result = loader.run()
+
+        assert result["fast"] == "done"
+        assert result["slow"] == "fallback"
+        assert result.timed_out == ["slow"]
+
+    def test_tasks_run_under_the_deadline_budget(self, mock_app, budgets):
+        with mock_app.test_request_context("/"):
+            loader = ParallelLoader(max_workers=2, timeout_ms=2000)
+            loader.add("one", _sleep, 0, 1)
+            loader.add("two", _sleep, 0, 2)
+            loader.run()
+
+        assert sorted(name for name, _ in budgets) == ["parallel_loader.one", "parallel_loader.two"]
+        assert all(0 < budget_ms <= 2000 for _, budget_ms in budgets)
+
+    def test_no_budget_without_deadline(self, mock_app, budgets):
+        with mock_app.test_request_context("/"):
+            loader = ParallelLoader(max_workers=2, timeout_ms=0)
+            loader.add("one", _sleep, 0, 1)
+            loader.add("two", _sleep, 0, 2)
+            loader.run()
+
+        assert budgets == []
+
+    def test_cancelled_statement_counts_as_timed_out(self, mock_app):
+        def cancelled():
+            raise QueryBudgetExceededError("parallel_loader.cancelled", 50)
+
+        with mock_app.test_request_context("/"):
+            loader = ParallelLoader(max_workers=2, timeout_ms=1000)
+            loader.add("ok", _sleep, 0, 1)
+            loader.add("cancelled", cancelled, default=[])
+            result = loader.run()
+
+        assert result["ok"] == 1
+        assert result["cancelled"] == []
+        assert result.timed_out == ["cancelled"]
+
+    def test_tasks_see_the_request(self, mock_app):
+        def read_arg():
+            from flask import request
+
+            return request.args["lang"], threading.current_thread().name
+
+        with mock_app.test_request_context("/?lang=ar"):
+            loader = ParallelLoader(max_workers=2, timeout_ms=0)
+            loader.add("one", read_arg)
+            loader.add("two", read_arg)
+            result = loader.run()
+
+        assert result["one"][0] == result["two"][0] == "ar"
+        assert result["one"][1].startswith("parallel-loader")
+
+    def test_merges_sql_stats(self, mock_app):
+        def record(ms):
+            g._sql_stats = RequestQueryStats()
+            g._sql_stats.record("SELECT 1", ms)
+
+        with mock_app.test_request_context("/"):
+            loader = ParallelLoader(max_workers=2, timeout_ms=0)
+            loader.add("one", record, 2.0)
+            loader.add("two", record, 3.0)
+            loader.run()
+
+            assert g._sql_stats.count == 2
+            assert g._sql_stats.total_ms == 5.0
+
+    def test_exceptions_propagate(self, mock_app):
+        def fail():
+            raise RuntimeError("boom")
+
+        with mock_app.test_request_context("/"):
+            loader = ParallelLoader(max_workers=2, timeout_ms=0)
+            loader.add("ok", _sleep, 0, 1)
+            loader.add("fail", fail)
+            with pytest.raises(RuntimeError, match="boom"):
+                loader.run()
+
+    def test_duplicate_names(self):
+        loader = ParallelLoader(max_workers=1, timeout_ms=0)
+        loader.add("a", _sleep, 0, 1)
+        with pytest.raises(ValueError):
+            loader.add("a", _sleep, 0, 2)
+
+    def test_inline_on_sqlite(self, mock_app):
+        with mock_app.test_request_context("/"):
+            assert parallel_workers() == 1
+            loader = ParallelLoader(timeout_ms=0)
+            loader.add("thread", lambda: threading.current_thread())
+            loader.add("value", _sleep, 0, 5)
+            result = loader.run()
+
+        assert result["thread"] is threading.current_thread()
+        assert result["value"] == 5
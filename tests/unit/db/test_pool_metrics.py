@@ -0,0 +1,110 @@
+import dataclasses
+
+import pytest
+from sqlalchemy import create_engine, text
+
+from src.main_app.config import flask_config
+from src.main_app.config.flask_config import pool_sizing
+from src.main_app.db.pool_metrics import InstrumentedQueuePool, pool_status
+from src.main_app.shared.core.metrics import metrics
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        poolclass=InstrumentedQueuePool,
+        pool_size=1,
+        max_overflow=1,
+    )
+    engine.pool.telemetry.bind = "test"
+    metrics.reset()
+    yield engine
+    engine.dispose()
+    metrics.reset()
+
+
+def _mysql_config(monkeypatch, **performance):
+    settings = flask_config.settings
+    patched = dataclasses.replace(
+        settings,
+        database_data=dataclasses.replace(settings.database_data, db_host="db.example", db_replica_host=""),
+        performance=dataclasses.replace(settings.performance, **performance),
+    )
+    monkeypatch.setattr(flask_config, "settings", patched)
+    return flask_config.Config()
+
+
+class TestPoolSizing:
+    def test_threads_bound_pool_size(self):
+        assert pool_sizing(workers=4, threads=1, connection_budget=20) == (1, 4)
+
+    def test_budget_shared_between_workers(self):
+        assert pool_sizing(workers=4, threads=8, connection_budget=20) == (5, 0)
+
+    def test_at_least_one_connection(self):
+        assert pool_sizing(workers=40, threads=4, connection_budget=20) == (1, 0)
+
+
+class TestConfigPoolOptions:
+    def test_fixed_size_by_default(self, monkeypatch):
+        config = _mysql_config(monkeypatch, pool_auto_size=False, pool_size=5, pool_max_overflow=10)
+        assert config.SQLALCHEMY_ENGINE_OPTIONS["pool_size"] == 5
+        assert config.SQLALCHEMY_ENGINE_OPTIONS["max_overflow"] == 10
+
+    def test_auto_size(self, monkeypatch):
+        config = _mysql_config(
+            monkeypatch, pool_auto_size=True, web_workers=4, web_threads=2, db_connection_budget=20
+        )
+        assert config.SQLALCHEMY_ENGINE_OPTIONS["pool_size"] == 2
+        assert config.SQLALCHEMY_ENGINE_OPTIONS["max_overflow"] == 3
+
+    def test_telemetry_selects_pool_class(self, monkeypatch):
+        config = _mysql_config(monkeypatch, pool_telemetry=True)
+        assert config.SQLALCHEMY_ENGINE_OPTIONS["poolclass"] is InstrumentedQueuePool
+
+        config = _mysql_config(monkeypatch, pool_telemetry=False)
+        assert "poolclass" not in config.SQLALCHEMY_ENGINE_OPTIONS
+
+
+class TestInstrumentedQueuePool:
+    def test_records_checkouts_and_connects(self, engine):
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+
+        stats = engine.pool.telemetry.to_dict()
+        assert stats["checkouts"] == 2
+        assert stats["connects"] == 1
+        assert stats["overflow_checkouts"] == 0
+        assert metrics.get("db.pool.checkouts", bind="test") == 2
+
+    def test_records_overflow(self, engine):
+        with engine.connect(), engine.connect():
+            pass
+        assert engine.pool.telemetry.overflow_checkouts == 1
+        assert metrics.get("db.pool.overflow_checkouts", bind="test") == 1
+
+    def test_records_invalidation(self, engine):
+        with engine.connect() as conn:
+            conn.invalidate()
+        assert engine.pool.telemetry.invalidations == 1
+        assert metrics.get("db.pool.invalidations", bind="test") == 1
+
+    def test_counters_survive_dispose(self, engine):
+        with engine.connect():
+            pass
+        engine.dispose()
+        with engine.connect():
+            pass
+        assert engine.pool.telemetry.checkouts == 2
+        assert engine.pool.telemetry.connects == 2
+
+
+def test_pool_status_lists_default_bind(mock_app):
+    status = pool_status()
+    assert "default" in status
+    assert status["default"]["pool"]
@@ -0,0 +1,96 @@
+import dataclasses
+import time
+
+import pytest
+from flask import session as flask_session
+
+from src.main_app.config import flask_config
+from src.main_app.db import read_replica
+from src.main_app.db.read_replica import LAST_WRITE_SESSION_KEY, mark_recent_write, primary_reads, read_session
+from src.main_app.db.services.content.lang_service import LangService
+from src.main_app.db.services.pages.leaderboard_service import LeaderboardService
+from src.main_app.db.services.utils import cached_query
+from src.main_app.extensions import db
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def replica(monkeypatch):
+    """Pretend the primary engine is also a replica (the in-memory SQLite DB is shared)."""
+    monkeypatch.setattr(read_replica, "replica_engine", lambda: db.engine)
+
+
+class TestReadSession:
+    def test_primary_without_replica(self, mock_app):
+        with mock_app.test_request_context():
+            assert read_session() is db.session
+
+    def test_replica_session_is_reused_within_context(self, mock_app, replica):
+        with mock_app.test_request_context():
+            session = read_session()
+            assert session is not db.session
+            assert read_session() is session
+
+    def test_services_read_through_replica(self, mock_app, replica):
+        LangService().add_lang("ar", "العربية", "Arabic")
+        with mock_app.test_request_context():
+            service = LeaderboardService()
+            assert service.session is not db.session
+            assert service.get_distinct_langs() == []
+
+    def test_primary_reads_block(self, mock_app, replica):
+        with mock_app.test_request_context():
+            with primary_reads():
+                assert read_session() is db.session
+            assert read_session() is not db.session
+
+    def test_cached_queries_read_from_primary(self, mock_app, replica):
+        sessions = []
+
+        @cached_query("example_table")
+        def load(self):
+            sessions.append(read_session())
+            return 1
+
+        with mock_app.test_request_context():
+            load(None)
+
+        assert sessions == [db.session]
+
+
+class TestReadYourWrites:
+    def test_write_pins_request_to_primary(self, mock_app, replica):
+        with mock_app.test_request_context():
+            LangService().add_lang("ar", "العربية", "Arabic")
+            assert LAST_WRITE_SESSION_KEY in flask_session
+            assert read_session() is db.session
+
+    def test_recent_write_in_browser_session(self, mock_app, replica):
+        with mock_app.test_request_context():
+            flask_session[LAST_WRITE_SESSION_KEY] = time.time()
+            assert read_session() is db.session
+
+    def test_old_write_uses_replica_again(self, mock_app, replica):
+        with mock_app.test_request_context():
+            flask_session[LAST_WRITE_SESSION_KEY] = time.time() - 3600
+            assert read_session() is not db.session
+
+    def test_mark_is_noop_without_replica(self, mock_app):
+        with mock_app.test_request_context():
+            mark_recent_write()
+            assert LAST_WRITE_SESSION_KEY not in flask_session
+
+
+class TestReplicaBindConfig:
+    def test_replica_host_adds_bind(self, monkeypatch):
+        settings = flask_config.settings
+        database_data = dataclasses.replace(
+            settings.database_data, db_host="primary.example", db_replica_host="replica.example"
+        )
+        monkeypatch.setattr(flask_config, "settings", dataclasses.replace(settings, database_data=database_data))
+
+        config = flask_config.Config()
+
+        assert "primary.example" in config.SQLALCHEMY_DATABASE_URI
+        assert "replica.example" in config.SQLALCHEMY_BINDS["replica"]
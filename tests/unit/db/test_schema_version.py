@@ -0,0 +1,63 @@
+import pytest
+
+from src.main_app import db as db_module
+from src.main_app.db import init_db
+from src.main_app.db.schema_version import metadata_fingerprint, record_fingerprint, stored_fingerprint
+from src.main_app.extensions import db
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def ddl_calls(monkeypatch):
+    calls = []
+    original = db_module.create_tables
+
+    def counting_create_tables(_db):
+        calls.append(_db)
+        original(_db)
+
+    monkeypatch.setattr(db_module, "create_tables", counting_create_tables)
+    monkeypatch.setattr(db_module, "create_views", lambda _db: None)
+    return calls
+
+
+class TestMetadataFingerprint:
+    def test_is_stable(self):
+        assert metadata_fingerprint(db) == metadata_fingerprint(db)
+        assert len(metadata_fingerprint(db)) == 64
+
+
+class TestStoredFingerprint:
+    def test_none_when_empty(self):
+        assert stored_fingerprint(db) is None
+
+    def test_returns_latest(self):
+        record_fingerprint(db, "a" * 64)
+        record_fingerprint(db, "b" * 64)
+        assert stored_fingerprint(db) == "b" * 64
+
+
+class TestInitDb:
+    def test_second_boot_skips_ddl(self, ddl_calls):
+        init_db(db)
+        init_db(db)
+        assert len(ddl_calls) == 1
+        assert stored_fingerprint(db) == metadata_fingerprint(db)
+
+    def test_changed_fingerprint_runs_ddl(self, ddl_calls):
+        record_fingerprint(db, "0" * 64)
+        init_db(db)
+        assert len(ddl_calls) == 1
+
+    def test_force_runs_ddl(self, ddl_calls):
+        init_db(db)
+        init_db(db, force=True)
+        assert len(ddl_calls) == 2
+
+
+def test_sync_schema_command(runner, ddl_calls):
+    result = runner.invoke(args=["sync-schema"])
+    assert result.exit_code == 0
+    assert "Schema synchronised." in result.output
+    assert len(ddl_calls) == 1
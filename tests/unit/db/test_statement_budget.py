@@ -0,0 +1,84 @@
+import dataclasses
+import json
+from contextlib import contextmanager
+
+import pytest
+from sqlalchemy import text
+
+from src.main_app.db import statement_budget as budget_module
+from src.main_app.db.exceptions import QueryBudgetExceededError
+from src.main_app.db.statement_budget import statement_budget
+from src.main_app.extensions import db
+from src.main_app.public.routes.api import routes as api_routes
+from src.main_app.shared.core.metrics import metrics
+
+pytestmark = pytest.mark.unit
+
+SLOW_SQL = text(
+    "WITH RECURSIVE c(x) AS (SELECT 1 UNION ALL SELECT x + 1 FROM c WHERE x < 100000000) SELECT count(*) FROM c"
+)
+
+
+@pytest.fixture(autouse=True)
+def _reset_metrics():
+    metrics.reset()
+    yield
+    metrics.reset()
+
+
+def _set_default_budget(monkeypatch, budget_ms):
+    settings = budget_module.settings
+    patched = dataclasses.replace(
+        settings, performance=dataclasses.replace(settings.performance, statement_budget_ms=budget_ms)
+    )
+    monkeypatch.setattr(budget_module, "settings", patched)
+
+
+class TestStatementBudget:
+    def test_fast_statement_runs(self):
+        with statement_budget("test.fast", db.session, budget_ms=1000):
+            assert db.session.execute(text("SELECT 1")).scalar() == 1
+        assert metrics.get("sql.budget_exceeded", budget="test.fast") == 0
+
+    def test_slow_statement_is_cancelled(self):
+        with pytest.raises(QueryBudgetExceededError) as excinfo:
+            with statement_budget("test.slow", db.session, budget_ms=20):
+                db.session.execute(SLOW_SQL).scalar()
+
+        assert excinfo.value.name == "test.slow"
+        assert excinfo.value.budget_ms == 20
+        assert metrics.get("sql.budget_exceeded", budget="test.slow") == 1
+
+    def test_swallowed_error_is_reraised(self):
+        with pytest.raises(QueryBudgetExceededError):
+            with statement_budget("test.swallowed", db.session, budget_ms=20):
+                try:
+                    db.session.execute(SLOW_SQL).scalar()
+                except Exception:
+                    pass
+        assert metrics.get("sql.budget_exceeded", budget="test.swallowed") == 1
+
+    def test_handler_removed_after_block(self):
+        with statement_budget("test.fast", db.session, budget_ms=1000):
+            db.session.execute(text("SELECT 1"))
+        db.session.rollback()
+        assert db.session.execute(text("SELECT 1")).scalar() == 1
+
+    def test_zero_budget_disables(self, monkeypatch):
+        _set_default_budget(monkeypatch, 0)
+        with statement_budget("test.disabled", db.session):
+            assert db.session.execute(text("SELECT 1")).scalar() == 1
+
+
+class TestDegradedResponse:
+    def test_publish_reports_stats_degraded(self, mock_client, monkeypatch):
+        @contextmanager
+        def exceeded(name, session, budget_ms=None):
+            raise QueryBudgetExceededError(name, 1)
+            yield
+
+        monkeypatch.setattr(api_routes, "statement_budget", exceeded)
+        response = mock_client.get("/api/publish_reports/stats")
+
+        assert response.status_code == 503
+        assert json.loads(response.data) == {"results": [], "count": 0, "degraded": True}
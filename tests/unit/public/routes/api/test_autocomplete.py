@@ -0,0 +1,82 @@
+"""
+Tests for src/main_app/public/routes/api/autocomplete.py and the /api/autocomplete endpoint.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from src.main_app.db.services import LangService, QidService, UsersService
+from src.main_app.public.routes.api.autocomplete import PrefixIndex, autocomplete_indexes
+
+
+@pytest.fixture(autouse=True)
+def _clear_indexes():
+    autocomplete_indexes.clear()
+    yield
+    autocomplete_indexes.clear()
+
+
+@pytest.fixture
+def seeded():
+    for username in ("Mr. Ibrahem", "Mr. X", "mrbot", "Doc James"):
+        UsersService().create_user(username)
+    langs = LangService()
+    langs.add_lang(code="ar", autonym="العربية", name="Arabic")
+    langs.add_lang(code="arz", autonym="مصرى", name="Egyptian Arabic")
+    langs.add_lang(code="fr", autonym="français", name="French")
+    QidService().add_or_update("Malaria", "Q12156")
+    QidService().add_or_update("Male infertility", "Q1")
+
+
+class TestPrefixIndex:
+    def test_search_is_case_insensitive_and_ordered(self):
+        index = PrefixIndex((name, {"value": name}) for name in ["beta", "Alpha", "alphabet", "ALP"])
+        assert [item["value"] for item in index.search("alp")] == ["ALP", "Alpha", "alphabet"]
+        assert index.search("x") == []
+
+    def test_item_with_several_keys_is_returned_once(self):
+        item = {"value": "ar"}
+        index = PrefixIndex([("ar", item), ("Arabic", item), ("", item)])
+        assert len(index) == 1
+        assert index.search("ar") == [item]
+
+    def test_limit(self):
+        index = PrefixIndex((f"t{i}", {"value": i}) for i in range(10))
+        assert len(index.search("t", limit=3)) == 3
+
+
+class TestAutocompleteEndpoint:
+    def test_users(self, mock_client, seeded):
+        response = mock_client.get("/api/autocomplete?kind=users&q=mr")
+
+        assert response.status_code == 200
+        assert [r["value"] for r in response.get_json()["results"]] == ["Mr. Ibrahem", "Mr. X", "mrbot"]
+        assert response.headers["Cache-Control"].startswith("public, max-age=")
+
+    def test_langs_match_code_name_and_autonym(self, mock_client, seeded):
+        by_code = mock_client.get("/api/autocomplete?kind=langs&q=ar").get_json()["results"]
+        assert [r["code"] for r in by_code] == ["ar", "arz"]
+        assert by_code[0]["label"] == "ar - Arabic (العربية)"
+
+        assert [r["code"] for r in mock_client.get("/api/autocomplete?kind=langs&q=egy").get_json()["results"]] == [
+            "arz"
+        ]
+        assert [r["code"] for r in mock_client.get("/api/autocomplete?kind=langs&q=FRAN").get_json()["results"]] == [
+            "fr"
+        ]
+
+    def test_titles_and_limit(self, mock_client, seeded):
+        data = mock_client.get("/api/autocomplete?kind=titles&q=mal&limit=1").get_json()
+        assert data == {"results": [{"value": "Malaria", "label": "Malaria"}], "count": 1}
+
+    def test_index_refreshes_after_write(self, mock_client, seeded):
+        assert mock_client.get("/api/autocomplete?kind=users&q=zz").get_json()["count"] == 0
+
+        UsersService().create_user("ZZ top")
+
+        assert mock_client.get("/api/autocomplete?kind=users&q=zz").get_json()["count"] == 1
+
+    @pytest.mark.parametrize("query", ["kind=pages&q=a", "q=a", "kind=users&limit=0"])
+    def test_bad_parameters(self, mock_client, query):
+        assert mock_client.get(f"/api/autocomplete?{query}").status_code == 400
@@ -0,0 +1,105 @@
+import dataclasses
+
+import pytest
+
+from src.main_app.db.services import ReportService
+from src.main_app.db.services.utils import bump_table_version
+from src.main_app.public.routes.api import conditional
+
+pytestmark = pytest.mark.unit
+
+URL = "/api/publish_reports"
+
+
+@pytest.fixture
+def performance(monkeypatch):
+    def patch(**fields):
+        settings = conditional.settings
+        patched = dataclasses.replace(settings, performance=dataclasses.replace(settings.performance, **fields))
+        monkeypatch.setattr(conditional, "settings", patched)
+
+    patch(api_conditional_get=True, api_etag_ttl=0)
+    return patch
+
+
+@pytest.fixture
+def count_views(monkeypatch):
+    calls = []
+    original = ReportService.query_reports_with_filters
+
+    def counting(self, *args, **kwargs):
+        calls.append(args)
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(ReportService, "query_reports_with_filters", counting)
+    return calls
+
+
+class TestConditionalGet:
+    def test_etag_match_skips_the_view(self, mock_client, performance, count_views):
+        first = mock_client.get(URL)
+        assert first.status_code == 200
+        assert first.headers["ETag"].startswith('W/"')
+        assert first.headers["Cache-Control"] == "no-cache"
+        assert "Last-Modified" in first.headers
+
+        second = mock_client.get(URL, headers={"If-None-Match": first.headers["ETag"]})
+
+        assert second.status_code == 304
+        assert second.data == b""
+        assert second.headers["ETag"] == first.headers["ETag"]
+        assert len(count_views) == 1
+
+    def test_write_changes_etag(self, mock_client, performance):
+        etag = mock_client.get(URL).headers["ETag"]
+        ReportService().add_report(title="T", user="U", lang="ar", sourcetitle="S", result="success", data="{}")
+
+        response = mock_client.get(URL, headers={"If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+        assert response.get_json()["count"] == 1
+
+    def test_query_arguments_change_etag(self, mock_client, performance):
+        etag = mock_client.get(URL).headers["ETag"]
+        assert mock_client.get(URL, query_string={"lang": "ar"}, headers={"If-None-Match": etag}).status_code == 200
+
+    def test_unrelated_table_keeps_etag(self, mock_client, performance):
+        etag = mock_client.get(URL).headers["ETag"]
+        bump_table_version("pages")
+        assert mock_client.get(URL, headers={"If-None-Match": etag}).status_code == 304
+
+    def test_if_modified_since(self, mock_client, performance):
+        last_modified = mock_client.get(URL).headers["Last-Modified"]
+        assert mock_client.get(URL, headers={"If-Modified-Since": last_modified}).status_code == 304
+
+        bump_table_version("publish_reports")
+        assert mock_client.get(URL, headers={"If-Modified-Since": "Mon, 01 Jan 2001 00:00:00 GMT"}).status_code == 200
+
+    def test_ttl_window_expires_etag(self, mock_client, performance, monkeypatch):
+        performance(api_conditional_get=True, api_etag_ttl=60)
+        monkeypatch.setattr(conditional.time, "time", lambda: 6000.0)
+        etag = mock_client.get(URL).headers["ETag"]
+        assert mock_client.get(URL, headers={"If-None-Match": etag}).status_code == 304
+
+        monkeypatch.setattr(conditional.time, "time", lambda: 6060.0)
+        assert mock_client.get(URL, headers={"If-None-Match": etag}).status_code == 200
+
+    def test_errors_are_not_tagged(self, mock_client, performance):
+        response = mock_client.get(URL, query_string={"limit": "x"})
+        assert response.status_code == 400
+        assert "ETag" not in response.headers
+
+    def test_per_endpoint_cache_control(self, mock_client, performance):
+        assert mock_client.get("/api/top_langs").headers["Cache-Control"] == "public, max-age=60"
+
+    def test_disabled(self, mock_client, performance):
+        performance(api_conditional_get=False)
+        etag = mock_client.get(URL).headers.get("ETag")
+        assert etag is None
+        assert mock_client.get(URL, headers={"If-None-Match": "*"}).status_code == 200
+
+
+def test_conditional_get_needs_tables():
+    with pytest.raises(ValueError):
+        conditional.conditional_get()
@@ -0,0 +1,103 @@
+import dataclasses
+
+import pytest
+
+from src.main_app.db.models import PageRecord
+from src.main_app.db.services.utils import bump_table_version
+from src.main_app.extensions import db
+from src.main_app.public.routes.td import leaderboard, leaderboard_fragments
+from src.main_app.public.routes.td.leaderboard_fragments import FragmentCache
+
+pytestmark = pytest.mark.unit
+
+URL = "/Translation_Dashboard/leaderboard/"
+
+
+@pytest.fixture
+def fragment_ttl(monkeypatch):
+    def patch(ttl):
+        settings = leaderboard_fragments.settings
+        performance = dataclasses.replace(settings.performance, leaderboard_fragment_ttl=ttl)
+        monkeypatch.setattr(leaderboard_fragments, "settings", dataclasses.replace(settings, performance=performance))
+
+    patch(300)
+    return patch
+
+
+@pytest.fixture
+def top_users_calls(monkeypatch):
+    calls = []
+    original = leaderboard.get_top_users
+
+    def counting(args):
+        calls.append(dict(args))
+        return original(args)
+
+    monkeypatch.setattr(leaderboard, "get_top_users", counting)
+    return calls
+
+
+@pytest.fixture
+def seeded():
+    db.session.add_all(
+        [
+            PageRecord(title="Malaria", user="Alice", lang="ar", target="ملاريا", pupdate="2024-03-02", word=10),
+            PageRecord(title="Fever", user="Bob", lang="fr", target="Fièvre", pupdate="2025-01-05", word=20),
+        ]
+    )
+    db.session.commit()
+
+
+class TestIndexFragments:
+    def test_second_view_is_served_from_cache(self, mock_client, fragment_ttl, top_users_calls, seeded):
+        first = mock_client.get(URL)
+        second = mock_client.get(URL)
+
+        assert first.status_code == second.status_code == 200
+        assert "Alice" in first.get_data(as_text=True)
+        assert first.data == second.data
+        assert len(top_users_calls) == 1
+
+    def test_filters_are_cached_separately(self, mock_client, fragment_ttl, top_users_calls, seeded):
+        mock_client.get(URL)
+        response = mock_client.get(URL, query_string={"user_group": "Nobody"})
+
+        assert len(top_users_calls) == 2
+        assert "Alice" not in response.get_data(as_text=True)
+
+    def test_write_invalidates(self, mock_client, fragment_ttl, top_users_calls, seeded):
+        mock_client.get(URL)
+        bump_table_version("pages")
+        mock_client.get(URL)
+
+        assert len(top_users_calls) == 2
+
+    def test_zero_ttl_disables(self, mock_client, fragment_ttl, top_users_calls, seeded):
+        fragment_ttl(0)
+        mock_client.get(URL)
+        mock_client.get(URL)
+
+        assert len(top_users_calls) == 2
+
+    def test_chart_data_is_valid_json_string(self, mock_client, fragment_ttl, seeded):
+        body = mock_client.get(URL).get_data(as_text=True)
+        assert "JSON.parse('{" in body
+
+
+class TestFragmentCache:
+    def test_put_uses_versions_read_before_loading(self, mock_app, fragment_ttl):
+        cache = FragmentCache()
+        versions = leaderboard_fragments.table_versions(("pages",))
+        bump_table_version("pages")
+        cache.put("tables", (), ("pages",), {"numbers": "x"}, versions)
+
+        assert cache.get("tables", (), ("pages",)) is None
+
+    def test_lru_bound(self, mock_app, fragment_ttl):
+        cache = FragmentCache(maxsize=2)
+        for key in range(3):
+            cache.put("chart", key, ("pages",), {"chart_data": "[]"})
+
+        assert len(cache) == 2
+        assert cache.get("chart", 0, ("pages",)) is None
+        assert cache.get("chart", 2, ("pages",)) == {"chart_data": "[]"}
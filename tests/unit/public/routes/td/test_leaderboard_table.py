@@ -0,0 +1,73 @@
+import dataclasses
+
+import pytest
+
+from src.main_app.db.models import PageRecord
+from src.main_app.extensions import db
+from src.main_app.public.routes.td import leaderboard
+from src.main_app.public.routes.td.leaderboard_table import (
+    PagesQuery,
+    decode_cursor,
+    encode_cursor,
+    parse_pages_query,
+)
+
+pytestmark = pytest.mark.unit
+
+LANG_URL = "/Translation_Dashboard/leaderboard/langs/ar"
+
+
+class TestPagesQuery:
+    def test_cursor_round_trip(self):
+        query = PagesQuery(sort="views", order="desc", limit=2)
+        cursor = encode_cursor(query, (42, 7), 2)
+
+        assert decode_cursor(cursor, "views", "desc") == ((42, 7), 2)
+        with pytest.raises(ValueError):
+            decode_cursor(cursor, "title", "desc")
+        with pytest.raises(ValueError):
+            decode_cursor("not-a-cursor", "views", "desc")
+
+    def test_parse_defaults_and_limits(self):
+        assert parse_pages_query({}, 100) == PagesQuery(sort="date", order="desc", limit=100)
+        assert parse_pages_query({}, 0).limit is None
+        assert parse_pages_query({"sort": "title", "limit": "9999"}, 100) == PagesQuery(
+            sort="title", order="asc", limit=500
+        )
+        with pytest.raises(ValueError):
+            parse_pages_query({"sort": "user"}, 100)
+
+
+class TestLangsPage:
+    @pytest.fixture
+    def page_size(self, monkeypatch):
+        settings = leaderboard.settings
+        performance = dataclasses.replace(settings.performance, leaderboard_page_size=2)
+        monkeypatch.setattr(leaderboard, "settings", dataclasses.replace(settings, performance=performance))
+
+    @pytest.fixture
+    def seeded(self):
+        db.session.add_all(
+            [
+                PageRecord(title="Malaria", user="Alice", lang="ar", target="ملاريا", pupdate="2024-03-02", word=10),
+                PageRecord(title="Asthma", user="Alice", lang="ar", target="ربو", pupdate="2024-03-20", word=30),
+                PageRecord(title="Fever", user="Bob", lang="ar", target="حمى", pupdate="2025-01-05", word=20),
+                PageRecord(title="Cold", user="Bob", lang="ar", target=""),
+                PageRecord(title="Cough", user="Bob", lang="fr", target="Toux", pupdate="2024-05-01", word=5),
+            ]
+        )
+        db.session.commit()
+
+    def test_totals_cover_every_page(self, seeded, page_size, mock_client):
+        response = mock_client.get(LANG_URL, query_string={"sort": "title"})
+        html = response.get_data(as_text=True)
+
+        assert response.status_code == 200
+        assert "Articles: <strong>4</strong>" in html
+        assert "Words: <strong>60</strong>" in html
+        assert "Asthma" in html and "Cold" in html and "Malaria" not in html
+        assert "after=" in html
+
+    def test_invalid_sort_falls_back(self, seeded, page_size, mock_client):
+        response = mock_client.get(LANG_URL, query_string={"sort": "user"})
+        assert response.status_code == 200
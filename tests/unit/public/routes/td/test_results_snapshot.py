@@ -0,0 +1,112 @@
+import dataclasses
+
+import pytest
+
+from src.main_app.db.services.utils import bump_table_version
+from src.main_app.public.routes.td import results_snapshot
+from src.main_app.public.routes.td.results_snapshot import ResultsSnapshotCache
+
+pytestmark = pytest.mark.unit
+
+
+class Loader:
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return {"build": self.calls}
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    # Run background refreshes inline so the tests are deterministic
+    monkeypatch.setattr(results_snapshot, "_start_refresh", lambda target: target())
+    return ResultsSnapshotCache(maxsize=2)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(results_snapshot.time, "monotonic", lambda: now[0])
+    return now
+
+
+def _set_ttl(monkeypatch, ttl, max_stale=3600):
+    settings = results_snapshot.settings
+    performance = dataclasses.replace(
+        settings.performance, results_snapshot_ttl=ttl, results_snapshot_max_stale=max_stale
+    )
+    monkeypatch.setattr(results_snapshot, "settings", dataclasses.replace(settings, performance=performance))
+
+
+class TestResultsSnapshotCache:
+    def test_fresh_snapshot_is_reused(self, cache):
+        loader = Loader()
+        assert cache.get("ar", "RTT", loader) == {"build": 1}
+        assert cache.get("ar", "RTT", loader) == {"build": 1}
+        assert loader.calls == 1
+
+    def test_keyed_by_lang_and_cat(self, cache):
+        loader = Loader()
+        cache.get("ar", "RTT", loader)
+        cache.get("fr", "RTT", loader)
+        assert loader.calls == 2
+
+    def test_write_serves_stale_then_refreshes(self, cache):
+        loader = Loader()
+        cache.get("ar", "RTT", loader)
+        bump_table_version("in_process")
+
+        # stale value is returned while the refresh rebuilds it
+        assert cache.get("ar", "RTT", loader) == {"build": 1}
+        assert loader.calls == 2
+        assert cache.get("ar", "RTT", loader) == {"build": 2}
+
+    def test_unrelated_write_keeps_snapshot(self, cache):
+        loader = Loader()
+        cache.get("ar", "RTT", loader)
+        bump_table_version("users")
+        cache.get("ar", "RTT", loader)
+        assert loader.calls == 1
+
+    def test_ttl_expiry_triggers_refresh(self, cache, clock, monkeypatch):
+        _set_ttl(monkeypatch, ttl=60)
+        loader = Loader()
+        cache.get("ar", "RTT", loader)
+        clock[0] += 61
+        assert cache.get("ar", "RTT", loader) == {"build": 1}
+        assert loader.calls == 2
+
+    def test_too_stale_rebuilds_synchronously(self, cache, clock, monkeypatch):
+        _set_ttl(monkeypatch, ttl=60, max_stale=120)
+        loader = Loader()
+        cache.get("ar", "RTT", loader)
+        clock[0] += 121
+        assert cache.get("ar", "RTT", loader) == {"build": 2}
+
+    def test_disabled_with_zero_ttl(self, cache, monkeypatch):
+        _set_ttl(monkeypatch, ttl=0)
+        loader = Loader()
+        cache.get("ar", "RTT", loader)
+        cache.get("ar", "RTT", loader)
+        assert loader.calls == 2
+        assert len(cache) == 0
+
+    def test_invalidate_by_lang(self, cache):
+        loader = Loader()
+        cache.get("ar", "RTT", loader)
+        cache.get("fr", "RTT", loader)
+        cache.invalidate(lang="ar")
+        assert len(cache) == 1
+        cache.get("ar", "RTT", loader)
+        assert loader.calls == 3
+
+    def test_evicts_least_recently_used(self, cache):
+        loader = Loader()
+        cache.get("ar", "RTT", loader)
+        cache.get("fr", "RTT", loader)
+        cache.get("ar", "RTT", loader)
+        cache.get("de", "RTT", loader)
+        cache.get("ar", "RTT", loader)
+        assert loader.calls == 3
@@ -0,0 +1,208 @@
+import dataclasses
+import json
+
+import pytest
+
+from src.main_app.db.models import (
+    AssessmentRecord,
+    CategoryMemberRecord,
+    CategoryRecord,
+    EnwikiPageviewRecord,
+    LangRecord,
+    QidRecord,
+)
+from src.main_app.extensions import db
+from src.main_app.public.routes.td import results_2026, td_route
+from src.main_app.public.routes.td.results_table import (
+    TableQuery,
+    decode_cursor,
+    default_table_query,
+    encode_cursor,
+    paginate_rows,
+    parse_table_query,
+)
+
+pytestmark = pytest.mark.unit
+
+ROWS_URL = "/Translation_Dashboard/table/rows"
+
+
+def _row(title, en_views=0, importance="Unknown", words=0, refs=0, is_full_row=False):
+    return {
+        "title": title,
+        "en_views": en_views,
+        "importance": importance,
+        "words": words,
+        "refs": refs,
+        "is_full_row": is_full_row,
+    }
+
+
+ROWS = [
+    _row("Asthma", en_views=500, importance="Top", words=900, refs=12),
+    _row("Asthma", en_views=500, importance="Top", words=3000, refs=40, is_full_row=True),
+    _row("Cancer", en_views=900, importance="High", words=400, refs=3),
+    _row("Fever", en_views="", importance="Low", words=100, refs=1),
+    _row("Malaria", en_views=500, importance="Mid", words=700, refs=9),
+]
+
+
+def _titles(page):
+    return [(row["title"], row["is_full_row"]) for row in page.rows]
+
+
+def _walk(query):
+    """Follow next cursors until the last page; return every row seen."""
+    seen = []
+    while True:
+        page = paginate_rows(ROWS, query)
+        seen.extend(_titles(page))
+        if page.next_cursor is None:
+            return seen
+        query = dataclasses.replace(query, after=decode_cursor(page.next_cursor, query.sort, query.order))
+
+
+class TestPaginateRows:
+    def test_default_sort_views_desc_ties_by_title(self):
+        page = paginate_rows(ROWS, default_table_query("missing", 10))
+        assert _titles(page) == [
+            ("Cancer", False),
+            ("Asthma", False),
+            ("Asthma", True),
+            ("Malaria", False),
+            ("Fever", False),
+        ]
+        assert page.next_cursor is None
+        assert page.total == 5
+
+    @pytest.mark.parametrize("sort", ["en_views", "importance", "words", "refs", "title"])
+    @pytest.mark.parametrize("order", ["asc", "desc"])
+    def test_cursor_walk_visits_every_row_once(self, sort, order):
+        full = _titles(paginate_rows(ROWS, TableQuery(table="missing", sort=sort, order=order, limit=10)))
+        walked = _walk(TableQuery(table="missing", sort=sort, order=order, limit=2))
+        assert walked == full
+
+    def test_importance_ranks(self):
+        page = paginate_rows(ROWS, TableQuery(table="missing", sort="importance", order="desc", limit=10))
+        assert [row["importance"] for row in page.rows] == ["Top", "Top", "High", "Mid", "Low"]
+
+    def test_filters(self):
+        query = TableQuery(table="missing", sort="title", order="asc", limit=10, q="a", importance="top")
+        page = paginate_rows(ROWS, query)
+        assert _titles(page) == [("Asthma", False), ("Asthma", True)]
+        assert page.total == 2
+
+    def test_exists_rows_use_display_title(self):
+        rows = [{"display_title": "Malaria"}, {"display_title": "Asthma"}]
+        page = paginate_rows(rows, default_table_query("exists", 1))
+        assert page.rows == [{"display_title": "Asthma"}]
+        assert page.next_cursor is not None
+
+
+class TestParseTableQuery:
+    def test_defaults(self):
+        query = parse_table_query({}, default_limit=100)
+        assert (query.table, query.sort, query.order, query.limit) == ("missing", "en_views", "desc", 100)
+
+    def test_limit_is_capped(self):
+        assert parse_table_query({"limit": "100000"}, default_limit=100).limit == 500
+
+    @pytest.mark.parametrize(
+        "args",
+        [
+            {"table": "users"},
+            {"sort": "qid"},
+            {"table": "exists", "sort": "en_views"},
+            {"order": "sideways"},
+            {"limit": "many"},
+            {"after": "not-a-cursor"},
+        ],
+    )
+    def test_rejects_invalid_arguments(self, args):
+        with pytest.raises(ValueError):
+            parse_table_query(args, default_limit=100)
+
+    def test_cursor_bound_to_sort(self):
+        cursor = encode_cursor(default_table_query("missing", 10), (-500, "asthma", False))
+        assert parse_table_query({"after": cursor}, default_limit=100).after == (-500, "asthma", False)
+        with pytest.raises(ValueError):
+            parse_table_query({"after": cursor, "sort": "words"}, default_limit=100)
+
+
+@pytest.fixture
+def seeded():
+    titles = ["Asthma", "Cancer", "Fever", "Malaria", "Measles"]
+    db.session.add_all(
+        [
+            LangRecord(code="ar", autonym="العربية", name="Arabic"),
+            CategoryRecord(category="RTT", campaign="Main"),
+            AssessmentRecord(title="Cancer", importance="Top"),
+        ]
+    )
+    for views, title in enumerate(titles):
+        db.session.add_all(
+            [
+                CategoryMemberRecord(category="RTT", article_id=title),
+                QidRecord(title=title, qid=f"Q{views + 1}"),
+                EnwikiPageviewRecord(title=title, en_views=views * 100),
+            ]
+        )
+    db.session.commit()
+
+
+def _set_page_size(monkeypatch, page_size):
+    settings = td_route.settings
+    performance = dataclasses.replace(settings.performance, results_page_size=page_size)
+    monkeypatch.setattr(td_route, "settings", dataclasses.replace(settings, performance=performance))
+
+
+class TestTableRowsEndpoint:
+    def test_pages_through_missing_rows(self, mock_client, seeded):
+        args = {"code": "ar", "camp": "Main", "limit": "2"}
+        first = json.loads(mock_client.get(ROWS_URL, query_string=args).data)
+        assert [row["title"] for row in first["rows"]] == ["Measles", "Malaria"]
+        assert first["total"] == 5
+
+        second = json.loads(mock_client.get(ROWS_URL, query_string={**args, "after": first["next_cursor"]}).data)
+        assert [row["title"] for row in second["rows"]] == ["Fever", "Cancer"]
+
+    def test_only_page_rows_are_rendered(self, mock_client, seeded, monkeypatch):
+        rendered = []
+        original = results_2026.wikidata_link
+
+        def counting(qid):
+            rendered.append(qid)
+            return original(qid)
+
+        monkeypatch.setattr(results_2026, "wikidata_link", counting)
+        data = json.loads(mock_client.get(ROWS_URL, query_string={"code": "ar", "camp": "Main", "limit": "2"}).data)
+
+        assert data["total"] == 5
+        assert rendered == ["Q5", "Q4"]
+        assert all("_qid" not in row and row["qid_html"] for row in data["rows"])
+
+    def test_sort_and_filter(self, mock_client, seeded):
+        args = {"code": "ar", "camp": "Main", "sort": "importance", "order": "desc", "q": "e"}
+        data = json.loads(mock_client.get(ROWS_URL, query_string=args).data)
+        assert [row["title"] for row in data["rows"]] == ["Cancer", "Fever", "Measles"]
+        assert data["next_cursor"] is None
+
+    def test_invalid_camp(self, mock_client, seeded):
+        response = mock_client.get(ROWS_URL, query_string={"code": "ar", "camp": "Nope"})
+        assert response.status_code == 400
+
+    def test_invalid_sort(self, mock_client, seeded):
+        response = mock_client.get(ROWS_URL, query_string={"code": "ar", "camp": "Main", "sort": "qid"})
+        assert response.status_code == 400
+        assert "sort" in json.loads(response.data)["error"]
+
+    def test_table_page_renders_first_page(self, mock_client, seeded, monkeypatch):
+        _set_page_size(monkeypatch, 2)
+        response = mock_client.get("/Translation_Dashboard/table", query_string={"code": "ar", "camp": "Main"})
+        html = response.get_data(as_text=True)
+
+        assert response.status_code == 200
+        assert "Measles" in html and "Malaria" in html
+        assert "Asthma" not in html
+        assert 'data-rows-url="/Translation_Dashboard/table/rows"' in html
+        assert "js/results_table.js" in html
@@ -0,0 +1,60 @@
+"""
+Unit tests for src/main_app/shared/clients/category_cache.py module.
+"""
+
+import json
+import os
+import time
+
+import pytest
+
+from src.main_app.shared.clients.category_cache import CategoryMembershipCache
+
+
+@pytest.fixture
+def cache():
+    return CategoryMembershipCache(maxsize=2)
+
+
+class TestCategoryMembershipCache:
+    def test_put_writes_file(self, cache, tmp_path):
+        cache.put(str(tmp_path), "Category:Lungs", ["Asthma", "Pneumonia"])
+
+        data = json.loads((tmp_path / "cats_cash" / "Category:Lungs.json").read_text(encoding="utf-8"))
+        assert data["list"] == ["Asthma", "Pneumonia"]
+        assert data["fetched_at"] == pytest.approx(time.time(), abs=5)
+        assert [p.name for p in (tmp_path / "cats_cash").iterdir()] == ["Category:Lungs.json"]
+
+    def test_file_shared_between_caches(self, cache, tmp_path):
+        cache.put(str(tmp_path), "RTT", ["Asthma"])
+        entry = CategoryMembershipCache().get(str(tmp_path), "RTT")
+        assert entry is not None
+        assert entry.titles == ["Asthma"]
+
+    def test_legacy_file_uses_mtime(self, cache, tmp_path):
+        cache_dir = tmp_path / "cats_cash"
+        cache_dir.mkdir()
+        path = cache_dir / "RTT.json"
+        path.write_text(json.dumps({"list": ["Asthma"]}), encoding="utf-8")
+        os.utime(path, (1000, 1000))
+
+        entry = cache.get(str(tmp_path), "RTT")
+        assert entry.fetched_at == 1000
+        assert not entry.is_fresh(ttl=60)
+        assert entry.is_fresh(ttl=0)
+
+    def test_corrupt_file_is_a_miss(self, cache, tmp_path):
+        (tmp_path / "cats_cash").mkdir()
+        (tmp_path / "cats_cash" / "RTT.json").write_text("{not json", encoding="utf-8")
+        assert cache.get(str(tmp_path), "RTT") is None
+
+    def test_memory_layer_is_lru(self, cache):
+        for cat in ("A", "B", "C"):
+            cache.put("", cat, [cat])
+        assert cache.get("", "A") is None
+        assert cache.get("", "C").titles == ["C"]
+
+    def test_memory_serves_without_file(self, cache, tmp_path):
+        cache.put(str(tmp_path), "RTT", ["Asthma"])
+        (tmp_path / "cats_cash" / "RTT.json").unlink()
+        assert cache.get(str(tmp_path), "RTT").titles == ["Asthma"]
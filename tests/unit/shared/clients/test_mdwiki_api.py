@@ -1,4 +1,157 @@
 """
 Unit tests for src/main_app/shared/clients/mdwiki_api.py module.
-TODO: write tests
 """
+
+import threading
+import time
+
+import pytest
+
+from src.main_app.shared.clients.category_cache import category_cache
+from src.main_app.shared.clients.mdwiki_api import CategoryFetcher
+
+# Category tree served by FakeApi; "Category:Loop" lists its own parent
+TREE = {
+    "Category:Root": ["Asthma", "Category:Lungs", "Category:Heart", "File:X.png"],
+    "Category:Lungs": ["Pneumonia", "Category:Loop", "Asthma"],
+    "Category:Heart": ["Angina", "Category:Root"],
+    "Category:Loop": ["Lung cancer", "Category:Lungs"],
+}
+
+
+class FakeApi:
+    """Serves TREE two members per request so continuation is exercised."""
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def __call__(self, params, deadline=None):
+        with self._lock:
+            self.calls.append(params["cmtitle"])
+        time.sleep(self.delay)
+        members = TREE.get(params["cmtitle"], [])
+        start = int(params.get("cmcontinue") or 0)
+        chunk = members[start : start + 2]
+        data = {"query": {"categorymembers": [{"ns": 14 if t.startswith("Category:") else 0, "title": t} for t in chunk]}}
+        if start + 2 < len(members):
+            data["continue"] = {"cmcontinue": str(start + 2)}
+        return data
+
+
+@pytest.fixture(autouse=True)
+def _clear_category_cache():
+    category_cache.clear()
+    yield
+    category_cache.clear()
+
+
+@pytest.fixture
+def api():
+    return FakeApi()
+
+
+def _fetcher(api, **options):
+    fetcher = CategoryFetcher({"nocache": True, **options})
+    fetcher._post_urls_mdwiki = api
+    return fetcher
+
+
+class TestCategoryFetcherCrawl:
+    def test_depth_zero_fetches_root_only(self, api):
+        assert _fetcher(api).get_mdwiki_cat_members("Root") == ["Asthma"]
+        assert set(api.calls) == {"Category:Root"}
+
+    def test_breadth_first_order(self, api):
+        titles = _fetcher(api).get_mdwiki_cat_members("Root", depth=2)
+        assert titles == ["Asthma", "Pneumonia", "Angina", "Lung cancer"]
+
+    def test_each_category_fetched_once(self, api):
+        crawl = _fetcher(api).crawl("Root", depth=5)
+        assert crawl.complete
+        assert crawl.categories == 4
+        # Root and Lungs need two requests each (continuation), Heart and Loop one
+        assert sorted(api.calls) == sorted(
+            ["Category:Root"] * 2 + ["Category:Lungs"] * 2 + ["Category:Heart", "Category:Loop"]
+        )
+
+    def test_time_budget_returns_partial_result(self):
+        api = FakeApi(delay=0.2)
+        start = time.monotonic()
+        crawl = _fetcher(api, time_budget=0.3).crawl("Root", depth=2)
+
+        assert time.monotonic() - start < 1.0
+        assert not crawl.complete
+        assert "Asthma" in crawl.titles
+        assert "Lung cancer" not in crawl.titles
+
+    def test_failed_request_keeps_other_categories(self, api):
+        def flaky(params, deadline=None):
+            if params["cmtitle"] == "Category:Heart":
+                raise ConnectionError("boom")
+            return api(params, deadline)
+
+        titles = _fetcher(flaky).get_mdwiki_cat_members("Root", depth=1)
+        assert titles == ["Asthma", "Pneumonia"]
+
+    def test_failed_request_marks_crawl_incomplete(self, api):
+        def flaky(params, deadline=None):
+            if params["cmtitle"] == "Category:Heart":
+                raise ConnectionError("boom")
+            return api(params, deadline)
+
+        crawl = _fetcher(flaky).crawl("Root", depth=2)
+        assert not crawl.complete
+        # The failure does not stop the crawl below the categories that loaded
+        assert crawl.titles == ["Asthma", "Pneumonia", "Lung cancer"]
+
+
+class TestCategoryFetcherCache:
+    def _cached_fetcher(self, api, tmp_path, **options):
+        fetcher = CategoryFetcher({"tablesDir": str(tmp_path), **options})
+        fetcher._post_urls_mdwiki = api
+        return fetcher
+
+    def test_fetched_categories_are_written_through(self, api, tmp_path):
+        self._cached_fetcher(api, tmp_path).get_mdwiki_cat_members("Root", depth=1)
+        assert (tmp_path / "cats_cash" / "Root.json").is_file()
+        assert (tmp_path / "cats_cash" / "Category:Lungs.json").is_file()
+
+        api.calls.clear()
+        category_cache.clear()  # a new worker only has the files
+        titles = self._cached_fetcher(api, tmp_path).get_mdwiki_cat_members("Root", depth=1)
+        assert titles == ["Asthma", "Pneumonia", "Angina"]
+        assert api.calls == []
+
+    def test_expired_entry_is_refetched(self, api, tmp_path):
+        category_cache.put(str(tmp_path), "Root", ["Old title"])
+        titles = self._cached_fetcher(api, tmp_path, cache_ttl=-1).get_mdwiki_cat_members("Root")
+        assert titles == ["Old title"]
+
+        category_cache.clear()
+        (tmp_path / "cats_cash" / "Root.json").write_text('{"list": ["Old title"], "fetched_at": 0}')
+        titles = self._cached_fetcher(api, tmp_path, cache_ttl=60).get_mdwiki_cat_members("Root")
+        assert titles == ["Asthma"]
+
+    def test_expired_entry_used_when_api_fails(self, tmp_path):
+        def down(params, deadline=None):
+            raise ConnectionError("down")
+
+        (tmp_path / "cats_cash").mkdir()
+        (tmp_path / "cats_cash" / "Root.json").write_text('{"list": ["Old title"], "fetched_at": 0}')
+        titles = self._cached_fetcher(down, tmp_path, cache_ttl=60).get_mdwiki_cat_members("Root")
+        assert titles == ["Old title"]
+        assert category_cache.get(str(tmp_path), "Root").fetched_at == 0
+
+    def test_expired_entry_used_when_a_later_page_fails(self, api, tmp_path):
+        def fails_after_first_page(params, deadline=None):
+            if params.get("cmcontinue"):
+                raise ConnectionError("down")
+            return api(params, deadline)
+
+        (tmp_path / "cats_cash").mkdir()
+        (tmp_path / "cats_cash" / "Root.json").write_text('{"list": ["Old title"], "fetched_at": 0}')
+        crawl = self._cached_fetcher(fails_after_first_page, tmp_path, cache_ttl=60).crawl("Root")
+        assert crawl.titles == ["Old title"]
+        assert not crawl.complete
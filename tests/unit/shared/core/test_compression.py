@@ -0,0 +1,108 @@
+import dataclasses
+import gzip
+
+import pytest
+from flask import Flask, Response, jsonify
+
+from src.main_app.shared.core import compression
+from src.main_app.shared.core.compression import choose_encoding, init_compression, precompressed
+
+pytestmark = pytest.mark.unit
+
+BIG = {"rows": ["x" * 40] * 100}
+
+
+@pytest.fixture
+def app(monkeypatch):
+    settings = compression.settings
+    performance = dataclasses.replace(settings.performance, response_compression=True, compression_min_size=1024)
+    monkeypatch.setattr(compression, "settings", dataclasses.replace(settings, performance=performance))
+    monkeypatch.setattr(compression, "brotli", None)
+    precompressed.clear()
+
+    app = Flask(__name__)
+    init_compression(app)
+
+    @app.route("/big")
+    def big():
+        return jsonify(BIG)
+
+    @app.route("/small")
+    def small():
+        return jsonify({"a": 1})
+
+    @app.route("/cached")
+    def cached():
+        response = jsonify(BIG)
+        response.set_etag("v1", weak=True)
+        response.headers["Cache-Control"] = "public, max-age=60"
+        return response
+
+    @app.route("/html")
+    def html():
+        return Response("<p>" + "x" * 4000 + "</p>", mimetype="text/html")
+
+    @app.route("/error")
+    def error():
+        return jsonify(BIG), 500
+
+    return app
+
+
+def get(app, path, accept="gzip, deflate"):
+    return app.test_client().get(path, headers={"Accept-Encoding": accept})
+
+
+class TestCompressResponse:
+    def test_gzip_large_json(self, app):
+        response = get(app, "/big")
+
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert "Accept-Encoding" in response.headers["Vary"]
+        assert int(response.headers["Content-Length"]) == len(response.data)
+        assert gzip.decompress(response.data) == jsonify_bytes(app, BIG)
+
+    @pytest.mark.parametrize(
+        ("path", "accept"),
+        [("/small", "gzip"), ("/big", ""), ("/big", "gzip;q=0"), ("/html", "gzip"), ("/error", "gzip")],
+    )
+    def test_left_uncompressed(self, app, path, accept):
+        assert "Content-Encoding" not in get(app, path, accept).headers
+
+    def test_precompressed_cache(self, app):
+        first = get(app, "/cached")
+        assert len(precompressed) == 1
+
+        second = get(app, "/cached")
+        assert second.data == first.data
+        assert len(precompressed) == 1
+        assert get(app, "/big").headers["Content-Encoding"] == "gzip"
+        assert len(precompressed) == 1
+
+    def test_disabled(self, app, monkeypatch):
+        settings = compression.settings
+        performance = dataclasses.replace(settings.performance, response_compression=False)
+        monkeypatch.setattr(compression, "settings", dataclasses.replace(settings, performance=performance))
+        assert "Content-Encoding" not in get(app, "/big").headers
+
+
+def jsonify_bytes(app, data):
+    with app.app_context():
+        return jsonify(data).get_data()
+
+
+class TestChooseEncoding:
+    @pytest.mark.parametrize(
+        ("header", "with_brotli", "expected"),
+        [
+            ("gzip, deflate, br", True, "br"),
+            ("gzip, deflate, br", False, "gzip"),
+            ("br;q=0, gzip", True, "gzip"),
+            ("*", False, "gzip"),
+            ("*;q=0", True, None),
+            ("deflate", True, None),
+            ("", True, None),
+        ],
+    )
+    def test_negotiation(self, header, with_brotli, expected):
+        assert choose_encoding(header, object() if with_brotli else None) == expected
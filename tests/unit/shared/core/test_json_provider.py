@@ -0,0 +1,96 @@
+import dataclasses
+import decimal
+import json
+import uuid
+from datetime import date, datetime
+
+import pytest
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+
+from src.main_app.shared.core import json_provider
+from src.main_app.shared.core.json_provider import FastJSONProvider, init_json_provider, load_serializer
+
+pytestmark = pytest.mark.unit
+
+orjson = pytest.importorskip("orjson")
+
+
+@dataclasses.dataclass
+class Point:
+    x: int
+    y: int
+
+
+PAYLOAD = {
+    "results": [
+        {
+            "title": "ملاريا",
+            "date": date(2024, 3, 2),
+            "add_date": datetime(2024, 3, 2, 10, 30, 5),
+            "iso": "2024-03-02T10:30:05",
+            "views": decimal.Decimal("42"),
+            "id": uuid.UUID(int=7),
+            "point": Point(1, 2),
+            "missing": None,
+        }
+    ],
+    "count": 1,
+    "b": True,
+    "a": 1.5,
+}
+
+
+@pytest.fixture
+def app():
+    return Flask(__name__)
+
+
+class TestFastJSONProvider:
+    def test_matches_default_provider(self, app):
+        fast = FastJSONProvider(app, orjson)
+        default = DefaultJSONProvider(app)
+
+        assert json.loads(fast.dumps(PAYLOAD)) == json.loads(default.dumps(PAYLOAD))
+        # Key order and compact separators are kept; non-ASCII is written as UTF-8
+        assert fast.dumps(PAYLOAD) == default.dumps(PAYLOAD, separators=(",", ":"), ensure_ascii=False)
+
+    def test_response(self, app):
+        with app.app_context():
+            response = FastJSONProvider(app, orjson).response(PAYLOAD)
+
+        assert response.mimetype == "application/json"
+        assert response.get_data().endswith(b"}\n")
+        assert json.loads(response.get_data())["results"][0]["date"] == "Sat, 02 Mar 2024 00:00:00 GMT"
+
+    def test_falls_back_for_unsupported_values(self, app):
+        fast = FastJSONProvider(app, orjson)
+        assert fast.dumps({"big": 2**70}) == '{"big":1180591620717411303424}'
+        assert fast.dumps({"a": 1}, indent=2) == DefaultJSONProvider(app).dumps({"a": 1}, indent=2)
+
+    def test_standard_library_when_no_serializer(self, app):
+        assert FastJSONProvider(app).dumps({"a": "é"}) == DefaultJSONProvider(app).dumps({"a": "é"})
+
+    def test_loads(self, app):
+        assert FastJSONProvider(app, orjson).loads(b'{"a": [1, 2]}') == {"a": [1, 2]}
+
+
+class TestSerializerSetting:
+    def test_load_serializer(self):
+        assert load_serializer("auto") is orjson
+        assert load_serializer("json") is None
+        with pytest.raises(ValueError):
+            load_serializer("ujson")
+
+    def test_unknown_setting_falls_back(self, app, monkeypatch):
+        settings = json_provider.settings
+        performance = dataclasses.replace(settings.performance, json_serializer="ujson")
+        monkeypatch.setattr(json_provider, "settings", dataclasses.replace(settings, performance=performance))
+
+        init_json_provider(app)
+
+        assert isinstance(app.json, FastJSONProvider)
+        assert app.json.serializer is None
+
+    def test_app_uses_fast_provider(self, mock_app):
+        assert isinstance(mock_app.json, FastJSONProvider)
@@ -0,0 +1,28 @@
+import pytest
+
+from src.main_app.shared.core.metrics import MetricsRegistry
+
+pytestmark = pytest.mark.unit
+
+
+class TestMetricsRegistry:
+    def test_incr_and_get(self):
+        registry = MetricsRegistry()
+        registry.incr("requests")
+        registry.incr("requests", 2)
+        assert registry.get("requests") == 3
+        assert registry.get("missing") == 0
+
+    def test_labels_are_separate_series(self):
+        registry = MetricsRegistry()
+        registry.incr("hits", method="a")
+        registry.incr("hits", method="b")
+        registry.incr("hits", method="a")
+        assert registry.get("hits", method="a") == 2
+        assert registry.snapshot() == {"hits{method=a}": 2, "hits{method=b}": 1}
+
+    def test_reset(self):
+        registry = MetricsRegistry()
+        registry.incr("hits")
+        registry.reset()
+        assert registry.snapshot() == {}